@@ -1,6 +1,7 @@
 import FreeCAD as App
 import Part
 import Path
+import collections
 import numpy
 import math
 
@@ -39,6 +40,36 @@ def checkForBlindHole(baseshape, selectedFace):
     return bottomface
 
 
+def _raisedFeature(obj, candidate):
+    # check if the cylindrical 'lids' are inside the base
+    # object.  This eliminates extruded circles but allows
+    # actual holes.
+
+    startLidCenter = App.Vector(
+        candidate.BoundBox.Center.x,
+        candidate.BoundBox.Center.y,
+        candidate.BoundBox.ZMax,
+    )
+
+    endLidCenter = App.Vector(
+        candidate.BoundBox.Center.x,
+        candidate.BoundBox.Center.y,
+        candidate.BoundBox.ZMin,
+    )
+
+    return obj.isInside(startLidCenter, 1e-6, False) or obj.isInside(
+        endLidCenter, 1e-6, False
+    )
+
+
+def _getSeam(candidate):
+    # Finds the vertical seam edge in a cylinder
+
+    for e in candidate.Edges:
+        if isinstance(e.Curve, Part.Line):  # found the seam
+            return e
+
+
 def isDrillableCylinder(obj, candidate, tooldiameter=None, vector=App.Vector(0, 0, 1)):
     """
     checks if a candidate cylindrical face is drillable
@@ -53,34 +84,6 @@ def isDrillableCylinder(obj, candidate, tooldiameter=None, vector=App.Vector(0,
         )
     )
 
-    def raisedFeature(obj, candidate):
-        # check if the cylindrical 'lids' are inside the base
-        # object.  This eliminates extruded circles but allows
-        # actual holes.
-
-        startLidCenter = App.Vector(
-            candidate.BoundBox.Center.x,
-            candidate.BoundBox.Center.y,
-            candidate.BoundBox.ZMax,
-        )
-
-        endLidCenter = App.Vector(
-            candidate.BoundBox.Center.x,
-            candidate.BoundBox.Center.y,
-            candidate.BoundBox.ZMin,
-        )
-
-        return obj.isInside(startLidCenter, 1e-6, False) or obj.isInside(
-            endLidCenter, 1e-6, False
-        )
-
-    def getSeam(candidate):
-        # Finds the vertical seam edge in a cylinder
-
-        for e in candidate.Edges:
-            if isinstance(e.Curve, Part.Line):  # found the seam
-                return e
-
     if not candidate.ShapeType == "Face":
         raise TypeError("expected a Face")
 
@@ -90,7 +93,7 @@ def isDrillableCylinder(obj, candidate, tooldiameter=None, vector=App.Vector(0,
     if len(candidate.Edges) != 3:
         raise TypeError("cylinder does not have 3 edges.  Not supported yet")
 
-    if raisedFeature(obj, candidate):
+    if _raisedFeature(obj, candidate):
         Path.Log.debug("The cylindrical face is a raised feature")
         return False
 
@@ -111,7 +114,7 @@ def isDrillableCylinder(obj, candidate, tooldiameter=None, vector=App.Vector(0,
         Path.Log.track(result)
         return result
 
-    elif matchVector and not (compareVecs(getSeam(candidate).Curve.Direction, vector)):
+    elif matchVector and not (compareVecs(_getSeam(candidate).Curve.Direction, vector)):
         Path.Log.debug("The feature is not aligned with the given vector")
         return False
     else:
@@ -282,6 +285,121 @@ def compareVecs(vec1, vec2, exact=False):
         )
 
 
+class DrillableAnalysis:
+    """
+    Bulk analysis of the cylindrical faces of an object for getDrillableTargets.
+
+    Every face is analysed once: radius, seam direction and the normal of the
+    bottom face if it is a blind hole. Faces with the same seam direction, bottom
+    normal and radius are grouped, so the tool diameter and vector tests run once
+    per group. The expensive raised feature probes only run for faces which pass
+    them and are kept for later queries. The results are the same as calling
+    isDrillable for every face.
+    """
+
+    def __init__(self, obj):
+        self.obj = obj
+        self.shape = obj.Shape
+        self.groups = {}
+        self.raised = {}
+
+        # circular faces and their edges for the blind hole check, by hash code
+        shp = self.shape
+        self.circularFaces = [
+            f
+            for f in shp.Faces
+            if len(f.OuterWire.Edges) == 1
+            and type(f.OuterWire.Edges[0].Curve) == Part.Circle
+        ]
+        self.outerEdges = collections.defaultdict(list)
+        self.faceEdges = collections.defaultdict(list)
+        for i, f in enumerate(self.circularFaces):
+            e = f.OuterWire.Edges[0]
+            self.outerEdges[e.hashCode()].append(e)
+            for e in f.Edges:
+                self.faceEdges[e.hashCode()].append((i, e))
+
+        for i, face in enumerate(shp.Faces):
+            # the same prerequisites as isDrillableCylinder
+            if not isinstance(face.Surface, Part.Cylinder) or len(face.Edges) != 3:
+                continue
+            fname = "Face{}".format(i + 1)
+            try:
+                candidate = self.obj.getSubObject(fname)
+                seam = _getSeam(candidate)
+                direction = tuple(seam.Curve.Direction) if seam else None
+                bottom = self.blindHoleNormal(candidate)
+                key = (direction, bottom, candidate.Surface.Radius)
+            except Exception as e:
+                Path.Log.debug(e)
+                continue
+            self.groups.setdefault(key, []).append((i, fname, candidate))
+
+    def blindHoleNormal(self, candidate):
+        """Normal of the face checkForBlindHole finds, None for through holes."""
+        common = None
+        for e in candidate.Edges:
+            if any(e.isSame(x) for x in self.outerEdges.get(e.hashCode(), [])):
+                common = e
+                break
+        if common is None:
+            return None
+        bottom = max(
+            i for i, e in self.faceEdges.get(common.hashCode(), []) if e.isSame(common)
+        )
+        return tuple(self.circularFaces[bottom].normalAt(0, 0))
+
+    def matches(self, key, tooldiameter, vector):
+        (direction, bottom, radius) = key
+        if tooldiameter is None and vector is None:
+            return True
+        if tooldiameter is not None and tooldiameter / 2 > radius:
+            return False
+        if bottom is not None and vector is not None:
+            # blind holes only drillable at exact vector
+            return compareVecs(App.Vector(bottom), vector, exact=True)
+        if vector is not None:
+            return direction is not None and compareVecs(App.Vector(direction), vector)
+        return True
+
+    def isRaised(self, fname, candidate):
+        if fname not in self.raised:
+            self.raised[fname] = _raisedFeature(self.shape, candidate)
+        return self.raised[fname]
+
+    def targets(self, tooldiameter=None, vector=App.Vector(0, 0, 1)):
+        results = []
+        for key, faces in self.groups.items():
+            if self.matches(key, tooldiameter, vector):
+                results.extend(
+                    (i, fname)
+                    for i, fname, candidate in faces
+                    if not self.isRaised(fname, candidate)
+                )
+        return [(self.obj, fname) for i, fname in sorted(results)]
+
+
+# analyses of the most recently searched objects
+_analyses = collections.OrderedDict()
+_analysesSize = 4
+
+
+def drillableAnalysis(obj):
+    """
+    Returns the DrillableAnalysis of obj, analyses are cached as long as the
+    object's shape doesn't change.
+    """
+    key = (obj.FullName, obj.Shape.hashCode())
+    analysis = _analyses.get(key)
+    if analysis is None or not analysis.shape.isSame(obj.Shape):
+        analysis = DrillableAnalysis(obj)
+        _analyses[key] = analysis
+        while len(_analyses) > _analysesSize:
+            _analyses.popitem(last=False)
+    _analyses.move_to_end(key)
+    return analysis
+
+
 def getDrillableTargets(obj, ToolDiameter=None, vector=App.Vector(0, 0, 1)):
     """
     Returns a list of tuples for drillable subelements from the given object
@@ -292,27 +410,14 @@ def getDrillableTargets(obj, ToolDiameter=None, vector=App.Vector(0, 0, 1)):
 
     """
 
-    shp = obj.Shape
+    return drillableAnalysis(obj).targets(ToolDiameter, vector)
 
-    results = []
-    for i in range(1, len(shp.Faces)+1):
-        fname = "Face{}".format(i)
-        Path.Log.debug(fname)
-        candidate = obj.getSubObject(fname)
 
-        if not isinstance(candidate.Surface, Part.Cylinder):
-            continue
-
-        try:
-            drillable = isDrillable(
-                shp, candidate, tooldiameter=ToolDiameter, vector=vector
-            )
-            Path.Log.debug("fname: {} : drillable {}".format(fname, drillable))
-        except Exception as e:
-            Path.Log.debug(e)
-            continue
-
-        if drillable:
-            results.append((obj, fname))
+def getDrillableTargetsForDiameters(obj, ToolDiameters, vector=App.Vector(0, 0, 1)):
+    """
+    Returns a dictionary with the list of drillable subelements of the given object
+    for each of the tool diameters, see getDrillableTargets.
+    """
 
-    return results
+    analysis = drillableAnalysis(obj)
+    return {d: analysis.targets(d, vector) for d in ToolDiameters}
@@ -45,6 +45,12 @@ class AdvancedPreferencesPage:
             self.form.WarningSuppressOpenCamLib.isChecked(),
             self.form.WarningSuppressVelocity.isChecked(),
         )
+        Path.Preferences.setOclScanProcesses(self.form.OclScanProcesses.value())
+        Path.Preferences.setPostProcessorProcesses(
+            self.form.PostProcessorProcesses.value()
+        )
+        Path.Preferences.setAdaptiveProcesses(self.form.AdaptiveProcesses.value())
+        Path.Preferences.setHoleOrderTimeBudget(self.form.HoleOrderTimeBudget.value())
 
     def loadSettings(self):
         Path.Log.track()
@@ -66,6 +72,12 @@ class AdvancedPreferencesPage:
         self.form.WarningSuppressVelocity.setChecked(
             Path.Preferences.suppressVelocity()
         )
+        self.form.OclScanProcesses.setValue(Path.Preferences.oclScanProcesses())
+        self.form.PostProcessorProcesses.setValue(
+            Path.Preferences.postProcessorProcesses()
+        )
+        self.form.AdaptiveProcesses.setValue(Path.Preferences.adaptiveProcesses())
+        self.form.HoleOrderTimeBudget.setValue(Path.Preferences.holeOrderTimeBudget())
         self.updateSelection()
 
     def updateSelection(self, state=None):
@@ -32,6 +32,8 @@ other than Path.Log, then it probably doesn't belong here.
 
 import FreeCAD
 import Path
+import multiprocessing
+import sys
 
 translate = FreeCAD.Qt.translate
 
@@ -159,3 +161,15 @@ def clearExpressionEngine(obj):
             obj.setExpression(attr, None)
 
 
+def forkAvailable():
+    """forkAvailable() ... returns True if work can be spread across forked processes.
+
+    Document objects and OpenCAMLib data can't be pickled, worker processes get
+    them by forking. Fork is not safe with the system frameworks on macOS. A forked
+    copy of the GUI process inherits the threads and locks of Qt, thus nothing is
+    forked while the GUI is up."""
+    return (
+        "fork" in multiprocessing.get_all_start_methods()
+        and sys.platform != "darwin"
+        and not FreeCAD.GuiUp
+    )
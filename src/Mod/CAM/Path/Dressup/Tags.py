@@ -27,6 +27,7 @@ import FreeCAD
 import Path
 import Path.Dressup.Utils as PathDressup
 import PathScripts.PathUtils as PathUtils
+import bisect
 import copy
 import math
 
@@ -115,6 +116,46 @@ def debugCone(vector, r1, r2, height, label, color=None):
             obj.ViewObject.ShapeColor = color
 
 
+def _edgeKey(edge):
+    """Hashable key of the geometry of an edge for the intersection cache."""
+    first = edge.FirstParameter
+    last = edge.LastParameter
+    key = [type(edge.Curve).__name__]
+    for pt in [
+        edge.valueAt(first),
+        edge.valueAt((first + last) / 2),
+        edge.valueAt(last),
+    ]:
+        key.extend([round(pt.x, 6), round(pt.y, 6), round(pt.z, 6)])
+    return tuple(key)
+
+
+class _IntersectionCache:
+    """Intersections of edges with tags, kept from one recompute to the next.
+    Entries not used by a recompute are dropped, so moving a tag only intersects
+    the edges around its old and new position again."""
+
+    def __init__(self):
+        self.previous = {}
+        self.current = {}
+
+    def restart(self):
+        self.previous = self.current
+        self.current = {}
+
+    def lookup(self, key):
+        if key in self.current:
+            return (True, self.current[key])
+        if key in self.previous:
+            value = self.previous[key]
+            self.current[key] = value
+            return (True, value)
+        return (False, None)
+
+    def store(self, key, value):
+        self.current[key] = value
+
+
 class Tag:
     def __init__(self, nr, x, y, width, height, angle, radius, enabled=True):
         Path.Log.track(
@@ -141,6 +182,10 @@ class Tag:
         self.r2 = None
         self.solid = None
         self.z = None
+        self.boundBox = None
+        self.key = None
+        # set by the dressup to reuse intersections of previous recomputes
+        self.intersections = None
 
     def fullWidth(self):
         return 2 * self.toolRadius + self.width
@@ -204,6 +249,21 @@ class Tag:
         if not Path.Geom.isRoughly(0, radius):
             Path.Log.debug("makeFillet(%.4f)" % radius)
             self.solid = self.solid.makeFillet(radius, [self.solid.Edges[0]])
+        self.boundBox = self.solid.BoundBox
+        self.boundBox.enlarge(Path.Geom.Tolerance)
+        self.key = tuple(
+            round(v, 6)
+            for v in [
+                self.x,
+                self.y,
+                z,
+                R,
+                self.width,
+                self.height,
+                self.angle,
+                self.radius,
+            ]
+        )
 
     def filterIntersections(self, pts, face):
         if (
@@ -270,9 +330,25 @@ class Tag:
             zLast = edge.valueAt(edge.LastParameter).z
             zMax = self.top()
             if isDefinitelySmaller(zFirst, zMax) or isDefinitelySmaller(zLast, zMax):
-                return self.nextIntersectionClosestTo(
-                    edge, self.solid, edge.valueAt(param)
+                # edges outside the tag's bounding box can't intersect its solid
+                if not self.boundBox.intersect(edge.BoundBox):
+                    return None
+                refPt = edge.valueAt(param)
+                if self.intersections is None:
+                    return self.nextIntersectionClosestTo(edge, self.solid, refPt)
+                key = (
+                    self.key,
+                    _edgeKey(edge),
+                    round(refPt.x, 6),
+                    round(refPt.y, 6),
+                    round(refPt.z, 6),
                 )
+                found, pt = self.intersections.lookup(key)
+                if not found:
+                    pt = self.nextIntersectionClosestTo(edge, self.solid, refPt)
+                    self.intersections.store(key, pt)
+                if pt is not None:
+                    return FreeCAD.Vector(pt)
         return None
 
     def bbEdges(self):
@@ -670,6 +746,23 @@ class _RapidEdges:
         return False
 
 
+class _TagIndex:
+    """Interval index over the bounding boxes of the enabled tags, returns the tags
+    an edge can intersect without any OCC intersection."""
+
+    def __init__(self, tags):
+        entries = sorted(
+            (tag.boundBox.XMin, i) for i, tag in enumerate(tags) if tag.enabled
+        )
+        self.xMin = [xMin for xMin, i in entries]
+        self.boxes = [(i, tags[i].boundBox) for xMin, i in entries]
+
+    def candidates(self, edge):
+        bb = edge.BoundBox
+        end = bisect.bisect_right(self.xMin, bb.XMax)
+        return set(i for i, box in self.boxes[:end] if box.intersect(bb))
+
+
 class PathData:
     def __init__(self, obj):
         Path.Log.track(obj.Base.Name)
@@ -991,6 +1084,7 @@ class ObjectTagDressup:
         self.pathData = None
         self.toolRadius = None
         self.mappers = []
+        self.intersections = _IntersectionCache()
 
         obj.Proxy = self
         obj.Base = base
@@ -1005,6 +1099,7 @@ class ObjectTagDressup:
         self.pathData = None
         self.toolRadius = None
         self.mappers = []
+        self.intersections = _IntersectionCache()
         return None
 
     def onDocumentRestored(self, obj):
@@ -1084,6 +1179,10 @@ class ObjectTagDressup:
 
         self.mappers = []
         mapper = None
+        self.intersections.restart()
+        tagIndex = _TagIndex(tags)
+        candidates = None
+        candidatesEdge = None
 
         tc = PathDressup.toolController(obj.Base)
         horizFeed = tc.HorizFeed.Value
@@ -1113,6 +1212,14 @@ class ObjectTagDressup:
                     edge = None
 
             if edge:
+                if edge is not candidatesEdge:
+                    candidates = tagIndex.candidates(edge)
+                    candidatesEdge = edge
+                # skip the tags too far away to intersect the edge
+                while t < len(tags) and (t + lastTag) % len(tags) not in candidates:
+                    t += 1
+
+            if edge and t < len(tags):
                 tIndex = (t + lastTag) % len(tags)
                 t += 1
                 i = tags[tIndex].intersects(edge, edge.FirstParameter)
@@ -1179,6 +1286,7 @@ class ObjectTagDressup:
                 not i in disabledIn,
             )
             tag.createSolidsAt(self.pathData.minZ, self.toolRadius)
+            tag.intersections = self.intersections
             rawTags.append(tag)
         # disable all tags that intersect with their previous tag
         prev = None
@@ -54,9 +54,10 @@ class CAMSanity:
     and export it in a format that is useful to the user.
     """
 
-    def __init__(self, job, output_file):
+    def __init__(self, job, output_file, simulate=False):
         self.job = job
         self.output_file = output_file
+        self.simulate = simulate
         self.filelocation = os.path.dirname(output_file)
 
         # set the filelocation to the parent of the output filename
@@ -305,8 +306,61 @@ class CAMSanity:
             }
             data["operations"].append(opdata)
 
+        if self.simulate:
+            data["squawkData"].extend(self._simulationSquawks())
+
         return data
 
+    def _simulationSquawks(self):
+        """
+        Simulate the material removal of the job and report collisions
+        """
+        import Path.Main.Simulator as PathSimulator
+
+        squawks = []
+        sim = PathSimulator.simulateJob(self.job)
+        for collision in sim.rapidCollisions:
+            squawks.append(
+                self.squawk(
+                    "CAMSanity",
+                    translate(
+                        "CAM_Sanity",
+                        "Rapid move into stock in {}, command {}: {}",
+                    ).format(
+                        collision["operation"],
+                        collision["command"],
+                        collision["gcode"],
+                    ),
+                    squawkType="WARNING",
+                )
+            )
+        for collision in sim.holderGouges:
+            squawks.append(
+                self.squawk(
+                    "CAMSanity",
+                    translate(
+                        "CAM_Sanity",
+                        "Tool shank or holder touches the stock in {}, command {}: {}",
+                    ).format(
+                        collision["operation"],
+                        collision["command"],
+                        collision["gcode"],
+                    ),
+                    squawkType="CAUTION",
+                )
+            )
+        squawks.append(
+            self.squawk(
+                "CAMSanity",
+                translate("CAM_Sanity", "Simulated removed volume: {}").format(
+                    FreeCAD.Units.Quantity(
+                        sim.removedVolume, FreeCAD.Units.Volume
+                    ).UserString
+                ),
+            )
+        )
+        return squawks
+
     def _stockData(self):
         obj = self.job
         data = {
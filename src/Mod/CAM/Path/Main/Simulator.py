@@ -0,0 +1,417 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *   Copyright (c) 2024 FreeCAD Project Association                        *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+"""
+Headless material removal simulation of CAM jobs.
+
+The stock is represented by a height map, the top Z of the material for every
+cell of a regular XY grid. The tool is swept along the commands of the
+operations and lowers the height map where it passes. Besides the final stock
+heights and the removed volume the simulation reports rapid moves into the
+stock and contacts of the non cutting part of the tool with the stock.
+
+No GUI is needed, thus jobs can be validated from scripts and tests:
+
+    import Path.Main.Simulator as PathSimulator
+    sim = PathSimulator.simulateJob(job)
+    print(sim.removedVolume, sim.rapidCollisions, sim.holderGouges)
+"""
+
+import FreeCAD
+import Path
+import Path.Dressup.Utils as PathDressup
+import math
+import numpy
+
+# lazily loaded modules
+from lazy_loader.lazy_loader import LazyLoader
+
+PathUtils = LazyLoader("PathScripts.PathUtils", globals(), "PathScripts.PathUtils")
+
+if False:
+    Path.Log.setLevel(Path.Log.Level.DEBUG, Path.Log.thisModule())
+    Path.Log.trackModule(Path.Log.thisModule())
+else:
+    Path.Log.setLevel(Path.Log.Level.INFO, Path.Log.thisModule())
+
+
+# material closer than this to the tool is not reported as collision
+CollisionTolerance = 0.01
+
+# upper limit of the number of values of the arrays calculated at once for a chunk of
+# tool positions, a chunk needs about ten of them
+ChunkSize = 500000
+
+
+def _value(tool, name, default=None):
+    """_value(tool, name, default) ... float value of a tool property or default"""
+    value = getattr(tool, name, None)
+    if value is None:
+        return default
+    return float(getattr(value, "Value", value))
+
+
+class ToolProfile:
+    """
+    Rotational profile of a tool, the height of the tool surface above the tip
+    as a function of the distance from the tool axis.
+    Only the part up to the cutting edge height removes material, the part above
+    it (shank and holder) must not touch the stock.
+    """
+
+    def __init__(
+        self,
+        diameter,
+        shape="endmill",
+        cuttingEdgeHeight=None,
+        flatRadius=0.0,
+        cuttingEdgeAngle=180.0,
+        tipDiameter=0.0,
+        shankDiameter=None,
+    ):
+        self.radius = diameter / 2.0
+        self.shape = shape.lower().replace("-", "").replace(" ", "")
+        self.cuttingEdgeHeight = cuttingEdgeHeight if cuttingEdgeHeight else math.inf
+        self.flatRadius = min(flatRadius, self.radius)
+        self.cuttingEdgeAngle = cuttingEdgeAngle
+        self.tipRadius = min(tipDiameter / 2.0, self.radius)
+        self.shankRadius = shankDiameter / 2.0 if shankDiameter else self.radius
+
+    @classmethod
+    def fromTool(cls, tool):
+        """fromTool(tool) ... profile of a tool bit or legacy tool"""
+        shape = getattr(tool, "ShapeName", "") or getattr(tool, "ToolType", "")
+        angle = _value(tool, "CuttingEdgeAngle", 180.0)
+        if shape.lower() == "drill":
+            angle = _value(tool, "TipAngle", angle)
+        return cls(
+            _value(tool, "Diameter", 0.0),
+            shape,
+            cuttingEdgeHeight=_value(tool, "CuttingEdgeHeight", _value(tool, "Length")),
+            flatRadius=_value(tool, "FlatRadius", 0.0),
+            cuttingEdgeAngle=angle,
+            tipDiameter=_value(tool, "TipDiameter", 0.0),
+            shankDiameter=_value(tool, "ShankDiameter"),
+        )
+
+    def heights(self, distance):
+        """heights(distance) ... tool surface above the tip, inf outside of the tool"""
+        r = numpy.minimum(distance, self.radius)
+        if self.shape in ("ballend", "ballnose"):
+            h = self.radius - numpy.sqrt(self.radius**2 - r**2)
+        elif self.shape == "bullnose":
+            corner = self.radius - self.flatRadius
+            rc = numpy.maximum(r - self.flatRadius, 0.0)
+            h = corner - numpy.sqrt(numpy.maximum(corner**2 - rc**2, 0.0))
+        elif (
+            self.shape in ("vbit", "chamfer", "drill", "engraver")
+            and self.cuttingEdgeAngle < 180
+        ):
+            slope = 1.0 / math.tan(math.radians(self.cuttingEdgeAngle) / 2.0)
+            h = numpy.maximum(r - self.tipRadius, 0.0) * slope
+        else:
+            h = numpy.zeros_like(r)
+        return numpy.where(distance <= self.radius, h, numpy.inf)
+
+
+class HeightMap:
+    """
+    Top Z of the stock material on a regular XY grid of cells.
+    Cells without material are NaN.
+    """
+
+    def __init__(self, boundBox, resolution):
+        self.resolution = resolution
+        self.zMin = boundBox.ZMin
+        self.zMax = boundBox.ZMax
+        nx = max(1, int(math.ceil(boundBox.XLength / resolution)))
+        ny = max(1, int(math.ceil(boundBox.YLength / resolution)))
+        self.x = boundBox.XMin + (numpy.arange(nx) + 0.5) * resolution
+        self.y = boundBox.YMin + (numpy.arange(ny) + 0.5) * resolution
+        self.heights = numpy.full((ny, nx), boundBox.ZMax)
+
+    @classmethod
+    def fromShape(cls, shape, resolution):
+        """fromShape(shape, resolution) ... height map of a stock solid"""
+        bb = shape.BoundBox
+        heightMap = cls(bb, resolution)
+        if not math.isclose(
+            shape.Volume, bb.XLength * bb.YLength * bb.ZLength, rel_tol=1e-6
+        ):
+            # not a box, cells outside of the stock outline have no material
+            outside = ~heightMap._insideSection(shape, (bb.ZMin + bb.ZMax) / 2.0)
+            heightMap.heights[outside] = numpy.nan
+        return heightMap
+
+    def _insideSection(self, shape, z):
+        """_insideSection(shape, z) ... mask of the cells inside the section at z.
+        The section wires are discretized and every row of cells is tested by the
+        crossings of the row with the polygon edges, holes are handled by even-odd."""
+        segments = []
+        for wire in shape.slice(FreeCAD.Vector(0, 0, 1), z):
+            pts = wire.discretize(Deflection=self.resolution / 10)
+            pts = numpy.array([(p.x, p.y) for p in pts])
+            segments.append(numpy.column_stack((pts[:-1], pts[1:])))
+        if not segments:
+            Path.Log.warning("No section of the stock at z={}".format(z))
+            return numpy.ones(self.heights.shape, dtype=bool)
+        x0, y0, x1, y1 = numpy.concatenate(segments).T
+        inside = numpy.empty(self.heights.shape, dtype=bool)
+        for iy, y in enumerate(self.y):
+            crossing = (y0 <= y) != (y1 <= y)
+            t = (y - y0[crossing]) / (y1[crossing] - y0[crossing])
+            xs = numpy.sort(x0[crossing] + t * (x1[crossing] - x0[crossing]))
+            inside[iy] = numpy.searchsorted(xs, self.x) % 2 == 1
+        return inside
+
+    def volume(self):
+        """volume() ... material volume above the stock bottom"""
+        return float(numpy.nansum(self.heights - self.zMin)) * self.resolution**2
+
+    def _window(self, lo, hi, coords):
+        i0 = int(numpy.searchsorted(coords, lo, side="left"))
+        i1 = int(numpy.searchsorted(coords, hi, side="right"))
+        return i0, i1
+
+    def _chunks(self, points, radius):
+        """_chunks(points, radius) ... consecutive tool positions processed at once.
+        The arrays of a chunk span all cells of the chunk's bounding box for every
+        position, thus the chunk is limited by positions times cells to ChunkSize."""
+        kernel = (2 * radius / self.resolution + 2) ** 2
+        maxCount = max(1, int(ChunkSize / kernel))
+        start = 0
+        while start < len(points):
+            rest = points[start : start + maxCount]
+            lo = numpy.minimum.accumulate(rest[:, :2])
+            hi = numpy.maximum.accumulate(rest[:, :2])
+            cells = numpy.prod((hi - lo + 2 * radius) / self.resolution + 2, axis=1)
+            size = cells * numpy.arange(1, len(rest) + 1)
+            count = max(1, int(numpy.searchsorted(size, ChunkSize, side="right")))
+            yield points[start : start + count]
+            start += count
+
+    def sweep(self, points, profile, rapid=False):
+        """sweep(points, profile, rapid) ... moves the tool tip along points.
+        The material is removed down to the tool surface, the removed volume is returned
+        together with the deepest collision of the tool with the material.
+        For rapid moves any material above the tool surface collides, for feed moves the
+        material touching the shank above the cutting edge height."""
+        checkRadius = profile.radius if rapid else profile.shankRadius
+        radius = max(profile.radius, checkRadius)
+        removed = 0.0
+        penetration = 0.0
+        for chunk in self._chunks(points, radius):
+            ix0, ix1 = self._window(
+                chunk[:, 0].min() - radius, chunk[:, 0].max() + radius, self.x
+            )
+            iy0, iy1 = self._window(
+                chunk[:, 1].min() - radius, chunk[:, 1].max() + radius, self.y
+            )
+            if ix0 >= ix1 or iy0 >= iy1:
+                continue
+            old = self.heights[iy0:iy1, ix0:ix1]
+            dx = self.x[None, None, ix0:ix1] - chunk[:, 0, None, None]
+            dy = self.y[None, iy0:iy1, None] - chunk[:, 1, None, None]
+            distance = numpy.hypot(dx, dy)
+            z = chunk[:, 2, None, None]
+            surface = z + profile.heights(distance)
+
+            cut = numpy.minimum.accumulate(surface, axis=0)
+            with numpy.errstate(invalid="ignore"):
+                # cells cut down to the stock bottom have no material left
+                material = numpy.where(old > self.zMin, old, numpy.nan)
+                if rapid:
+                    # the material the move runs into
+                    inside = material[None] - surface
+                else:
+                    # the material at every tool position, after former positions cut
+                    before = numpy.concatenate((material[None], cut[:-1]))
+                    before = numpy.minimum(material[None], before)
+                    before = numpy.where(before > self.zMin, before, numpy.nan)
+                    inside = numpy.where(
+                        distance <= checkRadius,
+                        before - (z + profile.cuttingEdgeHeight),
+                        -1.0,
+                    )
+                depth = numpy.nanmax(inside, initial=0.0)
+            penetration = max(penetration, float(depth))
+
+            new = numpy.maximum(numpy.minimum(old, cut[-1]), self.zMin)
+            with numpy.errstate(invalid="ignore"):
+                removed += float(numpy.nansum(old - new)) * self.resolution**2
+            self.heights[iy0:iy1, ix0:ix1] = numpy.where(numpy.isnan(old), old, new)
+        return removed, penetration
+
+
+def movePoints(start, cmd, step):
+    """movePoints(start, cmd, step) ... tip positions of a move, at most step apart.
+    The start point is not included. Arcs are interpolated in the XY plane."""
+    params = cmd.Parameters
+    end = numpy.array(
+        [
+            params.get("X", start[0]),
+            params.get("Y", start[1]),
+            params.get("Z", start[2]),
+        ]
+    )
+    if cmd.Name in Path.Geom.CmdMoveArc:
+        cx = start[0] + params.get("I", 0.0)
+        cy = start[1] + params.get("J", 0.0)
+        r = math.hypot(start[0] - cx, start[1] - cy)
+        a0 = math.atan2(start[1] - cy, start[0] - cx)
+        a1 = math.atan2(end[1] - cy, end[0] - cx)
+        sweep = a1 - a0
+        if cmd.Name in Path.Geom.CmdMoveCCW:
+            sweep = sweep % (2 * math.pi) or 2 * math.pi
+        else:
+            sweep = -((-sweep) % (2 * math.pi) or 2 * math.pi)
+        length = math.hypot(abs(sweep) * r, end[2] - start[2])
+        n = max(1, int(math.ceil(length / step)))
+        t = numpy.arange(1, n + 1) / n
+        a = a0 + sweep * t
+        return numpy.column_stack(
+            (
+                cx + r * numpy.cos(a),
+                cy + r * numpy.sin(a),
+                start[2] + (end[2] - start[2]) * t,
+            )
+        )
+    n = max(1, int(math.ceil(numpy.linalg.norm(end - start) / step)))
+    t = (numpy.arange(1, n + 1) / n)[:, None]
+    return start + (end - start) * t
+
+
+def _drillMoves(cmd, position, firstDrill):
+    """_drillMoves(cmd, position, firstDrill) ... a drill cycle as list of moves"""
+    params = cmd.Parameters
+    x = params.get("X", position[0])
+    y = params.get("Y", position[1])
+    r = params.get("R", position[2])
+    z = params.get("Z", position[2])
+    moves = []
+    if firstDrill:
+        moves.append(Path.Command("G0", {"Z": r}))
+    moves.append(Path.Command("G0", {"X": x, "Y": y, "Z": r}))
+    moves.append(Path.Command("G1", {"X": x, "Y": y, "Z": z}))
+    moves.append(Path.Command("G0", {"X": x, "Y": y, "Z": r}))
+    return moves
+
+
+class Simulation:
+    """
+    Simulation of the material removal of a sequence of commands.
+    Collisions are collected as dictionaries with the keys operation, command,
+    gcode and depth. command is the index of the command in the operation path.
+    """
+
+    def __init__(self, heightMap, startPosition=None):
+        self.heightMap = heightMap
+        self.step = heightMap.resolution / 2.0
+        if startPosition is None:
+            startPosition = (0.0, 0.0, heightMap.zMax)
+        self.position = numpy.array(startPosition, dtype=float)
+        self.removedVolume = 0.0
+        self.rapidCollisions = []
+        self.holderGouges = []
+
+    def _collision(self, collisions, label, index, cmd, depth):
+        Path.Log.debug("collision {} #{} {} depth {}".format(label, index, cmd, depth))
+        collisions.append(
+            {
+                "operation": label,
+                "command": index,
+                "gcode": cmd.toGCode(),
+                "depth": depth,
+            }
+        )
+
+    def simulate(self, commands, profile, label=""):
+        """simulate(commands, profile, label) ... cuts the stock along commands.
+        label is used to identify the operation in the collision reports."""
+        firstDrill = True
+        for index, cmd in enumerate(commands):
+            if cmd.Name in Path.Geom.CmdMoveDrill:
+                moves = _drillMoves(cmd, self.position, firstDrill)
+                firstDrill = False
+            elif cmd.Name in Path.Geom.CmdMoveAll:
+                moves = [cmd]
+                firstDrill = True
+            else:
+                if cmd.Name == "G80":
+                    firstDrill = True
+                continue
+            for move in moves:
+                self._move(move, profile, label, index, cmd)
+        return self
+
+    def _move(self, move, profile, label, index, cmd):
+        points = movePoints(self.position, move, self.step)
+        self.position = points[-1]
+        rapid = move.Name in Path.Geom.CmdMoveRapid
+        removed, depth = self.heightMap.sweep(points, profile, rapid)
+        if depth > CollisionTolerance:
+            collisions = self.rapidCollisions if rapid else self.holderGouges
+            self._collision(collisions, label, index, cmd, depth)
+        self.removedVolume += removed
+
+    def stockHeights(self):
+        """stockHeights() ... (x, y, heights) of the height map cells"""
+        return (self.heightMap.x, self.heightMap.y, self.heightMap.heights)
+
+
+def defaultResolution(stock):
+    """defaultResolution(stock) ... cell size for 200 cells along the longest side"""
+    bb = stock.BoundBox
+    return max(bb.XLength, bb.YLength) / 200.0
+
+
+def simulateJob(job, resolution=None):
+    """simulateJob(job, resolution) ... simulates all active operations of job.
+    Returns the Simulation, resolution is the cell size of the height map."""
+    stock = job.Stock.Shape
+    if resolution is None:
+        resolution = defaultResolution(stock)
+    sim = Simulation(HeightMap.fromShape(stock, resolution))
+
+    profiles = {}
+    lastTool = None
+    for op in job.Operations.Group:
+        if not getattr(op, "Active", True) or op.Path is None:
+            continue
+        try:
+            tool = PathDressup.toolController(op).Tool
+        except Exception:
+            tool = None
+        if tool is None:
+            Path.Log.warning(
+                "Operation {} has no tool, it is not simulated".format(op.Label)
+            )
+            continue
+        if tool.Name not in profiles:
+            profiles[tool.Name] = ToolProfile.fromTool(tool)
+        if lastTool is not None and tool is not lastTool:
+            # the tool change retracts the spindle
+            sim.position[2] = max(sim.position[2], sim.heightMap.zMax)
+        lastTool = tool
+        commands = PathUtils.getPathWithPlacement(op).Commands
+        sim.simulate(commands, profiles[tool.Name], op.Label)
+    return sim
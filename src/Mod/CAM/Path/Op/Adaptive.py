@@ -23,12 +23,15 @@
 # ***************************************************************************
 
 import Path
+import Path.Base.Util as PathUtil
 import Path.Op.Base as PathOp
 import PathScripts.PathUtils as PathUtils
 import FreeCAD
 import time
+import hashlib
 import json
 import math
+import multiprocessing
 import area
 from PySide.QtCore import QT_TRANSLATE_NOOP
 
@@ -118,6 +121,123 @@ def CalcHelixConePoint(height, cur_z, radius, angle):
     return {"X": x, "Y": y, "Z": z}
 
 
+def _pathGroups(paths, margin):
+    """_pathGroups(paths, margin) ... return the indices of paths grouped by overlapping
+    bounding boxes. Boxes closer than margin overlap, paths in different groups can't
+    interact with each other."""
+    boxes = []
+    for i, path in enumerate(paths):
+        if path:
+            xs = [pt[0] for pt in path]
+            ys = [pt[1] for pt in path]
+            boxes.append(
+                (
+                    min(xs) - margin / 2,
+                    max(xs) + margin / 2,
+                    min(ys) - margin / 2,
+                    max(ys) + margin / 2,
+                    i,
+                )
+            )
+
+    parent = list(range(len(paths)))
+
+    def root(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    # sweep along x, only boxes still open at the current XMin can overlap
+    active = []
+    for box in sorted(boxes):
+        active = [a for a in active if a[1] >= box[0]]
+        for a in active:
+            if a[2] <= box[3] and box[2] <= a[3]:
+                parent[root(a[4])] = root(box[4])
+        active.append(box)
+
+    groups = {}
+    for box in sorted(boxes, key=lambda b: b[4]):
+        groups.setdefault(root(box[4]), []).append(box[4])
+    return list(groups.values())
+
+
+def _regionGroups(paths, opType, toolDiameter, stockToLeave):
+    """_regionGroups(paths, opType, toolDiameter, stockToLeave) ... return the paths
+    grouped into regions which can't interact and are solved independently.
+    The boundaries are offset by the stock to leave and united in a single run, thus
+    regions closer than the tool plus the stock to leave on both sides interact. The
+    outside regions share the stock boundary or their offset profiles may merge, they
+    are solved together."""
+    if opType in (
+        area.AdaptiveOperationType.ClearingOutside,
+        area.AdaptiveOperationType.ProfilingOutside,
+    ):
+        return [paths]
+    margin = toolDiameter + 2 * stockToLeave
+    return [[paths[i] for i in group] for group in _pathGroups(paths, margin)]
+
+
+def _inputHash(params, paths):
+    data = json.dumps([params, paths], sort_keys=True)
+    return hashlib.sha1(data.encode()).hexdigest()
+
+
+def _noProgress(tpaths):
+    return False
+
+
+_parallelSolve = None
+_pollInterval = 0.1  # seconds between progress updates while waiting for workers
+
+
+def _runSolve(index):
+    return _parallelSolve(index, _noProgress)
+
+
+def _solveGroups(solve, count, progressFn):
+    """_solveGroups(solve, count, progressFn) ... return solve(i, progressFn) for all
+    count groups. The groups are solved by forked worker processes if the adaptive
+    processes preference asks for more than one and forking is available, which it
+    isn't while the GUI is up. Their results are passed to progressFn as they come
+    in, while waiting for the workers progressFn is called with no paths, so
+    processing can be stopped. Groups not solved because progressFn asked to stop
+    are None."""
+    global _parallelSolve
+
+    solved = [None] * count
+    processes = min(Path.Preferences.adaptiveProcesses(), count)
+    if processes < 2 or not PathUtil.forkAvailable():
+        for i in range(count):
+            solved[i] = solve(i, progressFn)
+            if progressFn([]):
+                break
+        return solved
+
+    Path.Log.debug("Solving {} regions with {} processes".format(count, processes))
+    _parallelSolve = solve
+    try:
+        context = multiprocessing.get_context("fork")
+        with context.Pool(processes) as pool:
+            pending = {i: pool.apply_async(_runSolve, (i,)) for i in range(count)}
+            stop = False
+            while pending and not stop:
+                done = [i for i, result in pending.items() if result.ready()]
+                if not done:
+                    next(iter(pending.values())).wait(_pollInterval)
+                    stop = progressFn([])
+                for i in done:
+                    solved[i] = pending.pop(i).get()
+                    paths = [p for region in solved[i] for p in region["AdaptivePaths"]]
+                    if progressFn(paths):
+                        stop = True
+                        break
+    finally:
+        _parallelSolve = None
+    return solved
+
+
 def GenerateGCode(op, obj, adaptiveResults, helixDiameter):
     if len(adaptiveResults) == 0 or len(adaptiveResults[0]["AdaptivePaths"]) == 0:
         return
@@ -741,9 +861,11 @@ def Execute(op, obj):
 
         inputStateChanged = False
         adaptiveResults = None
+        previousResults = []
 
         if obj.AdaptiveOutputState is not None and obj.AdaptiveOutputState != "":
             adaptiveResults = obj.AdaptiveOutputState
+            previousResults = obj.AdaptiveOutputState
 
         if json.dumps(obj.AdaptiveInputState) != json.dumps(inputStateObject):
             inputStateChanged = True
@@ -770,31 +892,58 @@ def Execute(op, obj):
         start = time.time()
 
         if inputStateChanged or adaptiveResults is None:
-            a2d = area.Adaptive2d()
-            a2d.stepOverFactor = 0.01 * obj.StepOver
-            a2d.toolDiameter = float(op.tool.Diameter)
-            a2d.helixRampDiameter = helixDiameter
-            a2d.keepToolDownDistRatio = keepToolDownRatio
-            a2d.stockToLeave = float(obj.StockToLeave)
-            a2d.tolerance = float(obj.Tolerance)
-            a2d.forceInsideOut = obj.ForceInsideOut
-            a2d.finishingProfile = obj.FinishingProfile
-            a2d.opType = opType
-
-            # EXECUTE
-            results = a2d.Execute(stockPath2d, path2d, progressFn)
-
-            # need to convert results to python object to be JSON serializable
-            adaptiveResults = []
-            for result in results:
-                adaptiveResults.append(
+            groups = _regionGroups(
+                path2d, opType, float(op.tool.Diameter), float(obj.StockToLeave)
+            )
+
+            # results of groups whose input didn't change are taken from the last run
+            params = {k: v for k, v in inputStateObject.items() if k != "geometry"}
+            hashes = [_inputHash(params, group) for group in groups]
+            previous = {}
+            for region in previousResults:
+                previous.setdefault(region.get("InputHash"), []).append(region)
+            solved = [previous.get(h) for h in hashes]
+            pending = [i for i in range(len(groups)) if solved[i] is None]
+            Path.Log.debug(
+                "{} of {} regions to solve".format(len(pending), len(groups))
+            )
+
+            def solve(index, progress):
+                a2d = area.Adaptive2d()
+                a2d.stepOverFactor = 0.01 * obj.StepOver
+                a2d.toolDiameter = float(op.tool.Diameter)
+                a2d.helixRampDiameter = helixDiameter
+                a2d.keepToolDownDistRatio = keepToolDownRatio
+                a2d.stockToLeave = float(obj.StockToLeave)
+                a2d.tolerance = float(obj.Tolerance)
+                a2d.forceInsideOut = obj.ForceInsideOut
+                a2d.finishingProfile = obj.FinishingProfile
+                a2d.opType = opType
+
+                # EXECUTE
+                group = pending[index]
+                results = a2d.Execute(stockPath2d, groups[group], progress)
+
+                # need to convert results to python object to be JSON serializable
+                return [
                     {
                         "HelixCenterPoint": result.HelixCenterPoint,
                         "StartPoint": result.StartPoint,
                         "AdaptivePaths": result.AdaptivePaths,
                         "ReturnMotionType": result.ReturnMotionType,
+                        "InputHash": hashes[group],
                     }
-                )
+                    for result in results
+                ]
+
+            for index, results in enumerate(
+                _solveGroups(solve, len(pending), progressFn)
+            ):
+                solved[pending[index]] = results
+
+            adaptiveResults = [
+                region for results in solved if results for region in results
+            ]
 
         # GENERATE
         GenerateGCode(op, obj, adaptiveResults, helixDiameter)
@@ -244,7 +244,9 @@ class ObjectDrilling(PathCircularHoleBase.ObjectOp):
         else: obj.RetractMode = "G98"
         self.commandlist.append(Path.Command(obj.RetractMode))
 
-        holes = PathUtils.sort_locations(holes, ["x", "y"])
+        holes = PathUtils.sort_locations(
+            holes, ["x", "y"], time_budget=Path.Preferences.holeOrderTimeBudget()
+        )
 
         # This section is technical debt. The computation of the
         # target shapes should be factored out for re-use.
@@ -174,7 +174,9 @@ class ObjectHelix(PathCircularHoleBase.ObjectOp):
 
         self.commandlist.append(Path.Command("G0", {"Z": obj.ClearanceHeight.Value}))
 
-        holes = sort_locations(holes, ["x", "y"])
+        holes = sort_locations(
+            holes, ["x", "y"], time_budget=Path.Preferences.holeOrderTimeBudget()
+        )
 
         tool = obj.ToolController.Tool
         tooldiamter = (
@@ -48,10 +48,14 @@ except ImportError:
 
 from PySide.QtCore import QT_TRANSLATE_NOOP
 import Path
+import Path.Base.Util as PathUtil
 import Path.Op.Base as PathOp
 import Path.Op.SurfaceSupport as PathSurfaceSupport
 import PathScripts.PathUtils as PathUtils
 import math
+import multiprocessing
+import numpy
+import os
 import time
 
 # lazily loaded modules
@@ -70,6 +74,83 @@ else:
     Path.Log.setLevel(Path.Log.Level.INFO, Path.Log.thisModule())
 
 
+# scan batch function of a parallel drop cutter run, inherited by the forked workers
+_parallelScan = None
+
+
+def _dropCutScan(pdc, scan):
+    """Run the drop cutter along a line (A, B) or an arc ((sp, ep, cp), cMode)
+    and return the cutter location points as (x, y, z) tuples."""
+    path = ocl.Path()  # create an empty path object
+    if isinstance(scan[1], bool):
+        ((sp, ep, cp), cMode) = scan
+        p1 = ocl.Point(sp[0], sp[1], 0)  # start point of arc
+        p2 = ocl.Point(ep[0], ep[1], 0)  # end point of arc
+        C = ocl.Point(cp[0], cp[1], 0)  # center point of arc
+        path.append(ocl.Arc(p1, p2, C, cMode))  # add the arc to the path
+    else:
+        ((x1, y1), (x2, y2)) = scan
+        p1 = ocl.Point(x1, y1, 0)  # start-point of line
+        p2 = ocl.Point(x2, y2, 0)  # end-point of line
+        path.append(ocl.Line(p1, p2))  # add the line to the path
+    pdc.setPath(path)
+    pdc.run()  # run dropcutter algorithm on path
+    return [(p.x, p.y, p.z) for p in pdc.getCLPoints()]
+
+
+def _threadsRunning():
+    """_threadsRunning() ... True if this process runs more than one thread.
+    OCL runs its algorithms with OpenMP, the worker threads of a run with more than
+    one thread stay alive in the pool of the OpenMP runtime. A forked copy inherits
+    the pool without its threads and deadlocks as soon as it runs OCL with more than
+    one thread itself. A process without other threads is forked safely, which is
+    the case as long as OCL only ran in forked workers. The threads are unknown
+    without /proc, then nothing is forked."""
+    try:
+        return len(os.listdir("/proc/self/task")) > 1
+    except OSError:
+        return True
+
+
+def _runScanBatch(batch):
+    (start, end) = batch
+    return _parallelScan(start, end)
+
+
+def _runScans(scanBatch, count):
+    """_runScans(scanBatch, count) ... run scanBatch(start, end) over count scans.
+    The scans are split into batches of consecutive scan lines run by forked worker
+    processes, each with its own copy of the STL and cutter, if the OCL scan
+    processes preference asks for more than one and the process can be forked, see
+    _threadsRunning(). The scans are returned in order."""
+    global _parallelScan
+
+    processes = min(Path.Preferences.oclScanProcesses(), count)
+    if processes < 2 or not PathUtil.forkAvailable():
+        return scanBatch(0, count)
+    if _threadsRunning():
+        Path.Log.debug("Threads running in this process, scanning serially")
+        return scanBatch(0, count)
+
+    # several batches per process balance scan lines of different cost
+    size = max(1, math.ceil(count / (processes * 4)))
+    batches = [(i, min(i + size, count)) for i in range(0, count, size)]
+    Path.Log.debug(
+        "Scanning {} lines in {} batches with {} processes".format(
+            count, len(batches), processes
+        )
+    )
+    _parallelScan = scanBatch
+    try:
+        context = multiprocessing.get_context("fork")
+        with context.Pool(processes) as pool:
+            # batches are handed out in order, each worker sees increasing starts
+            results = pool.map(_runScanBatch, batches, chunksize=1)
+    finally:
+        _parallelScan = None
+    return [scan for batch in results for scan in batch]
+
+
 class ObjectSurface(PathOp.ObjectOp):
     """Proxy object for Surfacing operation."""
 
@@ -359,6 +440,15 @@ class ObjectSurface(PathOp.ObjectOp):
                     "Set the sampling resolution. Smaller values quickly increase processing time.",
                 ),
             ),
+            (
+                "App::PropertyDistance",
+                "MinSampleInterval",
+                "Clearing Options",
+                QT_TRANSLATE_NOOP(
+                    "App::Property",
+                    "Set the finest resolution of adaptive sampling, which refines the sample interval only where the surface height changes. Set to 0 for fixed sampling.",
+                ),
+            ),
             (
                 "App::PropertyFloat",
                 "StepOver",
@@ -534,6 +624,7 @@ class ObjectSurface(PathOp.ObjectOp):
             "StartIndex": 0.0,
             "StopIndex": 360.0,
             "SampleInterval": 1.0,
+            "MinSampleInterval": 0.0,
             "BoundaryAdjustment": 0.0,
             "InternalFeaturesAdjustment": 0.0,
             "AvoidLastX_Faces": 0,
@@ -586,6 +677,7 @@ class ObjectSurface(PathOp.ObjectOp):
         obj.setEditorMode("StopIndex", R0)
         obj.setEditorMode("CutterTilt", R0)
         obj.setEditorMode("CutPattern", R2)
+        obj.setEditorMode("MinSampleInterval", R2)
         obj.setEditorMode("CutPatternAngle", P0)
         obj.setEditorMode("PatternCenterAt", P2)
         obj.setEditorMode("PatternCenterCustom", P2)
@@ -690,6 +782,12 @@ class ObjectSurface(PathOp.ObjectOp):
             obj.SampleInterval.Value = 25.4
             Path.Log.error("Sample interval limits are 0.001 to 25.4 millimeters.")
 
+        if obj.MinSampleInterval.Value < 0.0:
+            obj.MinSampleInterval.Value = 0.0
+        if 0.0 < obj.MinSampleInterval.Value < 0.0001:
+            obj.MinSampleInterval.Value = 0.0001
+            Path.Log.error("Sample interval limits are 0.001 to 25.4 millimeters.")
+
         # Limit cut pattern angle
         if obj.CutPatternAngle < -360.0:
             obj.CutPatternAngle = 0.0
@@ -1131,6 +1229,7 @@ class ObjectSurface(PathOp.ObjectOp):
             depthparams[lenDP - 1],
             obj.SampleInterval.Value,
             self.cutter,
+            obj.MinSampleInterval.Value,
         )
         safePDC = self._planarGetPDC(
             self.safeSTLs[mdlIdx],
@@ -1268,6 +1367,12 @@ class ObjectSurface(PathOp.ObjectOp):
 
         if offsetPoints or obj.CutPattern == "Offset":
             PNTSET = PathSurfaceSupport.pathGeomToOffsetPointSet(obj, pathGeom)
+            # D format is ((p1, p2), (p3, p4))
+            scans = iter(
+                self._planarDropCutScans(
+                    pdc, [I for D in PNTSET for I in D if I != "BRK"]
+                )
+            )
             for D in PNTSET:
                 stpOvr = []
                 ofst = []
@@ -1277,9 +1382,7 @@ class ObjectSurface(PathOp.ObjectOp):
                         stpOvr.append(I)
                         ofst = []
                     else:
-                        # D format is ((p1, p2), (p3, p4))
-                        (A, B) = I
-                        ofst.extend(self._planarDropCutScan(pdc, A, B))
+                        ofst.extend(next(scans))
                 if len(ofst) > 0:
                     stpOvr.append(ofst)
                 SCANS.extend(stpOvr)
@@ -1296,14 +1399,18 @@ class ObjectSurface(PathOp.ObjectOp):
             elif obj.CutPattern == "Spiral":
                 PNTSET = PathSurfaceSupport.pathGeomToSpiralPointSet(obj, pathGeom)
 
+            # D format is ((p1, p2), (p3, p4))
+            scans = iter(
+                self._planarDropCutScans(
+                    pdc, [LN for STEP in PNTSET for LN in STEP if LN != "BRK"]
+                )
+            )
             for STEP in PNTSET:
                 for LN in STEP:
                     if LN == "BRK":
                         stpOvr.append(LN)
                     else:
-                        # D format is ((p1, p2), (p3, p4))
-                        (A, B) = LN
-                        stpOvr.append(self._planarDropCutScan(pdc, A, B))
+                        stpOvr.append(next(scans))
                 SCANS.append(stpOvr)
                 stpOvr = []
         elif obj.CutPattern in ["Circular", "CircularZigZag"]:
@@ -1312,66 +1419,57 @@ class ObjectSurface(PathOp.ObjectOp):
             # PNTSET = PathSurfaceSupport.pathGeomToCircularPointSet(obj, pathGeom, self.CutClimb, self.toolDiam, self.closedGap, self.gaps, self.tmpCOM)
             PNTSET = PathSurfaceSupport.pathGeomToCircularPointSet(self, obj, pathGeom)
 
+            # dirFlg 1 is counter-clockwise
+            scans = iter(
+                self._planarDropCutScans(
+                    pdc,
+                    [
+                        (Arc, dirFlg == 1)
+                        for (aTyp, dirFlg, ARCS) in PNTSET
+                        for Arc in ARCS
+                        if Arc != "BRK"
+                    ],
+                )
+            )
             for so in range(0, len(PNTSET)):
                 stpOvr = []
-                erFlg = False
                 (aTyp, dirFlg, ARCS) = PNTSET[so]
 
-                if dirFlg == 1:  # 1
-                    cMode = True
-                else:
-                    cMode = False
-
                 for a in range(0, len(ARCS)):
                     Arc = ARCS[a]
                     if Arc == "BRK":
                         stpOvr.append("BRK")
                     else:
-                        scan = self._planarCircularDropCutScan(pdc, Arc, cMode)
-                        if scan is False:
-                            erFlg = True
-                        else:
-                            if aTyp == "L":
-                                scan.append(
-                                    FreeCAD.Vector(scan[0].x, scan[0].y, scan[0].z)
-                                )
-                            stpOvr.append(scan)
-                if erFlg is False:
-                    SCANS.append(stpOvr)
+                        scan = next(scans)
+                        if aTyp == "L":
+                            scan.append(FreeCAD.Vector(scan[0].x, scan[0].y, scan[0].z))
+                        stpOvr.append(scan)
+                SCANS.append(stpOvr)
         # Eif
 
         return SCANS
 
-    def _planarDropCutScan(self, pdc, A, B):
-        (x1, y1) = A
-        (x2, y2) = B
-        path = ocl.Path()  # create an empty path object
-        p1 = ocl.Point(x1, y1, 0)  # start-point of line
-        p2 = ocl.Point(x2, y2, 0)  # end-point of line
-        lo = ocl.Line(p1, p2)  # line-object
-        path.append(lo)  # add the line to the path
-        pdc.setPath(path)
-        pdc.run()  # run dropcutter algorithm on path
-        CLP = pdc.getCLPoints()
-        PNTS = [FreeCAD.Vector(p.x, p.y, p.z) for p in CLP]
-        return PNTS  # pdc.getCLPoints()
+    def _planarDropCutScans(self, pdc, scans):
+        """_planarDropCutScans(pdc, scans) ... run the drop cutter along a list of
+        lines (A, B) and arcs ((sp, ep, cp), cMode) and return their point lists
+        in the same order, see _runScans()."""
 
-    def _planarCircularDropCutScan(self, pdc, Arc, cMode):
-        path = ocl.Path()  # create an empty path object
-        (sp, ep, cp) = Arc
+        def scanBatch(start, end):
+            return [_dropCutScan(pdc, scan) for scan in scans[start:end]]
 
-        # process list of segment tuples (vect, vect)
-        p1 = ocl.Point(sp[0], sp[1], 0)  # start point of arc
-        p2 = ocl.Point(ep[0], ep[1], 0)  # end point of arc
-        C = ocl.Point(cp[0], cp[1], 0)  # center point of arc
-        ao = ocl.Arc(p1, p2, C, cMode)  # arc object
-        path.append(ao)  # add the arc to the path
-        pdc.setPath(path)
-        pdc.run()  # run dropcutter algorithm on path
-        CLP = pdc.getCLPoints()
+        return [
+            [FreeCAD.Vector(x, y, z) for (x, y, z) in points]
+            for points in _runScans(scanBatch, len(scans))
+        ]
+
+    def _planarDropCutScan(self, pdc, A, B):
+        return [FreeCAD.Vector(x, y, z) for (x, y, z) in _dropCutScan(pdc, (A, B))]
 
+    def _planarCircularDropCutScan(self, pdc, Arc, cMode):
         # Convert OCL object data to FreeCAD vectors
-        return [FreeCAD.Vector(p.x, p.y, p.z) for p in CLP]
+        return [
+            FreeCAD.Vector(x, y, z) for (x, y, z) in _dropCutScan(pdc, (Arc, cMode))
+        ]
 
     # Main planar scan functions
     def _planarDropCutSingle(self, JOB, obj, pdc, safePDC, depthparams, SCANDATA):
@@ -2021,9 +2119,80 @@ class ObjectSurface(PathOp.ObjectOp):
                         },
                     )
                 )
+            else:
+                (coPlanar, cmds) = self._fitArcsG2G3(LN, tolrnc)
 
         return (coPlanar, cmds)
 
+    def _fitArcsG2G3(self, LN, tolrnc):
+        """_fitArcsG2G3(LN, tolrnc) ... Convert the horizontal runs of a circular
+        scan that is not coplanar as a whole into G2/G3 arcs around the pattern center,
+        with G1 moves between them. The arc direction follows the points of the run.
+        Returns False if there is no run to convert."""
+        pnts = numpy.array([(p.x, p.y, p.z) for p in LN], dtype=float)
+        hghts = pnts[:, 2].tolist()
+        radii = numpy.hypot(
+            pnts[:, 0] - self.tmpCOM.x, pnts[:, 1] - self.tmpCOM.y
+        ).tolist()
+        numPts = len(LN)
+
+        # Find runs of at least three points at the height and radius of their start
+        runs = []
+        strt = 0
+        while strt < numPts - 2:
+            end = strt
+            while (
+                end + 1 < numPts
+                and abs(hghts[end + 1] - hghts[strt]) <= tolrnc
+                and abs(radii[end + 1] - radii[strt]) <= tolrnc
+            ):
+                end += 1
+            if end - strt >= 2:
+                runs.append((strt, end))
+                strt = end
+            else:
+                strt += 1
+        if not runs:
+            return (False, [])
+
+        cmds = []
+        nxt = 0  # next point to move to
+        for strt, end in runs:
+            for pnt in LN[nxt : strt + 1]:
+                cmds.append(
+                    Path.Command(
+                        "G1", {"X": pnt.x, "Y": pnt.y, "Z": pnt.z, "F": self.horizFeed}
+                    )
+                )
+            ijk = self.tmpCOM.sub(LN[strt])  # vector from start to center
+            xyz = LN[end]
+            # counterclockwise around the center if the cross products are positive
+            rel = pnts[strt : end + 1, :2] - (self.tmpCOM.x, self.tmpCOM.y)
+            turn = (rel[:-1, 0] * rel[1:, 1] - rel[:-1, 1] * rel[1:, 0]).sum()
+            cmds.append(
+                Path.Command(
+                    "G3" if turn > 0.0 else "G2",
+                    {
+                        "X": xyz.x,
+                        "Y": xyz.y,
+                        "Z": xyz.z,
+                        "I": ijk.x,
+                        "J": ijk.y,
+                        "K": ijk.z,  # leave same xyz.z height
+                        "F": self.horizFeed,
+                    },
+                )
+            )
+            nxt = end + 1
+        for pnt in LN[nxt:]:
+            cmds.append(
+                Path.Command(
+                    "G1", {"X": pnt.x, "Y": pnt.y, "Z": pnt.z, "F": self.horizFeed}
+                )
+            )
+
+        return (True, cmds)
+
     def _planarApplyDepthOffset(self, SCANDATA, DepthOffset):
         Path.Log.debug("Applying DepthOffset value: {}".format(DepthOffset))
         lenScans = len(SCANDATA)
@@ -2037,8 +2206,16 @@ class ObjectSurface(PathOp.ObjectOp):
                     for pt in range(0, numPts):
                         SCANDATA[s][prt][pt].z += DepthOffset
 
-    def _planarGetPDC(self, stl, finalDep, SampleInterval, cutter):
-        pdc = ocl.PathDropCutter()  # create a pdc [PathDropCutter] object
+    def _planarGetPDC(
+        self, stl, finalDep, SampleInterval, cutter, minSampleInterval=0.0
+    ):
+        if 0.0 < minSampleInterval < SampleInterval:
+            # sample at SampleInterval and subdivide down to minSampleInterval
+            # only where the cutter location height changes
+            pdc = ocl.AdaptivePathDropCutter()
+            pdc.setMinSampling(minSampleInterval)
+        else:
+            pdc = ocl.PathDropCutter()  # create a pdc [PathDropCutter] object
         pdc.setSTL(stl)  # add stl model
         pdc.setCutter(cutter)  # add cutter
         pdc.setZ(finalDep)  # set minimumZ (final / target depth value)
@@ -2318,9 +2495,7 @@ class ObjectSurface(PathOp.ObjectOp):
         self, obj, stl, advances, xmin, ymin, xmax, ymax, layDep, sample
     ):
         cutterOfst = 0.0
-        iCnt = 0
-        Lines = []
-        result = None
+        scans = []
 
         pdc = ocl.PathDropCutter()  # create a pdc
         pdc.setCutter(self.cutter)
@@ -2332,65 +2507,69 @@ class ObjectSurface(PathOp.ObjectOp):
             cutterOfst = layDep * math.sin(math.radians(obj.CutterTilt))
             Path.Log.debug("CutterTilt: cutterOfst is " + str(cutterOfst))
 
-        sumAdv = 0.0
-        for adv in advances:
-            sumAdv += adv
-            if adv > 0.0:
-                # Rotate STL object using OCL method
-                radsRot = math.radians(adv)
-                if obj.RotationAxis == "X":
-                    stl.rotate(radsRot, 0.0, 0.0)
-                else:
-                    stl.rotate(0.0, radsRot, 0.0)
-
-            # Set STL after rotation is made
-            pdc.setSTL(stl)
-
-            # add Line objects to the path in this loop
-            if obj.RotationAxis == "X":
-                p1 = ocl.Point(xmin, cutterOfst, 0.0)  # start-point of line
-                p2 = ocl.Point(xmax, cutterOfst, 0.0)  # end-point of line
-            else:
-                p1 = ocl.Point(cutterOfst, ymin, 0.0)  # start-point of line
-                p2 = ocl.Point(cutterOfst, ymax, 0.0)  # end-point of line
+        # add Line objects to the path for each advance
+        if obj.RotationAxis == "X":
+            p1 = (xmin, cutterOfst)  # start-point of line
+            p2 = (xmax, cutterOfst)  # end-point of line
+        else:
+            p1 = (cutterOfst, ymin)  # start-point of line
+            p2 = (cutterOfst, ymax)  # end-point of line
 
+        for iCnt in range(len(advances)):
             # Create line object
             if obj.RotationAxis == obj.DropCutterDir:  # parallel cut
                 if obj.CutPattern == "ZigZag":
                     if iCnt % 2 == 0.0:  # even
-                        lo = ocl.Line(p1, p2)
+                        scans.append((p1, p2))
                     else:  # odd
-                        lo = ocl.Line(p2, p1)
+                        scans.append((p2, p1))
                 elif obj.CutPattern == "Line":
                     if self.CutClimb is True:
-                        lo = ocl.Line(p2, p1)
+                        scans.append((p2, p1))
                     else:
-                        lo = ocl.Line(p1, p2)
+                        scans.append((p1, p2))
                 else:
                     # default to line-object
-                    lo = ocl.Line(p1, p2)
+                    scans.append((p1, p2))
             else:
-                lo = ocl.Line(p1, p2)  # line-object
-
-            path = ocl.Path()  # create an empty path object
-            path.append(lo)  # add the line to the path
-            pdc.setPath(path)  # set path
-            pdc.run()  # run drop-cutter on the path
-            result = pdc.getCLPoints()  # request the list of points
+                scans.append((p1, p2))
+
+        # the STL is rotated by the advances in order, in each worker process
+        # up to the first scan line of its batch
+        rotated = [0]
+
+        def rotateTo(count):
+            while rotated[0] < count:
+                adv = advances[rotated[0]]
+                if adv > 0.0:
+                    # Rotate STL object using OCL method
+                    radsRot = math.radians(adv)
+                    if obj.RotationAxis == "X":
+                        stl.rotate(radsRot, 0.0, 0.0)
+                    else:
+                        stl.rotate(0.0, radsRot, 0.0)
+                rotated[0] += 1
+
+        def scanBatch(start, end):
+            result = []
+            for i in range(start, end):
+                rotateTo(i + 1)
+                # Set STL after rotation is made
+                pdc.setSTL(stl)
+                result.append(_dropCutScan(pdc, scans[i]))
+            return result
 
-            # Convert list of OCL objects to list of Vectors for faster access and Apply depth offset
-            if obj.DepthOffset.Value != 0.0:
-                Lines.append(
-                    [
-                        FreeCAD.Vector(p.x, p.y, p.z + obj.DepthOffset.Value)
-                        for p in result
-                    ]
-                )
-            else:
-                Lines.append([FreeCAD.Vector(p.x, p.y, p.z) for p in result])
+        Lines = []
+        depthOffset = obj.DepthOffset.Value
+        for result in _runScans(scanBatch, len(scans)):
+            # Convert list of OCL points to list of Vectors for faster access and Apply depth offset
+            Lines.append(
+                [FreeCAD.Vector(x, y, z + depthOffset) for (x, y, z) in result]
+            )
 
-            iCnt += 1
-        # End loop
+        # Scans run in worker processes leave the STL here unrotated
+        rotateTo(len(advances))
+        sumAdv = sum(advances)
 
         # Rotate STL object back to original position using OCL method
         reset = -1 * math.radians(sumAdv - self.resetTolerance)
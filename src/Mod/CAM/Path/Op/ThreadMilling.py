@@ -26,6 +26,7 @@ import Path
 import Path.Base.Generator.threadmilling as threadmilling
 import Path.Op.Base as PathOp
 import Path.Op.CircularHoleBase as PathCircularHoleBase
+import PathScripts.PathUtils as PathUtils
 import math
 from PySide.QtCore import QT_TRANSLATE_NOOP
 
@@ -492,6 +493,12 @@ class ObjectThreadMilling(PathCircularHoleBase.ObjectOp):
                 Path.Log.error("Cannot create thread with pitch {}".format(pitch))
                 return
 
+            timeBudget = Path.Preferences.holeOrderTimeBudget()
+            if timeBudget > 0:
+                holes = PathUtils.sort_locations(
+                    holes, ["x", "y"], time_budget=timeBudget
+                )
+
             # rapid to clearance height
             for loc in holes:
                 self.executeThreadMill(
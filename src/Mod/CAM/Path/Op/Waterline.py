@@ -525,7 +525,6 @@ class ObjectWaterline(PathOp.ObjectOp):
         obj.setEditorMode("AvoidLastX_InternalFeatures", hide)
         obj.setEditorMode("BoundaryAdjustment", hide)
         obj.setEditorMode("HandleMultipleFeatures", hide)
-        obj.setEditorMode("OptimizeLinearPaths", hide)
         obj.setEditorMode("OptimizeStepOverTransitions", hide)
         obj.setEditorMode("GapThreshold", hide)
         obj.setEditorMode("GapSizes", hide)
@@ -576,6 +575,12 @@ class ObjectWaterline(PathOp.ObjectOp):
         self.initOpProperties(obj, warn=True)
         self.opApplyPropertyDefaults(obj, job, self.addNewProps)
 
+        # OptimizeLinearPaths was hidden and unused before it simplified the loops,
+        # the loops of these documents stay unchanged until it is enabled
+        hidden = "Hidden" in obj.getEditorMode("OptimizeLinearPaths")
+        if hidden or "OptimizeLinearPaths" in self.addNewProps:
+            obj.OptimizeLinearPaths = False
+
         mode = 2 if Path.Log.getLevel(Path.Log.thisModule()) != 4 else 0
         obj.setEditorMode("ShowTempObjects", mode)
 
@@ -1688,11 +1693,11 @@ class ObjectWaterline(PathOp.ObjectOp):
         # generate the path commands
         output = []
 
-        # prev = FreeCAD.Vector(2135984513.165, -58351896873.17455, 13838638431.861)
-        nxt = FreeCAD.Vector(0.0, 0.0, 0.0)
-
-        # Create first point
-        pnt = FreeCAD.Vector(loop[0].x, loop[0].y, layDep)
+        # Create loop points at layer depth
+        pnts = [FreeCAD.Vector(p.x, p.y, layDep) for p in loop]
+        if obj.OptimizeLinearPaths:
+            pnts = PathUtils.simplify3dLine(pnts, tolerance=obj.LinearDeflection.Value)
+        pnt = pnts[0]
 
         # Position cutter to begin loop
         output.append(
@@ -1703,22 +1708,12 @@ class ObjectWaterline(PathOp.ObjectOp):
         )
         output.append(Path.Command("G1", {"Z": pnt.z, "F": self.vertFeed}))
 
-        lenCLP = len(loop)
-        lastIdx = lenCLP - 1
         # Cycle through each point on loop
-        for i in range(0, lenCLP):
-            if i < lastIdx:
-                nxt.x = loop[i + 1].x
-                nxt.y = loop[i + 1].y
-                nxt.z = layDep
-
+        for pnt in pnts:
             output.append(
                 Path.Command("G1", {"X": pnt.x, "Y": pnt.y, "F": self.horizFeed})
             )
 
-            # Rotate point data
-            pnt = nxt
-
         # Save layer end point for use in transitioning to next layer
         self.layerEndPnt = pnt
 
@@ -27,7 +27,10 @@ from importlib import reload
 import FreeCAD
 import Path
 import Path.Base.Util as PathUtil
+import contextlib
 import importlib.util
+import io
+import multiprocessing
 import os
 import sys
 import re
@@ -49,6 +52,23 @@ class _TempObject:
     Label = "Fixture"
 
 
+# post processor and sections of a parallel export, inherited by the forked workers
+_parallelExport = None
+
+
+def _exportSection(index):
+    """Post process one section in a forked worker.
+    Returns the G-code and the output of the post."""
+    post, postables = _parallelExport
+    partname, sublist = postables[index]
+    # the worker must not open the G-code editor or write to the GUI
+    FreeCAD.GuiUp = False
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+        gcode = post.exportSection(sublist)
+    return gcode, output.getvalue()
+
+
 class PostProcessorFactory:
     """Factory class for creating post processors."""
 
@@ -317,17 +337,64 @@ class WrapperPost(PostProcessor):
         self._tooltip = getattr(self.script_module, "TOOLTIP", "No tooltip provided")
         self._tooltipargs = getattr(self.script_module, "TOOLTIP_ARGS", [])
 
+    def exportSection(self, sublist):
+        return self.script_module.export(sublist, "-", self._job.PostProcessorArgs)
+
+    def parallelExportable(self):
+        """parallelExportable() ... True if the sections can be exported in parallel.
+        A script carrying state from one section to the next must be exported
+        serially, thus it has to declare its sections independent by setting
+        PARALLEL_EXPORT = True. Line numbers continue across the sections, they are
+        never exported in parallel."""
+        if not getattr(self.script_module, "PARALLEL_EXPORT", False):
+            return False
+        args = self._job.PostProcessorArgs or ""
+        return not (
+            getattr(self.script_module, "OUTPUT_LINE_NUMBERS", False)
+            or "--line-numbers" in args.split()
+        )
+
     def export(self):
         # Dynamically reload the module for the export to ensure up-to-date usage
 
         postables = self._buildPostList()
         Path.Log.debug(f"postables count: {len(postables)}")
 
+        processes = min(Path.Preferences.postProcessorProcesses(), len(postables))
+        if processes > 1 and self.parallelExportable() and PathUtil.forkAvailable():
+            return self._exportParallel(postables, processes)
+        return self._exportSerial(postables)
+
+    def _exportSerial(self, postables):
         g_code_sections = []
         for idx, section in enumerate(postables):
             partname, sublist = section
 
-            gcode = self.script_module.export(sublist, "-", self._job.PostProcessorArgs)
+            gcode = self.exportSection(sublist)
+            Path.Log.debug(f"Exported {partname}")
+            g_code_sections.append((partname, gcode))
+        return g_code_sections
+
+    def _exportParallel(self, postables, processes):
+        """Post process the sections in forked worker processes.
+        The sections are returned in the order of the post list."""
+        global _parallelExport
+
+        Path.Log.debug(
+            f"Exporting {len(postables)} sections with {processes} processes"
+        )
+        _parallelExport = (self, postables)
+        try:
+            context = multiprocessing.get_context("fork")
+            with context.Pool(processes) as pool:
+                results = pool.map(_exportSection, range(len(postables)))
+        finally:
+            _parallelExport = None
+
+        g_code_sections = []
+        for (partname, sublist), (gcode, output) in zip(postables, results):
+            if output:
+                print(output, end="")
             Path.Log.debug(f"Exported {partname}")
             g_code_sections.append((partname, gcode))
         return g_code_sections
@@ -28,7 +28,7 @@
 # ***************************************************************************
 
 import re
-from typing import Any, Callable, Dict, List, Tuple, Union
+from typing import Any, Callable, Dict, List, Set, Tuple, Union
 
 import FreeCAD
 from FreeCAD import Units
@@ -43,6 +43,7 @@ PathParameters = Dict[str, PathParameter]
 Values = Dict[str, Any]
 
 ParameterFunction = Callable[[Values, str, str, PathParameter, PathParameters], str]
+CompiledParameterFunction = Callable[[str, PathParameter, PathParameters], str]
 
 
 def check_for_an_adaptive_op(
@@ -89,7 +90,7 @@ def check_for_drill_translate(
                 + format_command_line(values, command_line)
                 + values["COMMAND_SPACE"],
             )
-            gcode += f"{linenumber(values)}{comment}{nl}"
+            gcode.append(f"{linenumber(values)}{comment}{nl}")
         # wrap this block to ensure that the value of values["MOTION_MODE"]
         # is restored in case of error
         try:
@@ -124,7 +125,7 @@ def check_for_machine_specific_commands(
         if m:
             raw_command = m.group(1)
             # pass literally to the controller
-            gcode += f"{linenumber(values)}{raw_command}{nl}"
+            gcode.append(f"{linenumber(values)}{raw_command}{nl}")
 
 
 def check_for_spindle_wait(
@@ -135,9 +136,11 @@ def check_for_spindle_wait(
     nl: str = "\n"
 
     if values["SPINDLE_WAIT"] > 0 and command in ("M3", "M03", "M4", "M04"):
-        gcode += f"{linenumber(values)}{format_command_line(values, command_line)}{nl}"
+        gcode.append(
+            f"{linenumber(values)}{format_command_line(values, command_line)}{nl}"
+        )
         cmd = format_command_line(values, ["G4", f'P{values["SPINDLE_WAIT"]}'])
-        gcode += f"{linenumber(values)}{cmd}{nl}"
+        gcode.append(f"{linenumber(values)}{cmd}{nl}")
 
 
 def check_for_suppressed_commands(
@@ -156,7 +159,7 @@ def check_for_suppressed_commands(
                 + format_command_line(values, command_line)
                 + values["COMMAND_SPACE"],
             )
-            gcode += f"{linenumber(values)}{comment}{nl}"
+            gcode.append(f"{linenumber(values)}{comment}{nl}")
         # remove the command
         return True
     return False
@@ -170,7 +173,7 @@ def check_for_tlo(
 
     if command in ("M6", "M06") and values["USE_TLO"]:
         cmd = format_command_line(values, ["G43", f'H{str(int(params["T"]))}'])
-        gcode += f"{linenumber(values)}{cmd}{nl}"
+        gcode.append(f"{linenumber(values)}{cmd}{nl}")
 
 
 def check_for_tool_change(
@@ -182,13 +185,13 @@ def check_for_tool_change(
     if command in ("M6", "M06"):
         if values["OUTPUT_COMMENTS"]:
             comment = create_comment(values, "Begin toolchange")
-            gcode += f"{linenumber(values)}{comment}{nl}"
+            gcode.append(f"{linenumber(values)}{comment}{nl}")
         if values["OUTPUT_TOOL_CHANGE"]:
             if values["STOP_SPINDLE_FOR_TOOL_CHANGE"]:
                 # stop the spindle
-                gcode += f"{linenumber(values)}M5{nl}"
+                gcode.append(f"{linenumber(values)}M5{nl}")
             for line in values["TOOL_CHANGE"].splitlines(False):
-                gcode += f"{linenumber(values)}{line}{nl}"
+                gcode.append(f"{linenumber(values)}{line}{nl}")
         elif values["OUTPUT_COMMENTS"]:
             # convert the tool change to a comment
             comment = create_comment(
@@ -197,11 +200,98 @@ def check_for_tool_change(
                 + format_command_line(values, command_line)
                 + values["COMMAND_SPACE"],
             )
-            gcode += f"{linenumber(values)}{comment}{nl}"
+            gcode.append(f"{linenumber(values)}{comment}{nl}")
             return True
     return False
 
 
+def compile_parameter_functions(
+    values: Values,
+) -> List[Tuple[str, CompiledParameterFunction]]:
+    """Compile the parameter functions in PARAMETER_ORDER for the current values.
+
+    The units and number formats are looked up once.  The default parameter
+    functions are replaced by functions producing the same text, parameter
+    functions set by a postprocessor are called as they are.
+    """
+    axis_format: str = f'.{str(values["AXIS_PRECISION"])}f'
+    # Quantity.getValueAs divides by the value of the unit
+    axis_unit: float = Units.Quantity(values["UNIT_FORMAT"]).Value
+    feed_format: str = f'.{str(values["FEED_PRECISION"])}f'
+    feed_unit: float = Units.Quantity(values["UNIT_SPEED_FORMAT"]).Value
+    output_doubles: bool = values["OUTPUT_DOUBLES"]
+    parameter: str
+    parameter_functions: List[Tuple[str, CompiledParameterFunction]] = []
+    rapid_moves = values["RAPID_MOVES"]
+    spindle_format: str = f'.{str(values["SPINDLE_DECIMALS"])}f'
+
+    def axis_parameter(param: str) -> CompiledParameterFunction:
+        def function(
+            command: str,  # pylint: disable=unused-argument
+            param_value: PathParameter,
+            current_location: PathParameters,
+        ) -> str:
+            if (
+                not output_doubles
+                and param in current_location
+                and current_location[param] == param_value
+            ):
+                return ""
+            return format(float(param_value / axis_unit), axis_format)
+
+        return function
+
+    def F_parameter(param: str) -> CompiledParameterFunction:
+        def function(
+            command: str, param_value: PathParameter, current_location: PathParameters
+        ) -> str:
+            if (
+                not output_doubles
+                and param in current_location
+                and current_location[param] == param_value
+            ):
+                return ""
+            if command in rapid_moves:
+                return ""
+            feed = param_value / feed_unit
+            if feed <= 0.0:
+                return ""
+            return format(float(feed), feed_format)
+
+        return function
+
+    def int_parameter(param: str) -> CompiledParameterFunction:
+        return lambda command, param_value, current_location: str(int(param_value))
+
+    def length_parameter(param: str) -> CompiledParameterFunction:
+        return lambda command, param_value, current_location: format(
+            float(param_value / axis_unit), axis_format
+        )
+
+    def S_parameter(param: str) -> CompiledParameterFunction:
+        return lambda command, param_value, current_location: format(
+            float(param_value), spindle_format
+        )
+
+    def other_parameter(param: str) -> CompiledParameterFunction:
+        return lambda command, param_value, current_location: values[
+            "PARAMETER_FUNCTIONS"
+        ][param](values, command, param, param_value, current_location)
+
+    compiled_functions = {
+        default_axis_parameter: axis_parameter,
+        default_F_parameter: F_parameter,
+        default_int_parameter: int_parameter,
+        default_length_parameter: length_parameter,
+        default_S_parameter: S_parameter,
+    }
+    for parameter in values["PARAMETER_ORDER"]:
+        function = values["PARAMETER_FUNCTIONS"].get(parameter)
+        compile_function = compiled_functions.get(function, other_parameter)
+        parameter_functions.append((parameter, compile_function(parameter)))
+    return parameter_functions
+
+
 def create_comment(values: Values, comment_string: str) -> str:
     """Create a comment from a string using the correct comment symbol."""
     if values["COMMENT_SYMBOL"] == "(":
@@ -625,7 +715,7 @@ def parse_a_group(values: Values, gcode: Gcode, pathobj) -> None:
     if hasattr(pathobj, "Group"):  # We have a compound or project.
         if values["OUTPUT_COMMENTS"]:
             comment = create_comment(values, f"Compound: {pathobj.Label}")
-            gcode += f"{linenumber(values)}{comment}{nl}"
+            gcode.append(f"{linenumber(values)}{comment}{nl}")
         for p in pathobj.Group:
             parse_a_group(values, gcode, p)
     else:  # parsing simple path
@@ -634,101 +724,115 @@ def parse_a_group(values: Values, gcode: Gcode, pathobj) -> None:
             return
         if values["OUTPUT_PATH_LABELS"] and values["OUTPUT_COMMENTS"]:
             comment = create_comment(values, f"Path: {pathobj.Label}")
-            gcode += f"{linenumber(values)}{comment}{nl}"
+            gcode.append(f"{linenumber(values)}{comment}{nl}")
         parse_a_path(values, gcode, pathobj)
 
 
 def parse_a_path(values: Values, gcode: Gcode, pathobj) -> None:
     """Parse a simple Path."""
+    adaptive: bool
     adaptive_op_variables: Tuple[bool, float, float]
     cmd: str
     command: str
     command_line: CommandLine
+    command_space: str = values["COMMAND_SPACE"]
     current_location: PathParameters = {}  # keep track for no doubles
     drill_retract_mode: str = "G98"
     lastcommand: str = ""
+    modal: bool = values["MODAL"]
+    motion_commands = values["MOTION_COMMANDS"]
     motion_location: PathParameters = {}  # keep track of last motion location
     nl: str = "\n"
+    output_comments: bool = values["OUTPUT_COMMENTS"]
     parameter: str
+    parameter_functions: List[Tuple[str, CompiledParameterFunction]]
     parameter_value: str
+    params: PathParameters
+    special_commands: Set[str]
 
     current_location.update(
         Path.Command("G0", {"X": -1, "Y": -1, "Z": -1, "F": 0.0}).Parameters
     )
     adaptive_op_variables = determine_adaptive_op(values, pathobj)
+    adaptive = values["OUTPUT_ADAPTIVE"] and adaptive_op_variables[0]
+    parameter_functions = compile_parameter_functions(values)
+    # the commands which may need more than their own output line
+    special_commands = {"M6", "M06"}
+    special_commands.update(values["SUPPRESS_COMMANDS"])
+    if values["SPINDLE_WAIT"] > 0:
+        special_commands.update(("M3", "M03", "M4", "M04"))
+    if values["TRANSLATE_DRILL_CYCLES"]:
+        special_commands.update(values["DRILL_CYCLES_TO_TRANSLATE"])
 
     for c in pathobj.Path.Commands:
         command = c.Name
+        params = c.Parameters
         command_line = []
 
         # Modify the command name if necessary
         if command[0] == "(":
-            if not values["OUTPUT_COMMENTS"]:
+            if not output_comments:
                 continue
             if values["COMMENT_SYMBOL"] != "(" and len(command) > 2:
                 command = create_comment(values, command[1:-1])
-        cmd = check_for_an_adaptive_op(
-            values, command, command_line, adaptive_op_variables
-        )
-        if cmd:
-            command = cmd
+        if adaptive:
+            cmd = check_for_an_adaptive_op(
+                values, command, command_line, adaptive_op_variables
+            )
+            if cmd:
+                command = cmd
         # Add the command name to the command line
         command_line.append(command)
         # if modal: suppress the command if it is the same as the last one
-        if values["MODAL"] and command == lastcommand:
+        if modal and command == lastcommand:
             command_line.pop(0)
 
         # Now add the remaining parameters in order
-        for parameter in values["PARAMETER_ORDER"]:
-            if parameter in c.Parameters:
-                parameter_value = values["PARAMETER_FUNCTIONS"][parameter](
-                    values,
-                    command,
-                    parameter,
-                    c.Parameters[parameter],
-                    current_location,
-                )
+        for parameter, function in parameter_functions:
+            if parameter in params:
+                parameter_value = function(command, params[parameter], current_location)
                 if parameter_value:
                     command_line.append(f"{parameter}{parameter_value}")
 
-        set_adaptive_op_speed(
-            values, command, command_line, c.Parameters, adaptive_op_variables
-        )
+        if adaptive:
+            set_adaptive_op_speed(
+                values, command, command_line, params, adaptive_op_variables
+            )
         # Remember the current command
         lastcommand = command
         # Remember the current location
-        current_location.update(c.Parameters)
+        current_location.update(params)
         if command in ("G90", "G91"):
             # Remember the motion mode
             values["MOTION_MODE"] = command
         elif command in ("G98", "G99"):
             # Remember the drill retract mode for drill_translate
             drill_retract_mode = command
-        if command in values["MOTION_COMMANDS"]:
+        if command in motion_commands:
             # Remember the current location for drill_translate
-            motion_location.update(c.Parameters)
-        if check_for_drill_translate(
-            values,
-            gcode,
-            command,
-            command_line,
-            c.Parameters,
-            motion_location,
-            drill_retract_mode,
-        ):
-            command_line = []
-        check_for_spindle_wait(values, gcode, command, command_line)
-        if check_for_tool_change(values, gcode, command, command_line):
-            command_line = []
-        if check_for_suppressed_commands(values, gcode, command, command_line):
-            command_line = []
+            motion_location.update(params)
+        if command in special_commands or command[0] == "(":
+            if check_for_drill_translate(
+                values,
+                gcode,
+                command,
+                command_line,
+                params,
+                motion_location,
+                drill_retract_mode,
+            ):
+                command_line = []
+            check_for_spindle_wait(values, gcode, command, command_line)
+            if check_for_tool_change(values, gcode, command, command_line):
+                command_line = []
+            if check_for_suppressed_commands(values, gcode, command, command_line):
+                command_line = []
         # Add a line number to the front and a newline to the end of the command line
         if command_line:
-            gcode += (
-                f"{linenumber(values)}{format_command_line(values, command_line)}{nl}"
-            )
-        check_for_tlo(values, gcode, command, c.Parameters)
-        check_for_machine_specific_commands(values, gcode, command)
+            gcode.append(f"{linenumber(values)}{command_space.join(command_line)}{nl}")
+        if command in special_commands or command[0] == "(":
+            check_for_tlo(values, gcode, command, params)
+            check_for_machine_specific_commands(values, gcode, command)
 
 
 def set_adaptive_op_speed(
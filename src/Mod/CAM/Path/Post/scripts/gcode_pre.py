@@ -33,7 +33,9 @@ preserved. It is up to the user to create and assign appropriate tool
 controllers.
 
 Only gcodes that are supported by Path are imported. Thus things like G43
-are suppressed.
+are suppressed. The file is read line by line while the modal state of the
+program is tracked: lines with axis words only, inch units and incremental
+distances are imported as complete moves in absolute metric coordinates.
 
 Importing gcode is inherently dangerous because context cannot be safely
 assumed. The user should carefully examine the resulting gcode!
@@ -44,6 +46,7 @@ from GCode.
 
 import FreeCAD
 import Path
+import Path.Base.MachineState as PathMachineState
 import PathScripts.PathUtils as PathUtils
 import os
 import re
@@ -117,64 +120,187 @@ def _isImportEnvironmentReady():
     return True
 
 
-def parse(inputstring):
-    "parse(inputstring): returns a parsed output string"
+# comments and G-code words of a line
+_comment = re.compile(r"\([^)]*\)|;.*")
+_word = re.compile(r"([A-Z])\s*([-+]?(?:\d+\.?\d*|\.\d+))")
 
-    supported = [
-        "G0",
-        "G00",
-        "G1",
-        "G01",
-        "G2",
-        "G02",
-        "G3",
-        "G03",
-        "G81",
-        "G82",
-        "G83",
-        "G90",
-        "G91",
-    ]
-
-    axis = ["X", "Y", "Z", "A", "B", "C", "U", "V", "W"]
+_motion = Path.Geom.CmdMoveAll
+_linear = ["X", "Y", "Z", "I", "J", "K", "R", "Q"]
+_axis = ["X", "Y", "Z", "A", "B", "C", "U", "V", "W"]
 
-    FreeCAD.Console.PrintMessage("preprocessing...\n")
-    Path.Log.track(inputstring)
-    # split the input by line
-    lines = inputstring.splitlines()
-    output = []
-    lastcommand = None
 
-    for lin in lines:
-        # remove any leftover trailing and preceding spaces
-        lin = lin.strip()
+def _code(letter, value):
+    """_code(letter, value) ... normalized name of a G or M word, G01 -> G1."""
+    number = float(value)
+    if number == int(number):
+        return letter + str(int(number))
+    return letter + str(number)
 
-        # discard empty lines
-        if not lin:
-            continue
 
-        # remove line numbers
-        if lin[0].upper() in ["N"]:
-            lin = lin.split(" ", 1)
-            if len(lin) >= 1:
-                lin = lin[1].strip()
-            else:
-                continue
+class GcodeImporter:
+    """GcodeImporter ... streaming tokenizer of G-code lines.
 
-        # Anything else not a G/M code or an axis move is ignored.
-        if lin[0] not in ["G", "M", "X", "Y", "Z", "A", "B", "C", "U", "V", "W"]:
-            continue
+    The lines are translated one at a time into Path commands. The modal state
+    of the program (motion mode, canned cycle words, units, absolute/incremental
+    distances, arc plane, feed, spindle and coolant) is tracked so that moves which
+    only repeat axis words, inch programs and incremental moves are imported as
+    complete absolute metric commands. Position, feed, spindle and tool are tracked
+    in a Path.Base.MachineState. Feeds are converted from units per minute to
+    Path's internal mm/s."""
 
-        # if the remaining line is supported, store it
-        currcommand = lin.split()[0]
+    def __init__(self):
+        self.machine = PathMachineState.MachineState()
+        self.motion = None
+        self.cycle = {}
+        self.plane = "G17"
+        self.retract = None
+        self.incremental = False
+        self.scale = 1.0
+        self.coolant = "M9"
+        self.tool = None
+        self.toolChange = False
+
+    def _emit(self, commands, name, params):
+        command = Path.Command(name, params)
+        self.machine.addCommand(command)
+        commands.append(command)
+
+    def _move(self, commands, params):
+        """Emit a move of the current motion mode with absolute metric coordinates."""
+        machine = self.machine
+        move = {}
+        for letter in _axis + ["I", "J", "K", "R", "Q", "P"]:
+            if letter in params:
+                move[letter] = params[letter]
+                if letter in _linear:
+                    move[letter] *= self.scale
+
+        if self.motion in Path.Geom.CmdMoveDrill:
+            # the cycle words are modal, R is relative to the initial level and
+            # Z to the R level in incremental mode
+            cycle = {letter: move[letter] for letter in "ZRQP" if letter in move}
+            if self.incremental:
+                if "R" in cycle:
+                    cycle["R"] += machine.Z
+                if "Z" in cycle:
+                    cycle["Z"] += cycle.get("R", self.cycle.get("R", machine.Z))
+            self.cycle.update(cycle)
+            move.update(self.cycle)
+            relative = ["X", "Y"]
+        else:
+            relative = ["X", "Y", "Z", "A", "B", "C"]
+
+        if self.incremental:
+            for letter in relative:
+                if letter in move:
+                    move[letter] += getattr(machine, letter)
+
+        if self.motion not in Path.Geom.CmdMoveRapid and machine.F:
+            move["F"] = machine.F
+        self._emit(commands, self.motion, move)
+
+    def parseLine(self, line):
+        """parseLine(line) ... returns the list of Path commands of a G-code line.
+        A tool change on the line is recorded in tool and toolChange."""
+        commands = []
+        words = _word.findall(_comment.sub("", line.upper()))
+        if not words:
+            return commands
+
+        gcodes = []
+        mcodes = []
+        params = {}
+        for letter, value in words:
+            if letter == "G":
+                gcodes.append(_code("G", value))
+            elif letter == "M":
+                mcodes.append(_code("M", value))
+            elif letter != "N":
+                params[letter] = float(value)
+
+        # units apply to the words of their own line
+        if "G20" in gcodes or "G21" in gcodes:
+            self.scale = 25.4 if "G20" in gcodes else 1.0
+        if "T" in params:
+            self.tool = int(params["T"])
+        if "F" in params:
+            # G-code feeds are per minute, Path feeds are per second
+            self.machine.F = params["F"] * self.scale / 60.0
+        if "S" in params:
+            self.machine.S = params["S"]
+
+        move = True
+        for name in gcodes:
+            if name in ["G90", "G91"]:
+                self.incremental = name == "G91"
+            elif name in ["G17", "G18", "G19"]:
+                if name != self.plane:
+                    self.plane = name
+                    self._emit(commands, name, {})
+            elif name in ["G98", "G99"]:
+                if name != self.retract:
+                    self.retract = name
+                    self._emit(commands, name, {})
+            elif name in ["G28", "G30", "G53"]:
+                # moves in machine coordinates can't be imported
+                move = False
+            elif name in self.machine.WCSLIST:
+                self._emit(commands, name, {})
+            elif name == "G80":
+                self.motion = None
+                self.cycle = {}
+                self._emit(commands, name, {})
+            elif name == "G4" and "P" in params:
+                self._emit(commands, name, {"P": params.pop("P")})
+                move = False
+            elif name in _motion:
+                if name != self.motion:
+                    self.cycle = {}
+                self.motion = name
+            # anything else, like tool length offsets, is not imported
+
+        for name in mcodes:
+            if name == "M6":
+                self.toolChange = True
+            elif name in ["M3", "M4"]:
+                self._emit(commands, name, {"S": self.machine.S})
+            elif name == "M5":
+                self._emit(commands, name, {})
+            elif name in ["M7", "M8", "M9"]:
+                if name != self.coolant:
+                    self.coolant = name
+                    self._emit(commands, name, {})
+
+        if move and self.motion and any(letter in params for letter in _axis):
+            self._move(commands, params)
+        return commands
+
+    def sections(self, lines):
+        """sections(lines) ... generator of (gcode, toolnumber) tuples of the lines,
+        split on tool changes. Only one section is held in memory at a time."""
+        toolnumber = 0
+        gcode = []
+        for line in lines:
+            commands = self.parseLine(line)
+            if self.toolChange:
+                self.toolChange = False
+                if gcode:
+                    yield (gcode, toolnumber)
+                gcode = []
+                toolnumber = self.tool if self.tool is not None else 0
+            gcode.extend(command.toGCode() for command in commands)
+        if gcode:
+            yield (gcode, toolnumber)
 
-        if currcommand in supported:
-            output.append(lin)
-            lastcommand = currcommand
 
-        # modal commands have no G or M but have axis moves. append those too.
-        elif currcommand[0] in axis and lastcommand:
-            output.append(lastcommand + " " + lin)
+def parse(inputstring):
+    "parse(inputstring): returns a parsed output string"
+
+    FreeCAD.Console.PrintMessage("preprocessing...\n")
+    Path.Log.track(inputstring)
+    output = []
+    for gcode, toolnumber in GcodeImporter().sections(inputstring.splitlines()):
+        output.extend(gcode)
 
     FreeCAD.Console.PrintMessage("done preprocessing.\n")
     return output
@@ -183,35 +309,10 @@ def parse(inputstring):
 def _identifygcodeByToolNumberList(filename):
     """called when freecad imports a file"""
     Path.Log.track(filename)
-    gcodeByToolNumberList = []
-
-    gfile = pyopen(filename)
-    gcode = gfile.read()
-    gfile.close()
-
-    # Regular expression to match tool changes in the format 'M6 Tn'
-    p = re.compile("[mM]+?\s?0?6\s?T\d*\s")
-
-    # split the gcode on tool changes
-    paths = re.split("([mM]+?\s?0?6\s?T\d*\s)", gcode)
-
-    # iterate the gcode sections and add customs for each
-    toolnumber = 0
-
-    for path in paths:
-
-        # if the section is a tool change, extract the tool number
-        m = p.match(path)
-        if m:
-            toolnumber = int(m.group().split("T")[-1])
-            continue
-
-        # Parse the gcode and throw away any empty lists
-        gcode = parse(path)
-        if len(gcode) > 0:
-            gcodeByToolNumberList.append((gcode, toolnumber))
 
-    return gcodeByToolNumberList
+    # stream the file, sections are returned as they are complete
+    with pyopen(filename) as gfile:
+        yield from GcodeImporter().sections(gfile)
 
 
 def insert(filename, docname=None):
@@ -99,6 +99,7 @@ OUTPUT_DOUBLES = (
 )
 COMMAND_SPACE = " "
 LINENR = 100  # line number starting value
+PARALLEL_EXPORT = True  # split output sections don't depend on each other
 
 # These globals will be reflected in the Machine configuration of the project
 UNITS = "G21"  # G21 for metric, G20 for us standard
@@ -43,6 +43,7 @@ PostProcessorDefaultArgs = "PostProcessorDefaultArgs"
 PostProcessorBlacklist = "PostProcessorBlacklist"
 PostProcessorOutputFile = "PostProcessorOutputFile"
 PostProcessorOutputPolicy = "PostProcessorOutputPolicy"
+PostProcessorProcesses = "PostProcessorProcesses"
 
 LastPathToolBit = "LastPathToolBit"
 LastPathToolLibrary = "LastPathToolLibrary"
@@ -68,6 +69,10 @@ WarningSuppressVelocity = "WarningSuppressVelocity"
 EnableExperimentalFeatures = "EnableExperimentalFeatures"
 EnableAdvancedOCLFeatures = "EnableAdvancedOCLFeatures"
 
+HoleOrderTimeBudget = "HoleOrderTimeBudget"
+OclScanProcesses = "OclScanProcesses"
+AdaptiveProcesses = "AdaptiveProcesses"
+
 
 def preferences():
     return FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/CAM")
@@ -233,6 +238,38 @@ def defaultOutputPolicy():
     return pref.GetString(PostProcessorOutputPolicy, "")
 
 
+def postProcessorProcesses():
+    return preferences().GetInt(PostProcessorProcesses, 1)
+
+
+def setPostProcessorProcesses(processes):
+    preferences().SetInt(PostProcessorProcesses, processes)
+
+
+def holeOrderTimeBudget():
+    return preferences().GetFloat(HoleOrderTimeBudget, 0.0)
+
+
+def setHoleOrderTimeBudget(seconds):
+    preferences().SetFloat(HoleOrderTimeBudget, seconds)
+
+
+def oclScanProcesses():
+    return preferences().GetInt(OclScanProcesses, 1)
+
+
+def setOclScanProcesses(processes):
+    preferences().SetInt(OclScanProcesses, processes)
+
+
+def adaptiveProcesses():
+    return preferences().GetInt(AdaptiveProcesses, 1)
+
+
+def setAdaptiveProcesses(processes):
+    preferences().SetInt(AdaptiveProcesses, processes)
+
+
 def defaultStockTemplate():
     return preferences().GetString(DefaultStockTemplate, "")
 
@@ -24,6 +24,7 @@ import FreeCAD
 import Path
 import Path.Base.Util as PathUtil
 import Path.Base.PropertyBag as PathPropertyBag
+import Path.Tool.Catalogue as PathToolCatalogue
 import json
 import os
 import zipfile
@@ -63,23 +64,8 @@ def _findToolFile(name, containerFile, typ):
         paths = []
     paths.extend(Path.Preferences.searchPathsTool(typ))
 
-    def _findFile(path, name):
-        Path.Log.track(path, name)
-        fullPath = os.path.join(path, name)
-        if os.path.exists(fullPath):
-            return (True, fullPath)
-        for root, ds, fs in os.walk(path):
-            for d in ds:
-                found, fullPath = _findFile(d, name)
-                if found:
-                    return (True, fullPath)
-        return (False, None)
-
-    for p in paths:
-        found, path = _findFile(p, name)
-        if found:
-            return path
-    return None
+    # the catalogue only touches the disk for directories which changed
+    return PathToolCatalogue.catalogue().find(name, paths)
 
 
 def findToolShape(name, path=None):
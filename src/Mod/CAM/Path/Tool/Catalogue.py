@@ -0,0 +1,333 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *   Copyright (c) 2024 FreeCAD Project Association                        *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+import FreeCAD
+import Path
+import collections
+import contextlib
+import json
+import os
+
+__title__ = "Tool bit catalogue."
+__author__ = "FreeCAD Project Association"
+__url__ = "https://www.freecad.org"
+__doc__ = "Persistent index of tool bit, shape and library files."
+
+if False:
+    Path.Log.setLevel(Path.Log.Level.DEBUG, Path.Log.thisModule())
+    Path.Log.trackModule(Path.Log.thisModule())
+else:
+    Path.Log.setLevel(Path.Log.Level.INFO, Path.Log.thisModule())
+
+
+CatalogueVersion = 1
+
+
+def _toFloat(value):
+    if value is None:
+        return None
+    try:
+        return FreeCAD.Units.Quantity(value).Value
+    except (TypeError, ValueError):
+        return None
+
+
+def _material(attrs):
+    for group in ["parameter", "attribute"]:
+        value = attrs.get(group, {}).get("Material")
+        if value:
+            return str(value)
+    return None
+
+
+class Catalogue(object):
+    """Catalogue(path) ... index of the tool files in a set of directories.
+
+    Directory listings are cached with the mtime of the directory, tool bit
+    declarations with the mtime and size of their file. Nothing is read
+    from disk again as long as those don't change, which is what makes
+    large libraries on slow network shares usable. The index is stored as
+    a compact JSON file at path, if given, and survives FreeCAD sessions.
+    It is written after every lookup which changed it, or only once at the
+    end of a batch() of lookups.
+
+    find() uses an index of the file names below each search path, kept for
+    the session. It is validated against the directory mtimes once per
+    batch, outside of a batch only if it has no existing file for a name."""
+
+    def __init__(self, path=None):
+        self.path = path
+        self.dirs = {}
+        self.bits = {}
+        self.dirty = False
+        self.batchDepth = 0
+        self.names = {}
+        self.checked = set()
+        if path:
+            self._load()
+
+    def _load(self):
+        try:
+            with open(self.path) as fp:
+                data = json.load(fp)
+        except (OSError, ValueError) as e:
+            Path.Log.debug("no tool catalogue loaded from {}: {}".format(self.path, e))
+            return
+        if data.get("version") != CatalogueVersion:
+            Path.Log.info("discarding outdated tool catalogue {}".format(self.path))
+            return
+        self.dirs = data.get("dirs", {})
+        self.bits = data.get("bits", {})
+
+    def save(self):
+        """save() ... write the index back to disk if anything changed."""
+        if not self.dirty or not self.path:
+            return
+        data = {"version": CatalogueVersion, "dirs": self.dirs, "bits": self.bits}
+        tmp = "{}.{}".format(self.path, os.getpid())
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(tmp, "w") as fp:
+                json.dump(data, fp, separators=(",", ":"))
+            os.replace(tmp, self.path)
+            self.dirty = False
+        except OSError as e:
+            Path.Log.warning(
+                "Could not save tool catalogue {}: {}".format(self.path, e)
+            )
+
+    @contextlib.contextmanager
+    def batch(self):
+        """batch() ... context manager, the index is saved once when it is left."""
+        self.batchDepth += 1
+        try:
+            yield self
+        finally:
+            self.batchDepth -= 1
+            if self.batchDepth == 0:
+                self.checked.clear()
+            self._autoSave()
+
+    def _autoSave(self):
+        if self.batchDepth == 0:
+            self.save()
+
+    def directory(self, path):
+        """directory(path) ... return (subdirs, files) of path or None."""
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            if self.dirs.pop(path, None) is not None:
+                self.dirty = True
+            return None
+
+        entry = self.dirs.get(path)
+        if entry is None or entry["mtime"] != mtime:
+            Path.Log.debug("scanning {}".format(path))
+            dirs = []
+            files = []
+            try:
+                with os.scandir(path) as it:
+                    for e in it:
+                        if e.is_dir():
+                            dirs.append(e.name)
+                        else:
+                            files.append(e.name)
+            except OSError as e:
+                Path.Log.warning("Could not scan {}: {}".format(path, e))
+                return None
+            entry = {"mtime": mtime, "dirs": sorted(dirs), "files": sorted(files)}
+            self.dirs[path] = entry
+            self.dirty = True
+        return (entry["dirs"], entry["files"])
+
+    def walk(self, path):
+        """walk(path) ... yield (dir, files) for path and all directories below it."""
+        queue = collections.deque([path])
+        while queue:
+            d = queue.popleft()
+            listing = self.directory(d)
+            if listing is not None:
+                yield (d, listing[1])
+                queue.extend(os.path.join(d, sub) for sub in listing[0])
+
+    def _index(self, path):
+        """_index(path) ... name index of path, rebuilt if a directory changed."""
+        mtimes = {d: self.dirs[d]["mtime"] for d, files in self.walk(path)}
+        index = self.names.get(path)
+        if index is None or index["mtimes"] != mtimes:
+            files = {}
+            for d in mtimes:
+                for f in self.dirs[d]["files"]:
+                    files.setdefault(f, os.path.join(d, f))
+            index = {"mtimes": mtimes, "files": files}
+            self.names[path] = index
+        return index
+
+    def _lookup(self, name, path):
+        index = self.names.get(path)
+        if index is not None:
+            found = index["files"].get(name)
+            if path in self.checked:
+                return found
+            if found and self.batchDepth == 0 and os.path.isfile(found):
+                return found
+        index = self._index(path)
+        if self.batchDepth:
+            self.checked.add(path)
+        return index["files"].get(name)
+
+    def find(self, name, paths):
+        """find(name, paths) ... return first file called name in or below paths.
+        name can be relative to a path, including subdirectories."""
+        Path.Log.track(name, paths)
+        found = None
+        for p in paths:
+            if os.path.dirname(name):
+                path = os.path.join(p, name)
+                found = path if os.path.isfile(path) else None
+            else:
+                found = self._lookup(name, p)
+            if found:
+                break
+        self._autoSave()
+        return found
+
+    def files(self, path, ext, recursive=False):
+        """files(path, ext, recursive=False) ... sorted files ending in ext."""
+        if recursive:
+            listings = self.walk(path)
+        else:
+            listing = self.directory(path)
+            listings = [(path, listing[1])] if listing else []
+        result = []
+        for d, files in listings:
+            result.extend(os.path.join(d, f) for f in files if f.endswith(ext))
+        self._autoSave()
+        return sorted(result)
+
+    def _bit(self, path):
+        st = os.stat(path)
+        entry = self.bits.get(path)
+        if (
+            entry is None
+            or entry["mtime"] != st.st_mtime_ns
+            or entry["size"] != st.st_size
+        ):
+            with open(path) as fp:
+                attrs = json.load(fp)
+            params = attrs.get("parameter", {})
+            entry = {
+                "mtime": st.st_mtime_ns,
+                "size": st.st_size,
+                "attrs": attrs,
+                "diameter": _toFloat(params.get("Diameter")),
+                "material": _material(attrs),
+            }
+            self.bits[path] = entry
+            self.dirty = True
+        return entry
+
+    def declaration(self, path):
+        """declaration(path) ... return the parsed tool bit file, like Bit.Declaration.
+        The returned dictionary is shared with the catalogue and must not be modified.
+        """
+        return self._bit(path)["attrs"]
+
+    def query(self, paths, name=None, diameter=None, material=None, tolerance=1e-6):
+        """query(paths, name, diameter, material, tolerance) ... matching tool bits.
+        name matches case insensitive anywhere in the tool's name or file name,
+        diameter is compared in mm within tolerance and material has to match the
+        Material parameter or attribute of the tool bit.
+        """
+        Path.Log.track(paths, name, diameter, material)
+        if name:
+            name = name.lower()
+        if material:
+            material = material.lower()
+        result = []
+        seen = set()
+        for p in paths:
+            for d, files in self.walk(p):
+                for f in files:
+                    path = os.path.join(d, f)
+                    if not f.endswith(".fctb") or path in seen:
+                        continue
+                    seen.add(path)
+                    try:
+                        entry = self._bit(path)
+                    except (OSError, ValueError) as e:
+                        Path.Log.warning("Skipping tool bit {}: {}".format(path, e))
+                        continue
+                    if name and not (
+                        name in f.lower()
+                        or name in str(entry["attrs"].get("name", "")).lower()
+                    ):
+                        continue
+                    if diameter is not None and (
+                        entry["diameter"] is None
+                        or abs(entry["diameter"] - diameter) > tolerance
+                    ):
+                        continue
+                    if material and (entry["material"] or "").lower() != material:
+                        continue
+                    result.append(path)
+        self._autoSave()
+        return result
+
+    def prune(self):
+        """prune() ... drop all entries of files and directories which are gone."""
+        for path in [p for p in self.bits if not os.path.isfile(p)]:
+            del self.bits[path]
+            self.dirty = True
+        for path in [p for p in self.dirs if not os.path.isdir(p)]:
+            del self.dirs[path]
+            self.dirty = True
+        self.save()
+
+
+_catalogue = None
+
+
+def catalogueFile():
+    return os.path.join(FreeCAD.getUserCachePath(), "CAM", "ToolCatalogue.json")
+
+
+def catalogue():
+    """catalogue() ... return the shared tool catalogue of this session."""
+    global _catalogue
+    if _catalogue is None:
+        _catalogue = Catalogue(catalogueFile())
+    return _catalogue
+
+
+def queryToolBits(name=None, diameter=None, material=None, paths=None):
+    """queryToolBits(name, diameter, material, paths) ... matching tool bit files.
+    If no paths are given the last used tool bit directory and the default tool bits
+    are searched.
+    """
+    if paths is None:
+        paths = [Path.Preferences.lastPathToolBit()]
+        paths.extend(
+            p for p in Path.Preferences.searchPathsTool("Bit") if p not in paths
+        )
+    return catalogue().query(paths, name, diameter, material)
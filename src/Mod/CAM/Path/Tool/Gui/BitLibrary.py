@@ -26,6 +26,7 @@ import FreeCAD
 import FreeCADGui
 import Path
 import Path.Tool.Bit as PathToolBit
+import Path.Tool.Catalogue as PathToolCatalogue
 import Path.Tool.Gui.Bit as PathToolBitGui
 import Path.Tool.Gui.BitEdit as PathToolBitEdit
 import Path.Tool.Gui.Controller as PathToolControllerGui
@@ -256,8 +257,7 @@ class ModelFactory:
         path = Path.Preferences.lastPathToolLibrary()
 
         if os.path.isdir(path):  # opening all tables in a directory
-            libFiles = [f for f in glob.glob(path + os.path.sep + "*.fctl")]
-            libFiles.sort()
+            libFiles = PathToolCatalogue.catalogue().files(path, ".fctl")
             for libFile in libFiles:
                 loc, fnlong = os.path.split(libFile)
                 fn, ext = os.path.splitext(fnlong)
@@ -282,19 +282,24 @@ class ModelFactory:
             Path.Log.error(f"Failed to load library from {path}: {e}")
             return
 
-        for tool_bit in library.get("tools", []):
-            try:
-                nr = tool_bit["nr"]
-                bit = PathToolBit.findToolBit(tool_bit["path"], path)
-                if bit:
-                    Path.Log.track(bit)
-                    tool = PathToolBit.Declaration(bit)
-                    data_model.appendRow(ModelFactory._tool_add(nr, tool, bit))
-                else:
-                    Path.Log.error(f"Could not find tool #{nr}: {tool_bit['path']}")
-            except Exception as e:
-                msg = f"Error loading tool: {tool_bit['path']} : {e}"
-                FreeCAD.Console.PrintError(msg)
+        # tool bits are read through the catalogue, shape files are not opened
+        # until a bit is actually used and its body loaded
+        # the catalogue is saved once after all tool bits are loaded
+        catalogue = PathToolCatalogue.catalogue()
+        with catalogue.batch():
+            for tool_bit in library.get("tools", []):
+                try:
+                    nr = tool_bit["nr"]
+                    bit = PathToolBit.findToolBit(tool_bit["path"], path)
+                    if bit:
+                        Path.Log.track(bit)
+                        tool = catalogue.declaration(bit)
+                        data_model.appendRow(ModelFactory._tool_add(nr, tool, bit))
+                    else:
+                        Path.Log.error(f"Could not find tool #{nr}: {tool_bit['path']}")
+                except Exception as e:
+                    msg = f"Error loading tool: {tool_bit['path']} : {e}"
+                    FreeCAD.Console.PrintError(msg)
 
     @staticmethod
     def _generate_tooltip(toolbit: dict) -> str:
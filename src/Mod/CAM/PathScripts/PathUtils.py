@@ -26,7 +26,10 @@ from FreeCAD import Vector
 from PySide import QtCore
 import Path
 import Path.Main.Job as PathJob
+import collections
 import math
+import numpy
+import time
 from numpy import linspace
 
 # lazily loaded modules
@@ -453,58 +456,227 @@ def addToJob(obj, jobname=None):
     return job
 
 
-def sort_locations(locations, keys, attractors=None):
+def sort_locations(locations, keys, attractors=None, time_budget=0.0):
     """sort holes by the nearest neighbor method
     keys: two-element list of keys for X and Y coordinates. for example ['x','y']
+    attractors: keys whose absolute values are added to the distance, default [keys[0]]
+    time_budget: seconds to improve the order as travelling salesman tour, 0 disables
     originally written by m0n5t3r for PathHelix
     """
-    from queue import PriorityQueue
-    from collections import defaultdict
+    if not locations:
+        return []
 
     if attractors is None:
         attractors = []
 
     attractors = attractors or [keys[0]]
 
-    def sqdist(a, b):
-        """square Euclidean distance"""
-        d = 0
-        for k in keys:
-            d += (a[k] - b[k]) ** 2
+    coords = numpy.array([[loc[k] for k in keys] for loc in locations], dtype=float)
+    weight = numpy.array(
+        [sum(abs(loc[k]) for k in attractors) for loc in locations], dtype=float
+    )
 
-        return d
+    def closest(location, columns, weight):
+        # square Euclidean distance plus the weight of the attractors
+        d = numpy.zeros(len(weight))
+        for column, value in zip(columns, location):
+            d += (column - value) ** 2
+        # argmin returns the first of equal values, ties keep the order of locations
+        return int(numpy.argmin(d + weight))
+
+    # the first location is the one closest to the origin
+    first = closest(numpy.zeros(len(keys)), coords.T, weight)
+
+    order = [first]
+    remaining = numpy.arange(len(locations))
+    columns = [numpy.ascontiguousarray(c) for c in coords.T]
+    weight[first] = numpy.inf
+    visited = 1
+    for _ in range(len(locations) - 1):
+        if 2 * visited > len(remaining):
+            # drop the visited locations
+            keep = numpy.isfinite(weight)
+            remaining = remaining[keep]
+            columns = [c[keep] for c in columns]
+            weight = weight[keep]
+            visited = 0
+        i = closest(coords[order[-1]], columns, weight)
+        order.append(int(remaining[i]))
+        weight[i] = numpy.inf
+        visited += 1
+
+    if time_budget > 0 and len(locations) > 2:
+        order = _sort_locations_tsp(coords[:, :2], order, time_budget)
+
+    return [locations[i] for i in order]
+
+
+def locations_distance(locations, keys):
+    """returns the length of the straight moves along the sorted locations"""
+    return sum(
+        math.hypot(*[b[k] - a[k] for k in keys])
+        for a, b in zip(locations, locations[1:])
+    )
 
-    def weight(location):
-        w = 0
 
-        for k in attractors:
-            w += abs(location[k])
+class _LocationGrid:
+    """grid of square cells for the neighbour search of 2D points"""
+
+    def __init__(self, coords, points_per_cell=2.0):
+        self.coords = coords
+        lo = coords.min(axis=0)
+        span = coords.max(axis=0) - lo
+        count = len(coords)
+        size = math.sqrt(span[0] * span[1] * points_per_cell / count)
+        self.size = max(size, max(span) * points_per_cell / count, 1e-6)
+        self.origin = lo
+        self.cells = {}
+        for i, cell in enumerate(self.cellOf(coords)):
+            self.cells.setdefault(cell, []).append(i)
+
+    def cellOf(self, points):
+        cells = numpy.floor((points - self.origin) / self.size).astype(int)
+        return [tuple(c) for c in cells.tolist()]
+
+    def neighbours(self, count):
+        """approximately the count closest points of every point, sorted by distance"""
+        result = []
+        cells = self.cellOf(self.coords)
+        for i, (cx, cy) in enumerate(cells):
+            candidates = [
+                j
+                for x in (cx - 1, cx, cx + 1)
+                for y in (cy - 1, cy, cy + 1)
+                for j in self.cells.get((x, y), ())
+                if j != i
+            ]
+            d = numpy.hypot(*(self.coords[candidates] - self.coords[i]).T)
+            closest = numpy.argsort(d)[:count]
+            result.append([candidates[j] for j in closest])
+        return result
 
-        return w
 
-    def find_closest(location_list, location, dist):
-        q = PriorityQueue()
+def _sort_locations_tsp(coords, order, time_budget):
+    """returns the indices of coords as short open tour with the start of order.
+    The tour of order is improved with 2-opt and Or-opt moves until no
+    improvement is found or the time budget is used up."""
+    deadline = time.monotonic() + time_budget
+    count = len(coords)
+    pts = coords.tolist()
 
-        for i, j in enumerate(location_list):
-            # prevent dictionary comparison by inserting the index
-            q.put((dist(j, location) + weight(j), i, j))
+    def dist(a, b):
+        return math.hypot(pts[a][0] - pts[b][0], pts[a][1] - pts[b][1])
 
-        prio, i, result = q.get()
+    def length(tour):
+        return sum(dist(a, b) for a, b in zip(tour, tour[1:]))
 
-        return result
+    neighbours = _LocationGrid(coords).neighbours(8)
+    tour = numpy.array(order)
+    pos = numpy.empty(count, dtype=int)
+    pos[tour] = numpy.arange(count)
 
-    out = []
-    zero = defaultdict(lambda: 0)
+    def reverse(i, j):
+        tour[i : j + 1] = tour[i : j + 1][::-1].copy()
+        pos[tour[i : j + 1]] = numpy.arange(i, j + 1)
 
-    out.append(find_closest(locations, zero, sqdist))
-    locations.remove(out[-1])
+    def two_opt(a):
+        """try to replace an edge of a and an edge of a neighbour c by (a, c)"""
+        i = pos[a]
+        for step in (1, -1):
+            if not 0 <= i + step < count:
+                continue
+            b = tour[i + step]
+            dab = dist(a, b)
+            for c in neighbours[a]:
+                dac = dist(a, c)
+                if dac >= dab:
+                    break
+                j = pos[c]
+                if j + step == count or j + step < 0:
+                    if step < 0:
+                        # the start of the tour stays in place
+                        continue
+                    # c is the end of the tour, b becomes the end
+                    gain = dab - dac
+                    d = None
+                else:
+                    d = tour[j + step]
+                    if d == a or c == b:
+                        continue
+                    gain = dab + dist(c, d) - dac - dist(b, d)
+                if gain > Path.Geom.Tolerance:
+                    if step > 0 and j > i:
+                        reverse(i + 1, j)
+                    elif step > 0:
+                        reverse(j + 1, i)
+                    elif j < i:
+                        reverse(j, i - 1)
+                    else:
+                        reverse(i, j - 1)
+                    return [a, b, c] + ([] if d is None else [d])
+        return None
 
-    while locations:
-        closest = find_closest(locations, out[-1], sqdist)
-        out.append(closest)
-        locations.remove(closest)
+    def or_opt(a):
+        """try to move a segment of up to 3 locations starting at a next to a neighbour"""
+        i = pos[a]
+        if i == 0:
+            return None
+        for length in (1, 2, 3):
+            if i + length > count:
+                break
+            seg = tour[i : i + length].tolist()
+            p = tour[i - 1]
+            n = tour[i + length] if i + length < count else None
+            removed = dist(p, seg[0])
+            if n is not None:
+                removed += dist(seg[-1], n) - dist(p, n)
+            for end, other in ((seg[0], seg[-1]), (seg[-1], seg[0])):
+                for c in neighbours[end]:
+                    j = pos[c]
+                    if i - 1 <= j < i + length:
+                        continue
+                    dce = dist(c, end)
+                    if dce >= removed:
+                        break
+                    # insert the segment after c with end next to c
+                    e = tour[j + 1] if j + 1 < count else None
+                    added = dce
+                    if e is not None:
+                        added += dist(other, e) - dist(c, e)
+                    if removed - added > Path.Geom.Tolerance:
+                        rest = numpy.concatenate((tour[:i], tour[i + length :]))
+                        k = int(numpy.nonzero(rest == c)[0][0]) + 1
+                        moved = seg if end == seg[0] else seg[::-1]
+                        tour[:] = numpy.concatenate((rest[:k], moved, rest[k:]))
+                        pos[tour] = numpy.arange(count)
+                        return [a, p, c] + seg + [x for x in (n, e) if x is not None]
+        return None
 
-    return out
+    # don't look bits, only locations next to a change are checked again
+    queue = collections.deque(tour.tolist())
+    active = numpy.ones(count, dtype=bool)
+    while queue and time.monotonic() < deadline:
+        a = queue.popleft()
+        active[a] = False
+        changed = two_opt(a) or or_opt(a)
+        if changed:
+            for x in changed:
+                if not active[x]:
+                    active[x] = True
+                    queue.append(x)
+
+    tour = tour.tolist()
+    initial = length(order)
+    improved = length(tour)
+    if improved > initial:
+        # every move shortens the tour, this only guards against rounding
+        tour, improved = list(order), initial
+    Path.Log.info(
+        "Sorted {} locations, travel distance {:.2f} instead of {:.2f}".format(
+            count, improved, initial
+        )
+    )
+    return tour
 
 
 def guessDepths(objshape, subs=None):
@@ -770,7 +942,9 @@ def simplify3dLine(line, tolerance=1e-4):
     """Simplify a line defined by a list of App.Vectors, while keeping the
     maximum deviation from the original line within the defined tolerance.
     Implementation of
-    https://en.wikipedia.org/wiki/Ramer%E2%80%93Douglas%E2%80%93Peucker_algorithm"""
+    https://en.wikipedia.org/wiki/Ramer%E2%80%93Douglas%E2%80%93Peucker_algorithm
+    The distances of a range are computed at once on a NumPy copy of the points."""
+    points = numpy.array([(v.x, v.y, v.z) for v in line], dtype=float)
     stack = [(0, len(line) - 1)]
     results = []
 
@@ -780,17 +954,20 @@ def simplify3dLine(line, tolerance=1e-4):
         if end - start < 2:
             results.extend(line[start:end])
             return
-        # Find point with maximum distance
-        maxIndex, maxDistance = 0, 0.0
-        startPoint, endPoint = (line[start], line[end])
-        for i in range(start + 1, end):
-            v = line[i]
-            distance = v.distanceToLineSegment(startPoint, endPoint).Length
-            if distance > maxDistance:
-                maxDistance = distance
-                maxIndex = i
-        if maxDistance > tolerance:
+        # Find point with maximum distance to the segment, same as
+        # Vector.distanceToLineSegment()
+        startPoint = points[start]
+        segment = points[end] - startPoint
+        offsets = points[start + 1 : end] - startPoint
+        length2 = segment.dot(segment)
+        if length2 > 0:
+            t = numpy.clip(offsets.dot(segment) / length2, 0.0, 1.0)
+            offsets = offsets - t[:, None] * segment
+        distances = numpy.einsum("ij,ij->i", offsets, offsets)
+        maxIndex = int(distances.argmax())
+        if distances[maxIndex] > tolerance * tolerance:
             # Push second branch first, to be executed last
+            maxIndex += start + 1
             stack.append((maxIndex, end))
             stack.append((start, maxIndex))
         else:
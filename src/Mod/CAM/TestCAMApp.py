@@ -53,14 +53,18 @@ from Tests.TestPathPost import TestResolvingPostProcessorName
 from Tests.TestPathPost import TestFileNameGenerator
 
 from Tests.TestPathPreferences import TestPathPreferences
+from Tests.TestPathPreprocessor import TestPathPreprocessor
 from Tests.TestPathProfile import TestPathProfile
 from Tests.TestPathPropertyBag import TestPathPropertyBag
 from Tests.TestPathRotationGenerator import TestPathRotationGenerator
 from Tests.TestPathSetupSheet import TestPathSetupSheet
+from Tests.TestPathSimulator import TestPathSimulator
 from Tests.TestPathStock import TestPathStock
+from Tests.TestPathSurface import TestPathSurface
 from Tests.TestPathThreadMilling import TestPathThreadMilling
 from Tests.TestPathThreadMillingGenerator import TestPathThreadMillingGenerator
 from Tests.TestPathToolBit import TestPathToolBit
+from Tests.TestPathToolCatalogue import TestPathToolCatalogue
 from Tests.TestPathToolChangeGenerator import TestPathToolChangeGenerator
 from Tests.TestPathToolController import TestPathToolController
 from Tests.TestPathUtil import TestPathUtil
@@ -105,14 +109,18 @@ False if TestPostProcessorFactory.__name__ else True
 False if TestResolvingPostProcessorName.__name__ else True
 False if TestPathPostUtils.__name__ else True
 False if TestPathPreferences.__name__ else True
+False if TestPathPreprocessor.__name__ else True
 False if TestPathProfile.__name__ else True
 False if TestPathPropertyBag.__name__ else True
 False if TestPathRotationGenerator.__name__ else True
 False if TestPathSetupSheet.__name__ else True
+False if TestPathSimulator.__name__ else True
 False if TestPathStock.__name__ else True
+False if TestPathSurface.__name__ else True
 False if TestPathThreadMilling.__name__ else True
 False if TestPathThreadMillingGenerator.__name__ else True
 False if TestPathToolBit.__name__ else True
+False if TestPathToolCatalogue.__name__ else True
 False if TestPathToolChangeGenerator.__name__ else True
 False if TestPathToolController.__name__ else True
 False if TestPathUtil.__name__ else True
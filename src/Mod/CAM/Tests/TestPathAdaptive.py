@@ -24,8 +24,11 @@
 
 import FreeCAD
 import Part
+import Path
+import Path.Base.Util
 import Path.Op.Adaptive as PathAdaptive
 import Path.Main.Job as PathJob
+import area
 from Tests.PathTestUtils import PathTestBase
 
 if FreeCAD.GuiUp:
@@ -414,6 +417,118 @@ class TestPathAdaptive(PathTestBase):
                 break
         self.assertTrue(isInBox, "No paths originating within the inner hole.")
 
+    def test08(self):
+        """test08() Verify independent regions are grouped by their boundaries."""
+
+        def square(x, y, size):
+            return [[x, y], [x + size, y], [x + size, y + size], [x, y + size], [x, y]]
+
+        paths = [
+            square(0, 0, 10),
+            square(50, 0, 10),
+            square(2, 2, 3),  # island in first pocket
+            [[50, 0], [60, -20]],  # edge continuing second pocket
+            [],
+            square(12, 0, 10),  # 2mm from first pocket
+        ]
+        self.assertEqual(PathAdaptive._pathGroups(paths, 1.0), [[0, 2], [1, 3], [5]])
+        self.assertEqual(PathAdaptive._pathGroups(paths, 3.0), [[0, 2, 5], [1, 3]])
+
+        # the stock to leave widens the margin, outside operations aren't split
+        inside = area.AdaptiveOperationType.ClearingInside
+        self.assertEqual(len(PathAdaptive._regionGroups(paths, inside, 1.0, 0.0)), 3)
+        self.assertEqual(len(PathAdaptive._regionGroups(paths, inside, 1.0, 1.0)), 2)
+        for opType in (
+            area.AdaptiveOperationType.ClearingOutside,
+            area.AdaptiveOperationType.ProfilingOutside,
+        ):
+            self.assertEqual(
+                PathAdaptive._regionGroups(paths, opType, 1.0, 0.0), [paths]
+            )
+
+    def test09(self):
+        """test09() Verify unchanged regions are reused by their input hash."""
+
+        adaptive = PathAdaptive.Create("Adaptive")
+        adaptive.Base = [(self.doc.Fusion, ["Face3"])]  # (base, subs_list)
+        adaptive.Label = "test09+"
+        adaptive.Comment = "test09() Verify results of unchanged regions are reused."
+        adaptive.FinishingProfile = False
+        adaptive.StepOver = 75
+        adaptive.UseOutline = False
+        adaptive.setExpression("StepDown", None)
+        adaptive.StepDown.Value = 20.0
+
+        _addViewProvider(adaptive)
+        self.doc.recompute()
+        solved = adaptive.AdaptiveOutputState
+        self.assertTrue(solved)
+        self.assertTrue(all(region.get("InputHash") for region in solved))
+
+        # a changed input state re-evaluates all regions, the marked ones are reused
+        adaptive.AdaptiveOutputState = [dict(region, Reused=True) for region in solved]
+        adaptive.AdaptiveInputState = {}
+        adaptive.touch()
+        self.doc.recompute()
+        self.assertTrue(all(r.get("Reused") for r in adaptive.AdaptiveOutputState))
+
+        # regions with a different input hash are solved again
+        adaptive.AdaptiveOutputState = [
+            dict(region, Reused=True, InputHash="stale") for region in solved
+        ]
+        adaptive.AdaptiveInputState = {}
+        adaptive.touch()
+        self.doc.recompute()
+        self.assertEqual(adaptive.AdaptiveOutputState, solved)
+
+    def test10(self):
+        """test10() Verify forked workers solve regions like the serial solver."""
+
+        def square(x, y, size):
+            return [[x, y], [x + size, y], [x + size, y + size], [x, y + size]]
+
+        stock = [square(-10, -10, 90)]
+        groups = [[square(0, 0, 20)], [square(40, 0, 20), square(45, 5, 5)]]
+
+        def solve(index, progress):
+            a2d = area.Adaptive2d()
+            a2d.stepOverFactor = 0.2
+            a2d.toolDiameter = 5.0
+            a2d.helixRampDiameter = 1.0
+            a2d.tolerance = 0.1
+            a2d.opType = area.AdaptiveOperationType.ClearingInside
+            return [
+                {
+                    "HelixCenterPoint": result.HelixCenterPoint,
+                    "StartPoint": result.StartPoint,
+                    "AdaptivePaths": result.AdaptivePaths,
+                    "ReturnMotionType": result.ReturnMotionType,
+                }
+                for result in a2d.Execute(stock, groups[index], progress)
+            ]
+
+        progress = []
+
+        def progressFn(tpaths):
+            progress.append(len(tpaths))
+            return False
+
+        processes = Path.Preferences.adaptiveProcesses()
+        try:
+            Path.Preferences.setAdaptiveProcesses(1)
+            serial = PathAdaptive._solveGroups(solve, len(groups), progressFn)
+            Path.Preferences.setAdaptiveProcesses(2)
+            del progress[:]
+            forked = PathAdaptive._solveGroups(solve, len(groups), progressFn)
+        finally:
+            Path.Preferences.setAdaptiveProcesses(processes)
+
+        self.assertTrue(all(serial))
+        self.assertEqual(forked, serial)
+        if Path.Base.Util.forkAvailable():
+            # every solved region is reported once it comes in
+            self.assertEqual(len([n for n in progress if n]), len(groups))
+
 
 # Eclass
 
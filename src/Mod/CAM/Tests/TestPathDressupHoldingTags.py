@@ -20,6 +20,8 @@
 # *                                                                         *
 # ***************************************************************************
 
+import Part
+import Path.Dressup.Tags as PathDressupTags
 import Tests.PathTestUtils as PathTestUtils
 import math
 
@@ -67,3 +69,25 @@ class TestHoldingTags(PathTestUtils.PathTestBase):
         h = 2.5 * math.tan((60 / 180.0) * math.pi) * 1.01
         print(h)
         self.assertConeAt(tag.solid, Vector(0, 0, -h * 0.01), 2.5, 0, h)
+
+    def test05(self):
+        """Verify tag intersections are filtered by bounding box and cached."""
+        tag = Tag(0, 0, 0, 4, 5, 90, 0, True)
+        tag.createSolidsAt(0, 0)
+        through = Part.Edge(Part.LineSegment(Vector(-10, 0, 1), Vector(10, 0, 1)))
+        away = Part.Edge(Part.LineSegment(Vector(-10, 20, 1), Vector(10, 20, 1)))
+
+        self.assertIsNone(tag.intersects(away, away.FirstParameter))
+        pt = tag.intersects(through, through.FirstParameter)
+        self.assertCoincide(pt, Vector(-2, 0, 1))
+
+        index = PathDressupTags._TagIndex([tag])
+        self.assertEqual(index.candidates(away), set())
+        self.assertEqual(index.candidates(through), {0})
+
+        tag.intersections = PathDressupTags._IntersectionCache()
+        self.assertCoincide(tag.intersects(through, through.FirstParameter), pt)
+        tag.intersections.restart()
+        self.assertEqual(len(tag.intersections.previous), 1)
+        self.assertCoincide(tag.intersects(through, through.FirstParameter), pt)
+        self.assertEqual(len(tag.intersections.current), 1)
@@ -273,3 +273,18 @@ class TestPathDrillable(PathTestUtils.PathTestBase):
 
         results = Drillable.getDrillableTargets(self.obj, ToolDiameter=20, vector=None)
         self.assertEqual(len(results), 5)
+
+    def test21(self):
+        """Test getDrillableTargetsForDiameters"""
+        results = Drillable.getDrillableTargetsForDiameters(
+            self.obj, [None, 20], vector=None
+        )
+        self.assertEqual(len(results[None]), 20)
+        self.assertEqual(len(results[20]), 5)
+        self.assertEqual(
+            results[20], Drillable.getDrillableTargets(self.obj, 20, vector=None)
+        )
+
+        # the analysis is reused as long as the shape doesn't change
+        analysis = Drillable.drillableAnalysis(self.obj)
+        self.assertTrue(analysis is Drillable.drillableAnalysis(self.obj))
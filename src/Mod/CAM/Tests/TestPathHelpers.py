@@ -149,3 +149,61 @@ class TestPathHelpers(PathTestBase):
         l = Part.makeLine(v1, v2)
         results = PathUtils.filterArcs(l)
         self.assertTrue(len(results) == 0)
+
+    def test03(self):
+        """Test PathUtils sort_locations nearest neighbor order"""
+
+        locations = [
+            {"x": 10, "y": 0},
+            {"x": 0, "y": 0},
+            {"x": 5, "y": 0},
+            {"x": 0, "y": 5},
+        ]
+        result = PathUtils.sort_locations(locations, ["x", "y"])
+        self.assertEqual(
+            [(loc["x"], loc["y"]) for loc in result], [(0, 0), (0, 5), (5, 0), (10, 0)]
+        )
+        self.assertEqual(PathUtils.sort_locations([], ["x", "y"]), [])
+
+    def test04(self):
+        """Test PathUtils sort_locations with tour improvement"""
+
+        # a perforated panel, every other row is shifted, and a regular grid
+        panel = [
+            {"x": x * 5 + (y % 2) * 2.5, "y": y * 4.33}
+            for y in range(20)
+            for x in range(40)
+        ]
+        grid = [{"x": x * 5, "y": y * 5} for y in range(20) for x in range(20)]
+        for locations in (panel, grid):
+            greedy = PathUtils.sort_locations(list(locations), ["x", "y"])
+            tour = PathUtils.sort_locations(list(locations), ["x", "y"], time_budget=5)
+
+            self.assertEqual(len(tour), len(locations))
+            self.assertEqual(
+                sorted((loc["x"], loc["y"]) for loc in tour),
+                sorted((loc["x"], loc["y"]) for loc in locations),
+            )
+            self.assertEqual(tour[0], greedy[0])
+            # the tour is never longer than the default order
+            self.assertTrue(
+                PathUtils.locations_distance(tour, ["x", "y"])
+                <= PathUtils.locations_distance(greedy, ["x", "y"])
+            )
+
+    def test05(self):
+        """Test PathUtils simplify3dLine"""
+
+        line = [FreeCAD.Vector(x, 0, 0) for x in range(11)]
+        line.extend(FreeCAD.Vector(10, y, y * 0.00001) for y in range(1, 11))
+        result = PathUtils.simplify3dLine(line, tolerance=0.001)
+        self.assertEqual(len(result), 3)
+        self.assertTrue(result[0] is line[0])
+        self.assertTrue(result[1] is line[10])
+        self.assertTrue(result[2] is line[-1])
+
+        # deviations beyond the tolerance are kept
+        line[15].z = 0.1
+        result = PathUtils.simplify3dLine(line, tolerance=0.001)
+        self.assertTrue(line[15] in result)
+        self.assertEqual(len(PathUtils.simplify3dLine(line[:1])), 1)
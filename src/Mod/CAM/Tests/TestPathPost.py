@@ -410,6 +410,43 @@ class TestPostProcessorClass(unittest.TestCase):
         for sec in sections:
             print(sec[0])
 
+    def test040(self):
+        """Test the parallel export of split output."""
+        processes = Path.Preferences.postProcessorProcesses()
+        splitOutput = self.job.SplitOutput
+        args = self.job.PostProcessorArgs
+        self.job.SplitOutput = True
+
+        def export(processes, postArgs):
+            # a new post for every export, the line numbers continue from the last one
+            self.job.PostProcessorArgs = postArgs
+            Path.Preferences.setPostProcessorProcesses(processes)
+            post = PostProcessorFactory.get_post_processor(self.job, "linuxcnc")
+            return post.export()
+
+        postArgs = "--no-header --no-show-editor"
+        try:
+            serial = export(1, postArgs)
+            parallel = export(4, postArgs)
+            # line numbers continue across the sections, they are exported serially
+            serialNumbered = export(1, postArgs + " --line-numbers")
+            parallelNumbered = export(4, postArgs + " --line-numbers")
+            post = PostProcessorFactory.get_post_processor(self.job, "linuxcnc")
+            self.assertFalse(post.parallelExportable())
+            self.job.PostProcessorArgs = postArgs
+            self.assertTrue(post.parallelExportable())
+            # scripts which don't declare their sections independent aren't parallel
+            post = PostProcessorFactory.get_post_processor(self.job, "grbl")
+            self.assertFalse(post.parallelExportable())
+        finally:
+            Path.Preferences.setPostProcessorProcesses(processes)
+            self.job.SplitOutput = splitOutput
+            self.job.PostProcessorArgs = args
+        self.assertTrue(len(serial) > 1)
+        self.assertEqual(serial, parallel)
+        self.assertNotEqual(serial, serialNumbered)
+        self.assertEqual(serialNumbered, parallelNumbered)
+
 
 # class TestPostProcessorScript(unittest.TestCase):
 #     """Test old-school posts"""
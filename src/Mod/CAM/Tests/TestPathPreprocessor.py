@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *   Copyright (c) 2024 FreeCAD Project Association                        *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+
+from Path.Post.scripts import gcode_pre
+from Tests.PathTestUtils import PathTestBase
+
+
+class TestPathPreprocessor(PathTestBase):
+    """Unit tests for the streaming G-code importer of gcode_pre."""
+
+    def sections(self, gcode):
+        importer = gcode_pre.GcodeImporter()
+        return list(importer.sections(gcode.splitlines()))
+
+    def test00(self):
+        """Verify sections are split on tool changes."""
+        sections = self.sections(
+            "G90\nG0 X1\nT3 M6\nG0 X2\nM6 T4\nG0 X3\nT5\nG0 X4\nM6\nG0 X5\n"
+        )
+        self.assertEqual([tool for gcode, tool in sections], [0, 3, 4, 5])
+        self.assertEqual(sections[2][0], ["G0 X3.000000", "G0 X4.000000"])
+
+    def test01(self):
+        """Verify modal moves and feeds."""
+        sections = self.sections(
+            "N10 G21 G90 G17\nG1 X1 Y2 F600 (cut)\nX3\nG2 X5 Y2 I1 J0\n"
+        )
+        self.assertEqual(len(sections), 1)
+        gcode = sections[0][0]
+        self.assertEqual(len(gcode), 3)
+        self.assertEqual(gcode[1], "G1 F10.000000 X3.000000")
+        self.assertTrue(gcode[2].startswith("G2"))
+
+    def test02(self):
+        """Verify inch and incremental moves are imported absolute metric."""
+        importer = gcode_pre.GcodeImporter()
+        importer.parseLine("G20 G90 G0 X1 Y1")
+        commands = importer.parseLine("G91 G1 X1 F1")
+        self.assertEqual(commands[0].Name, "G1")
+        self.assertRoughly(commands[0].Parameters["X"], 50.8)
+        self.assertRoughly(commands[0].Parameters["F"], 25.4 / 60)
+        self.assertRoughly(importer.machine.Y, 25.4)
+
+    def test03(self):
+        """Verify canned cycle words are modal and machine moves are skipped."""
+        importer = gcode_pre.GcodeImporter()
+        self.assertEqual(importer.parseLine("G53 G0 Z0"), [])
+        importer.parseLine("G90 G0 X0 Y0 Z10")
+        importer.parseLine("G81 X1 Y1 Z-2 R1 F60")
+        commands = importer.parseLine("X2")
+        self.assertEqual(commands[0].Name, "G81")
+        self.assertRoughly(commands[0].Parameters["Z"], -2)
+        self.assertRoughly(commands[0].Parameters["R"], 1)
+        self.assertRoughly(commands[0].Parameters["X"], 2)
+        self.assertEqual(importer.parseLine("G80")[0].Name, "G80")
+        self.assertEqual(importer.parseLine("X3"), [])
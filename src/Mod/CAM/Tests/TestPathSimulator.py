@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *   Copyright (c) 2024 FreeCAD Project Association                        *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+import Part
+import Path
+import Path.Main.Simulator as PathSimulator
+import math
+
+from Tests.PathTestUtils import PathTestBase
+
+
+class TestPathSimulator(PathTestBase):
+    """Unit tests for the headless material removal simulation."""
+
+    def setUp(self):
+        # stock 100 x 50 x 20
+        self.stock = Part.makeBox(100, 50, 20)
+        self.endmill = PathSimulator.ToolProfile(
+            6.0, "endmill", cuttingEdgeHeight=10.0, shankDiameter=6.0
+        )
+
+    def simulate(self, commands, profile, resolution=0.5):
+        heightMap = PathSimulator.HeightMap.fromShape(self.stock, resolution)
+        sim = PathSimulator.Simulation(heightMap, (0.0, 0.0, 30.0))
+        return sim.simulate([Path.Command(*c) for c in commands], profile, "op")
+
+    def test00(self):
+        """Verify tool profiles."""
+        ball = PathSimulator.ToolProfile(6.0, "ballend")
+        h = ball.heights(PathSimulator.numpy.array([0.0, 3.0, 4.0]))
+        self.assertRoughly(h[0], 0.0)
+        self.assertRoughly(h[1], 3.0)
+        self.assertTrue(math.isinf(h[2]))
+
+        vbit = PathSimulator.ToolProfile(
+            10.0, "v-bit", cuttingEdgeAngle=90.0, tipDiameter=2.0
+        )
+        h = vbit.heights(PathSimulator.numpy.array([0.5, 5.0]))
+        self.assertRoughly(h[0], 0.0)
+        self.assertRoughly(h[1], 4.0)
+
+    def test01(self):
+        """Verify the removed volume of a slot through the stock."""
+        sim = self.simulate(
+            [
+                ("G0", {"X": -10, "Y": 25, "Z": 30}),
+                ("G1", {"Z": 15}),
+                ("G1", {"X": 110}),
+                ("G0", {"Z": 30}),
+            ],
+            self.endmill,
+        )
+        self.assertRoughly(sim.removedVolume, 6 * 100 * 5)
+        self.assertEqual(sim.rapidCollisions, [])
+        self.assertEqual(sim.holderGouges, [])
+        x, y, heights = sim.stockHeights()
+        self.assertRoughly(PathSimulator.numpy.nanmin(heights), 15)
+        self.assertRoughly(PathSimulator.numpy.nanmax(heights), 20)
+
+    def test02(self):
+        """Verify rapid moves into the stock are reported."""
+        sim = self.simulate(
+            [("G0", {"X": 50, "Y": 25, "Z": 30}), ("G0", {"Z": 15})], self.endmill
+        )
+        self.assertEqual(len(sim.rapidCollisions), 1)
+        self.assertEqual(sim.rapidCollisions[0]["command"], 1)
+        self.assertRoughly(sim.rapidCollisions[0]["depth"], 5)
+
+    def test03(self):
+        """Verify cuts deeper than the cutting edge are reported as holder gouge."""
+        sim = self.simulate(
+            [
+                ("G0", {"X": -10, "Y": 25, "Z": 30}),
+                ("G1", {"Z": 5}),
+                ("G1", {"X": 50}),
+            ],
+            self.endmill,
+        )
+        self.assertEqual(len(sim.rapidCollisions), 0)
+        self.assertEqual(len(sim.holderGouges), 1)
+        self.assertEqual(sim.holderGouges[0]["command"], 2)
+        self.assertRoughly(sim.holderGouges[0]["depth"], 5)
+
+    def test04(self):
+        """Verify drill cycles through the stock."""
+        drill = PathSimulator.ToolProfile(5.0, "drill", cuttingEdgeAngle=118)
+        sim = self.simulate(
+            [
+                ("G0", {"X": 10, "Y": 10, "Z": 30}),
+                ("G81", {"X": 10, "Y": 10, "Z": -2, "R": 22}),
+                ("G81", {"X": 30, "Y": 10, "Z": -2, "R": 22}),
+                ("G80", {}),
+            ],
+            drill,
+        )
+        self.assertEqual(sim.rapidCollisions, [])
+        self.assertEqual(sim.holderGouges, [])
+        # the height map approximates the holes by cells
+        hole = math.pi * 2.5**2 * 20
+        self.assertTrue(abs(sim.removedVolume - 2 * hole) < 0.1 * 2 * hole)
+
+    def test05(self):
+        """Verify the height map of a stock which is not a box."""
+        self.stock = Part.makeCylinder(20, 10).cut(Part.makeCylinder(5, 10))
+        heightMap = PathSimulator.HeightMap.fromShape(self.stock, 0.25)
+        volume = self.stock.Volume
+        self.assertTrue(abs(heightMap.volume() - volume) < 0.02 * volume)
+        self.assertTrue(PathSimulator.numpy.isnan(heightMap.heights[0, 0]))
+        center = heightMap.heights[len(heightMap.y) // 2, len(heightMap.x) // 2]
+        self.assertTrue(PathSimulator.numpy.isnan(center))
+
+    def test06(self):
+        """Verify the results don't depend on the chunks of tool positions."""
+        commands = [
+            ("G0", {"X": 0, "Y": 0, "Z": 30}),
+            ("G1", {"Z": 15}),
+            ("G1", {"X": 100, "Y": 50}),
+            ("G1", {"Z": 5}),
+            ("G1", {"X": 0, "Y": 50}),
+        ]
+        sim = self.simulate(commands, self.endmill)
+        chunkSize = PathSimulator.ChunkSize
+        try:
+            PathSimulator.ChunkSize = 5000
+            small = self.simulate(commands, self.endmill)
+        finally:
+            PathSimulator.ChunkSize = chunkSize
+        self.assertRoughly(small.removedVolume, sim.removedVolume)
+        self.assertEqual(len(small.holderGouges), 1)
+        self.assertRoughly(small.holderGouges[0]["depth"], sim.holderGouges[0]["depth"])
+        x, y, heights = sim.stockHeights()
+        self.assertTrue((small.stockHeights()[2] == heights).all())
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *   Copyright (c) 2024 FreeCAD Project Association                        *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+import FreeCAD
+import Path
+import Path.Base.Util as PathUtil
+import Tests.PathTestUtils as PathTestUtils
+import math
+import os
+import types
+
+try:
+    import Path.Op.Surface as PathSurface
+except ImportError:
+    PathSurface = None  # OpenCamLib is not installed
+
+
+def waveSurface(size):
+    """Return an ocl.STLSurf of a wavy square surface."""
+    ocl = PathSurface.ocl
+
+    def point(x, y):
+        return ocl.Point(x, y, math.sin(x * 0.3) * math.cos(y * 0.3))
+
+    stl = ocl.STLSurf()
+    for x in range(size):
+        for y in range(size):
+            stl.addTriangle(ocl.Triangle(point(x, y), point(x + 1, y), point(x, y + 1)))
+            stl.addTriangle(
+                ocl.Triangle(point(x + 1, y), point(x + 1, y + 1), point(x, y + 1))
+            )
+    return stl
+
+
+class TestPathSurface(PathTestUtils.PathTestBase):
+    def setUp(self):
+        if PathSurface is None:
+            self.skipTest("OpenCamLib is not installed")
+        self.processes = Path.Preferences.oclScanProcesses()
+
+    def tearDown(self):
+        if PathSurface is not None:
+            Path.Preferences.setOclScanProcesses(self.processes)
+
+    def test00(self):
+        """Verify forked scans return the points of the serial scans in order."""
+        ocl = PathSurface.ocl
+        stl = waveSurface(20)
+        scans = [((0, y * 0.5), (20, y * 0.5)) for y in range(40)]
+        scans.append(((((5, 10), (15, 10), (10, 10)), True)))
+
+        def scanBatch(start, end):
+            pdc = ocl.PathDropCutter()
+            pdc.setSTL(stl)
+            pdc.setCutter(ocl.BallCutter(3.0, 10.0))
+            pdc.setZ(-5.0)
+            pdc.setSampling(0.25)
+            return [
+                (os.getpid(), PathSurface._dropCutScan(pdc, scans[i]))
+                for i in range(start, end)
+            ]
+
+        # the serial scans leave the OpenMP threads of OCL behind, they run last
+        forks = not PathSurface._threadsRunning() and PathUtil.forkAvailable()
+        Path.Preferences.setOclScanProcesses(2)
+        forked = PathSurface._runScans(scanBatch, len(scans))
+        Path.Preferences.setOclScanProcesses(1)
+        serial = PathSurface._runScans(scanBatch, len(scans))
+
+        self.assertEqual(len(forked), len(scans))
+        self.assertEqual([s for pid, s in forked], [s for pid, s in serial])
+        self.assertTrue(all(pid == os.getpid() for pid, s in serial))
+        if forks:
+            self.assertTrue(all(pid != os.getpid() for pid, s in forked))
+
+    def test01(self):
+        """Verify the horizontal runs of a circular scan become arcs around the center."""
+        op = types.SimpleNamespace(tmpCOM=FreeCAD.Vector(10, 5, 0), horizFeed=100)
+
+        def arcPoint(deg, z):
+            a = math.radians(deg)
+            return FreeCAD.Vector(10 + 4 * math.cos(a), 5 + 4 * math.sin(a), z)
+
+        # a counterclockwise quarter arc at z=-1, followed by a step down
+        LN = [arcPoint(deg, -1) for deg in range(0, 91, 15)]
+        LN += [arcPoint(100, -2), arcPoint(110, -3)]
+        (converted, cmds) = PathSurface.ObjectSurface._fitArcsG2G3(op, LN, 0.001)
+
+        self.assertTrue(converted)
+        self.assertEqual([c.Name for c in cmds], ["G1", "G3", "G1", "G1"])
+        self.assertCoincide(FreeCAD.Vector(14, 5, -1), cmds[0].Placement.Base)
+        self.assertCoincide(FreeCAD.Vector(10, 9, -1), cmds[1].Placement.Base)
+        self.assertRoughly(cmds[1].Parameters["I"], -4)
+        self.assertRoughly(cmds[1].Parameters["J"], 0)
+
+        # the same arc the other way around is clockwise
+        LN = [arcPoint(deg, -1) for deg in range(90, -1, -15)] + [arcPoint(-10, -2)]
+        (converted, cmds) = PathSurface.ObjectSurface._fitArcsG2G3(op, LN, 0.001)
+
+        self.assertTrue(converted)
+        self.assertEqual([c.Name for c in cmds], ["G1", "G2", "G1"])
+        self.assertCoincide(FreeCAD.Vector(14, 5, -1), cmds[1].Placement.Base)
+        self.assertRoughly(cmds[1].Parameters["I"], 0)
+        self.assertRoughly(cmds[1].Parameters["J"], -4)
+
+        # no run of three points at one height and radius
+        LN = [arcPoint(0, -1), arcPoint(10, -2), arcPoint(20, -3)]
+        self.assertEqual(
+            PathSurface.ObjectSurface._fitArcsG2G3(op, LN, 0.001), (False, [])
+        )
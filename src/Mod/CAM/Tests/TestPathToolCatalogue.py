@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *   Copyright (c) 2024 FreeCAD Project Association                        *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+import Path.Tool.Catalogue as PathToolCatalogue
+import Tests.PathTestUtils as PathTestUtils
+import json
+import os
+import shutil
+import tempfile
+
+
+def writeBit(path, name, diameter, material=None):
+    params = {"Diameter": "{} mm".format(diameter), "Length": "50.00 mm"}
+    if material:
+        params["Material"] = material
+    attrs = {
+        "version": 2,
+        "name": name,
+        "shape": "endmill.fcstd",
+        "parameter": params,
+        "attribute": {},
+    }
+    with open(path, "w") as fp:
+        json.dump(attrs, fp)
+
+
+def touch(path, delta):
+    """Move the mtime of path by delta seconds, file system timestamps are too coarse
+    to rely on them changing within a test."""
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + int(delta * 1e9)))
+
+
+class TestPathToolCatalogue(PathTestUtils.PathTestBase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.bits = os.path.join(self.dir, "Bit")
+        os.makedirs(os.path.join(self.bits, "metric", "carbide"))
+        writeBit(os.path.join(self.bits, "6mm_Endmill.fctb"), "6mm Endmill", 6)
+        writeBit(
+            os.path.join(self.bits, "metric", "3mm_Endmill.fctb"),
+            "3mm Endmill",
+            3,
+            "HSS",
+        )
+        writeBit(
+            os.path.join(self.bits, "metric", "carbide", "3mm_Ball.fctb"),
+            "3mm Ball End",
+            3,
+            "Carbide",
+        )
+        self.index = os.path.join(self.dir, "cache", "ToolCatalogue.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test00(self):
+        """Verify files are found in nested directories and new files show up."""
+        catalogue = PathToolCatalogue.Catalogue()
+        found = catalogue.find("3mm_Ball.fctb", [self.bits])
+        self.assertEqual(
+            found, os.path.join(self.bits, "metric", "carbide", "3mm_Ball.fctb")
+        )
+        self.assertIsNone(catalogue.find("2mm_Drill.fctb", [self.bits]))
+        self.assertIsNone(catalogue.find("3mm_Ball.fctb", [self.bits + "-missing"]))
+
+        path = os.path.join(self.bits, "metric", "2mm_Drill.fctb")
+        writeBit(path, "2mm Drill", 2)
+        touch(os.path.dirname(path), 1)
+        self.assertEqual(catalogue.find("2mm_Drill.fctb", [self.bits]), path)
+        self.assertEqual(len(catalogue.files(self.bits, ".fctb", recursive=True)), 4)
+        self.assertEqual(len(catalogue.files(self.bits, ".fctb")), 1)
+
+    def test01(self):
+        """Verify the index is persistent and invalidated by the file mtime."""
+        path = os.path.join(self.bits, "6mm_Endmill.fctb")
+        catalogue = PathToolCatalogue.Catalogue(self.index)
+        self.assertEqual(catalogue.declaration(path)["name"], "6mm Endmill")
+        catalogue.save()
+        self.assertTrue(os.path.isfile(self.index))
+
+        # same size and mtime - the stored declaration is still used
+        st = os.stat(path)
+        writeBit(path, "6mm Endmell", 6)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        catalogue = PathToolCatalogue.Catalogue(self.index)
+        self.assertEqual(catalogue.declaration(path)["name"], "6mm Endmill")
+        self.assertFalse(catalogue.dirty)
+
+        touch(path, 1)
+        self.assertEqual(catalogue.declaration(path)["name"], "6mm Endmell")
+        self.assertTrue(catalogue.dirty)
+
+    def test02(self):
+        """Verify tool bit queries."""
+        catalogue = PathToolCatalogue.Catalogue(self.index)
+
+        def query(**kwargs):
+            return sorted(
+                os.path.basename(p) for p in catalogue.query([self.bits], **kwargs)
+            )
+
+        self.assertEqual(len(query()), 3)
+        self.assertEqual(query(diameter=3), ["3mm_Ball.fctb", "3mm_Endmill.fctb"])
+        self.assertEqual(
+            query(name="endmill"), ["3mm_Endmill.fctb", "6mm_Endmill.fctb"]
+        )
+        self.assertEqual(query(name="ball end"), ["3mm_Ball.fctb"])
+        self.assertEqual(query(material="carbide"), ["3mm_Ball.fctb"])
+        self.assertEqual(query(diameter=3, material="hss"), ["3mm_Endmill.fctb"])
+        self.assertEqual(query(diameter=4), [])
+
+    def test03(self):
+        """Verify relative names and that a batch saves the index only once."""
+        catalogue = PathToolCatalogue.Catalogue(self.index)
+        name = os.path.join("metric", "3mm_Endmill.fctb")
+        self.assertEqual(
+            catalogue.find(name, [self.bits]), os.path.join(self.bits, name)
+        )
+        self.assertIsNone(catalogue.find(os.path.join("imperial", name), [self.bits]))
+
+        catalogue.find("3mm_Ball.fctb", [self.bits])
+        self.assertTrue(os.path.isfile(self.index))
+        os.remove(self.index)
+
+        catalogue = PathToolCatalogue.Catalogue(self.index)
+        with catalogue.batch():
+            catalogue.find("3mm_Ball.fctb", [self.bits])
+            catalogue.declaration(os.path.join(self.bits, "6mm_Endmill.fctb"))
+            self.assertFalse(os.path.isfile(self.index))
+        self.assertTrue(os.path.isfile(self.index))
+        self.assertFalse(catalogue.dirty)
+
+    def test04(self):
+        """Verify lookups use the name index, validated once per batch."""
+        catalogue = PathToolCatalogue.Catalogue()
+        ball = os.path.join(self.bits, "metric", "carbide", "3mm_Ball.fctb")
+        drill = os.path.join(self.bits, "metric", "2mm_Drill.fctb")
+
+        with catalogue.batch():
+            self.assertEqual(catalogue.find("3mm_Ball.fctb", [self.bits]), ball)
+            writeBit(drill, "2mm Drill", 2)
+            touch(os.path.dirname(drill), 1)
+            # the directories are not looked at again within the batch
+            self.assertIsNone(catalogue.find("2mm_Drill.fctb", [self.bits]))
+        self.assertEqual(catalogue.find("2mm_Drill.fctb", [self.bits]), drill)
+
+        # outside of a batch a missing file invalidates the entry
+        os.remove(ball)
+        touch(os.path.dirname(ball), 1)
+        self.assertIsNone(catalogue.find("3mm_Ball.fctb", [self.bits]))
+        self.assertNotIn("3mm_Ball.fctb", catalogue.names[self.bits]["files"])
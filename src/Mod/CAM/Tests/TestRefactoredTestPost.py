@@ -120,6 +120,17 @@ class TestRefactoredTestPost(PathTestUtils.PathTestBase):
     #
     #############################################################################
 
+    def test00010(self):
+        """Test a parameter function set by the postprocessor."""
+
+        def x_parameter(values, command, param, param_value, current_location):
+            return f"[{param_value}]"
+
+        postprocessor.global_values["PARAMETER_FUNCTIONS"]["X"] = x_parameter
+        self.compare_third_line("G0 X10 Y20 Z30", "G0 X[10.0] Y20.000 Z30.000", "")
+
+    #############################################################################
+
     def test00100(self):
         """Test axis modal.
 
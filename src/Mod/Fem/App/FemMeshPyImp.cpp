@@ -34,6 +34,7 @@
 #include <TopoDS_Face.hxx>
 #include <TopoDS_Shape.hxx>
 #include <algorithm>
+#include <map>
 #include <stdexcept>
 #endif
 
@@ -241,6 +242,43 @@ PyObject* FemMeshPy::addNode(PyObject* args)
     return nullptr;
 }
 
+PyObject* FemMeshPy::addNodes(PyObject* args)
+{
+    PyObject* coords;
+    PyObject* ids;
+    if (!PyArg_ParseTuple(args, "OO", &coords, &ids)) {
+        return nullptr;
+    }
+
+    try {
+        Py::Sequence coordList(coords);
+        Py::Sequence idList(ids);
+        Py::Sequence::size_type count = idList.size();
+        if (coordList.size() != 3 * count) {
+            throw std::runtime_error("Three coordinates are needed for every node");
+        }
+        SMESH_Mesh* mesh = getFemMeshPtr()->getSMesh();
+        SMESHDS_Mesh* meshDS = mesh->GetMeshDS();
+        for (Py::Sequence::size_type i = 0; i < count; ++i) {
+            double x = static_cast<double>(Py::Float(coordList[3 * i]));
+            double y = static_cast<double>(Py::Float(coordList[3 * i + 1]));
+            double z = static_cast<double>(Py::Float(coordList[3 * i + 2]));
+            int id = static_cast<int>(static_cast<long>(Py::Long(idList[i])));
+            if (!meshDS->AddNodeWithID(x, y, z, id)) {
+                throw std::runtime_error("Failed to add node");
+            }
+        }
+    }
+    catch (const Py::Exception&) {
+        return nullptr;
+    }
+    catch (const std::exception& e) {
+        PyErr_SetString(Base::PyExc_FC_GeneralError, e.what());
+        return nullptr;
+    }
+    Py_Return;
+}
+
 PyObject* FemMeshPy::addEdge(PyObject* args)
 {
     SMESH_Mesh* mesh = getFemMeshPtr()->getSMesh();
@@ -1514,6 +1552,54 @@ PyObject* FemMeshPy::getIdByElementType(PyObject* args)
     return Py::new_reference_to(tuple);
 }
 
+PyObject* FemMeshPy::getElementNodesByType(PyObject* args)
+{
+    const char* typeStr;
+    if (!PyArg_ParseTuple(args, "s", &typeStr)) {
+        return nullptr;
+    }
+
+    auto it = std::find_if(vecTypeName.begin(), vecTypeName.end(), [=](const pairStrElemType& x) {
+        return x.first == typeStr;
+    });
+
+    if (it == vecTypeName.end()) {
+        PyErr_SetString(PyExc_ValueError, "Invalid element type");
+        return nullptr;
+    }
+
+    // sorted by ID like getIdByElementType()
+    SMDSAbs_ElementType elemType = it->second;
+    std::map<int, const SMDS_MeshElement*> elements;
+    std::size_t nodeCount = 0;
+    SMDS_ElemIteratorPtr aElemIter =
+        getFemMeshPtr()->getSMesh()->GetMeshDS()->elementsIterator(elemType);
+    while (aElemIter->more()) {
+        const SMDS_MeshElement* aElem = aElemIter->next();
+        elements[aElem->GetID()] = aElem;
+        nodeCount += aElem->NbNodes();
+    }
+
+    Py::Tuple ids(elements.size());
+    Py::Tuple counts(elements.size());
+    Py::Tuple nodes(nodeCount);
+    int index = 0;
+    int nodeIndex = 0;
+    for (const auto& elem : elements) {
+        ids.setItem(index, Py::Long(elem.first));
+        counts.setItem(index++, Py::Long(elem.second->NbNodes()));
+        for (int i = 0; i < elem.second->NbNodes(); i++) {
+            nodes.setItem(nodeIndex++, Py::Long(elem.second->GetNode(i)->GetID()));
+        }
+    }
+
+    Py::Tuple result(3);
+    result.setItem(0, ids);
+    result.setItem(1, counts);
+    result.setItem(2, nodes);
+    return Py::new_reference_to(result);
+}
+
 // ===== Attributes ============================================================
 
 Py::Dict FemMeshPy::getNodes() const
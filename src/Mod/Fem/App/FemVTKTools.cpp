@@ -64,8 +64,10 @@
 #include <App/Application.h>
 #include <App/Document.h>
 #include <App/DocumentObject.h>
+#include <App/PropertyStandard.h>
 #include <Base/Console.h>
 #include <Base/FileInfo.h>
+#include <Base/Interpreter.h>
 #include <Base/TimeInfo.h>
 #include <Base/Type.h>
 
@@ -143,6 +145,67 @@ void fillMeshElementIds(vtkCell* cell, std::vector<int>& ids)
     }
 }
 
+// The node data of a result object can be held by the binary result cache,
+// it is loaded for the time of an export, see femresult/resultcache.py
+std::vector<std::string> loadCachedResult(const App::DocumentObject* result)
+{
+    std::vector<std::string> properties;
+    auto cache = dynamic_cast<App::PropertyString*>(result->getPropertyByName("ResultCache"));
+    if (!cache || cache->getStrValue().empty()) {
+        return properties;
+    }
+
+    Base::PyGILStateLocker lock;
+    PyObject* module = PyImport_ImportModule("femresult.resultcache");
+    if (!module) {
+        Base::PyException e;  // extract the Python error text
+        e.ReportException();
+        return properties;
+    }
+    try {
+        Py::Module cachemod(module, true);
+        Py::Object object(const_cast<App::DocumentObject*>(result)->getPyObject(), true);
+        Py::Sequence loaded(cachemod.callMemberFunction("load_for_export", Py::TupleN(object)));
+        for (const auto& prop : loaded) {
+            properties.push_back(Py::String(prop).as_std_string());
+        }
+    }
+    catch (Py::Exception&) {
+        Base::PyException e;  // extract the Python error text
+        e.ReportException();
+    }
+    return properties;
+}
+
+void unloadCachedResult(const App::DocumentObject* result,
+                        const std::vector<std::string>& properties)
+{
+    if (properties.empty()) {
+        return;
+    }
+
+    Base::PyGILStateLocker lock;
+    PyObject* module = PyImport_ImportModule("femresult.resultcache");
+    if (!module) {
+        Base::PyException e;  // extract the Python error text
+        e.ReportException();
+        return;
+    }
+    try {
+        Py::Module cachemod(module, true);
+        Py::Object object(const_cast<App::DocumentObject*>(result)->getPyObject(), true);
+        Py::List names;
+        for (const auto& prop : properties) {
+            names.append(Py::String(prop));
+        }
+        cachemod.callMemberFunction("unload_result", Py::TupleN(object, names));
+    }
+    catch (Py::Exception&) {
+        Base::PyException e;  // extract the Python error text
+        e.ReportException();
+    }
+}
+
 }  // namespace
 
 
@@ -892,6 +955,9 @@ void FemVTKTools::exportFreeCADResult(const App::DocumentObject* result,
     const SMESH_Mesh* smesh = static_cast<FemMeshObject*>(meshObj)->FemMesh.getValue().getSMesh();
     const SMESHDS_Mesh* meshDS = smesh->GetMeshDS();
 
+    // the cached node data is emptied again after the export
+    const std::vector<std::string> cachedProperties = loadCachedResult(result);
+
     // all result object meshes are in mm therefore for e.g. length outputs like
     // displacement we must divide by 1000
     double factor = 1.0;
@@ -1020,6 +1086,8 @@ void FemVTKTools::exportFreeCADResult(const App::DocumentObject* result,
         }
     }
 
+    unloadCachedResult(result, cachedProperties);
+
     Base::Console().Log("End: Create VTK result data from FreeCAD result data.\n");
 }
 
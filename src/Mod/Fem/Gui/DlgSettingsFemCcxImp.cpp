@@ -78,6 +78,7 @@ void DlgSettingsFemCcxImp::saveSettings()
 
     ui->cb_analysis_type->onSave();
     ui->cb_BeamShellOutput->onSave();  // Beam shell output 3d or 2d
+    ui->sb_node_search_processes->onSave();
     ui->sb_eigenmode_number->onSave();
     ui->dsb_eigenmode_high_limit->onSave();
     ui->dsb_eigenmode_low_limit->onSave();
@@ -105,6 +106,7 @@ void DlgSettingsFemCcxImp::loadSettings()
 
     ui->cb_analysis_type->onRestore();
     ui->cb_BeamShellOutput->onRestore();  // Beam shell output 3d or 2d
+    ui->sb_node_search_processes->onRestore();
     ui->sb_eigenmode_number->onRestore();
     ui->dsb_eigenmode_high_limit->onRestore();
     ui->dsb_eigenmode_low_limit->onRestore();
@@ -85,6 +85,7 @@ void DlgSettingsFemGeneralImp::saveSettings()
     ui->cb_restore_result_dialog->onSave();
     ui->cb_keep_results_on_rerun->onSave();
     ui->cb_hide_constraint->onSave();
+    ui->cb_result_cache->onSave();
 
     ui->cb_wd_temp->onSave();
     ui->cb_wd_beside->onSave();
@@ -101,6 +102,7 @@ void DlgSettingsFemGeneralImp::loadSettings()
     ui->cb_restore_result_dialog->onRestore();
     ui->cb_keep_results_on_rerun->onRestore();
     ui->cb_hide_constraint->onRestore();
+    ui->cb_result_cache->onRestore();
 
     ui->cb_wd_temp->onRestore();
     ui->cb_wd_beside->onRestore();
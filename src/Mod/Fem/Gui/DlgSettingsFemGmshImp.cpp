@@ -51,12 +51,16 @@ void DlgSettingsFemGmshImp::saveSettings()
 {
     ui->cb_gmsh_binary_std->onSave();
     ui->fc_gmsh_binary_path->onSave();
+    ui->cb_gmsh_mesh_cache->onSave();
+    ui->sb_gmsh_cache_size->onSave();
 }
 
 void DlgSettingsFemGmshImp::loadSettings()
 {
     ui->cb_gmsh_binary_std->onRestore();
     ui->fc_gmsh_binary_path->onRestore();
+    ui->cb_gmsh_mesh_cache->onRestore();
+    ui->sb_gmsh_cache_size->onRestore();
 }
 
 /**
@@ -84,6 +84,9 @@ FreeCAD.addExportType(
     "feminout.importYamlJsonMesh",
 )
 
+FreeCAD.addImportType("FEM mesh binary NumPy (*.meshnpz *.MESHNPZ)", "feminout.importNpzMesh")
+FreeCAD.addExportType("FEM mesh binary NumPy (*.meshnpz)", "feminout.importNpzMesh")
+
 FreeCAD.addImportType("FEM mesh Z88 (*i1.txt *I1.TXT)", "feminout.importZ88Mesh")
 FreeCAD.addExportType("FEM mesh Z88 (*i1.txt)", "feminout.importZ88Mesh")
 
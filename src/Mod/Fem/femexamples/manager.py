@@ -214,6 +214,42 @@ def get_meshname():
     return "Mesh"
 
 
+def load_mesh(mesh_module_name):
+    # returns the FemMesh of a Python mesh module in femexamples/meshes
+    # the mesh is cached as binary mesh file in the user cache directory
+    # thus the Python mesh module only runs the first time or after it has been changed
+    import importlib
+    import os
+    import Fem
+    from feminout import importNpzMesh
+
+    module_file = os.path.join(os.path.dirname(__file__), "meshes", mesh_module_name + ".py")
+    cache_file = os.path.join(
+        FreeCAD.getUserCachePath(), "FemExampleMeshes", mesh_module_name + ".meshnpz"
+    )
+    if os.path.isfile(cache_file) and (
+        os.path.getmtime(cache_file) >= os.path.getmtime(module_file)
+    ):
+        fem_mesh = importNpzMesh.read(cache_file)
+        if fem_mesh:
+            return fem_mesh
+
+    mesh_module = importlib.import_module("femexamples.meshes." + mesh_module_name)
+    fem_mesh = Fem.FemMesh()
+    control = mesh_module.create_nodes(fem_mesh)
+    if not control:
+        FreeCAD.Console.PrintError("Error on creating nodes.\n")
+    control = mesh_module.create_elements(fem_mesh)
+    if not control:
+        FreeCAD.Console.PrintError("Error on creating elements.\n")
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        importNpzMesh.write(cache_file, fem_mesh)
+    except OSError as e:
+        FreeCAD.Console.PrintWarning(f"Mesh {mesh_module_name} not cached: {e}\n")
+    return fem_mesh
+
+
 def get_header(information):
     return """{name}
 
@@ -33,6 +33,8 @@ __url__ = "https://www.freecad.org"
 
 import os
 
+import numpy as np
+
 import FreeCAD
 from FreeCAD import Console
 from builtins import open as pyopen
@@ -58,27 +60,39 @@ def insert(filename, docname):
 
 
 # ********* module specific methods *********
-def importFrd(filename, analysis=None, result_name_prefix="", result_analysis_type=""):
+def importFrd(
+    filename,
+    analysis=None,
+    result_name_prefix="",
+    result_analysis_type="",
+    steps=None,
+    fields=None,
+):
+    """
+    Imports a CalculiX frd file as result mesh and result objects.
+
+    steps and fields are passed to iter_frd_result_sets(). Only one result
+    set (step) at a time is held in memory while the result objects are filled.
+    """
     import ObjectsFem
     from . import importToolsFem
+    from femresult import resultcache
 
     if analysis:
         doc = analysis.Document
     else:
         doc = FreeCAD.ActiveDocument
 
-    m = read_frd_result(filename)
+    m = read_frd_mesh(filename)
     result_mesh_object = None
     res_obj = None
+    cache_key = resultcache.get_file_hash(filename) if resultcache.is_enabled() else None
 
     if len(m["Nodes"]) > 0:
         mesh = importToolsFem.make_femmesh(m)
         res_mesh_is_compacted = False
         nodenumbers_for_compacted_mesh = []
 
-        number_of_increments = len(m["Results"])
-        Console.PrintLog("Increments: " + str(number_of_increments) + "\n")
-
         def make_result_mesh(result_name):
             res_obj = ObjectsFem.makeResultMechanical(doc, results_name)
             # create result mesh
@@ -87,127 +101,134 @@ def importFrd(filename, analysis=None, result_name_prefix="", result_analysis_ty
             res_obj.Mesh = result_mesh_object
             return res_obj
 
-        if len(m["Results"]) > 0:
-            for result_set in m["Results"]:
-                if "number" in result_set:
-                    eigenmode_number = result_set["number"]
-                else:
-                    eigenmode_number = 0
-                step_time = result_set["time"]
-                step_time = round(step_time, 2)
-                if eigenmode_number > 0:
-                    results_name = "{}EigenMode_{}_Results".format(
-                        result_name_prefix, eigenmode_number
+        # the increments are counted while the file is read, the result names
+        # only need to know if the file has more than one
+        number_of_increments = 0
+        for result_set in iter_frd_result_sets(filename, steps, fields):
+            number_of_increments += 1
+            if "number" in result_set:
+                eigenmode_number = result_set["number"]
+            else:
+                eigenmode_number = 0
+            step_time = result_set["time"]
+            step_time = round(step_time, 2)
+            if eigenmode_number > 0:
+                results_name = "{}EigenMode_{}_Results".format(result_name_prefix, eigenmode_number)
+            elif result_set["step"] > 0 or not result_set["last"]:
+                if result_analysis_type == "buckling":
+                    results_name = "{}BucklingFactor_{}_Results".format(
+                        result_name_prefix, step_time
                     )
-                elif number_of_increments > 1:
-                    if result_analysis_type == "buckling":
-                        results_name = "{}BucklingFactor_{}_Results".format(
-                            result_name_prefix, step_time
-                        )
-                    else:
-                        results_name = f"{result_name_prefix}Time_{step_time}_Results"
                 else:
-                    results_name = f"{result_name_prefix}Results"
+                    results_name = f"{result_name_prefix}Time_{step_time}_Results"
+            else:
+                results_name = f"{result_name_prefix}Results"
 
-                res_obj = make_result_mesh(results_name)
-                res_obj = importToolsFem.fill_femresult_mechanical(res_obj, result_set)
-                if analysis:
-                    # need to be here, becasause later on, the analysis objs are needed
-                    # see fill of principal stresses
-                    analysis.addObject(res_obj)
-
-                # more result object calculations
-                from femresult import resulttools
-                from femtools import femutils
-
-                if not res_obj.MassFlowRate:
-                    # information 1:
-                    # only compact result if not Flow 1D results
-                    # compact result object, workaround for bug 2873
-                    # https://www.freecad.org/tracker/view.php?id=2873
-                    # information 2:
-                    # if the result data has multiple result sets there will be multiple result objs
-                    # they all will use one mesh obj
-                    # on the first res obj fill: the mesh obj will be compacted, thus
-                    # it does not need to be compacted on further result sets
-                    # but NodeNumbers need to be compacted for every result set (res object fill)
-                    # example frd file: https://forum.freecad.org/viewtopic.php?t=32649#p274291
-                    if res_mesh_is_compacted is False:
-                        # first result set, compact FemMesh and NodeNumbers
-                        res_obj = resulttools.compact_result(res_obj)
-                        res_mesh_is_compacted = True
-                        nodenumbers_for_compacted_mesh = res_obj.NodeNumbers
-                    else:
-                        # all other result sets, do not compact FemMesh, only set NodeNumbers
-                        res_obj.NodeNumbers = nodenumbers_for_compacted_mesh
-
-                # fill DisplacementLengths
-                res_obj = resulttools.add_disp_apps(res_obj)
-                # fill vonMises
-                res_obj = resulttools.add_von_mises(res_obj)
-                # fill principal stress
-                # if material reinforced object use add additional values to the res_obj
-                if res_obj.getParentGroup():
-                    has_reinforced_mat = False
-                    for obj in res_obj.getParentGroup().Group:
-                        if femutils.is_of_type(obj, "Fem::MaterialReinforced"):
-                            has_reinforced_mat = True
-                            Console.PrintLog(
-                                "Reinforced material object detected, "
-                                "reinforced principal stresses and standard principal "
-                                "stresses will be added.\n"
-                            )
-                            resulttools.add_principal_stress_reinforced(res_obj)
-                            break
-                    if has_reinforced_mat is False:
+            res_obj = make_result_mesh(results_name)
+            res_obj = importToolsFem.fill_femresult_mechanical_arrays(res_obj, result_set)
+            if analysis:
+                # need to be here, becasause later on, the analysis objs are needed
+                # see fill of principal stresses
+                analysis.addObject(res_obj)
+
+            # more result object calculations
+            from femresult import resulttools
+            from femtools import femutils
+
+            if not res_obj.MassFlowRate:
+                # information 1:
+                # only compact result if not Flow 1D results
+                # compact result object, workaround for bug 2873
+                # https://www.freecad.org/tracker/view.php?id=2873
+                # information 2:
+                # if the result data has multiple result sets there will be multiple result objs
+                # they all will use one mesh obj
+                # on the first res obj fill: the mesh obj will be compacted, thus
+                # it does not need to be compacted on further result sets
+                # but NodeNumbers need to be compacted for every result set (res object fill)
+                # example frd file: https://forum.freecad.org/viewtopic.php?t=32649#p274291
+                if res_mesh_is_compacted is False:
+                    # first result set, compact FemMesh and NodeNumbers
+                    res_obj = resulttools.compact_result(res_obj)
+                    res_mesh_is_compacted = True
+                    nodenumbers_for_compacted_mesh = res_obj.NodeNumbers
+                else:
+                    # all other result sets, do not compact FemMesh, only set NodeNumbers
+                    res_obj.NodeNumbers = nodenumbers_for_compacted_mesh
+
+            # fill DisplacementLengths
+            res_obj = resulttools.add_disp_apps(res_obj)
+            # fill vonMises
+            res_obj = resulttools.add_von_mises(res_obj)
+            # fill principal stress
+            # if material reinforced object use add additional values to the res_obj
+            if res_obj.getParentGroup():
+                has_reinforced_mat = False
+                for obj in res_obj.getParentGroup().Group:
+                    if femutils.is_of_type(obj, "Fem::MaterialReinforced"):
+                        has_reinforced_mat = True
                         Console.PrintLog(
-                            "No reinforced material object detected, "
-                            "standard principal stresses will be added.\n"
+                            "Reinforced material object detected, "
+                            "reinforced principal stresses and standard principal "
+                            "stresses will be added.\n"
                         )
-                        # fill PrincipalMax, PrincipalMed, PrincipalMin, MaxShear
-                        res_obj = resulttools.add_principal_stress_std(res_obj)
-                else:
+                        resulttools.add_principal_stress_reinforced(res_obj)
+                        break
+                if has_reinforced_mat is False:
                     Console.PrintLog(
-                        "No Analysis detected, standard principal stresses will be added.\n"
+                        "No reinforced material object detected, "
+                        "standard principal stresses will be added.\n"
                     )
-                    # if a pure frd file was opened no analysis and thus no parent group
                     # fill PrincipalMax, PrincipalMed, PrincipalMin, MaxShear
                     res_obj = resulttools.add_principal_stress_std(res_obj)
-                # fill Stats
-                res_obj = resulttools.fill_femresult_stats(res_obj)
-
-                # create a results pipeline if not already existing
-                pipeline_name = "Pipeline_" + results_name
-                pipeline_obj = doc.getObject(pipeline_name)
-                if pipeline_obj is None:
-                    pipeline_obj = ObjectsFem.makePostVtkResult(doc, res_obj, results_name)
-                    pipeline_visibility = True
-                    if analysis:
-                        analysis.addObject(pipeline_obj)
-                else:
-                    if FreeCAD.GuiUp:
-                        # store pipeline visibility because pipeline_obj.load makes the
-                        # pipeline always visible
-                        pipeline_visibility = pipeline_obj.ViewObject.Visibility
-                    pipeline_obj.load(res_obj)
-                # update the pipeline
-                pipeline_obj.recomputeChildren()
-                pipeline_obj.recompute()
+            else:
+                Console.PrintLog(
+                    "No Analysis detected, standard principal stresses will be added.\n"
+                )
+                # if a pure frd file was opened no analysis and thus no parent group
+                # fill PrincipalMax, PrincipalMed, PrincipalMin, MaxShear
+                res_obj = resulttools.add_principal_stress_std(res_obj)
+            # fill Stats
+            res_obj = resulttools.fill_femresult_stats(res_obj)
+
+            # create a results pipeline if not already existing
+            pipeline_name = "Pipeline_" + results_name
+            pipeline_obj = doc.getObject(pipeline_name)
+            if pipeline_obj is None:
+                pipeline_obj = ObjectsFem.makePostVtkResult(doc, res_obj, results_name)
+                pipeline_visibility = True
+                if analysis:
+                    analysis.addObject(pipeline_obj)
+            else:
                 if FreeCAD.GuiUp:
-                    pipeline_obj.ViewObject.updateColorBars()
-                    # make results mesh invisible, will be made visible
-                    # later in task_solver_ccxtools.py
-                    res_obj.Mesh.ViewObject.Visibility = False
-                    # restore pipeline visibility
-                    pipeline_obj.ViewObject.Visibility = pipeline_visibility
-
-        elif result_analysis_type == "check":
+                    # store pipeline visibility because pipeline_obj.load makes the
+                    # pipeline always visible
+                    pipeline_visibility = pipeline_obj.ViewObject.Visibility
+                pipeline_obj.load(res_obj)
+            # update the pipeline
+            pipeline_obj.recomputeChildren()
+            pipeline_obj.recompute()
+            if FreeCAD.GuiUp:
+                pipeline_obj.ViewObject.updateColorBars()
+                # make results mesh invisible, will be made visible
+                # later in task_solver_ccxtools.py
+                res_obj.Mesh.ViewObject.Visibility = False
+                # restore pipeline visibility
+                pipeline_obj.ViewObject.Visibility = pipeline_visibility
+
+            # the node data is moved into the binary result cache and loaded when needed
+            if cache_key:
+                resultcache.store_result(res_obj, cache_key)
+
+        Console.PrintLog("Increments: " + str(number_of_increments) + "\n")
+
+        if number_of_increments == 0 and result_analysis_type == "check":
             results_name = f"{result_name_prefix}Check"
             res_obj = make_result_mesh(results_name)
             if analysis:
                 analysis.addObject(res_obj)
 
-        else:
+        elif number_of_increments == 0:
             error_message = (
                 "Nodes, but no results found in frd file. "
                 "It means there only is a mesh but no results in frd file. "
@@ -247,22 +268,68 @@ def importFrd(filename, analysis=None, result_name_prefix="", result_analysis_ty
     return res_obj
 
 
-# read a calculix result file and extract the nodes
-# displacement vectors and stress values.
+# ********* frd reader *********
+# the frd file is read in binary mode, every record has fixed width fields
+# a result block (DISP, STRESS, ...) is parsed straight into NumPy arrays
+# the result sets (steps) are yielded one after the other, thus the memory
+# needed while reading scales with the size of one step and not with the file
+
+# result blocks: name in the "-4" header line, key in the result set, number of values
+FRD_RESULT_BLOCKS = (
+    ("DISP", "disp", 3),
+    ("STRESS", "stress", 6),
+    ("TOSTRAIN", "strain", 6),
+    ("PE", "peeq", 1),
+    ("NDTEMP", "temp", 1),
+    ("FLUX", "heatflux", 3),
+    ("MAFLOW", "mflow", 1),
+    ("STPRES", "npressure", 1),
+)
+
+# number of records parsed at once into NumPy arrays
+FRD_CHUNK_SIZE = 65536
+
+
 def read_frd_result(frd_input):
-    Console.PrintMessage(f"Read ccx results from frd file: {frd_input}\n")
-    inout_nodes = []
-    inout_nodes_file = frd_input.rsplit(".", 1)[0] + "_inout_nodes.txt"
-    if os.path.exists(inout_nodes_file):
-        Console.PrintMessage(f"Read special 1DFlow nodes data form: {inout_nodes_file}\n")
-        f = pyopen(inout_nodes_file, "r")
-        lines = f.readlines()
-        for line in lines:
-            a = line.split(",")
-            inout_nodes.append(a)
-        f.close()
-        Console.PrintMessage(f"{inout_nodes}\n")
-    frd_file = pyopen(frd_input, "r")
+    """
+    Reads the mesh and all result sets of a CalculiX frd file.
+
+    Returns the mesh dictionary of read_frd_mesh() with all result sets
+    added as list of dictionaries in "Results". The result values are
+    dictionaries node number --> value, like they have always been.
+    For large files use read_frd_mesh() and iter_frd_result_sets().
+    """
+    m = read_frd_mesh(frd_input)
+    m["Nodes"] = {nd: FreeCAD.Vector(*xyz) for nd, xyz in m["Nodes"].items()}
+    results = []
+    for result_set in iter_frd_result_sets(frd_input):
+        mode_results = {"number": result_set["number"], "time": result_set["time"]}
+        for key, value in result_set.items():
+            if key in ("number", "time", "step", "last"):
+                continue
+            node_numbers, values = value
+            if key in ("disp", "heatflux"):
+                values = [FreeCAD.Vector(*v) for v in values.tolist()]
+            elif values.ndim > 1:
+                values = [tuple(v) for v in values.tolist()]
+            else:
+                values = values.tolist()
+            mode_results[key] = dict(zip(node_numbers.tolist(), values))
+        results.append(mode_results)
+    m["Results"] = results
+    return m
+
+
+def read_frd_mesh(frd_input):
+    """
+    Reads nodes and elements of a CalculiX frd file.
+
+    The reading stops at the first result block. The nodes are returned
+    as dictionary node number --> (x, y, z), the elements as dictionaries
+    element number --> node numbers in FreeCAD node order.
+    """
+    Console.PrintMessage(f"Read ccx mesh from frd file: {frd_input}\n")
+    inout_nodes = read_inout_nodes(frd_input)
     nodes = {}
     elements_hexa8 = {}
     elements_penta6 = {}
@@ -276,64 +343,42 @@ def read_frd_result(frd_input):
     elements_quad8 = {}
     elements_seg2 = {}
     elements_seg3 = {}
-    results = []
-    mode_results = {}
-    mode_results["number"] = float("NaN")
-    mode_results["time"] = float("NaN")
-    mode_disp = {}
-    mode_stress = {}
-    mode_strain = {}
-    mode_peeq = {}
-    mode_temp = {}
-    mode_heatflux = {}
-    mode_massflow = {}
-    mode_networkpressure = {}
 
     nodes_found = False
     elements_found = False
-    mode_time_found = False
-    mode_disp_found = False
-    mode_stress_found = False
-    mode_strain_found = False
-    mode_peeq_found = False
-    mode_temp_found = False
-    mode_heatflux_found = False
-    mode_massflow_found = False
-    mode_networkpressure_found = False
-    end_of_section_found = False
-    end_of_frd_data_found = False
     input_continues = False
-    mode_eigen_changed = False
-    mode_time_changed = False
-
-    eigenmode = 0
-    eigentemp = 0
+    node_lines = []
     elem = -1
     elemType = 0
-    timestep = 0
-    timetemp = 0
 
+    frd_file = pyopen(frd_input, "rb")
     for line in frd_file:
 
         # Check if we found nodes section
-        if line[4:6] == "2C":
+        if line[4:6] == b"2C":
             nodes_found = True
-        if nodes_found and (line[1:3] == "-1"):
-            # we found a nodes line, lets extract the node and coordinate data
-            elem = int(line[4:13])
-            nodes_x = float(line[13:25])
-            nodes_y = float(line[25:37])
-            nodes_z = float(line[37:49])
-            nodes[elem] = FreeCAD.Vector(nodes_x, nodes_y, nodes_z)
+            continue
+        if nodes_found:
+            if line[1:3] == b"-1":
+                node_lines.append(line)
+                if len(node_lines) == FRD_CHUNK_SIZE:
+                    _add_frd_nodes(nodes, node_lines)
+                    node_lines = []
+            elif line[1:3] == b"-3":
+                _add_frd_nodes(nodes, node_lines)
+                node_lines = []
+                nodes_found = False
+            continue
 
         # Check if we found elements section
-        if line[4:6] == "3C":
+        if line[4:6] == b"3C":
             elements_found = True
-        if elements_found and (line[1:3] == "-1"):
+            continue
+        if elements_found and (line[1:3] == b"-1"):
             # we found a first element line, lets extract element number
             elem = int(line[4:13])
             elemType = int(line[14:18])
-        if elements_found and (line[1:3] == "-2"):
+        if elements_found and (line[1:3] == b"-2"):
             # we found a second element line, lets extract the elements
             # node order fits with node order in writeAbaqus() in FemMesh.cpp
             if elemType == 1:
@@ -565,260 +610,21 @@ def read_frd_result(frd_input):
                 else:
                     # normal node numbering for D, B32 elements
                     elements_seg3[elem] = (nd1, nd2, nd3)
+        if elements_found and (line[1:3] == b"-3"):
+            elements_found = False
+            continue
 
-        # Check if we found new eigenmode line
-        if line[5:10] == "PMODE":
-            eigentemp = int(line[30:36])
-            if eigentemp > eigenmode:
-                eigenmode = eigentemp
-                mode_eigen_changed = True
-
-        # Check if we found new time step
-        if line[4:10] == "1PSTEP":
-            mode_time_found = True
-        if mode_time_found and (line[2:7] == "100CL"):
-            # we found the new time step line
-            # !!! be careful here, there is timetemp and timestep!
-            # TODO: use more differ names
-            timetemp = float(line[13:25])
-            if timetemp > timestep:
-                timestep = timetemp
-                mode_time_changed = True
-
-        # Check if we found displacement section
-        if line[5:9] == "DISP":
-            mode_disp_found = True
-        if mode_disp_found and (line[1:3] == "-1"):
-            # we found a displacement line
-            elem = int(line[4:13])
-            mode_disp_x = float(line[13:25])
-            mode_disp_y = float(line[25:37])
-            mode_disp_z = float(line[37:49])
-            mode_disp[elem] = FreeCAD.Vector(mode_disp_x, mode_disp_y, mode_disp_z)
-
-        # Check if we found stress section
-        if line[5:11] == "STRESS":
-            mode_stress_found = True
-        if mode_stress_found and (line[1:3] == "-1"):
-            # we found a stress line
-            elem = int(line[4:13])
-            stress_1 = float(line[13:25])
-            stress_2 = float(line[25:37])
-            stress_3 = float(line[37:49])
-            stress_4 = float(line[49:61])
-            stress_5 = float(line[61:73])
-            stress_6 = float(line[73:85])
-            # CalculiX frd files: (Sxx, Syy, Szz, Sxy, Syz, Szx)
-            # FreeCAD:            (Sxx, Syy, Szz, Sxy, Sxz, Syz)
-            # thus exchange the last two entries
-            mode_stress[elem] = (stress_1, stress_2, stress_3, stress_4, stress_6, stress_5)
-
-        # Check if we found strain section
-        if line[5:13] == "TOSTRAIN":
-            mode_strain_found = True
-        if mode_strain_found and (line[1:3] == "-1"):
-            # we found a strain line in the frd file
-            elem = int(line[4:13])
-            strain_1 = float(line[13:25])
-            strain_2 = float(line[25:37])
-            strain_3 = float(line[37:49])
-            strain_4 = float(line[49:61])
-            strain_5 = float(line[61:73])
-            strain_6 = float(line[73:85])
-            # CalculiX frd files: (Exx, Eyy, Ezz, Exy, Eyz, Ezx)
-            # FreeCAD:            (Exx, Eyy, Ezz, Exy, Exz, Eyz)
-            # thus exchange the last two entries
-            mode_strain[elem] = (strain_1, strain_2, strain_3, strain_4, strain_6, strain_5)
-
-        # Check if we found an equivalent plastic strain section
-        if line[5:7] == "PE":
-            mode_peeq_found = True
-        if mode_peeq_found and (line[1:3] == "-1"):
-            # we found an equivalent plastic strain line
-            elem = int(line[4:13])
-            peeq = float(line[13:25])
-            mode_peeq[elem] = peeq
-
-        # Check if we found a temperature section
-        if line[5:11] == "NDTEMP":
-            mode_temp_found = True
-        if mode_temp_found and (line[1:3] == "-1"):
-            # we found a temperature line
-            elem = int(line[4:13])
-            temperature = float(line[13:25])
-            mode_temp[elem] = temperature
-
-        # Check if we found heat flux section
-        if line[5:9] == "FLUX":
-            mode_heatflux_found = True
-        if mode_heatflux_found and (line[1:3] == "-1"):
-            # we found a heat_flux line
-            elem = int(line[4:13])
-            mode_heatflux_x = float(line[13:25])
-            mode_heatflux_y = float(line[25:37])
-            mode_heatflux_z = float(line[37:49])
-            mode_heatflux[elem] = FreeCAD.Vector(mode_heatflux_x, mode_heatflux_y, mode_heatflux_z)
-
-        # Check if we found a mass flow section
-        if line[5:11] == "MAFLOW":
-            mode_massflow_found = True
-        if mode_massflow_found and (line[1:3] == "-1"):
-            # we found a mass flow line
-            elem = int(line[4:13])
-            massflow = float(line[13:25])
-            mode_massflow[elem] = massflow * 1000  # convert units to kg/s from t/s
-            if inout_nodes:
-                for i in range(len(inout_nodes)):
-                    if elem == int(inout_nodes[i][1]):
-                        node = int(inout_nodes[i][2])
-                        # convert units to kg/s from t/s
-                        mode_massflow[node] = massflow * 1000
-
-        # Check if we found a network pressure section
-        if line[5:11] == "STPRES":
-            mode_networkpressure_found = True
-        if mode_networkpressure_found and (line[1:3] == "-1"):
-            # we found a network pressure line
-            elem = int(line[4:13])
-            networkpressure = float(line[13:25])
-            mode_networkpressure[elem] = networkpressure
-            if inout_nodes:
-                for i in range(len(inout_nodes)):
-                    if elem == int(inout_nodes[i][1]):
-                        node = int(inout_nodes[i][2])
-                        mode_networkpressure[node] = networkpressure
-
-        # Check if we found the end of a section
-        if line[1:3] == "-3":
-            end_of_section_found = True
-
-            if nodes_found:
-                nodes_found = False
-                node_element_section = True
-
-            if elements_found:
-                elements_found = False
-                node_element_section = True
-
-            if mode_disp_found:
-                mode_results["disp"] = mode_disp
-                mode_disp = {}
-                mode_disp_found = False
-                node_element_section = False
-
-            if mode_stress_found:
-                mode_results["stress"] = mode_stress
-                mode_stress = {}
-                mode_stress_found = False
-                node_element_section = False
-
-            if mode_strain_found:
-                mode_results["strain"] = mode_strain
-
-                mode_strain = {}
-                mode_strain_found = False
-                node_element_section = False
-
-            if mode_peeq_found:
-                mode_results["peeq"] = mode_peeq
-                mode_peeq = {}
-                mode_peeq_found = False
-                node_element_section = False
-
-            if mode_temp_found:
-                mode_results["temp"] = mode_temp
-                mode_temp = {}
-                mode_temp_found = False
-                node_element_section = False
-
-            if mode_heatflux_found:
-                mode_results["heatflux"] = mode_heatflux
-                mode_heatflux = {}
-                mode_heatflux_found = False
-                node_element_section = False
-
-            if mode_massflow_found:
-                mode_results["mflow"] = mode_massflow
-                mode_massflow = {}
-                mode_massflow_found = False
-                node_element_section = False
-
-            if mode_networkpressure_found:
-                mode_results["npressure"] = mode_networkpressure
-                mode_networkpressure_found = False
-                mode_networkpressure = {}
-                node_element_section = False
-
-            """
-            print("---- End of Section --> Mode_Results may be changed ----")
-            for key in sorted(mode_results):
-                if key is "number" or key is "time":
-                    print(key + " --> " + str(mode_results[key]))
-                else:
-                    print(key + " --> " + str(len(mode_results[key])))
-            print("----Mode_Results----\n")
-            """
-
-        # Check if we found the end of frd data
-        if line[1:5] == "9999":
-            end_of_frd_data_found = True
-
+        # results or end of frd data, the mesh is complete
         if (
-            (mode_eigen_changed or mode_time_changed or end_of_frd_data_found)
-            and end_of_section_found
-            and not node_element_section
+            line[1:3] == b"-4"
+            or line[4:10] == b"1PSTEP"
+            or line[5:10] == b"PMODE"
+            or line[1:5] == b"9999"
         ):
+            break
 
-            """
-            print("\n\n----Append mode_results to results")
-            print(line)
-            for key in sorted(mode_results):
-                if key is "number" or key is "time":
-                    print(key + " --> " + str(mode_results[key]))
-                else:
-                    print(key + " --> " + str(len(mode_results[key])))
-            print("----Append Mode_Results----\n")
-            """
-
-            # append mode_results to results and reset mode_result
-            results.append(mode_results)
-            mode_results = {}
-            # https://forum.freecad.org/viewtopic.php?f=18&t=32649&start=10#p274686
-            mode_results["number"] = float("NaN")
-            mode_results["time"] = float("NaN")
-            end_of_section_found = False
-
-        # on changed --> write changed values in mode_result
-        # will be the first to do on an empty mode_result
-        if mode_eigen_changed:
-            mode_results["number"] = eigenmode
-            mode_eigen_changed = False
-
-        if mode_time_changed:
-            mode_results["time"] = timestep
-            # mode_results["time"] = 0  # Don't return time if static  # Why?
-            mode_time_found = False
-            mode_time_changed = False
-
-        # here we are in the indent of loop for every line in frd file
-        # do not add a print here :-)
-
-    # close frd file if loop over all lines is finished
     frd_file.close()
 
-    """
-    # debug prints and checks with the read data
-    print("\n\n----RESULTS values begin----")
-    print(len(results))
-    # print("\n")
-    # print(results)
-    print("----RESULTS values end----\n\n")
-    """
-
-    if not inout_nodes:
-        if results:
-            if "mflow" in results[0] or "npressure" in results[0]:
-                Console.PrintError("We have mflow or npressure, but no inout_nodes file.\n")
     if not nodes:
         Console.PrintError("FEM: No nodes found in Frd file.\n")
 
@@ -836,5 +642,253 @@ def read_frd_result(frd_input):
         "Hexa20Elem": elements_hexa20,
         "Penta6Elem": elements_penta6,
         "Penta15Elem": elements_penta15,
-        "Results": results,
     }
+
+
+def read_frd_steps(frd_input):
+    """
+    Returns the result sets of a CalculiX frd file without their values.
+
+    Every list entry is a dictionary with "number", "time", "step" and
+    "last", see iter_frd_result_sets().
+    """
+    return list(iter_frd_result_sets(frd_input, fields=()))
+
+
+def read_frd_result_summary(frd_input):
+    """
+    Returns minimum and maximum values of every result set of a CalculiX frd file.
+
+    No result objects are created, the file is streamed step by step.
+    Every list entry is a dictionary with "number", "time" and the keys
+    <field>_min and <field>_max, e.g. "disp_max". Vector fields are given
+    by their magnitude, the stress by the von Mises stress ("vonmises").
+    The strain is not summarized.
+    """
+    from femresult import resulttools
+
+    summary = []
+    fields = ("disp", "stress", "peeq", "temp", "heatflux", "mflow", "npressure")
+    for result_set in iter_frd_result_sets(frd_input, fields=fields):
+        stats = {"number": result_set["number"], "time": result_set["time"]}
+        for key in fields:
+            if key not in result_set or not len(result_set[key][0]):
+                continue
+            values = result_set[key][1]
+            if key == "stress":
+                key = "vonmises"
+                values = resulttools.calculate_von_mises_batch(values)
+            elif values.ndim > 1:
+                values = np.linalg.norm(values, axis=1)
+            stats[key + "_min"], stats[key + "_max"] = resulttools.get_min_max(values)
+        summary.append(stats)
+    return summary
+
+
+def iter_frd_result_sets(frd_input, steps=None, fields=None):
+    """
+    Yields the result sets of a CalculiX frd file one after the other.
+
+    steps: step indices (counted from 0) to be read, None reads all steps
+    fields: result set keys to be read (see FRD_RESULT_BLOCKS), None reads all
+
+    Every result set is a dictionary with "number" (eigenmode), "time",
+    "step" (the step index), "last" (no further step in the file) and
+    for every read field a tuple (node_numbers, values) of NumPy arrays.
+    Blocks of not requested steps and fields are skipped without parsing.
+    A node listed twice in a block gets the values of its last record.
+    """
+    inout_nodes = read_inout_nodes(frd_input)
+    if steps is not None:
+        steps = set(steps)
+        if not steps:
+            return
+        last_step = max(steps)
+    if fields is not None:
+        fields = set(fields)
+    result_blocks = [(name.encode(), key, columns) for name, key, columns in FRD_RESULT_BLOCKS]
+
+    mode_results = {"number": float("NaN"), "time": float("NaN")}
+    step_index = 0
+    step_has_blocks = False
+
+    mesh_section_found = False
+    mode_time_found = False
+    block = None  # (key, number of values) of the block to be parsed
+    inout_nodes_missing = False
+    block_found = False
+    block_lines = []
+    block_chunks = []
+
+    eigenmode = 0
+    timestep = 0
+
+    frd_file = pyopen(frd_input, "rb")
+    for line in frd_file:
+        record = line[1:3]
+
+        # data lines are the vast majority, thus check them first
+        if record == b"-1" or record == b"-2":
+            if block is not None and record == b"-1":
+                block_lines.append(line)
+                if len(block_lines) == FRD_CHUNK_SIZE:
+                    block_chunks.append(_read_frd_block(block_lines, block[1]))
+                    block_lines = []
+            continue
+
+        # end of a section
+        if record == b"-3":
+            if mesh_section_found:
+                mesh_section_found = False
+            elif block_found:
+                if block is not None:
+                    if block_lines:
+                        block_chunks.append(_read_frd_block(block_lines, block[1]))
+                    key, columns = block
+                    mode_results[key] = _merge_frd_block(key, columns, block_chunks, inout_nodes)
+                    if key in ("mflow", "npressure") and not inout_nodes:
+                        inout_nodes_missing = True
+                block = None
+                block_found = False
+                block_lines = []
+                block_chunks = []
+            continue
+
+        # nodes and elements sections are skipped
+        if line[4:6] == b"2C" or line[4:6] == b"3C":
+            mesh_section_found = True
+            continue
+
+        # header of a result block
+        if record == b"-4":
+            block_found = True
+            step_has_blocks = True
+            if steps is None or step_index in steps:
+                for name, key, columns in result_blocks:
+                    if line[5 : 5 + len(name)] == name:
+                        if fields is None or key in fields:
+                            block = (key, columns)
+                        break
+            continue
+
+        # Check if we found the end of frd data
+        if line[1:5] == b"9999":
+            break
+
+        # Check if we found new eigenmode or new time step line
+        step_changed = False
+        if line[5:10] == b"PMODE":
+            eigentemp = int(line[30:36])
+            if eigentemp > eigenmode:
+                eigenmode = eigentemp
+                step_changed = True
+        if line[4:10] == b"1PSTEP":
+            mode_time_found = True
+        timetemp = None
+        if mode_time_found and (line[2:7] == b"100CL"):
+            timetemp = float(line[13:25])
+            if timetemp > timestep:
+                timestep = timetemp
+                mode_time_found = False
+                step_changed = True
+            else:
+                timetemp = None
+
+        if step_changed:
+            # a new result set starts, the finished one is yielded
+            if step_has_blocks:
+                if steps is None or step_index in steps:
+                    mode_results["step"] = step_index
+                    mode_results["last"] = False
+                    yield mode_results
+                step_index += 1
+                step_has_blocks = False
+                mode_results = {"number": float("NaN"), "time": float("NaN")}
+                if steps is not None and step_index > last_step:
+                    break
+            if line[5:10] == b"PMODE":
+                mode_results["number"] = eigenmode
+            if timetemp is not None:
+                mode_results["time"] = timestep
+    else:
+        # no end of frd data found, the last result set is incomplete
+        step_has_blocks = False
+
+    frd_file.close()
+
+    if inout_nodes_missing:
+        Console.PrintError("We have mflow or npressure, but no inout_nodes file.\n")
+    if step_has_blocks and (steps is None or step_index in steps):
+        mode_results["step"] = step_index
+        mode_results["last"] = True
+        yield mode_results
+
+
+def read_inout_nodes(frd_input):
+    """Reads the special 1DFlow inout nodes file written next to the frd file."""
+    inout_nodes = []
+    inout_nodes_file = frd_input.rsplit(".", 1)[0] + "_inout_nodes.txt"
+    if os.path.exists(inout_nodes_file):
+        Console.PrintLog(f"Read special 1DFlow nodes data form: {inout_nodes_file}\n")
+        f = pyopen(inout_nodes_file, "r")
+        for line in f.readlines():
+            inout_nodes.append(line.split(","))
+        f.close()
+    return inout_nodes
+
+
+def _read_frd_block(lines, columns):
+    # parses fixed width "-1" records into node numbers and values
+    # record: " -1" + node number (10 chars) + values (12 chars each)
+    width = 13 + 12 * columns
+    count = len(lines)
+    data = b"".join([line.rstrip(b"\r\n")[:width].ljust(width) for line in lines])
+    raw = np.frombuffer(data, dtype=np.uint8).reshape(count, width)
+    node_numbers = np.ascontiguousarray(raw[:, 3:13]).view("S10").ravel().astype(np.int64)
+    values = np.ascontiguousarray(raw[:, 13:]).view("S12").reshape(count, columns)
+    return node_numbers, values.astype(np.float64)
+
+
+def _add_frd_nodes(nodes, lines):
+    if lines:
+        node_numbers, coords = _read_frd_block(lines, 3)
+        nodes.update(zip(node_numbers.tolist(), map(tuple, coords.tolist())))
+
+
+def _merge_frd_block(key, columns, chunks, inout_nodes):
+    if chunks:
+        node_numbers = np.concatenate([chunk[0] for chunk in chunks])
+        values = np.concatenate([chunk[1] for chunk in chunks])
+    else:
+        node_numbers = np.empty(0, dtype=np.int64)
+        values = np.empty((0, columns), dtype=np.float64)
+    if len(node_numbers) > 1 and not (np.diff(node_numbers) > 0).all():
+        # duplicate node records, the last one is used like in a dictionary
+        unique, first = np.unique(node_numbers, return_index=True)
+        if len(unique) < len(node_numbers):
+            last = len(node_numbers) - 1 - np.unique(node_numbers[::-1], return_index=True)[1]
+            order = np.argsort(first)
+            node_numbers = unique[order]
+            values = values[last[order]]
+    if key == "stress" or key == "strain":
+        # CalculiX frd files: (Sxx, Syy, Szz, Sxy, Syz, Szx)
+        # FreeCAD:            (Sxx, Syy, Szz, Sxy, Sxz, Syz)
+        # thus exchange the last two entries
+        values = values[:, [0, 1, 2, 3, 5, 4]]
+    elif columns == 1:
+        values = values[:, 0]
+    if key == "mflow":
+        # convert units to kg/s from t/s
+        values = values * 1000
+    if (key == "mflow" or key == "npressure") and inout_nodes:
+        # 1D flow network results, the values of the inout nodes are
+        # assigned to their mapped nodes too, these blocks are small
+        mapped = {}
+        for elem, value in zip(node_numbers.tolist(), values.tolist()):
+            mapped[elem] = value
+            for inout in inout_nodes:
+                if elem == int(inout[1]):
+                    mapped[int(inout[2])] = value
+        node_numbers = np.array(list(mapped), dtype=np.int64)
+        values = np.array(list(mapped.values()), dtype=np.float64)
+    return node_numbers, values
@@ -31,13 +31,73 @@ __date__ = "04/08/2016"
 #  \ingroup FEM
 #  \brief FreeCAD INP file reader for FEM workbench
 
+import mmap
 import os
+import warnings
+
+import numpy as np
 
 import FreeCAD
 from FreeCAD import Console
 from builtins import open as pyopen
 
 
+# mesh data keys of the supported elements: element kind and number of nodes
+ELEMENTS = {
+    "Tria3Elem": ("face", 3),
+    "Tria6Elem": ("face", 6),
+    "Quad4Elem": ("face", 4),
+    "Quad8Elem": ("face", 8),
+    "Tetra4Elem": ("volume", 4),
+    "Tetra10Elem": ("volume", 10),
+    "Hexa8Elem": ("volume", 8),
+    "Hexa20Elem": ("volume", 20),
+    "Penta6Elem": ("volume", 6),
+    "Penta15Elem": ("volume", 15),
+    "Seg2Elem": ("edge", 2),
+    "Seg3Elem": ("edge", 3),
+}
+
+# CalculiX element types and their mesh data keys
+INP_ELEMENT_TYPES = {
+    elm_type: elm_key
+    for elm_types, elm_key in (
+        (["S3", "CPS3", "CPE3", "CAX3"], "Tria3Elem"),
+        (["S6", "CPS6", "CPE6", "CAX6"], "Tria6Elem"),
+        (["S4", "S4R", "CPS4", "CPS4R", "CPE4", "CPE4R", "CAX4", "CAX4R"], "Quad4Elem"),
+        (["S8", "S8R", "CPS8", "CPS8R", "CPE8", "CPE8R", "CAX8", "CAX8R"], "Quad8Elem"),
+        (["C3D4"], "Tetra4Elem"),
+        (["C3D10"], "Tetra10Elem"),
+        (["C3D8", "C3D8R", "C3D8I"], "Hexa8Elem"),
+        (["C3D20", "C3D20R", "C3D20RI"], "Hexa20Elem"),
+        (["C3D6"], "Penta6Elem"),
+        (["C3D15"], "Penta15Elem"),
+        (["B31", "B31R", "T3D2"], "Seg2Elem"),
+        (["B32", "B32R", "T3D3"], "Seg3Elem"),
+    )
+    for elm_type in elm_types
+}
+
+# switch from the CalculiX node numbering to the FreeCAD node numbering
+# numbering do not change: tria3, tria6, quad4, quad8, seg2
+CCX_TO_FC_NODE_ORDER = {
+    "Tetra4Elem": [1, 0, 2, 3],
+    "Tetra10Elem": [1, 0, 2, 3, 4, 6, 5, 8, 7, 9],
+    "Hexa8Elem": [5, 6, 7, 4, 1, 2, 3, 0],
+    "Hexa20Elem": [5, 6, 7, 4, 1, 2, 3, 0, 13, 14, 15, 12, 9, 10, 11, 8, 17, 18, 19, 16],
+    "Penta6Elem": [4, 5, 3, 1, 2, 0],
+    "Penta15Elem": [4, 5, 3, 1, 2, 0, 10, 11, 9, 7, 8, 6, 13, 14, 12],
+    "Seg3Elem": [0, 2, 1],
+}
+
+# the commas of a data block are replaced by blanks
+# thus NumPy reads the values of all lines as one whitespace separated sequence
+_INP_SEPARATORS = bytes.maketrans(b",", b" ")
+# lookup table of the blank characters
+_INP_BLANKS = np.zeros(256, dtype=bool)
+_INP_BLANKS[list(b" \t\r\n")] = True
+
+
 # ********* generic FreeCAD import and export methods *********
 
 
@@ -61,9 +121,13 @@ def insert(filename, docname):
 def read(filename):
     """read a FemMesh from a inp mesh file and return the FemMesh"""
     # no document object is created, just the FemMesh is returned
-    mesh_data = read_inp(filename)
     from . import importToolsFem
 
+    mesh_arrays = read_inp_arrays(filename)
+    if mesh_arrays is not None:
+        return importToolsFem.make_femmesh_from_arrays(mesh_arrays)
+    # the line by line reader is used if a block could not be read in bulk
+    mesh_data = read_inp(filename)
     return importToolsFem.make_femmesh(mesh_data)
 
 
@@ -80,20 +144,7 @@ def read_inp(file_name):
     """read .inp file"""
     # ATM only mesh reading is supported (no boundary conditions)
 
-    class elements:
-
-        tria3 = {}
-        tria6 = {}
-        quad4 = {}
-        quad8 = {}
-        tetra4 = {}
-        tetra10 = {}
-        hexa8 = {}
-        hexa20 = {}
-        penta6 = {}
-        penta15 = {}
-        seg2 = {}
-        seg3 = {}
+    elements = {elm_key: {} for elm_key in ELEMENTS}
 
     error_seg3 = False  # to print "not supported"
     nodes = {}
@@ -142,10 +193,9 @@ def read_inp(file_name):
         elif read_node is True:
             line_list = line.split(",")
             number = int(line_list[0])
-            x = float(line_list[1])
-            y = float(line_list[2])
-            z = float(line_list[3])
-            nodes[number] = [x, y, z]
+            # omitted coordinates are zero, e.g. for 2D meshes
+            coords = [float(value) for value in line_list[1:4] if value.strip()]
+            nodes[number] = coords + [0.0] * (3 - len(coords))
 
         # reading elements
         elif line[:8].upper() == "*ELEMENT":
@@ -154,43 +204,12 @@ def read_inp(file_name):
                 if line_part.lstrip()[:4] == "TYPE":
                     elm_type = line_part.split("=")[1].strip()
 
-            if elm_type in ["S3", "CPS3", "CPE3", "CAX3"]:
-                elm_category = elements.tria3
-                number_of_nodes = 3
-            elif elm_type in ["S6", "CPS6", "CPE6", "CAX6"]:
-                elm_category = elements.tria6
-                number_of_nodes = 6
-            elif elm_type in ["S4", "S4R", "CPS4", "CPS4R", "CPE4", "CPE4R", "CAX4", "CAX4R"]:
-                elm_category = elements.quad4
-                number_of_nodes = 4
-            elif elm_type in ["S8", "S8R", "CPS8", "CPS8R", "CPE8", "CPE8R", "CAX8", "CAX8R"]:
-                elm_category = elements.quad8
-                number_of_nodes = 8
-            elif elm_type == "C3D4":
-                elm_category = elements.tetra4
-                number_of_nodes = 4
-            elif elm_type == "C3D10":
-                elm_category = elements.tetra10
-                number_of_nodes = 10
-            elif elm_type in ["C3D8", "C3D8R", "C3D8I"]:
-                elm_category = elements.hexa8
-                number_of_nodes = 8
-            elif elm_type in ["C3D20", "C3D20R", "C3D20RI"]:
-                elm_category = elements.hexa20
-                number_of_nodes = 20
-            elif elm_type == "C3D6":
-                elm_category = elements.penta6
-                number_of_nodes = 6
-            elif elm_type == "C3D15":
-                elm_category = elements.penta15
-                number_of_nodes = 15
-            elif elm_type in ["B31", "B31R", "T3D2"]:
-                elm_category = elements.seg2
-                number_of_nodes = 2
-            elif elm_type in ["B32", "B32R", "T3D3"]:
-                elm_category = elements.seg3
-                number_of_nodes = 3
-                error_seg3 = True  # to print "not supported"
+            if elm_type in INP_ELEMENT_TYPES:
+                elm_key = INP_ELEMENT_TYPES[elm_type]
+                number_of_nodes = ELEMENTS[elm_key][1]
+                elm_category = elements[elm_key]
+                if elm_key == "Seg3Elem":
+                    error_seg3 = True  # to print "not supported"
             else:
                 error_not_supported_elemtype = True
 
@@ -220,78 +239,179 @@ def read_inp(file_name):
     f.close()
 
     # switch from the CalculiX node numbering to the FreeCAD node numbering
-    # numbering do not change: tria3, tria6, quad4, quad8, seg2
-    for en in elements.tetra4:
-        n = elements.tetra4[en]
-        elements.tetra4[en] = [n[1], n[0], n[2], n[3]]
-    for en in elements.tetra10:
-        n = elements.tetra10[en]
-        elements.tetra10[en] = [n[1], n[0], n[2], n[3], n[4], n[6], n[5], n[8], n[7], n[9]]
-    for en in elements.hexa8:
-        n = elements.hexa8[en]
-        elements.hexa8[en] = [n[5], n[6], n[7], n[4], n[1], n[2], n[3], n[0]]
-    for en in elements.hexa20:
-        n = elements.hexa20[en]
-        elements.hexa20[en] = [
-            n[5],
-            n[6],
-            n[7],
-            n[4],
-            n[1],
-            n[2],
-            n[3],
-            n[0],
-            n[13],
-            n[14],
-            n[15],
-            n[12],
-            n[9],
-            n[10],
-            n[11],
-            n[8],
-            n[17],
-            n[18],
-            n[19],
-            n[16],
-        ]
-    for en in elements.penta6:
-        n = elements.penta6[en]
-        elements.penta6[en] = [n[4], n[5], n[3], n[1], n[2], n[0]]
-    for en in elements.penta15:
-        n = elements.penta15[en]
-        elements.penta15[en] = [
-            n[4],
-            n[5],
-            n[3],
-            n[1],
-            n[2],
-            n[0],
-            n[10],
-            n[11],
-            n[9],
-            n[7],
-            n[8],
-            n[6],
-            n[13],
-            n[14],
-            n[12],
-        ]
-    for en in elements.seg3:
-        n = elements.seg3[en]
-        elements.seg3[en] = [n[0], n[2], n[1]]
-
-    return {
-        "Nodes": nodes,
-        "Seg2Elem": elements.seg2,
-        "Seg3Elem": elements.seg3,
-        "Tria3Elem": elements.tria3,
-        "Tria6Elem": elements.tria6,
-        "Quad4Elem": elements.quad4,
-        "Quad8Elem": elements.quad8,
-        "Tetra4Elem": elements.tetra4,
-        "Tetra10Elem": elements.tetra10,
-        "Hexa8Elem": elements.hexa8,
-        "Hexa20Elem": elements.hexa20,
-        "Penta6Elem": elements.penta6,
-        "Penta15Elem": elements.penta15,
+    for elm_key, node_order in CCX_TO_FC_NODE_ORDER.items():
+        elm_category = elements[elm_key]
+        for en in elm_category:
+            n = elm_category[en]
+            elm_category[en] = [n[i] for i in node_order]
+
+    mesh_data = {"Nodes": nodes}
+    mesh_data.update(elements)
+    return mesh_data
+
+
+def read_inp_arrays(file_name):
+    """read the nodes and elements of an .inp file into NumPy arrays
+
+    The whole data lines of a *NODE or *ELEMENT block are tokenized by NumPy.
+    Returns the mesh arrays as used by importToolsFem.make_femmesh_from_arrays()
+    or None if a block could not be read this way.
+    """
+    mesh_blocks = {"Nodes": [], "model_definition": True}
+    if not _read_inp_blocks(file_name, mesh_blocks):
+        Console.PrintLog(f"Bulk reading of {file_name} failed, the lines are read one by one.\n")
+        return None
+
+    node_blocks = mesh_blocks.pop("Nodes")
+    del mesh_blocks["model_definition"]
+    nodes = np.concatenate(node_blocks + [np.empty((0, 4))])
+    nodes = _unique_rows(nodes, "node")
+    mesh_arrays = {
+        "node_ids": nodes[:, 0].astype(np.int64),
+        "nodes": np.ascontiguousarray(nodes[:, 1:]),
     }
+    for elm_key, elm_blocks in mesh_blocks.items():
+        if elm_key == "Seg3Elem":  # to print "not supported"
+            Console.PrintError("Error: seg3 (3-node beam element type) not supported, yet.\n")
+        elm_data = _unique_rows(np.concatenate(elm_blocks), "element")
+        elm_nodes = elm_data[:, 1:]
+        if elm_key in CCX_TO_FC_NODE_ORDER:
+            elm_nodes = elm_nodes[:, CCX_TO_FC_NODE_ORDER[elm_key]]
+        elm_kind, number_of_nodes = ELEMENTS[elm_key]
+        array_key = elm_kind + str(number_of_nodes)
+        mesh_arrays[array_key + "_ids"] = elm_data[:, 0]
+        mesh_arrays[array_key] = np.ascontiguousarray(elm_nodes)
+    return mesh_arrays
+
+
+def _read_inp_blocks(file_name, mesh_blocks):
+    # adds the node and element arrays of an .inp file and its included files to mesh_blocks
+    if os.path.getsize(file_name) == 0:
+        return True
+    with pyopen(file_name, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        for keyword, block in _get_keyword_blocks(data):
+            keyword_name, _, parameters = keyword.decode(errors="replace").partition(",")
+            keyword_name = keyword_name.strip().upper()
+
+            if keyword_name == "*INCLUDE":
+                include = parameters.partition("=")[2].strip().strip('"')
+                include_path = os.path.normpath(include)
+                if not os.path.isfile(include_path):
+                    include_path = os.path.join(os.path.split(file_name)[0], include_path)
+                if not _read_inp_blocks(include_path, mesh_blocks):
+                    return False
+
+            elif keyword_name == "*STEP":
+                mesh_blocks["model_definition"] = False
+
+            elif keyword_name == "*NODE" and mesh_blocks["model_definition"]:
+                nodes = _read_block_values(block, np.float64, 4)
+                if nodes is None:
+                    return False
+                mesh_blocks["Nodes"].append(nodes)
+
+            elif keyword_name == "*ELEMENT":
+                elm_type = ""
+                for parameter in parameters.upper().split(","):
+                    if parameter.lstrip()[:4] == "TYPE":
+                        elm_type = parameter.split("=")[1].strip()
+                if elm_type not in INP_ELEMENT_TYPES:
+                    Console.PrintError(f"Error: {elm_type} not supported.\n")
+                    continue
+                elm_key = INP_ELEMENT_TYPES[elm_type]
+                number_of_nodes = ELEMENTS[elm_key][1]
+                elm_data = _read_block_values(block, np.int64, 1 + number_of_nodes)
+                if elm_data is None:
+                    return False
+                mesh_blocks.setdefault(elm_key, []).append(elm_data)
+    return True
+
+
+def _get_keyword_blocks(data):
+    # returns the keyword lines and the data lines following them
+    # the lines starting with a star are searched, the data in between is not touched
+    # comment lines start with two stars, they are removed out of the data lines
+    star_lines = [0] if data[:1] == b"*" else []
+    pos = data.find(b"\n*")
+    while pos != -1:
+        star_lines.append(pos + 1)
+        pos = data.find(b"\n*", pos + 1)
+    star_lines.append(len(data))
+
+    keyword_blocks = []
+    for start, end in zip(star_lines, star_lines[1:]):
+        line_end = data.find(b"\n", start, end)
+        if line_end == -1:
+            line_end = end
+        block = data[line_end:end]
+        if data[start : start + 2] == b"**":
+            if keyword_blocks:
+                keyword_blocks[-1][1].append(block)
+            continue
+        keyword_blocks.append((data[start:line_end].rstrip(), [block]))
+    return [(keyword, b"".join(blocks)) for keyword, blocks in keyword_blocks]
+
+
+def _read_block_values(block, dtype, values_per_line):
+    # returns the values of a data block as array with values_per_line columns
+    # or None if the block could not be tokenized as a whole
+    text = block.translate(_INP_SEPARATORS).strip()
+    if not text:
+        return np.empty((0, values_per_line), dtype=dtype)
+    with warnings.catch_warnings():
+        # older NumPy versions warn instead of raising on unparsable data
+        warnings.simplefilter("error", DeprecationWarning)
+        try:
+            values = np.fromstring(text, dtype=dtype, sep=" ")
+        except (ValueError, DeprecationWarning):
+            return None
+    if values.size % values_per_line != 0 or not _block_records_match(block, values_per_line):
+        return None
+    return values.reshape(-1, values_per_line)
+
+
+def _block_records_match(block, values_per_line):
+    # checks each record of a data block has values_per_line values
+    # a record is a line with values, a line ending with a comma is continued on the next one
+    # e.g. nodes without z coordinate do not match and are read line by line
+    data = np.frombuffer(block, dtype=np.uint8)
+    comma = data == ord(",")
+    separator = _INP_BLANKS[data] | comma
+    value_starts = np.flatnonzero(~separator[1:] & separator[:-1]) + 1
+    if len(data) and not separator[0]:
+        value_starts = np.concatenate(([0], value_starts))
+    line_ends = np.flatnonzero(data == ord("\n"))
+    number_of_lines = len(line_ends) + 1
+
+    value_lines = np.searchsorted(line_ends, value_starts)
+    line_values = np.bincount(value_lines, minlength=number_of_lines)
+    # a line is continued if its last comma follows its last value
+    commas = np.flatnonzero(comma)
+    continued = _line_last(commas, line_ends) > _line_last(value_starts, line_ends)
+
+    lines = np.flatnonzero(line_values)
+    if not len(lines):
+        return False
+    record_starts = np.flatnonzero(np.concatenate(([True], ~continued[lines[:-1]])))
+    record_values = np.add.reduceat(line_values[lines], record_starts)
+    return bool(np.all(record_values == values_per_line))
+
+
+def _line_last(positions, line_ends):
+    # returns the last of the sorted positions in each line, -1 for lines without
+    lines = np.searchsorted(line_ends, positions)
+    last = np.concatenate((lines[1:] != lines[:-1], [True]))[: len(lines)]
+    line_last = np.full(len(line_ends) + 1, -1)
+    line_last[lines[last]] = positions[last]
+    return line_last
+
+
+def _unique_rows(values, kind):
+    # the last row of a duplicate id wins as in read_inp()
+    ids, counts = np.unique(values[:, 0], return_counts=True)
+    if len(ids) == len(values):
+        return values
+    duplicates = ids[counts > 1][:10].astype(np.int64).tolist()
+    Console.PrintWarning(f"Duplicate {kind} ids {duplicates}, the last definition is used.\n")
+    last = len(values) - 1 - np.unique(values[::-1, 0], return_index=True)[1]
+    return values[np.sort(last)]
@@ -0,0 +1,147 @@
+# ***************************************************************************
+# *   Copyright (c) 2024 FreeCAD Project Association                        *
+# *                                                                         *
+# *   This file is part of the FreeCAD CAx development system.              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+__title__ = "FreeCAD binary NumPy mesh reader and writer"
+__author__ = "FreeCAD Project Association"
+__url__ = "https://www.freecad.org"
+
+## @package importNpzMesh
+#  \ingroup FEM
+#  \brief FreeCAD binary NumPy mesh reader and writer for FEM workbench
+
+import os
+
+import numpy as np
+
+import FreeCAD
+from FreeCAD import Console
+
+from femmesh import meshtools
+
+from builtins import open as pyopen
+
+# the mesh is saved as uncompressed NumPy .npz archive:
+# - "node_ids": node numbers, int64 array (n)
+# - "nodes": node coordinates, float64 array (n, 3)
+# - for every element kind and node count, e.g. "volume10" for Tetra10:
+#   "<kind><count>_ids": element numbers, int64 array (m)
+#   "<kind><count>": element nodes in FreeCAD node order, int64 array (m, count)
+# an array is read with one copy out of the file, no Python code is evaluated
+
+FORMAT_VERSION = 1
+
+
+# ****************************************************************************
+# ********* generic FreeCAD import and export methods ************************
+# names are fix given from FreeCAD, these methods are called from FreeCAD
+# they are set in FEM modules Init.py
+
+
+def open(filename):
+    """called when freecad opens a file
+    a FEM mesh object is created in a new document"""
+
+    docname = os.path.splitext(os.path.basename(filename))[0]
+    return insert(filename, docname)
+
+
+def insert(filename, docname):
+    """called when freecad wants to import a file"
+    a FEM mesh object is created in a existing document"""
+
+    try:
+        doc = FreeCAD.getDocument(docname)
+    except NameError:
+        doc = FreeCAD.newDocument(docname)
+    FreeCAD.ActiveDocument = doc
+
+    import_npz_mesh(filename)
+    return doc
+
+
+def export(objectslist, filename):
+    "called when freecad exports a file"
+    if len(objectslist) != 1:
+        Console.PrintError("This exporter can only export one object.\n")
+        return
+    obj = objectslist[0]
+    if not obj.isDerivedFrom("Fem::FemMeshObject"):
+        Console.PrintError("No FEM mesh object selected.\n")
+        return
+
+    write(filename, obj.FemMesh)
+
+
+# ****************************************************************************
+# ********* module specific methods ******************************************
+# reader:
+# - a method uses a FemMesh instance, creates the FEM mesh document object and
+#     returns this object
+# - a method reads the arrays from file and creates the FemMesh instance
+#
+# writer:
+# - a method directly writes a FemMesh to the mesh file
+
+
+# ********* reader ***********************************************************
+def import_npz_mesh(filename):
+    """
+    read a FemMesh from a binary NumPy mesh file
+    insert a FreeCAD FEM Mesh object in the ActiveDocument
+    return the FEM mesh document object
+    """
+
+    mesh_name = os.path.basename(os.path.splitext(filename)[0])
+
+    mesh_object = None
+    femmesh = read(filename)
+    if femmesh:
+        mesh_object = FreeCAD.ActiveDocument.addObject("Fem::FemMeshObject", mesh_name)
+        mesh_object.FemMesh = femmesh
+
+    return mesh_object
+
+
+def read(filename):
+    """read a FemMesh from a binary NumPy mesh file and return the FemMesh"""
+    # no document object is created, just the FemMesh is returned
+    from . import importToolsFem
+
+    with np.load(filename) as mesh_data:
+        mesh_arrays = {key: mesh_data[key] for key in mesh_data.files}
+    if "nodes" not in mesh_arrays:
+        Console.PrintError(f"No nodes found in binary mesh file: {filename}\n")
+        return None
+    return importToolsFem.make_femmesh_from_arrays(mesh_arrays)
+
+
+# ********* writer ***********************************************************
+def write(filename, fem_mesh):
+    """directly write a FemMesh to a binary NumPy mesh file
+    fem_mesh: a FemMesh"""
+
+    mesh_arrays = meshtools.get_mesh_arrays(fem_mesh)
+    mesh_arrays["format_version"] = np.array(FORMAT_VERSION)
+    # a file object is used, otherwise NumPy appends the extension .npz
+    with pyopen(filename, "wb") as f:
+        np.savez(f, **mesh_arrays)
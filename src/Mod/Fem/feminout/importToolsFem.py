@@ -279,6 +279,42 @@ def make_femmesh(mesh_data):
     return mesh
 
 
+def make_femmesh_from_arrays(mesh_arrays):
+    """makes an FreeCAD FEM Mesh object from NumPy mesh arrays
+
+    mesh_arrays: dictionary as returned by meshtools.get_mesh_arrays()
+    - "node_ids" and "nodes": node numbers and node coordinates
+    - "<edge|face|volume><node count>" and "<key>_ids": element nodes and element numbers
+    all nodes are added by one call, the element nodes are in FreeCAD node order
+    """
+    import Fem
+
+    mesh = Fem.FemMesh()
+    if "nodes" not in mesh_arrays or len(mesh_arrays["nodes"]) == 0:
+        Console.PrintError("No Nodes found!\n")
+        return mesh
+    mesh.addNodes(mesh_arrays["nodes"].ravel().tolist(), mesh_arrays["node_ids"].tolist())
+    add_element = {
+        "edge": mesh.addEdge,
+        "face": mesh.addFace,
+        "volume": mesh.addVolume,
+    }
+    for kind in ("volume", "face", "edge"):
+        add = add_element[kind]
+        for key in sorted(mesh_arrays):
+            if key.rstrip("0123456789") != kind:
+                continue
+            element_ids = mesh_arrays[key + "_ids"].tolist()
+            for element_id, nodes in zip(element_ids, mesh_arrays[key].tolist()):
+                add(nodes, element_id)
+    Console.PrintLog(
+        "imported mesh: {} nodes, {} edges, {} faces, {} volumes\n".format(
+            mesh.NodeCount, mesh.EdgeCount, mesh.FaceCount, mesh.VolumeCount
+        )
+    )
+    return mesh
+
+
 def make_dict_from_femmesh(femmesh):
     """
     Converts FemMesh into dictionary structure which can immediately used
@@ -491,3 +527,92 @@ def fill_femresult_mechanical(res_obj, result_set):
             res_obj.Time = step_time
 
     return res_obj
+
+
+def fill_femresult_mechanical_arrays(res_obj, result_set):
+    """
+    fills a FreeCAD FEM mechanical result object with result data
+    the result values are tuples (node_numbers, values) of NumPy arrays
+    as returned by importCcxFrdResults.iter_frd_result_sets
+    """
+    if "number" in result_set:
+        eigenmode_number = result_set["number"]
+    else:
+        eigenmode_number = 0
+
+    if "time" in result_set:
+        step_time = result_set["time"]
+        step_time = round(step_time, 2)
+
+    def vectors(values):
+        return list(map(tuple, values.tolist()))
+
+    number_of_nodes = None
+    if "disp" in result_set:
+        node_numbers, disp = result_set["disp"]
+        number_of_nodes = len(node_numbers)
+        res_obj.DisplacementVectors = vectors(disp)
+        res_obj.NodeNumbers = node_numbers.tolist()
+
+        if "stress" in result_set:
+            # stress tensor columns (Sxx, Syy, Szz, Sxy, Sxz, Syz)
+            stress = result_set["stress"][1]
+            res_obj.NodeStressXX = stress[:, 0].tolist()
+            res_obj.NodeStressYY = stress[:, 1].tolist()
+            res_obj.NodeStressZZ = stress[:, 2].tolist()
+            res_obj.NodeStressXY = stress[:, 3].tolist()
+            res_obj.NodeStressXZ = stress[:, 4].tolist()
+            res_obj.NodeStressYZ = stress[:, 5].tolist()
+
+        if "strain" in result_set:
+            # strain tensor columns (Exx, Eyy, Ezz, Exy, Exz, Eyz)
+            strain = result_set["strain"][1]
+            res_obj.NodeStrainXX = strain[:, 0].tolist()
+            res_obj.NodeStrainYY = strain[:, 1].tolist()
+            res_obj.NodeStrainZZ = strain[:, 2].tolist()
+            res_obj.NodeStrainXY = strain[:, 3].tolist()
+            res_obj.NodeStrainXZ = strain[:, 4].tolist()
+            res_obj.NodeStrainYZ = strain[:, 5].tolist()
+
+        if "peeq" in result_set:
+            peeq = result_set["peeq"][1]
+            if len(peeq) > 0:
+                if len(peeq) != number_of_nodes:
+                    Console.PrintError("PEEQ seems to have extra nodes.\n")
+                res_obj.Peeq = peeq[:number_of_nodes].tolist()
+
+        if eigenmode_number > 0:
+            res_obj.Eigenmode = eigenmode_number
+
+    if "temp" in result_set:
+        temp_node_numbers, temperature = result_set["temp"]
+        if len(temperature) > 0:
+            if number_of_nodes is None:
+                res_obj.Temperature = temperature.tolist()
+                res_obj.NodeNumbers = temp_node_numbers.tolist()
+            else:
+                if len(temperature) != number_of_nodes:
+                    Console.PrintError("Temperature seems to have extra nodes.\n")
+                res_obj.Temperature = temperature[:number_of_nodes].tolist()
+            res_obj.Time = step_time
+
+    if "heatflux" in result_set:
+        heatflux = result_set["heatflux"][1]
+        if len(heatflux) > 0:
+            res_obj.HeatFlux = vectors(heatflux)
+
+    if "mflow" in result_set:
+        mflow_node_numbers, massflow = result_set["mflow"]
+        if len(massflow) > 0:
+            res_obj.MassFlowRate = massflow.tolist()
+            res_obj.Time = step_time
+            # disp does not exist, res_obj.NodeNumbers needs to be set
+            res_obj.NodeNumbers = mflow_node_numbers.tolist()
+
+    if "npressure" in result_set:
+        networkpressure = result_set["npressure"][1]
+        if len(networkpressure) > 0:
+            res_obj.NetworkPressure = networkpressure.tolist()
+            res_obj.Time = step_time
+
+    return res_obj
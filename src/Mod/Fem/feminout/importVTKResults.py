@@ -139,6 +139,11 @@ def importVtkFCResult(filename, resultname, analysis=None, result_name_prefix=No
 
         result_obj = restools.add_disp_apps(result_obj)  # DisplacementLengths
 
+    from femresult import resultcache
+
+    if resultcache.is_enabled():
+        resultcache.store_result(result_obj, resultcache.get_file_hash(filename))
+
     """ seems unused at the moment
     filenamebase = ".".join(filename.split(".")[:-1])  # pattern: filebase_timestamp.vtk
     ts = filenamebase.split("_")[-1]
@@ -34,9 +34,15 @@ __url__ = "https://www.freecad.org"
 
 import time
 
+import numpy as np
+
 import FreeCAD
 import Fem
 
+from femresult import resultcache
+
+from . import meshtools
+
 # import Mesh
 
 
@@ -90,167 +96,97 @@ face_dicts = {
 
 
 def femmesh_2_mesh(myFemMesh, myResults=None, myDispScale=1):
-    shiftBits = 20  # allows a million nodes, needs to be higher for more nodes in a FemMesh
+    """Returns the surface triangles of a FemMesh as list of points.
 
-    # This code generates a dict and a faceCode for each face of all elements
-    # All faceCodes are than sorted.
+    Every three points define a triangle, the list can be passed to Mesh.Mesh().
+    If a result object is given, the points are moved by the scaled displacements.
+    """
+
+    # This code collects the corner nodes of every face of all elements.
+    # The faces are keyed by their sorted node numbers and counted.
+    # A face which is used by only one element is on the surface of the mesh.
+    # All is done with array operations, thus there is no limit on the node numbers.
 
     start_time = time.process_time()
-    faceCodeList = []
-    faceCodeDict = {}
+    mesh_arrays = meshtools.get_mesh_arrays(myFemMesh)
 
+    face_nodes = {3: [], 4: []}
     if myFemMesh.VolumeCount > 0:
-        for ele in myFemMesh.Volumes:
-            element_nodes = myFemMesh.getElementNodes(ele)
-            # print("element_node: ", element_nodes)
-            faceDef = face_dicts[len(element_nodes)]
-
-            for key in faceDef:
-                nodeList = []
-                codeList = []
-                faceCode = 0
-                shifter = 0
-                for nodeIdx in faceDef[key]:
-                    nodeList.append(element_nodes[nodeIdx])
-                    codeList.append(element_nodes[nodeIdx])
-                codeList.sort()
-                for node in codeList:
-                    faceCode += node << shifter
-                    # x << n: x shifted left by n bits = Multiplication
-                    shifter += shiftBits
-                # print("codeList: ", codeList)
-                faceCodeDict[faceCode] = nodeList
-                faceCodeList.append(faceCode)
+        for key, element_nodes in mesh_arrays.items():
+            if not key.startswith("volume") or key.endswith("_ids"):
+                continue
+            for faceDef in face_dicts[element_nodes.shape[1]].values():
+                face_nodes[len(faceDef)].append(element_nodes[:, faceDef])
     elif myFemMesh.FaceCount > 0:
-        for ele in myFemMesh.Faces:
-            element_nodes = myFemMesh.getElementNodes(ele)
-            # print("element_node: ", element_nodes)
-            faceDef = {1: [0, 1, 2]}
-
-            for key in faceDef:
-                nodeList = []
-                codeList = []
-                faceCode = 0
-                shifter = 0
-                for nodeIdx in faceDef[key]:
-                    nodeList.append(element_nodes[nodeIdx])
-                    codeList.append(element_nodes[nodeIdx])
-                codeList.sort()
-                for node in codeList:
-                    faceCode += node << shifter
-                    # x << n: x shifted left by n bits = Multiplication
-                    shifter += shiftBits
-                # print("codeList: ", codeList)
-                faceCodeDict[faceCode] = nodeList
-                faceCodeList.append(faceCode)
-
-    faceCodeList.sort()
-    allFaces = len(faceCodeList)
-    actFaceIdx = 0
+        for key, element_nodes in mesh_arrays.items():
+            if not key.startswith("face") or key.endswith("_ids"):
+                continue
+            face_nodes[3].append(element_nodes[:, [0, 1, 2]])
+
     singleFaces = []
-    # Here we search for faces, which do not have a counterpart.
-    # These are the faces on the surface of the mesh.
-    while actFaceIdx < allFaces:
-        if actFaceIdx < (allFaces - 1):
-            if faceCodeList[actFaceIdx] == faceCodeList[actFaceIdx + 1]:
-                actFaceIdx += 2
-            else:
-                # print("found a single Face: ", faceCodeList[actFaceIdx])
-                singleFaces.append(faceCodeList[actFaceIdx])
-                actFaceIdx += 1
-        else:
-            FreeCAD.Console.PrintMessage(f"Found a last Face: {faceCodeList[actFaceIdx]}\n")
-            singleFaces.append(faceCodeList[actFaceIdx])
-            actFaceIdx += 1
-
-    output_mesh = []
+    for faces in face_nodes.values():
+        if not faces:
+            continue
+        faces = np.concatenate(faces)
+        faceCodes = np.sort(faces, axis=1)
+        # unique returns the index of the first occurrence of every face
+        # thus the face nodes keep the orientation given by the element
+        _, faceIdx, faceCount = np.unique(faceCodes, axis=0, return_index=True, return_counts=True)
+        singleFaces.append(faces[faceIdx[faceCount == 1]])
+
+    # split the quadrilateral faces into two triangles
+    triangles = [np.empty((0, 3), dtype=np.int64)]
+    for faces in singleFaces:
+        triangles.append(faces[:, [0, 1, 2]])
+        if faces.shape[1] == 4:
+            triangles.append(faces[:, [2, 3, 0]])
+    triangles = np.concatenate(triangles)
+
+    # node numbers to row index of the coordinate array
+    node_ids = mesh_arrays["node_ids"]
+    node_order = np.argsort(node_ids)
+    node_ids = node_ids[node_order]
+    coords = mesh_arrays["nodes"][node_order]
+
     if myResults:
         FreeCAD.Console.PrintMessage(f"{myResults.Name}\n")
-        for myFace in singleFaces:
-            face_nodes = faceCodeDict[myFace]
-            dispVec0 = myResults.DisplacementVectors[myResults.NodeNumbers.index(face_nodes[0])]
-            dispVec1 = myResults.DisplacementVectors[myResults.NodeNumbers.index(face_nodes[1])]
-            dispVec2 = myResults.DisplacementVectors[myResults.NodeNumbers.index(face_nodes[2])]
-            triangle = [
-                myFemMesh.getNodeById(face_nodes[0]) + dispVec0 * myDispScale,
-                myFemMesh.getNodeById(face_nodes[1]) + dispVec1 * myDispScale,
-                myFemMesh.getNodeById(face_nodes[2]) + dispVec2 * myDispScale,
-            ]
-            output_mesh.extend(triangle)
-            # print("my triangle: ", triangle)
-            if len(face_nodes) == 4:
-                dispVec3 = myResults.DisplacementVectors[myResults.NodeNumbers.index(face_nodes[3])]
-                triangle = [
-                    myFemMesh.getNodeById(face_nodes[2]) + dispVec2 * myDispScale,
-                    myFemMesh.getNodeById(face_nodes[3]) + dispVec3 * myDispScale,
-                    myFemMesh.getNodeById(face_nodes[0]) + dispVec0 * myDispScale,
-                ]
-                output_mesh.extend(triangle)
-                # print("my 2. triangle: ", triangle)
-
-    else:
-        for myFace in singleFaces:
-            face_nodes = faceCodeDict[myFace]
-            triangle = [
-                myFemMesh.getNodeById(face_nodes[0]),
-                myFemMesh.getNodeById(face_nodes[1]),
-                myFemMesh.getNodeById(face_nodes[2]),
-            ]
-            output_mesh.extend(triangle)
-            # print("my triangle: ", triangle)
-            if len(face_nodes) == 4:
-                triangle = [
-                    myFemMesh.getNodeById(face_nodes[2]),
-                    myFemMesh.getNodeById(face_nodes[3]),
-                    myFemMesh.getNodeById(face_nodes[0]),
-                ]
-                output_mesh.extend(triangle)
-                # print("my 2. triangle: ", triangle)
+        resultcache.load_result(myResults, ["NodeNumbers", "DisplacementVectors"])
+        result_nodes = np.array(myResults.NodeNumbers, dtype=np.int64)
+        disp = np.array([tuple(v) for v in myResults.DisplacementVectors], dtype=np.float64)
+        in_mesh = np.isin(result_nodes, node_ids)
+        coords = coords.copy()
+        coords[np.searchsorted(node_ids, result_nodes[in_mesh])] += (
+            disp.reshape(-1, 3)[in_mesh] * myDispScale
+        )
+
+    output_mesh = coords[np.searchsorted(node_ids, triangles.ravel())].tolist()
 
     end_time = time.process_time()
     FreeCAD.Console.PrintMessage(f"Mesh by surface search method: {end_time - start_time}\n")
     # call to mesh_2_femmesh to convert mesh to femmesh before return statement
-    mesh2femmesh = mesh_2_femmesh(myFemMesh, singleFaces, faceCodeDict)
+    mesh2femmesh = mesh_2_femmesh(myFemMesh, singleFaces)
     return output_mesh
 
 
 # additional function to convert mesh to femmesh
-def mesh_2_femmesh(myFemMesh, singleFaces, faceCodeDict):
+def mesh_2_femmesh(myFemMesh, singleFaces):
+    # singleFaces: arrays of the surface faces node numbers, one array per face node count
     start_time = time.process_time()
     femmesh = Fem.FemMesh()
     myfemmesh = myFemMesh.Nodes
     # nodes contains the nodes that are used
-    nodes = {}
-    for myFace in singleFaces:
-        face_nodes = faceCodeDict[myFace]
-        for j in (0, 1, 2):
-            try:
-                nodes[face_nodes[j]] += 1
-            except:
-                nodes[face_nodes[j]] = 0
-        if len(face_nodes) == 4:
-            j = 3
-            try:
-                nodes[face_nodes[j]] += 1
-            except:
-                nodes[face_nodes[j]] = 0
+    nodes = np.unique(np.concatenate([faces.ravel() for faces in singleFaces] + [[]]))
     sfNode = femmesh.addNode
     sfFace = femmesh.addFace
-    for key in myFemMesh.Nodes:
+    for key in nodes.astype(np.int64).tolist():
         mynode = myfemmesh[key]
-        try:
-            if nodes[key] >= 0:
-                sfNode(mynode[0], mynode[1], mynode[2], key)
-        except:
-            pass
-
-    output_mesh = []
-
-    for myFace in singleFaces:
-        face_nodes = faceCodeDict[myFace]
-        sfFace(face_nodes[0], face_nodes[1], face_nodes[2])
-        if len(face_nodes) == 4:
-            sfFace(face_nodes[2], face_nodes[3], face_nodes[0])
+        sfNode(mynode[0], mynode[1], mynode[2], key)
+
+    for faces in singleFaces:
+        for face_nodes in faces.tolist():
+            sfFace(face_nodes[0], face_nodes[1], face_nodes[2])
+            if len(face_nodes) == 4:
+                sfFace(face_nodes[2], face_nodes[3], face_nodes[0])
     obj = FreeCAD.ActiveDocument.addObject("Fem::FemMeshObject", "Mesh2Fem")
     obj.FemMesh = femmesh
     end_time = time.process_time()
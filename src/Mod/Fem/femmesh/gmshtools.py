@@ -27,7 +27,9 @@ __url__ = "https://www.freecad.org"
 ## \addtogroup FEM
 #  @{
 
+import hashlib
 import os
+import shutil
 import subprocess
 
 import FreeCAD
@@ -183,6 +185,7 @@ class GmshTools:
         self.temp_file_geo = ""
         self.mesh_name = ""
         self.gmsh_bin = ""
+        self.gmsh_returncode = None
         self.error = False
 
     def update_mesh_data(self):
@@ -202,7 +205,20 @@ class GmshTools:
             self.get_tmp_file_paths()
             self.get_gmsh_command()
             self.write_gmsh_input_files()
-            error = self.run_gmsh_with_geo()
+            cache_file = self.get_mesh_cache_file()
+            if cache_file and os.path.isfile(cache_file):
+                Console.PrintMessage("  Unchanged mesh found in cache, Gmsh is not run.\n")
+                Console.PrintLog(f"  Mesh cache file: {cache_file}\n")
+                shutil.copyfile(cache_file, self.temp_file_mesh)
+                # the modification time is the last use for the pruning of the cache
+                os.utime(cache_file)
+                error = ""
+            else:
+                if cache_file and os.path.isfile(self.temp_file_mesh):
+                    # the mesh of a former run must never be cached
+                    os.remove(self.temp_file_mesh)
+                error = self.run_gmsh_with_geo()
+                self.write_mesh_cache_file(cache_file, error)
             self.read_and_set_new_mesh()
         except GmshError as e:
             error = str(e)
@@ -918,12 +934,14 @@ class GmshTools:
     def run_gmsh_with_geo(self):
         command_list = [self.gmsh_bin, "-", self.temp_file_geo]
         # print(command_list)
+        self.gmsh_returncode = None
         try:
             p = subprocess.Popen(
                 command_list, shell=False, stdout=subprocess.PIPE, stderr=subprocess.PIPE
             )
             output, error = p.communicate()
             error = error.decode("utf-8")
+            self.gmsh_returncode = p.returncode
             # stdout is still cut at some point
             # but the warnings are in stderr and thus printed :-)
             # print(output)
@@ -949,6 +967,45 @@ class GmshTools:
 
         return new_err
 
+    def get_mesh_cache_file(self):
+        # the mesh cache is content addressed, the key is the hash of the Gmsh input
+        # the geo file holds all mesh settings, regions, boundary layers and groups
+        prefs = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Fem/Gmsh")
+        if not prefs.GetBool("UseMeshCache", False):
+            return None
+        mesh_hash = hashlib.sha256()
+        with open(self.temp_file_geometry, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                mesh_hash.update(chunk)
+        with open(self.temp_file_geo, "r") as f:
+            # the working directory does not change the mesh
+            mesh_hash.update(f.read().replace(self.working_dir, "").encode())
+        # another Gmsh binary could create another mesh
+        gmsh_bin = shutil.which(self.gmsh_bin)
+        if gmsh_bin:
+            gmsh_stat = os.stat(gmsh_bin)
+            mesh_hash.update(f"{gmsh_stat.st_size} {gmsh_stat.st_mtime}".encode())
+        cache_dir = os.path.join(FreeCAD.getUserCachePath(), "FemGmshMeshes")
+        return os.path.join(cache_dir, mesh_hash.hexdigest() + ".unv")
+
+    def write_mesh_cache_file(self, cache_file, gmsh_error):
+        # only the mesh of a clean Gmsh run is cached, a mesh with errors is never reused
+        if not cache_file or self.error or not os.path.isfile(self.temp_file_mesh):
+            return
+        if self.gmsh_returncode != 0 or "Error" in gmsh_error:
+            Console.PrintLog("  Gmsh reported errors, the mesh is not cached.\n")
+            return
+        try:
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+            # copy first and rename, a concurrent run never reads a partial file
+            shutil.copyfile(self.temp_file_mesh, cache_file + ".part")
+            os.replace(cache_file + ".part", cache_file)
+        except OSError as e:
+            Console.PrintWarning(f"Mesh could not be cached: {e}\n")
+            return
+        prefs = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Fem/Gmsh")
+        prune_mesh_cache(os.path.dirname(cache_file), prefs.GetInt("MeshCacheSize", 1000) << 20)
+
     def read_and_set_new_mesh(self):
         if not self.error:
             fem_mesh = Fem.read(self.temp_file_mesh)
@@ -969,6 +1026,32 @@ class GmshTools:
         Console.PrintWarning(error_message + "\n")
 
 
+def prune_mesh_cache(cache_dir, max_size):
+    """Removes the least recently used meshes until the cache is not larger than max_size bytes.
+
+    The modification time of a cached mesh is updated whenever it is used.
+    """
+    entries = []
+    try:
+        with os.scandir(cache_dir) as it:
+            for entry in it:
+                if entry.is_file() and entry.name.endswith(".unv"):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+    except OSError:
+        return
+    size = sum(entry[1] for entry in entries)
+    for _, file_size, path in sorted(entries):
+        if size <= max_size:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        size -= file_size
+        Console.PrintLog(f"  Mesh removed from the cache: {path}\n")
+
+
 ##  @}
 
 
@@ -33,6 +33,7 @@ import time
 import FreeCAD
 
 from femmesh import meshtools
+from femtools.femutils import fork_available
 from femtools.femutils import type_of_obj
 
 
@@ -43,12 +44,15 @@ class MeshSetsGetter:
         solver_obj,
         mesh_obj,
         member,
+        processes=1,
     ):
         # class attributes from parameter values
         self.analysis = analysis_obj
         self.solver_obj = solver_obj  # TODO without _obj
         self.mesh_object = mesh_obj  # TODO without _object
         self.member = member
+        # number of processes used for the reference shape node search
+        self.processes = processes
 
         # more attributes
         self.analysis_type = self.solver_obj.AnalysisType
@@ -95,6 +99,7 @@ class MeshSetsGetter:
         self.femelement_table = {}
         self.constraint_conflict_nodes = []
         self.femnodes_ele_table = {}
+        self.femnodes_index = None
         self.femelements_edges_only = []
         self.femelements_faces_only = []
         self.femelement_volumes_table = {}
@@ -111,6 +116,16 @@ class MeshSetsGetter:
     #     - done in return value of meshtools.get_femnodes_by_femobj_with_references
     # TODO FIXME might be appropriate for element sets and surfaceface sets too
 
+    # ********************************************************************************************
+    # ********************************************************************************************
+    # spatial index over the mesh nodes, built once and used for all reference shapes
+    def get_femnodes_index(self):
+        if self.femnodes_index is None:
+            if not self.femnodes_mesh:
+                self.femnodes_mesh = self.femmesh.Nodes
+            self.femnodes_index = meshtools.FemNodesIndex(self.femnodes_mesh, self.femmesh)
+        return self.femnodes_index
+
     # ********************************************************************************************
     # ********************************************************************************************
     # get all known sets
@@ -127,6 +142,9 @@ class MeshSetsGetter:
 
         time_start = time.process_time()
 
+        # node search of all reference shapes at once, if more processes are used
+        self.get_reference_shapes_nodes()
+
         # materials and element geometry element sets getter
         self.get_element_sets_material_and_femelement_geometry()
 
@@ -155,6 +173,57 @@ class MeshSetsGetter:
         setstime = round((time.process_time() - time_start), 3)
         FreeCAD.Console.PrintMessage(f"Getting mesh data time: {setstime} seconds.\n")
 
+    # ********************************************************************************************
+    # ********************************************************************************************
+    # the reference shapes of all objects are independent of each other
+    # their nodes are searched concurrently and cached in the femnodes_index
+    # the sets are built afterwards in the usual order from the cached nodes
+    def get_reference_shapes_nodes(self):
+        if self.processes < 2 or not fork_available():
+            return
+        if self.femmesh.GroupCount:
+            FreeCAD.Console.PrintLog(
+                "    Mesh with group data, the reference shape nodes are searched on demand.\n"
+            )
+            return
+        femobjs = (
+            self.member.mats_linear
+            + self.member.geos_shellthickness
+            + self.member.geos_beamsection
+            + self.member.geos_fluidsection
+            + self.member.cons_centrif
+            + self.member.cons_bodyheatsource
+            + self.member.cons_fixed
+            + self.member.cons_displacement
+            + self.member.cons_rigidbody
+            + self.member.cons_planerotation
+            + self.member.cons_contact
+            + self.member.cons_tie
+            + self.member.cons_transform
+            + self.member.cons_temperature
+            + self.member.cons_pressure
+            + self.member.cons_force
+            + self.member.cons_sectionprint
+            + self.member.cons_heatflux
+        )
+        shapes = {}
+        for femobj in femobjs:
+            for o, elem_tup in femobj["Object"].References:
+                for elem in elem_tup:
+                    key = (o.Name, elem)
+                    if key in shapes:
+                        continue
+                    ref_shape = meshtools.sub_shape_at_global_placement(o, elem)
+                    if ref_shape.ShapeType in ("Vertex", "Edge", "Face", "Solid"):
+                        shapes[key] = ref_shape
+        if shapes:
+            FreeCAD.Console.PrintMessage(
+                "Search the mesh nodes of {} reference shapes in {} processes.\n".format(
+                    len(shapes), self.processes
+                )
+            )
+            self.get_femnodes_index().add_shape_nodes(shapes, self.processes)
+
     # ********************************************************************************************
     # ********************************************************************************************
     # node sets
@@ -165,7 +234,9 @@ class MeshSetsGetter:
         for femobj in self.member.cons_fixed:
             # femobj --> dict, FreeCAD document object is femobj["Object"]
             print_obj_info(femobj["Object"])
-            femobj["Nodes"] = meshtools.get_femnodes_by_femobj_with_references(self.femmesh, femobj)
+            femobj["Nodes"] = meshtools.get_femnodes_by_femobj_with_references(
+                self.femmesh, femobj, self.get_femnodes_index()
+            )
             # add nodes to constraint_conflict_nodes, needed by constraint plane rotation
             for node in femobj["Nodes"]:
                 self.constraint_conflict_nodes.append(node)
@@ -200,7 +271,9 @@ class MeshSetsGetter:
         for femobj in self.member.cons_rigidbody:
             # femobj --> dict, FreeCAD document object is femobj["Object"]
             print_obj_info(femobj["Object"])
-            femobj["Nodes"] = meshtools.get_femnodes_by_femobj_with_references(self.femmesh, femobj)
+            femobj["Nodes"] = meshtools.get_femnodes_by_femobj_with_references(
+                self.femmesh, femobj, self.get_femnodes_index()
+            )
             # add nodes to constraint_conflict_nodes, needed by constraint plane rotation
             for node in femobj["Nodes"]:
                 self.constraint_conflict_nodes.append(node)
@@ -212,7 +285,9 @@ class MeshSetsGetter:
         for femobj in self.member.cons_displacement:
             # femobj --> dict, FreeCAD document object is femobj["Object"]
             print_obj_info(femobj["Object"])
-            femobj["Nodes"] = meshtools.get_femnodes_by_femobj_with_references(self.femmesh, femobj)
+            femobj["Nodes"] = meshtools.get_femnodes_by_femobj_with_references(
+                self.femmesh, femobj, self.get_femnodes_index()
+            )
             # add nodes to constraint_conflict_nodes, needed by constraint plane rotation
             for node in femobj["Nodes"]:
                 self.constraint_conflict_nodes.append(node)
@@ -224,7 +299,9 @@ class MeshSetsGetter:
         for femobj in self.member.cons_planerotation:
             # femobj --> dict, FreeCAD document object is femobj["Object"]
             print_obj_info(femobj["Object"])
-            femobj["Nodes"] = meshtools.get_femnodes_by_femobj_with_references(self.femmesh, femobj)
+            femobj["Nodes"] = meshtools.get_femnodes_by_femobj_with_references(
+                self.femmesh, femobj, self.get_femnodes_index()
+            )
 
     def get_constraints_transform_nodes(self):
         if not self.member.cons_transform:
@@ -233,7 +310,9 @@ class MeshSetsGetter:
         for femobj in self.member.cons_transform:
             # femobj --> dict, FreeCAD document object is femobj["Object"]
             print_obj_info(femobj["Object"])
-            femobj["Nodes"] = meshtools.get_femnodes_by_femobj_with_references(self.femmesh, femobj)
+            femobj["Nodes"] = meshtools.get_femnodes_by_femobj_with_references(
+                self.femmesh, femobj, self.get_femnodes_index()
+            )
 
     def get_constraints_temperature_nodes(self):
         if not self.member.cons_temperature:
@@ -242,7 +321,9 @@ class MeshSetsGetter:
         for femobj in self.member.cons_temperature:
             # femobj --> dict, FreeCAD document object is femobj["Object"]
             print_obj_info(femobj["Object"])
-            femobj["Nodes"] = meshtools.get_femnodes_by_femobj_with_references(self.femmesh, femobj)
+            femobj["Nodes"] = meshtools.get_femnodes_by_femobj_with_references(
+                self.femmesh, femobj, self.get_femnodes_index()
+            )
 
     def get_constraints_fluidsection_nodes(self):
         if not self.member.geos_fluidsection:
@@ -251,7 +332,9 @@ class MeshSetsGetter:
         for femobj in self.member.geos_fluidsection:
             # femobj --> dict, FreeCAD document object is femobj["Object"]
             print_obj_info(femobj["Object"])
-            femobj["Nodes"] = meshtools.get_femnodes_by_femobj_with_references(self.femmesh, femobj)
+            femobj["Nodes"] = meshtools.get_femnodes_by_femobj_with_references(
+                self.femmesh, femobj, self.get_femnodes_index()
+            )
 
     def get_constraints_force_nodeloads(self):
         if not self.member.cons_force:
@@ -302,15 +385,23 @@ class MeshSetsGetter:
                 FreeCAD.Console.PrintMessage("  Warning --> Force = 0\n")
             if femobj["RefShapeType"] == "Vertex":  # point load on vertices
                 femobj["NodeLoadTable"] = meshtools.get_force_obj_vertex_nodeload_table(
-                    self.femmesh, frc_obj
+                    self.femmesh, frc_obj, self.get_femnodes_index()
                 )
             elif femobj["RefShapeType"] == "Edge":  # line load on edges
                 femobj["NodeLoadTable"] = meshtools.get_force_obj_edge_nodeload_table(
-                    self.femmesh, self.femelement_table, self.femnodes_mesh, frc_obj
+                    self.femmesh,
+                    self.femelement_table,
+                    self.femnodes_mesh,
+                    frc_obj,
+                    self.get_femnodes_index(),
                 )
             elif femobj["RefShapeType"] == "Face":  # area load on faces
                 femobj["NodeLoadTable"] = meshtools.get_force_obj_face_nodeload_table(
-                    self.femmesh, self.femelement_table, self.femnodes_mesh, frc_obj
+                    self.femmesh,
+                    self.femelement_table,
+                    self.femnodes_mesh,
+                    frc_obj,
+                    self.get_femnodes_index(),
                 )
 
     # ********************************************************************************************
@@ -347,7 +438,11 @@ class MeshSetsGetter:
             # femobj --> dict, FreeCAD document object is femobj["Object"]
             print_obj_info(femobj["Object"])
             pressure_faces = meshtools.get_pressure_obj_faces(
-                self.femmesh, self.femelement_table, self.femnodes_ele_table, femobj
+                self.femmesh,
+                self.femelement_table,
+                self.femnodes_ele_table,
+                femobj,
+                self.get_femnodes_index(),
             )
             # the data model is for compatibility reason with deprecated version
             # get_pressure_obj_faces_depreciated returns the face ids in a tuple per ref_shape
@@ -373,7 +468,11 @@ class MeshSetsGetter:
             # femobj --> dict, FreeCAD document object is femobj["Object"]
             print_obj_info(femobj["Object"])
             contact_slave_faces, contact_master_faces = meshtools.get_contact_obj_faces(
-                self.femmesh, self.femelement_table, self.femnodes_ele_table, femobj
+                self.femmesh,
+                self.femelement_table,
+                self.femnodes_ele_table,
+                femobj,
+                self.get_femnodes_index(),
             )
             # [ele_id, ele_face_id], [ele_id, ele_face_id], ...]
             # whereas the ele_face_id might be ccx specific
@@ -405,7 +504,11 @@ class MeshSetsGetter:
             # femobj --> dict, FreeCAD document object is femobj["Object"]
             print_obj_info(femobj["Object"])
             slave_faces, master_faces = meshtools.get_tie_obj_faces(
-                self.femmesh, self.femelement_table, self.femnodes_ele_table, femobj
+                self.femmesh,
+                self.femelement_table,
+                self.femnodes_ele_table,
+                femobj,
+                self.get_femnodes_index(),
             )
             # [ele_id, ele_face_id], [ele_id, ele_face_id], ...]
             # whereas the ele_face_id might be ccx specific
@@ -435,7 +538,7 @@ class MeshSetsGetter:
                     # in the gui this is checked
                     ref_shape = o.Shape.getElement(elem)
                     if ref_shape.ShapeType == "Face":
-                        v = self.mesh_object.FemMesh.getccxVolumesByFace(ref_shape)
+                        v = self.get_ccxvolume_faces(o, elem, ref_shape)
                         if len(v) > 0:
                             femobj["SectionPrintFaces"] = v
                             # volume elements found
@@ -481,9 +584,26 @@ class MeshSetsGetter:
                     ho = o.Shape.getElement(elem)
                     if ho.ShapeType == "Face":
                         elem_info = f"{o.Name}:{elem}"
-                        face_table = self.mesh_object.FemMesh.getccxVolumesByFace(ho)
+                        face_table = self.get_ccxvolume_faces(o, elem, ho)
                         femobj["HeatFluxFaceTable"].append((elem_info, face_table))
 
+    # the volume element faces on a reference face, [[ele_id, ele_face_id], ...]
+    # the nodes of solid meshes are searched by the femnodes_index like for all other references
+    def get_ccxvolume_faces(self, obj, elem, ref_face):
+        if not meshtools.is_solid_femmesh(self.femmesh):
+            return self.mesh_object.FemMesh.getccxVolumesByFace(ref_face)
+        if not self.femnodes_mesh:
+            self.femnodes_mesh = self.femmesh.Nodes
+        if not self.femelement_table:
+            self.femelement_table = meshtools.get_femelement_table(self.femmesh)
+        if not self.femnodes_ele_table:
+            self.femnodes_ele_table = meshtools.get_femnodes_ele_table(
+                self.femnodes_mesh, self.femelement_table
+            )
+        return meshtools.get_ccxelement_faces_by_refshape(
+            self.femmesh, self.femnodes_ele_table, (obj, (elem,)), self.get_femnodes_index()
+        )
+
     # ********************************************************************************************
     # ********************************************************************************************
     # element sets constraints
@@ -533,7 +653,11 @@ class MeshSetsGetter:
                     self.femnodes_mesh, self.femelement_table
                 )
             control = meshtools.get_femelement_sets(
-                self.femmesh, self.femelement_table, femobjs, self.femnodes_ele_table
+                self.femmesh,
+                self.femelement_table,
+                femobjs,
+                self.femnodes_ele_table,
+                self.get_femnodes_index(),
             )
             # we only need to set it, if it is still True
             if (self.femelement_count_test is True) and (control is False):
@@ -545,7 +669,10 @@ class MeshSetsGetter:
         if not self.femelement_faces_table:
             self.femelement_faces_table = meshtools.get_femelement_faces_table(self.femmesh)
         meshtools.get_femelement_sets(
-            self.femmesh, self.femelement_faces_table, self.member.geos_shellthickness
+            self.femmesh,
+            self.femelement_faces_table,
+            self.member.geos_shellthickness,
+            femnodes_index=self.get_femnodes_index(),
         )
 
     def get_element_geometry1D_elements(self):
@@ -554,7 +681,10 @@ class MeshSetsGetter:
         if not self.femelement_edges_table:
             self.femelement_edges_table = meshtools.get_femelement_edges_table(self.femmesh)
         meshtools.get_femelement_sets(
-            self.femmesh, self.femelement_edges_table, self.member.geos_beamsection
+            self.femmesh,
+            self.femelement_edges_table,
+            self.member.geos_beamsection,
+            femnodes_index=self.get_femnodes_index(),
         )
 
     def get_element_rotation1D_elements(self):
@@ -578,7 +708,10 @@ class MeshSetsGetter:
         if not self.femelement_edges_table:
             self.femelement_edges_table = meshtools.get_femelement_edges_table(self.femmesh)
         meshtools.get_femelement_sets(
-            self.femmesh, self.femelement_edges_table, self.member.geos_fluidsection
+            self.femmesh,
+            self.femelement_edges_table,
+            self.member.geos_fluidsection,
+            femnodes_index=self.get_femnodes_index(),
         )
 
     def get_material_elements(self):
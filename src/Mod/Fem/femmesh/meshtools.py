@@ -27,15 +27,20 @@ __url__ = "https://www.freecad.org"
 ## \addtogroup FEM
 #  @{
 
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
 
 import FreeCAD
 
+from femtools import femutils
 from femtools import geomtools
 
 
 # ************************************************************************************************
-def get_femnodes_by_femobj_with_references(femmesh, femobj):
+def get_femnodes_by_femobj_with_references(femmesh, femobj, femnodes_index=None):
     node_set = []
     if femmesh.GroupCount:
         node_set = get_femmesh_groupdata_sets_by_name(femmesh, femobj, "Node")
@@ -50,7 +55,7 @@ def get_femnodes_by_femobj_with_references(femmesh, femobj):
             "    Finite element mesh nodes will be retrieved "
             "by searching the appropriate nodes in the finite element mesh.\n"
         )
-        node_set = get_femnodes_by_references(femmesh, femobj["Object"].References)
+        node_set = get_femnodes_by_references(femmesh, femobj["Object"].References, femnodes_index)
         # FreeCAD.Console.PrintMessage("node_set_nogroup: {}\n".format(node_set))
 
     # use set for node sets to be sure all nodes are unique
@@ -60,12 +65,14 @@ def get_femnodes_by_femobj_with_references(femmesh, femobj):
 
 
 # ************************************************************************************************
-def get_femelements_by_references(femmesh, femelement_table, references, femnodes_ele_table=None):
+def get_femelements_by_references(
+    femmesh, femelement_table, references, femnodes_ele_table=None, femnodes_index=None
+):
     """get the femelements for a list of references"""
     references_femelements = []
     for ref in references:
         # femnodes for the current ref
-        ref_femnodes = get_femnodes_by_refshape(femmesh, ref)
+        ref_femnodes = get_femnodes_by_refshape(femmesh, ref, femnodes_index)
         if femnodes_ele_table:
             # blind fast binary search, works for volumes only
             # femelements for all references
@@ -82,11 +89,11 @@ def get_femelements_by_references(femmesh, femelement_table, references, femnode
 
 
 # ************************************************************************************************
-def get_femnodes_by_references(femmesh, references):
+def get_femnodes_by_references(femmesh, references, femnodes_index=None):
     """get the femnodes for a list of references"""
     references_femnodes = []
     for ref in references:
-        references_femnodes += get_femnodes_by_refshape(femmesh, ref)
+        references_femnodes += get_femnodes_by_refshape(femmesh, ref, femnodes_index)
 
     # return references_femnodes  # keeps duplicate nodes, keeps node order
 
@@ -94,7 +101,11 @@ def get_femnodes_by_references(femmesh, references):
     return list(set(references_femnodes))  # removes duplicate nodes, sorts node order
 
 
-def get_femnodes_by_refshape(femmesh, ref):
+def get_femnodes_by_refshape(femmesh, ref, femnodes_index=None):
+    """get the femnodes of all elements of a reference
+    if a FemNodesIndex is given, only the mesh nodes near the
+    reference shape are checked, otherwise all mesh nodes are checked
+    """
     nodes = []
     for refelement in ref[1]:
         r = sub_shape_at_global_placement(ref[0], refelement)
@@ -105,7 +116,11 @@ def get_femnodes_by_refshape(femmesh, ref):
             "Object label: {}, "
             "Element name: {}\n".format(r.ShapeType, ref[0].Name, ref[0].Label, refelement)
         )
-        if r.ShapeType == "Vertex":
+        if r.ShapeType not in ("Vertex", "Edge", "Face", "Solid"):
+            FreeCAD.Console.PrintMessage("  No Vertice, Edge, Face or Solid as reference shapes!\n")
+        elif femnodes_index is not None:
+            nodes += femnodes_index.get_nodes_by_shape(r, (ref[0].Name, refelement))
+        elif r.ShapeType == "Vertex":
             nodes += femmesh.getNodesByVertex(r)
         elif r.ShapeType == "Edge":
             nodes += femmesh.getNodesByEdge(r)
@@ -113,11 +128,248 @@ def get_femnodes_by_refshape(femmesh, ref):
             nodes += femmesh.getNodesByFace(r)
         elif r.ShapeType == "Solid":
             nodes += femmesh.getNodesBySolid(r)
-        else:
-            FreeCAD.Console.PrintMessage("  No Vertice, Edge, Face or Solid as reference shapes!\n")
     return nodes
 
 
+# ************************************************************************************************
+class FemNodesIndex:
+    """spatial index over the nodes of a femmesh
+
+    The nodes are sorted into the cells of a regular grid. The nodes of
+    a cell are contiguous in the sorted arrays, thus the nodes inside a
+    bounding box are found by a binary search per grid column.
+    It should be created once and reused for all reference shapes,
+    see get_femnodes_by_refshape(). The nodes found for a reference
+    shape are cached, the nodes of many reference shapes can be searched
+    concurrently in worker processes, see add_shape_nodes().
+    The node search gives the same
+    nodes as the FemMesh methods getNodesByVertex(), getNodesByEdge(),
+    getNodesByFace() and getNodesBySolid(), but only the nodes near the
+    reference shape are checked with the exact distance.
+    The index only prefilters the nodes of vertices, edges and faces.
+    Solids and shapes with many candidate nodes are searched by the FemMesh
+    methods, they check the nodes in parallel threads.
+
+    femnodes_mesh: femmesh.Nodes, {nodeID: FreeCAD.Vector}
+    femmesh: the FemMesh of the nodes, without it all shapes are searched
+    by the index
+    """
+
+    def __init__(self, femnodes_mesh, femmesh=None, nodes_per_cell=8):
+        self.femmesh = femmesh
+        count = len(femnodes_mesh)
+        self.node_ids = np.fromiter(femnodes_mesh, dtype=np.int64, count=count)
+        self.coords = np.array(
+            [(v.x, v.y, v.z) for v in femnodes_mesh.values()], dtype=float
+        ).reshape(count, 3)
+        if count:
+            self.bound_min = self.coords.min(axis=0)
+            extent = self.coords.max(axis=0) - self.bound_min
+        else:
+            self.bound_min = np.zeros(3)
+            extent = np.zeros(3)
+        # cubic cells, about nodes_per_cell nodes per cell for evenly distributed nodes
+        dims = extent > 0.0
+        if dims.any():
+            cells = max(count / nodes_per_cell, 1.0)
+            self.cell_size = (np.prod(extent[dims]) / cells) ** (1.0 / dims.sum())
+            self.cell_size = max(self.cell_size, extent.max() / 2**20)
+        else:
+            self.cell_size = 1.0
+        self.grid_shape = (extent // self.cell_size).astype(np.int64) + 1
+        keys = self._get_cell_keys(self._get_cells(self.coords))
+        self.order = np.argsort(keys, kind="stable")
+        self.sorted_keys = keys[self.order]
+        # {key: node ids}, key is the tuple (object name, element name) of a reference shape
+        self.shape_nodes = {}
+
+    def _get_cells(self, points):
+        cells = ((points - self.bound_min) // self.cell_size).astype(np.int64)
+        return np.clip(cells, 0, self.grid_shape - 1)
+
+    def _get_cell_keys(self, cells):
+        ny, nz = self.grid_shape[1], self.grid_shape[2]
+        return (cells[..., 0] * ny + cells[..., 1]) * nz + cells[..., 2]
+
+    def get_node_indices_in_box(self, box_min, box_max):
+        """returns the indices of the nodes inside the box, sorted"""
+        box_min = np.asarray(box_min, dtype=float)
+        box_max = np.asarray(box_max, dtype=float)
+        if not len(self.node_ids) or (box_max < self.bound_min).any():
+            return np.empty(0, dtype=np.int64)
+        cell_min, cell_max = self._get_cells(np.array([box_min, box_max]))
+        columns = (cell_max[0] - cell_min[0] + 1) * (cell_max[1] - cell_min[1] + 1)
+        if columns > len(self.node_ids) // 4:
+            # large box, a check of all nodes is faster
+            candidates = np.arange(len(self.node_ids))
+        else:
+            ix, iy = np.meshgrid(
+                np.arange(cell_min[0], cell_max[0] + 1),
+                np.arange(cell_min[1], cell_max[1] + 1),
+                indexing="ij",
+            )
+            ix = ix.ravel()
+            iy = iy.ravel()
+            key_min = self._get_cell_keys(np.column_stack((ix, iy, np.full_like(ix, cell_min[2]))))
+            key_max = self._get_cell_keys(np.column_stack((ix, iy, np.full_like(ix, cell_max[2]))))
+            starts = np.searchsorted(self.sorted_keys, key_min, side="left")
+            counts = np.searchsorted(self.sorted_keys, key_max, side="right") - starts
+            entries = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(
+                counts.sum()
+            )
+            candidates = self.order[entries]
+        points = self.coords[candidates]
+        inside = ((points >= box_min) & (points <= box_max)).all(axis=1)
+        return np.sort(candidates[inside])
+
+    def add_shape_nodes(self, shapes, processes=1):
+        """searches the nodes of many shapes and caches them
+
+        shapes: {key: shape}, the key is used in get_nodes_by_shape()
+        processes: if greater than one the shapes are searched concurrently
+        in forked worker processes, they share the node arrays read-only
+        """
+        keys = [key for key in shapes if key not in self.shape_nodes]
+        # the FemMesh searches run threaded in this process, the forked
+        # workers only run the prefiltered searches
+        for key in [key for key in keys if self._searches_femmesh(shapes[key])]:
+            self.shape_nodes[key] = self.get_nodes_by_shape(shapes[key])
+            keys.remove(key)
+        if processes > 1 and len(keys) > 1 and femutils.fork_available():
+            # the shapes are passed to the workers as BREP strings
+            shape_breps = [
+                (shapes[key].ShapeType, shapes[key].exportBrepToString()) for key in keys
+            ]
+            with ProcessPoolExecutor(
+                max_workers=min(processes, len(keys)),
+                mp_context=multiprocessing.get_context("fork"),
+                initializer=_init_femnodes_index_worker,
+                initargs=(self,),
+            ) as executor:
+                # map returns the results in the order of the keys
+                results = list(executor.map(_get_femnodes_by_shape_brep, shape_breps))
+        else:
+            if processes > 1 and len(keys) > 1:
+                FreeCAD.Console.PrintLog(
+                    "    Worker processes can not be forked on this platform "
+                    "or in the GUI, the nodes are searched in one process.\n"
+                )
+            results = [self.get_nodes_by_shape(shapes[key]) for key in keys]
+        self.shape_nodes.update(zip(keys, results))
+
+    def get_nodes_by_shape(self, shape, key=None):
+        """returns the ids of the nodes on a Vertex, Edge, Face or in a Solid
+        if the key is given the nodes are taken from or added to the cache
+        """
+        if key is not None:
+            if key not in self.shape_nodes:
+                self.shape_nodes[key] = self.get_nodes_by_shape(shape)
+            return list(self.shape_nodes[key])
+        if shape.ShapeType == "Vertex":
+            return self.get_nodes_by_vertex(shape)
+        if self._searches_femmesh(shape):
+            if shape.ShapeType == "Solid":
+                return sorted(self.femmesh.getNodesBySolid(shape))
+            if shape.ShapeType == "Face":
+                return sorted(self.femmesh.getNodesByFace(shape))
+            return sorted(self.femmesh.getNodesByEdge(shape))
+        import Part
+
+        if shape.ShapeType == "Solid":
+            # limit where the mesh node belongs to the solid, see FemMesh::getNodesBySolid
+            limit = shape.getTolerance(1)
+        else:
+            # limit where the mesh node belongs to the edge or face
+            limit = shape.Tolerance
+        indices = self._get_candidate_indices(shape)
+        nodes = []
+        for i, (x, y, z) in zip(indices.tolist(), self.coords[indices].tolist()):
+            if shape.distToShape(Part.Vertex(x, y, z))[0] < limit:
+                nodes.append(int(self.node_ids[i]))
+        return nodes
+
+    def _get_candidate_indices(self, shape):
+        # the indices of the nodes in the bounding box of the shape
+        bound_box = shape.BoundBox
+        if shape.ShapeType != "Solid":
+            bound_box.enlarge(shape.Tolerance)
+        return self.get_node_indices_in_box(
+            (bound_box.XMin, bound_box.YMin, bound_box.ZMin),
+            (bound_box.XMax, bound_box.YMax, bound_box.ZMax),
+        )
+
+    def _searches_femmesh(self, shape):
+        # True if the nodes of the shape are searched by the FemMesh methods
+        if self.femmesh is None or shape.ShapeType == "Vertex":
+            return False
+        if shape.ShapeType == "Solid":
+            # almost all nodes of a solid reference are candidates
+            return True
+        # the FemMesh checks all nodes in parallel threads, the index
+        # checks its candidates one by one
+        threads = os.cpu_count() or 1
+        return len(self._get_candidate_indices(shape)) * threads > len(self.node_ids)
+
+    def get_nodes_by_vertex(self, vertex):
+        """returns the ids of the nodes on a vertex, see FemMesh::getNodesByVertex"""
+        limit = vertex.Tolerance
+        point = np.array((vertex.X, vertex.Y, vertex.Z))
+        indices = self.get_node_indices_in_box(point - limit, point + limit)
+        dist2 = ((self.coords[indices] - point) ** 2).sum(axis=1)
+        return self.node_ids[indices[dist2 <= limit * limit]].tolist()
+
+
+# the FemNodesIndex of a worker process, set once by the pool initializer
+_worker_femnodes_index = None
+
+
+def _init_femnodes_index_worker(femnodes_index):
+    global _worker_femnodes_index
+    _worker_femnodes_index = femnodes_index
+
+
+def _get_femnodes_by_shape_brep(shape_brep):
+    import Part
+
+    shape_type, brep = shape_brep
+    shape = Part.Shape()
+    shape.importBrepFromString(brep)
+    # the imported shape is a generic shape, get the typed one
+    sub_shapes = {"Vertex": "Vertexes", "Edge": "Edges", "Face": "Faces", "Solid": "Solids"}
+    shape = getattr(shape, sub_shapes[shape_type])[0]
+    return _worker_femnodes_index.get_nodes_by_shape(shape)
+
+
+# ************************************************************************************************
+def get_mesh_arrays(femmesh):
+    """returns the nodes and elements of a femmesh as dictionary of NumPy arrays
+    - "node_ids" and "nodes": node numbers and node coordinates
+    - for every element kind and node count, e.g. "volume10" for Tetra10:
+      "<kind><count>_ids" element numbers and "<kind><count>" element nodes
+    the element nodes of every element type are read at once, see
+    FemMesh.getElementNodesByType(), they are in FreeCAD node order
+    """
+    nodes = femmesh.Nodes
+    mesh_arrays = {
+        "node_ids": np.fromiter(nodes, dtype=np.int64, count=len(nodes)),
+        "nodes": np.array([(v.x, v.y, v.z) for v in nodes.values()], dtype=np.float64).reshape(
+            len(nodes), 3
+        ),
+    }
+    for kind, element_type in (("edge", "Edge"), ("face", "Face"), ("volume", "Volume")):
+        ids, counts, element_nodes = femmesh.getElementNodesByType(element_type)
+        ids = np.array(ids, dtype=np.int64)
+        counts = np.array(counts, dtype=np.int64)
+        element_nodes = np.array(element_nodes, dtype=np.int64)
+        starts = np.cumsum(counts) - counts
+        for count in np.unique(counts).tolist():
+            is_count = counts == count
+            key = kind + str(count)
+            mesh_arrays[key + "_ids"] = ids[is_count]
+            mesh_arrays[key] = element_nodes[starts[is_count][:, None] + np.arange(count)]
+    return mesh_arrays
+
+
 # ************************************************************************************************
 def get_femelement_table(femmesh):
     """get_femelement_table(femmesh): { elementid : [ nodeid, nodeid, ... , nodeid ] }"""
@@ -168,6 +420,104 @@ def get_femelement_edges_table(femmesh, edges_only=None):
 
 
 # ************************************************************************************************
+class FemNodesEleTable:
+    """compact node to element adjacency of a femelement_table
+
+    The membership of the nodes in the elements is stored in
+    compressed sparse row (CSR) form in NumPy arrays:
+    node_ids: sorted node ids of the mesh
+    offsets: the elements of node_ids[i] are in ele_indices[offsets[i]:offsets[i + 1]]
+    ele_indices: index of the element in element_ids
+    positions: the position of the node in the element
+    element_ids: element ids in the order of the femelement_table
+    element_types: the number of nodes of every element, which is used as
+    element type, since the femelement_table contains either volume or face
+    or edge elements and the node count is unique within them
+    see get_femelement_table()
+
+    Indexing with a node id returns the data of the former dict based
+    femnodes_ele_table: [[eleID, NodePosition], [], ...], whereas the
+    position of the node in the element is coded as a set bit at that
+    position in a bit array (integer).
+    """
+
+    def __init__(self, femnodes_mesh, femelement_table):
+        self.element_ids = np.fromiter(
+            femelement_table, dtype=np.int64, count=len(femelement_table)
+        )
+        self.element_types = np.fromiter(
+            (len(ele_nodes) for ele_nodes in femelement_table.values()),
+            dtype=np.int64,
+            count=len(femelement_table),
+        )
+        count = int(self.element_types.sum())
+        ele_nodes = np.fromiter(
+            (nd for ele_nodes in femelement_table.values() for nd in ele_nodes),
+            dtype=np.int64,
+            count=count,
+        )
+        ele_starts = np.zeros(len(self.element_ids), dtype=np.int64)
+        np.cumsum(self.element_types[:-1], out=ele_starts[1:])
+        ele_indices = np.repeat(np.arange(len(self.element_ids)), self.element_types)
+        positions = np.arange(count) - np.repeat(ele_starts, self.element_types)
+
+        # stable sort by node, thus the elements of a node keep the element table order
+        order = np.argsort(ele_nodes, kind="stable")
+        self.node_ids = np.unique(
+            np.concatenate((np.fromiter(femnodes_mesh, dtype=np.int64), ele_nodes))
+        )
+        # the entries of every node are contiguous, thus the start of the next
+        # node is the end of the current one
+        self.offsets = np.append(np.searchsorted(ele_nodes[order], self.node_ids), count)
+        self.ele_indices = ele_indices[order]
+        self.positions = positions[order]
+
+    def __len__(self):
+        return len(self.node_ids)
+
+    def __iter__(self):
+        return iter(self.node_ids.tolist())
+
+    def __contains__(self, node):
+        i = np.searchsorted(self.node_ids, node)
+        return i < len(self.node_ids) and self.node_ids[i] == node
+
+    def __getitem__(self, node):
+        i = np.searchsorted(self.node_ids, node)
+        if i == len(self.node_ids) or self.node_ids[i] != node:
+            raise KeyError(node)
+        rows = slice(self.offsets[i], self.offsets[i + 1])
+        return [
+            [ele, 1 << pos]
+            for ele, pos in zip(
+                self.element_ids[self.ele_indices[rows]].tolist(), self.positions[rows].tolist()
+            )
+        ]
+
+    def get_bit_patterns(self, node_set):
+        """returns the bit pattern of every element of element_ids as NumPy array
+        the bit of a node position is set, if the node is in node_set
+        see get_bit_pattern_dict() for more information
+        """
+        nodes = np.unique(np.asarray(list(node_set), dtype=np.int64))
+        rows = np.searchsorted(self.node_ids, nodes)
+        found = rows < len(self.node_ids)
+        found[found] = self.node_ids[rows[found]] == nodes[found]
+        rows = rows[found]
+        starts = self.offsets[rows]
+        counts = self.offsets[rows + 1] - starts
+        # indices of all entries of the nodes in ele_indices and positions
+        entries = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())
+        # every node position is set only once per element, thus sum is the same as bitwise or
+        bit_patterns = np.zeros(len(self.element_ids), dtype=np.int64)
+        np.add.at(
+            bit_patterns,
+            self.ele_indices[entries],
+            np.left_shift(1, self.positions[entries]),
+        )
+        return bit_patterns
+
+
 def get_femnodes_ele_table(femnodes_mesh, femelement_table):
     """the femnodes_ele_table contains for each node its membership in elements
     {nodeID : [[eleID, NodePosition], [], ...], nodeID : [[], [], ...], ...}
@@ -176,26 +526,11 @@ def get_femnodes_ele_table(femnodes_mesh, femelement_table):
     the position of the node in the element.
     The position of the node in the element is coded
     as a set bit at that position in a bit array (integer)
-    FIXME: the number of nodes per element should be
-    replaced by the type of the element
-    but I did not know how to get this from the mesh.
-    Since the femelement_table contains either
-    volume or face or edgemesh the femnodes_ele_table only
-    has either volume or face or edge elements
-    see get_femelement_table()
+    The table is stored as compact arrays, see class FemNodesEleTable.
+    It should be calculated only once and reused for all constraints.
     """
-    femnodes_ele_table = {}  # node_dict in ulrichs class
-    for n in femnodes_mesh:  # initialize it with sorted node keys and empty lists
-        femnodes_ele_table[n] = []
-    for ele in femelement_table:
-        ele_list = femelement_table[ele]
-        # FreeCAD.Console.PrintMessage("{}\n".format(ele_list))
-        pos = int(1)
-        for ele_node in ele_list:
-            femnodes_ele_table[ele_node].append([ele, pos])
-            pos = pos << 1
+    femnodes_ele_table = FemNodesEleTable(femnodes_mesh, femelement_table)
     FreeCAD.Console.PrintLog(f"len femnodes_ele_table: {len(femnodes_ele_table)}\n")
-    FreeCAD.Console.PrintLog(f"femnodes_ele_table: {femnodes_ele_table}\n")
     return femnodes_ele_table
 
 
@@ -220,48 +555,50 @@ def get_bit_pattern_dict(femelement_table, femnodes_ele_table, node_set):
     or has this element a face we are searching for?
     The number in the ele_dict is organized as a bit array.
     The corresponding bit is set, if the node of the node_set is contained in the element.
+    The vectorized FemNodesEleTable.get_bit_patterns() should be used for large meshes.
     """
     FreeCAD.Console.PrintLog("len femnodes_ele_table: " + str(len(femnodes_ele_table)) + "\n")
     FreeCAD.Console.PrintLog("len node_set: " + str(len(node_set)) + "\n")
-    FreeCAD.Console.PrintLog(f"node_set: {node_set}\n")
     bit_pattern_dict = get_copy_of_empty_femelement_table(femelement_table)
     # # initializing the bit_pattern_dict
     for ele in femelement_table:
         len_ele = len(femelement_table[ele])
         bit_pattern_dict[ele] = [len_ele, 0]
-    for node in node_set:
-        for nList in femnodes_ele_table[node]:
-            bit_pattern_dict[nList[0]][1] += nList[1]
+    if isinstance(femnodes_ele_table, FemNodesEleTable):
+        bit_patterns = femnodes_ele_table.get_bit_patterns(node_set)
+        for ele, pattern in zip(femnodes_ele_table.element_ids.tolist(), bit_patterns.tolist()):
+            bit_pattern_dict[ele][1] = pattern
+    else:
+        for node in node_set:
+            for nList in femnodes_ele_table[node]:
+                bit_pattern_dict[nList[0]][1] += nList[1]
     FreeCAD.Console.PrintLog("len bit_pattern_dict: " + str(len(bit_pattern_dict)) + "\n")
     # FreeCAD.Console.PrintMessage("bit_pattern_dict: {}\n".format(bit_pattern_dict))
     return bit_pattern_dict
 
 
 # ************************************************************************************************
+# the forum topic discussion with ulrich1a and others ... Better mesh last instead of mesh first
+# https://forum.freecad.org/viewtopic.php?f=18&t=17318#p137171
+# https://forum.freecad.org/viewtopic.php?f=18&t=17318&start=60#p141484
+# https://forum.freecad.org/viewtopic.php?f=18&t=17318&start=50#p141108
+# https://forum.freecad.org/viewtopic.php?f=18&t=17318&start=40#p140371
+# {number of element nodes: {bit mask of the face nodes: CalculiX face number}}
+CCX_FACE_MASKS = {
+    4: {7: 1, 11: 2, 13: 3, 14: 4},  # tet4
+    6: {56: 1, 7: 2, 54: 3, 45: 4, 27: 5},  # pent6
+    8: {240: 1, 15: 2, 102: 3, 204: 4, 153: 5, 51: 6},  # hex8
+    10: {119: 1, 411: 2, 717: 3, 814: 4},  # tet10
+    15: {3640: 1, 455: 2, 25782: 3, 22829: 4, 12891: 5},  # pent15
+    20: {61680: 1, 3855: 2, 402022: 3, 804044: 4, 624793: 5, 201011: 6},  # hex20
+}
+
+
 def get_ccxelement_faces_from_binary_search(bit_pattern_dict):
     """get the CalculiX element face numbers"""
-    # the forum topic discussion with ulrich1a and others ... Better mesh last instead of mesh first
-    # https://forum.freecad.org/viewtopic.php?f=18&t=17318#p137171
-    # https://forum.freecad.org/viewtopic.php?f=18&t=17318&start=60#p141484
-    # https://forum.freecad.org/viewtopic.php?f=18&t=17318&start=50#p141108
-    # https://forum.freecad.org/viewtopic.php?f=18&t=17318&start=40#p140371
-    tet10_mask = {119: 1, 411: 2, 717: 3, 814: 4}
-    tet4_mask = {7: 1, 11: 2, 13: 3, 14: 4}
-    hex8_mask = {240: 1, 15: 2, 102: 3, 204: 4, 153: 5, 51: 6}
-    hex20_mask = {61680: 1, 3855: 2, 402022: 3, 804044: 4, 624793: 5, 201011: 6}
-    pent6_mask = {56: 1, 7: 2, 54: 3, 45: 4, 27: 5}
-    pent15_mask = {3640: 1, 455: 2, 25782: 3, 22829: 4, 12891: 5}
-    vol_dict = {
-        4: tet4_mask,
-        6: pent6_mask,
-        8: hex8_mask,
-        10: tet10_mask,
-        15: pent15_mask,
-        20: hex20_mask,
-    }
     faces = []
     for ele in bit_pattern_dict:
-        mask_dict = vol_dict[bit_pattern_dict[ele][0]]
+        mask_dict = CCX_FACE_MASKS[bit_pattern_dict[ele][0]]
         for key in mask_dict:
             if (key & bit_pattern_dict[ele][1]) == key:
                 faces.append([ele, mask_dict[key]])
@@ -270,6 +607,49 @@ def get_ccxelement_faces_from_binary_search(bit_pattern_dict):
     return faces
 
 
+def get_ccxelement_faces_by_femnodes(femnodes_ele_table, node_set):
+    """get the CalculiX element face numbers of all element faces
+    which have all their nodes in node_set
+    vectorized version of get_bit_pattern_dict() and get_ccxelement_faces_from_binary_search()
+    returns [[eleID, faceID], ...] in the same order
+    """
+    bit_patterns = femnodes_ele_table.get_bit_patterns(node_set)
+    ele_types = femnodes_ele_table.element_types
+    found_eles = []
+    found_orders = []
+    found_faces = []
+    for ele_type, mask_dict in CCX_FACE_MASKS.items():
+        is_type = ele_types == ele_type
+        if not is_type.any():
+            continue
+        for order, (mask, face) in enumerate(mask_dict.items()):
+            hits = np.flatnonzero(is_type & ((bit_patterns & mask) == mask))
+            found_eles.append(hits)
+            found_orders.append(np.full(len(hits), order))
+            found_faces.append(np.full(len(hits), face))
+    if not found_eles:
+        return []
+    found_eles = np.concatenate(found_eles)
+    found_faces = np.concatenate(found_faces)
+    # element table order first, face mask order second
+    order = np.lexsort((np.concatenate(found_orders), found_eles))
+    faces = np.column_stack(
+        (femnodes_ele_table.element_ids[found_eles[order]], found_faces[order])
+    ).tolist()
+    FreeCAD.Console.PrintLog(f"found Faces: {len(faces)}\n")
+    return faces
+
+
+def get_ccxelement_faces_by_refshape(femmesh, femnodes_ele_table, ref, femnodes_index=None):
+    """get the CalculiX element faces of the solid elements on the faces of a reference
+    like FemMesh.getccxVolumesByFace(), but the nodes are searched like for all other
+    references and all solid element types are supported
+    returns [[eleID, faceID], ...]
+    """
+    node_set = sorted(set(get_femnodes_by_refshape(femmesh, ref, femnodes_index)))
+    return get_ccxelement_faces_by_femnodes(femnodes_ele_table, node_set)
+
+
 # ************************************************************************************************
 def get_femelements_by_femnodes_bin(femelement_table, femnodes_ele_table, node_list):
     """for every femelement of femelement_table
@@ -281,13 +661,19 @@ def get_femelements_by_femnodes_bin(femelement_table, femnodes_ele_table, node_l
     vol_masks = {4: 15, 6: 63, 8: 255, 10: 1023, 15: 32767, 20: 1048575}
     # Now we are looking for nodes inside of the Volumes = filling the bit_pattern_dict
     FreeCAD.Console.PrintMessage(f"len femnodes_ele_table: {len(femnodes_ele_table)}\n")
-    bit_pattern_dict = get_bit_pattern_dict(femelement_table, femnodes_ele_table, node_list)
-    # search
-    ele_list = []  # The ele_list contains the result of the search.
-    for ele in bit_pattern_dict:
-        FreeCAD.Console.PrintLog(f"bit_pattern_dict[ele][0]: {bit_pattern_dict[ele][0]}\n")
-        if bit_pattern_dict[ele][1] == vol_masks[bit_pattern_dict[ele][0]]:
-            ele_list.append(ele)
+    if isinstance(femnodes_ele_table, FemNodesEleTable):
+        # all nodes of the element are set, mask is (1 << number of element nodes) - 1
+        bit_patterns = femnodes_ele_table.get_bit_patterns(node_list)
+        all_set = np.left_shift(1, femnodes_ele_table.element_types) - 1
+        is_vol = np.isin(femnodes_ele_table.element_types, list(vol_masks))
+        ele_list = femnodes_ele_table.element_ids[is_vol & (bit_patterns == all_set)].tolist()
+    else:
+        bit_pattern_dict = get_bit_pattern_dict(femelement_table, femnodes_ele_table, node_list)
+        # search
+        ele_list = []  # The ele_list contains the result of the search.
+        for ele in bit_pattern_dict:
+            if bit_pattern_dict[ele][1] == vol_masks[bit_pattern_dict[ele][0]]:
+                ele_list.append(ele)
     FreeCAD.Console.PrintMessage(f"found Volumes: {len(ele_list)}\n")
     # FreeCAD.Console.PrintMessage("   volumes: {}\n".format(ele_list))
     return ele_list
@@ -301,6 +687,7 @@ def get_femelements_by_femnodes_std(femelement_table, node_list):
     e: elementlist
     nodes: nodelist"""
     FreeCAD.Console.PrintMessage("std search: get_femelements_by_femnodes_std\n")
+    node_list = set(node_list)
     e = []  # elementlist
     for elementID in sorted(femelement_table):
         nodecount = 0
@@ -327,6 +714,7 @@ def get_femvolumeelements_by_femfacenodes(femelement_table, node_list):
         --> if exact 6 or 8 element nodes are in node_list --> add femelement
     e: elementlist
     nodes: nodelist"""
+    node_list = set(node_list)
     e = []  # elementlist
     for elementID in sorted(femelement_table):
         nodecount = 0
@@ -377,7 +765,9 @@ def get_femvolumeelements_by_femfacenodes(femelement_table, node_list):
 
 
 # ************************************************************************************************
-def get_femelement_sets(femmesh, femelement_table, fem_objects, femnodes_ele_table=None):
+def get_femelement_sets(
+    femmesh, femelement_table, fem_objects, femnodes_ele_table=None, femnodes_index=None
+):
     # fem_objects = FreeCAD FEM document objects
     # get femelements for reference shapes of each obj.References
     count_femelements = 0
@@ -394,7 +784,7 @@ def get_femelement_sets(femmesh, femelement_table, fem_objects, femnodes_ele_tab
         if obj.References:
             ref_shape_femelements = []
             ref_shape_femelements = get_femelements_by_references(
-                femmesh, femelement_table, obj.References, femnodes_ele_table
+                femmesh, femelement_table, obj.References, femnodes_ele_table, femnodes_index
             )
             ref_shape_femelements_array = np.zeros_like(referenced_femelements)
             ref_shape_femelements_array[ref_shape_femelements] = 1
@@ -668,7 +1058,7 @@ def get_elset_short_name(obj, i):
 # ************************************************************************************************
 # ***** methods for retrieving nodes and node load values for constraint force *******************
 # ***** Vertex loads *****************************************************************************
-def get_force_obj_vertex_nodeload_table(femmesh, frc_obj):
+def get_force_obj_vertex_nodeload_table(femmesh, frc_obj, femnodes_index=None):
     # force_obj_node_load_table:
     #     [
     #         ("refshape_name.elemname", node_load_table),
@@ -689,7 +1079,10 @@ def get_force_obj_vertex_nodeload_table(femmesh, frc_obj):
                 "Object label: {}, "
                 "Element name: {}\n".format(ref_node.ShapeType, o.Name, o.Label, elem)
             )
-            node = femmesh.getNodesByVertex(ref_node)
+            if femnodes_index is not None:
+                node = femnodes_index.get_nodes_by_vertex(ref_node)
+            else:
+                node = femmesh.getNodesByVertex(ref_node)
             elem_info_string = "node load on shape: " + o.Name + ":" + elem
             if len(node) == 1:
                 force_obj_node_load_table.append(
@@ -706,7 +1099,9 @@ def get_force_obj_vertex_nodeload_table(femmesh, frc_obj):
 # get_force_obj_edge_nodeload_table
 # get_ref_edgenodes_table
 # get_ref_edgenodes_lengths
-def get_force_obj_edge_nodeload_table(femmesh, femelement_table, femnodes_mesh, frc_obj):
+def get_force_obj_edge_nodeload_table(
+    femmesh, femelement_table, femnodes_mesh, frc_obj, femnodes_index=None
+):
     # force_obj_node_load_table:
     #     [
     #         ("refshape_name.elemname", node_load_table),
@@ -733,11 +1128,13 @@ def get_force_obj_edge_nodeload_table(femmesh, femelement_table, femnodes_mesh,
         force_per_sum_ref_edge_length = force_quantity / sum_ref_edge_length
     for o, elem_tup in frc_obj.References:
         for elem in elem_tup:
-            ref_edge = o.Shape.getElement(elem)
+            ref_edge = sub_shape_at_global_placement(o, elem)
 
             # edge_table:
             #     { meshedgeID : ( nodeID, ... , nodeID ) }
-            edge_table = get_ref_edgenodes_table(femmesh, femelement_table, ref_edge)
+            edge_table = get_ref_edgenodes_table(
+                femmesh, femelement_table, ref_edge, femnodes_index, (o.Name, elem)
+            )
 
             # node_length_table:
             #     [ (nodeID, length), ... , (nodeID, length) ]
@@ -837,9 +1234,14 @@ def get_force_obj_edge_nodeload_table(femmesh, femelement_table, femnodes_mesh,
 
 
 # ************************************************************************************************
-def get_ref_edgenodes_table(femmesh, femelement_table, refedge):
+def get_ref_edgenodes_table(femmesh, femelement_table, refedge, femnodes_index=None, key=None):
     edge_table = {}  # { meshedgeID : ( nodeID, ... , nodeID ) }
-    refedge_nodes = femmesh.getNodesByEdge(refedge)
+    if femnodes_index is not None:
+        refedge_nodes = femnodes_index.get_nodes_by_shape(refedge, key)
+    else:
+        refedge_nodes = femmesh.getNodesByEdge(refedge)
+    # set for the membership checks inside the element loops
+    refedge_nodes = set(refedge_nodes)
     if is_solid_femmesh(femmesh):
         refedge_fem_volumeelements = []
         # if at least two nodes of a femvolumeelement are in
@@ -949,7 +1351,9 @@ def get_ref_edgenodes_lengths(femnodes_mesh, edge_table):
 # get_ref_facenodes_table
 # get_ref_facenodes_areas
 # build_mesh_faces_of_volume_elements
-def get_force_obj_face_nodeload_table(femmesh, femelement_table, femnodes_mesh, frc_obj):
+def get_force_obj_face_nodeload_table(
+    femmesh, femelement_table, femnodes_mesh, frc_obj, femnodes_index=None
+):
     # force_obj_node_load_table:
     #     [
     #         ("refshape_name.elemname",node_load_table),
@@ -980,7 +1384,9 @@ def get_force_obj_face_nodeload_table(femmesh, femelement_table, femnodes_mesh,
 
             # face_table:
             #    { meshfaceID : ( nodeID, ... , nodeID ) }
-            face_table = get_ref_facenodes_table(femmesh, femelement_table, ref_face)
+            face_table = get_ref_facenodes_table(
+                femmesh, femelement_table, ref_face, femnodes_index, (o.Name, elem)
+            )
 
             # node_area_table:
             #    [ (nodeID, Area), ... , (nodeID, Area) ]
@@ -1037,7 +1443,7 @@ def get_force_obj_face_nodeload_table(femmesh, femelement_table, femnodes_mesh,
 
 
 # ************************************************************************************************
-def get_ref_facenodes_table(femmesh, femelement_table, ref_face):
+def get_ref_facenodes_table(femmesh, femelement_table, ref_face, femnodes_index=None, key=None):
     face_table = {}  # { meshfaceID : ( nodeID, ... , nodeID ) }
     if is_solid_femmesh(femmesh):
         if has_no_face_data(femmesh):
@@ -1051,7 +1457,12 @@ def get_ref_facenodes_table(femmesh, femelement_table, ref_face):
             # they are not sorted, we just have the nodes.
             # We need to sort them according to the
             # shell mesh notation of tria3, tria6, quad4, quad8
-            ref_face_nodes = femmesh.getNodesByFace(ref_face)
+            if femnodes_index is not None:
+                ref_face_nodes = femnodes_index.get_nodes_by_shape(ref_face, key)
+            else:
+                ref_face_nodes = femmesh.getNodesByFace(ref_face)
+            # set for the membership checks inside the element loops
+            ref_face_nodes = set(ref_face_nodes)
             # try to use getccxVolumesByFace() to get the volume ids
             # of element with elementfaces on the ref_face
             # --> should work for tetra4 and tetra10
@@ -1094,7 +1505,10 @@ def get_ref_facenodes_table(femmesh, femelement_table, ref_face):
             for mf in faces:
                 face_table[mf] = femmesh.getElementNodes(mf)
     elif is_face_femmesh(femmesh):
-        ref_face_nodes = femmesh.getNodesByFace(ref_face)
+        if femnodes_index is not None:
+            ref_face_nodes = femnodes_index.get_nodes_by_shape(ref_face, key)
+        else:
+            ref_face_nodes = femmesh.getNodesByFace(ref_face)
         ref_face_elements = get_femelements_by_femnodes_std(femelement_table, ref_face_nodes)
         for mf in ref_face_elements:
             face_table[mf] = femelement_table[mf]
@@ -1421,18 +1835,17 @@ def get_ref_shape_node_sum_geom_table(node_geom_table):
 # ************************************************************************************************
 # ***** methods for retrieving element face sets *************************************************
 # ***** pressure faces ***************************************************************************
-def get_pressure_obj_faces(femmesh, femelement_table, femnodes_ele_table, femobj):
+def get_pressure_obj_faces(
+    femmesh, femelement_table, femnodes_ele_table, femobj, femnodes_index=None
+):
     # see get_ccxelement_faces_from_binary_search for more information
     if is_solid_femmesh(femmesh):
         # get the nodes
         # sorted and duplicates removed
-        prs_face_node_set = get_femnodes_by_femobj_with_references(femmesh, femobj)
+        prs_face_node_set = get_femnodes_by_femobj_with_references(femmesh, femobj, femnodes_index)
         # FreeCAD.Console.PrintMessage("prs_face_node_set: {}\n".format(prs_face_node_set))
-        # fill the bit_pattern_dict and search for the faces
-        bit_pattern_dict = get_bit_pattern_dict(
-            femelement_table, femnodes_ele_table, prs_face_node_set
-        )
-        pressure_faces = get_ccxelement_faces_from_binary_search(bit_pattern_dict)
+        # fill the bit patterns and search for the faces
+        pressure_faces = get_ccxelement_faces_by_femnodes(femnodes_ele_table, prs_face_node_set)
     elif is_face_femmesh(femmesh):
         pressure_faces = []
         # normally we should call get_femelements_by_references and
@@ -1483,7 +1896,9 @@ def get_pressure_obj_faces_depreciated(femmesh, femobj):
 
 
 # ***** contact faces ****************************************************************************
-def get_contact_obj_faces(femmesh, femelement_table, femnodes_ele_table, femobj):
+def get_contact_obj_faces(
+    femmesh, femelement_table, femnodes_ele_table, femobj, femnodes_index=None
+):
     # see comment on get_pressure_obj_faces_depreciated in the regard of getccxVolumesByFace()
 
     # sets are needed for each of the references separated
@@ -1532,22 +1947,14 @@ def get_contact_obj_faces(femmesh, femelement_table, femnodes_ele_table, femobj)
 
     if is_solid_femmesh(femmesh):
         FreeCAD.Console.PrintLog("    Get the nodes, sorted and duplicates removed.\n")
-        slaveface_nds = sorted(list(set(get_femnodes_by_refshape(femmesh, slave_ref))))
-        masterface_nds = sorted(list(set(get_femnodes_by_refshape(femmesh, master_ref))))
+        slaveface_nds = sorted(set(get_femnodes_by_refshape(femmesh, slave_ref, femnodes_index)))
+        masterface_nds = sorted(set(get_femnodes_by_refshape(femmesh, master_ref, femnodes_index)))
         FreeCAD.Console.PrintLog(f"    slaveface_nds: {slaveface_nds}\n")
         FreeCAD.Console.PrintLog(f"    masterface_nds: {slaveface_nds}\n")
 
-        FreeCAD.Console.PrintLog("    Fill the bit_pattern_dict and search for the faces.\n")
-        slave_bit_pattern_dict = get_bit_pattern_dict(
-            femelement_table, femnodes_ele_table, slaveface_nds
-        )
-        master_bit_pattern_dict = get_bit_pattern_dict(
-            femelement_table, femnodes_ele_table, masterface_nds
-        )
-
-        FreeCAD.Console.PrintLog("    Get the FaceIDs.\n")
-        slave_faces = get_ccxelement_faces_from_binary_search(slave_bit_pattern_dict)
-        master_faces = get_ccxelement_faces_from_binary_search(master_bit_pattern_dict)
+        FreeCAD.Console.PrintLog("    Fill the bit patterns and search for the faces.\n")
+        slave_faces = get_ccxelement_faces_by_femnodes(femnodes_ele_table, slaveface_nds)
+        master_faces = get_ccxelement_faces_by_femnodes(femnodes_ele_table, masterface_nds)
 
     elif is_face_femmesh(femmesh):
         slave_ref_shape = slave_ref[0].Shape.getElement(slave_ref[1][0])
@@ -1576,7 +1983,7 @@ def get_contact_obj_faces(femmesh, femelement_table, femnodes_ele_table, femobj)
 
 
 # ***** tie faces ****************************************************************************
-def get_tie_obj_faces(femmesh, femelement_table, femnodes_ele_table, femobj):
+def get_tie_obj_faces(femmesh, femelement_table, femnodes_ele_table, femobj, femnodes_index=None):
     # see comment get_contact_obj_faces
     # solid mesh is same as contact, but face mesh is not allowed for tie
     # TODO get rid of duplicate code for contact and tie
@@ -1615,22 +2022,14 @@ def get_tie_obj_faces(femmesh, femelement_table, femnodes_ele_table, femobj):
 
     if is_solid_femmesh(femmesh):
         # get the nodes, sorted and duplicates removed
-        slaveface_nds = sorted(list(set(get_femnodes_by_refshape(femmesh, slave_ref))))
-        masterface_nds = sorted(list(set(get_femnodes_by_refshape(femmesh, master_ref))))
+        slaveface_nds = sorted(set(get_femnodes_by_refshape(femmesh, slave_ref, femnodes_index)))
+        masterface_nds = sorted(set(get_femnodes_by_refshape(femmesh, master_ref, femnodes_index)))
         # FreeCAD.Console.PrintLog("slaveface_nds: {}\n".format(slaveface_nds))
         # FreeCAD.Console.PrintLog("masterface_nds: {}\n".format(slaveface_nds))
 
-        # fill the bit_pattern_dict and search for the faces
-        slave_bit_pattern_dict = get_bit_pattern_dict(
-            femelement_table, femnodes_ele_table, slaveface_nds
-        )
-        master_bit_pattern_dict = get_bit_pattern_dict(
-            femelement_table, femnodes_ele_table, masterface_nds
-        )
-
-        # get the faces ids
-        slave_faces = get_ccxelement_faces_from_binary_search(slave_bit_pattern_dict)
-        master_faces = get_ccxelement_faces_from_binary_search(master_bit_pattern_dict)
+        # fill the bit patterns and search for the faces ids
+        slave_faces = get_ccxelement_faces_by_femnodes(femnodes_ele_table, slaveface_nds)
+        master_faces = get_ccxelement_faces_by_femnodes(femnodes_ele_table, masterface_nds)
 
     elif is_face_femmesh(femmesh):
         FreeCAD.Console.PrintError("Shell mesh is not allowed for constraint tie.\n")
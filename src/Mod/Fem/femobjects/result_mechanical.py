@@ -226,12 +226,23 @@ class ResultMechanical(base_fempythonobject.BaseFemPythonObject):
         obj.setPropertyStatus("NodeStrainYZ", "LockDynamic")
         obj.addProperty("App::PropertyFloatList", "CriticalStrainRatio", "NodeData", "", True)
         obj.setPropertyStatus("CriticalStrainRatio", "LockDynamic")
+        self.add_result_cache_property(obj)
 
         # initialize the Stats with the appropriate count of items
         # see fill_femresult_stats in femresult/resulttools.py
         zero_list = 26 * [0]
         obj.Stats = zero_list
 
+    def add_result_cache_property(self, obj):
+        obj.addProperty(
+            "App::PropertyString",
+            "ResultCache",
+            "Data",
+            "Directory of the binary result cache holding the node data",
+            True,
+        )
+        obj.setPropertyStatus("ResultCache", "LockDynamic")
+
     def onDocumentRestored(self, obj):
         # migrate old result objects, because property "StressValues"
         # was renamed to "vonMises" in commit 8b68ab7
@@ -255,3 +266,7 @@ class ResultMechanical(base_fempythonobject.BaseFemPythonObject):
             for i in range(12, -1, -1):
                 del temp[3 * i + 1]
             obj.Stats = temp
+
+        # migrate old result objects, property "ResultCache" was added
+        if not hasattr(obj, "ResultCache"):
+            self.add_result_cache_property(obj)
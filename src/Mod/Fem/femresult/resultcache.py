@@ -0,0 +1,198 @@
+# ***************************************************************************
+# *   Copyright (c) 2024 FreeCAD Project Association                        *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+__title__ = "Fem binary result cache"
+__author__ = "FreeCAD Project Association"
+__url__ = "https://www.freecad.org"
+
+## \addtogroup FEM
+#  @{
+
+import hashlib
+import os
+import shutil
+
+import numpy as np
+
+import FreeCAD
+
+
+# the node data lists of a result object are stored as NumPy .npy files
+# one directory per result object inside a directory named by the hash of
+# the solver output file, the directory relative to the cache directory of
+# the document is set in the ResultCache property
+# the node data properties are emptied, thus they are not saved in the document
+# load_result() fills them again, only the requested ones and only on demand
+# unload_result() empties them again, e.g. when the result task panel is closed
+# the pipeline and the VTK export load them by load_for_export() and unload them again
+
+CACHED_PROPERTY_TYPES = (
+    "App::PropertyFloatList",
+    "App::PropertyIntegerList",
+    "App::PropertyVectorList",
+)
+
+
+def is_enabled():
+    prefs = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Fem/General")
+    return prefs.GetBool("ResultCache", False)
+
+
+def get_cache_dir(doc):
+    """Returns the result cache directory beside the document file.
+
+    If the document has not been saved yet the user cache directory is used,
+    named by the unique id of the document, the name is reused by every session.
+    """
+    if doc.FileName:
+        return os.path.splitext(doc.FileName)[0] + "_results"
+    return _get_unsaved_cache_dir(doc)
+
+
+def _get_unsaved_cache_dir(doc):
+    return os.path.join(FreeCAD.getUserCachePath(), "FemResults", doc.Uid)
+
+
+def get_result_dir(res_obj):
+    """Returns the cache directory of a result object or an empty string.
+
+    The ResultCache property is relative to the cache directory of the document,
+    thus the cache is found if it is moved together with the document. Results
+    cached before the document was saved the first time are still found in the
+    user cache directory.
+    """
+    result_dir = getattr(res_obj, "ResultCache", "")
+    if not result_dir:
+        return ""
+    doc = res_obj.Document
+    for cache_dir in (get_cache_dir(doc), _get_unsaved_cache_dir(doc)):
+        path = os.path.join(cache_dir, result_dir)
+        if os.path.isdir(path):
+            return path
+    return os.path.join(get_cache_dir(doc), result_dir)
+
+
+def get_file_hash(filename):
+    """Returns the SHA-1 hash of a solver output file, used as cache key."""
+    file_hash = hashlib.sha1()
+    with open(filename, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+
+def get_cached_properties(res_obj):
+    """Returns the names of the node data properties of a result object."""
+    return [
+        prop
+        for prop in res_obj.PropertiesList
+        if res_obj.getGroupOfProperty(prop) == "NodeData"
+        and res_obj.getTypeIdOfProperty(prop) in CACHED_PROPERTY_TYPES
+    ]
+
+
+def store_result(res_obj, key):
+    """Moves the node data of a result object into the cache.
+
+    key is the hash of the solver output file the result was read from.
+    """
+    result_dir = os.path.join(key, res_obj.Name)
+    cache_dir = os.path.join(get_cache_dir(res_obj.Document), result_dir)
+    os.makedirs(cache_dir, exist_ok=True)
+    for prop in get_cached_properties(res_obj):
+        values = getattr(res_obj, prop)
+        if not values:
+            continue
+        if res_obj.getTypeIdOfProperty(prop) == "App::PropertyVectorList":
+            values = [tuple(v) for v in values]
+        np.save(os.path.join(cache_dir, prop + ".npy"), np.array(values))
+        setattr(res_obj, prop, [])
+    res_obj.ResultCache = result_dir
+    FreeCAD.Console.PrintLog(f"Result data of {res_obj.Label} cached in: {cache_dir}\n")
+
+
+def load_result(res_obj, properties=None):
+    """Fills the node data properties of a result object from the cache.
+
+    properties: property names to be loaded, None loads all cached properties
+    Properties which already have values are not loaded again.
+    """
+    cache_dir = get_result_dir(res_obj)
+    if not cache_dir:
+        return res_obj
+    if not os.path.isdir(cache_dir):
+        FreeCAD.Console.PrintError(f"FEM: Result cache not found: {cache_dir}\n")
+        return res_obj
+    if properties is None:
+        properties = get_cached_properties(res_obj)
+    for prop in properties:
+        cache_file = os.path.join(cache_dir, prop + ".npy")
+        if getattr(res_obj, prop) or not os.path.isfile(cache_file):
+            continue
+        values = np.load(cache_file)
+        if values.ndim > 1:
+            setattr(res_obj, prop, list(map(tuple, values.tolist())))
+        else:
+            setattr(res_obj, prop, values.tolist())
+    return res_obj
+
+
+def load_for_export(res_obj):
+    """Fills all cached node data properties of a result object for an export.
+
+    Used by the C++ export of result objects to VTK, e.g. by the pipeline.
+    Returns the names of the loaded properties, unload_result() empties them again.
+    """
+    unloaded = [prop for prop in get_cached_properties(res_obj) if not getattr(res_obj, prop)]
+    load_result(res_obj, unloaded)
+    return [prop for prop in unloaded if getattr(res_obj, prop)]
+
+
+def unload_result(res_obj, properties=None):
+    """Empties the node data properties of a result object which are cached.
+
+    properties: property names to be emptied, None empties all cached properties
+    The data is kept in the cache, load_result() fills them again.
+    """
+    cache_dir = get_result_dir(res_obj)
+    if not cache_dir or not os.path.isdir(cache_dir):
+        return
+    if properties is None:
+        properties = get_cached_properties(res_obj)
+    for prop in properties:
+        if getattr(res_obj, prop) and os.path.isfile(os.path.join(cache_dir, prop + ".npy")):
+            setattr(res_obj, prop, [])
+
+
+def remove_result(res_obj):
+    """Removes the cached data of a result object."""
+    cache_dir = get_result_dir(res_obj)
+    if not cache_dir:
+        return
+    if os.path.isdir(cache_dir):
+        shutil.rmtree(cache_dir)
+        key_dir = os.path.dirname(cache_dir)
+        if not os.listdir(key_dir):
+            os.rmdir(key_dir)
+    res_obj.ResultCache = ""
+
+
+##  @}
@@ -27,10 +27,12 @@ __url__ = "https://www.freecad.org"
 #  @{
 
 import numpy as np
+import warnings
 from math import isnan
 
 import FreeCAD
 
+from femresult import resultcache
 from femtools.femutils import is_of_type
 
 
@@ -53,6 +55,7 @@ def purge_results(analysis):
         if m.isDerivedFrom("Fem::FemResultObject"):
             if m.Mesh and is_of_type(m.Mesh, "Fem::MeshResult"):
                 analysis.Document.removeObject(m.Mesh.Name)
+            resultcache.remove_result(m)
             analysis.Document.removeObject(m.Name)
     analysis.Document.recompute()
 
@@ -105,6 +108,7 @@ def show_displacement(resultobj, displacement_factor=0.0):
     if FreeCAD.GuiUp:
         if resultobj.Mesh.ViewObject.Visibility is False:
             resultobj.Mesh.ViewObject.Visibility = True
+        resultcache.load_result(resultobj, ("NodeNumbers", "DisplacementVectors"))
         resultobj.Mesh.ViewObject.setNodeDisplacementByVectors(
             resultobj.NodeNumbers, resultobj.DisplacementVectors
         )
@@ -133,6 +137,10 @@ def show_result(resultobj, result_type="Sabs", limit=None):
         reset_mesh_color(resultobj.Mesh)
         return
     if resultobj:
+        cached = {"Sabs": "vonMises", "Uabs": "DisplacementLengths"}
+        resultcache.load_result(
+            resultobj, ("NodeNumbers", cached.get(result_type, "DisplacementVectors"))
+        )
         if result_type == "Sabs":
             values = resultobj.vonMises
         elif result_type == "Uabs":
@@ -277,39 +285,28 @@ def fill_femresult_stats(res_obj):
     mflow_min = mflow_max = npress_min = npress_max = 0
 
     if res_obj.DisplacementVectors:
-        x_max, y_max, z_max = map(max, zip(*res_obj.DisplacementVectors))
-        x_min, y_min, z_min = map(min, zip(*res_obj.DisplacementVectors))
+        (x_min, y_min, z_min), (x_max, y_max, z_max) = get_min_max(res_obj.DisplacementVectors)
     if res_obj.DisplacementLengths:
-        a_min = min(res_obj.DisplacementLengths)
-        a_max = max(res_obj.DisplacementLengths)
+        a_min, a_max = get_min_max(res_obj.DisplacementLengths)
     if res_obj.vonMises:
-        s_min = min(res_obj.vonMises)
-        s_max = max(res_obj.vonMises)
+        s_min, s_max = get_min_max(res_obj.vonMises)
     if res_obj.PrincipalMax:
-        p1_min = min(res_obj.PrincipalMax)
-        p1_max = max(res_obj.PrincipalMax)
+        p1_min, p1_max = get_min_max(res_obj.PrincipalMax)
     if res_obj.PrincipalMed:
-        p2_min = min(res_obj.PrincipalMed)
-        p2_max = max(res_obj.PrincipalMed)
+        p2_min, p2_max = get_min_max(res_obj.PrincipalMed)
     if res_obj.PrincipalMin:
-        p3_min = min(res_obj.PrincipalMin)
-        p3_max = max(res_obj.PrincipalMin)
+        p3_min, p3_max = get_min_max(res_obj.PrincipalMin)
     if res_obj.MaxShear:
-        ms_min = min(res_obj.MaxShear)
-        ms_max = max(res_obj.MaxShear)
+        ms_min, ms_max = get_min_max(res_obj.MaxShear)
     if res_obj.Peeq:
-        peeq_min = min(res_obj.Peeq)
-        peeq_max = max(res_obj.Peeq)
+        peeq_min, peeq_max = get_min_max(res_obj.Peeq)
     if res_obj.Temperature:
-        temp_min = min(res_obj.Temperature)
-        temp_max = max(res_obj.Temperature)
+        temp_min, temp_max = get_min_max(res_obj.Temperature)
     if res_obj.MassFlowRate:
         # DisplacementVectors is empty, no_of_values needs to be set
-        mflow_min = min(res_obj.MassFlowRate)
-        mflow_max = max(res_obj.MassFlowRate)
+        mflow_min, mflow_max = get_min_max(res_obj.MassFlowRate)
     if res_obj.NetworkPressure:
-        npress_min = min(res_obj.NetworkPressure)
-        npress_max = max(res_obj.NetworkPressure)
+        npress_min, npress_max = get_min_max(res_obj.NetworkPressure)
 
     res_obj.Stats = [
         x_min,
@@ -369,6 +366,39 @@ def fill_femresult_stats(res_obj):
     return res_obj
 
 
+def get_min_max(values):
+    """Returns minimum and maximum of result values.
+
+    NaN values, which can happen on CalculiX frd result files, are ignored.
+    For values with more than one column minimum and maximum of every column
+    are returned.
+    """
+    values = np.asarray(values, dtype=float)
+    with np.errstate(invalid="ignore"), warnings.catch_warnings():
+        # all NaN values return NaN
+        warnings.simplefilter("ignore", RuntimeWarning)
+        v_min = np.nanmin(values, axis=0)
+        v_max = np.nanmax(values, axis=0)
+    return v_min.tolist(), v_max.tolist()
+
+
+def get_stress_tensors(res_obj):
+    """Returns the node stresses of a result object as NumPy array.
+
+    Every row is one stress tensor (Sxx, Syy, Szz, Sxy, Sxz, Syz).
+    """
+    return np.column_stack(
+        (
+            np.asarray(res_obj.NodeStressXX, dtype=float),
+            np.asarray(res_obj.NodeStressYY, dtype=float),
+            np.asarray(res_obj.NodeStressZZ, dtype=float),
+            np.asarray(res_obj.NodeStressXY, dtype=float),
+            np.asarray(res_obj.NodeStressXZ, dtype=float),
+            np.asarray(res_obj.NodeStressYZ, dtype=float),
+        )
+    )
+
+
 def add_disp_apps(res_obj):
     res_obj.DisplacementLengths = calculate_disp_abs(res_obj.DisplacementVectors)
     FreeCAD.Console.PrintLog("Added DisplacementLengths.\n")
@@ -376,18 +406,8 @@ def add_disp_apps(res_obj):
 
 
 def add_von_mises(res_obj):
-    mstress = []
-    iterator = zip(
-        res_obj.NodeStressXX,
-        res_obj.NodeStressYY,
-        res_obj.NodeStressZZ,
-        res_obj.NodeStressXY,
-        res_obj.NodeStressXZ,
-        res_obj.NodeStressYZ,
-    )
-    for Sxx, Syy, Szz, Sxy, Sxz, Syz in iterator:
-        mstress.append(calculate_von_mises((Sxx, Syy, Szz, Sxy, Sxz, Syz)))
-    res_obj.vonMises = mstress
+    stress_tensors = get_stress_tensors(res_obj)
+    res_obj.vonMises = calculate_von_mises_batch(stress_tensors).tolist()
     FreeCAD.Console.PrintLog("Added von Mises stress.\n")
     return res_obj
 
@@ -397,28 +417,14 @@ def add_principal_stress_std(res_obj):
     # TODO may be use only one container for principal stresses in result object
     # https://forum.freecad.org/viewtopic.php?f=18&t=33106&p=416006#p416006
     # but which one is better
-    prinstress1 = []
-    prinstress2 = []
-    prinstress3 = []
-    shearstress = []
-    iterator = zip(
-        res_obj.NodeStressXX,
-        res_obj.NodeStressYY,
-        res_obj.NodeStressZZ,
-        res_obj.NodeStressXY,
-        res_obj.NodeStressXZ,
-        res_obj.NodeStressYZ,
+    stress_tensors = get_stress_tensors(res_obj)
+    prinstress1, prinstress2, prinstress3, shearstress = calculate_principal_stress_std_batch(
+        stress_tensors
     )
-    for Sxx, Syy, Szz, Sxy, Sxz, Syz in iterator:
-        prin1, prin2, prin3, shear = calculate_principal_stress_std((Sxx, Syy, Szz, Sxy, Sxz, Syz))
-        prinstress1.append(prin1)
-        prinstress2.append(prin2)
-        prinstress3.append(prin3)
-        shearstress.append(shear)
-    res_obj.PrincipalMax = prinstress1
-    res_obj.PrincipalMed = prinstress2
-    res_obj.PrincipalMin = prinstress3
-    res_obj.MaxShear = shearstress
+    res_obj.PrincipalMax = prinstress1.tolist()
+    res_obj.PrincipalMed = prinstress2.tolist()
+    res_obj.PrincipalMin = prinstress3.tolist()
+    res_obj.MaxShear = shearstress.tolist()
     FreeCAD.Console.PrintLog("Added standard principal stresses and max shear values.\n")
 
     #
@@ -448,9 +454,9 @@ def add_principal_stress_std(res_obj):
             alpha = np.sqrt(np.e) * critical_uniaxial_strain
             beta = 1.5
             if res_obj.Peeq:
-                res_obj.CriticalStrainRatio = calculate_csr(
-                    prinstress1, prinstress2, prinstress3, alpha, beta, res_obj
-                )
+                res_obj.CriticalStrainRatio = calculate_csr_batch(
+                    prinstress1, prinstress2, prinstress3, res_obj.Peeq, alpha, beta
+                ).tolist()
 
     return res_obj
 
@@ -486,6 +492,25 @@ def calculate_csr(ps1, ps2, ps3, alpha, beta, res_obj):
     return csr
 
 
+def calculate_csr_batch(ps1, ps2, ps3, peeq, alpha, beta):
+    """Calculate critical strain ratio of all nodes at once.
+
+    Same as calculate_csr(), but all principal stresses and peeq values
+    are given as sequences and the critical strain ratios are returned
+    as NumPy array.
+    """
+    ps1 = np.asarray(ps1, dtype=float)
+    ps2 = np.asarray(ps2, dtype=float)
+    ps3 = np.asarray(ps3, dtype=float)
+    peeq = np.asarray(peeq, dtype=float)[: len(ps1)]
+    p = (ps1 + ps2 + ps3) / 3.0  # pressure
+    svm = np.sqrt(1.5 * (ps1 - p) ** 2 + 1.5 * (ps2 - p) ** 2 + 1.5 * (ps3 - p) ** 2)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        T = np.where(svm != 0.0, p / np.where(svm != 0.0, svm, 1.0), 0.0)  # stress triaxiality
+    critical_strain = alpha * np.exp(-beta * T)
+    return np.abs(peeq) / critical_strain
+
+
 def get_concrete_nodes(res_obj):
     """Determine concrete / non-concrete nodes."""
     from femmesh.meshtools import get_femnodes_by_refshape
@@ -543,22 +568,6 @@ def add_principal_stress_reinforced(res_obj):
     # TODO may be use only one container for principal stresses in result object
     # https://forum.freecad.org/viewtopic.php?f=18&t=33106&p=416006#p416006
     # but which one is better
-    prinstress1 = []
-    prinstress2 = []
-    prinstress3 = []
-    shearstress = []
-    ps1v = []
-    ps2v = []
-    ps3v = []
-    #
-    # additional arrays to hold reinforcement ratios
-    # and mohr coulomb stress
-    #
-    rhx = []
-    rhy = []
-    rhz = []
-    moc = []
-
     # material parameter
     for obj in res_obj.getParentGroup().Group:
         if is_of_type(obj, "Fem::MaterialReinforced"):
@@ -575,48 +584,36 @@ def add_principal_stress_reinforced(res_obj):
     # print(matrix_cs)
     # print(reinforce_yield)
 
-    iterator = zip(
-        res_obj.NodeStressXX,
-        res_obj.NodeStressYY,
-        res_obj.NodeStressZZ,
-        res_obj.NodeStressXY,
-        res_obj.NodeStressXZ,
-        res_obj.NodeStressYZ,
+    stress_tensors = get_stress_tensors(res_obj)
+    prinstress1, prinstress2, prinstress3, shearstress, psv = (
+        calculate_principal_stress_reinforced_batch(stress_tensors)
     )
-    for isv, stress_tensor in enumerate(iterator):
-
-        rhox = 0.0
-        rhoy = 0.0
-        rhoz = 0.0
-        mc = 0.0
-
-        if ic[isv] == 1:
-            #
-            # for concrete scxx etc. are affected by
-            # reinforcement (see calculate_rho(stress_tensor)). for all other
-            # materials scxx etc. are the original stresses
-            #
-            rhox, rhoy, rhoz = calculate_rho(stress_tensor, reinforce_yield)
-
-        prin1, prin2, prin3, shear, psv = calculate_principal_stress_reinforced(stress_tensor)
-
-        prinstress1.append(prin1)
-        prinstress2.append(prin2)
-        prinstress3.append(prin3)
-        shearstress.append(shear)
-        ps1v.append(psv[0])
-        ps2v.append(psv[1])
-        ps3v.append(psv[2])
-
-        #
-        # reinforcement ratios and mohr coulomb criterion
-        #
-        rhx.append(rhox)
-        rhy.append(rhoy)
-        rhz.append(rhoz)
-        if ic[isv] == 1:
-            mc = calculate_mohr_coulomb(prin1, prin3, matrix_af, matrix_cs)
-        moc.append(mc)
+
+    #
+    # reinforcement ratios and mohr coulomb criterion
+    # for concrete scxx etc. are affected by
+    # reinforcement (see calculate_rho(stress_tensor)). for all other
+    # materials scxx etc. are the original stresses
+    #
+    rho = np.zeros((len(stress_tensors), 3))
+    moc = np.zeros(len(stress_tensors))
+    is_concrete = np.asarray(ic[: len(stress_tensors)]) == 1
+    if is_concrete.any():
+        rho[is_concrete] = calculate_rho_batch(stress_tensors[is_concrete], reinforce_yield)
+        moc[is_concrete] = calculate_mohr_coulomb_batch(
+            prinstress1[is_concrete], prinstress3[is_concrete], matrix_af, matrix_cs
+        )
+    rhx = rho[:, 0].tolist()
+    rhy = rho[:, 1].tolist()
+    rhz = rho[:, 2].tolist()
+    moc = moc.tolist()
+    ps1v = [tuple(v) for v in psv[:, 0].tolist()]
+    ps2v = [tuple(v) for v in psv[:, 1].tolist()]
+    ps3v = [tuple(v) for v in psv[:, 2].tolist()]
+    prinstress1 = prinstress1.tolist()
+    prinstress2 = prinstress2.tolist()
+    prinstress3 = prinstress3.tolist()
+    shearstress = shearstress.tolist()
 
     res_obj.PrincipalMax = prinstress1
     res_obj.PrincipalMed = prinstress2
@@ -685,6 +682,54 @@ def calculate_von_mises(stress_tensor):
     return von_mises
 
 
+def calculate_von_mises_batch(stress_tensors):
+    """Calculate Von mises stress of all nodes at once.
+    Same as calculate_von_mises(), but vectorized.
+
+    stress_tensors ... NumPy array, every row (Sxx, Syy, Szz, Sxy, Sxz, Syz)
+    """
+    stress_tensors = np.asarray(stress_tensors, dtype=float).reshape(-1, 6)
+    normal = stress_tensors[:, :3]
+    shear = stress_tensors[:, 3:]
+    pressure = np.average(normal, axis=1)[:, np.newaxis]
+    von_mises = np.sqrt(
+        1.5 * np.sum((normal - pressure) ** 2, axis=1) + 3.0 * np.sum(shear**2, axis=1)
+    )
+    return von_mises
+
+
+def get_stress_matrices(stress_tensors):
+    # stress tensors (n, 6) --> symmetric stress matrices (n, 3, 3)
+    # https://forum.freecad.org/viewtopic.php?f=18&t=24637&start=10#p240408
+    s = stress_tensors
+    sigma = np.empty((len(s), 3, 3))
+    sigma[:, 0, 0] = s[:, 0]  # Sxx
+    sigma[:, 1, 1] = s[:, 1]  # Syy
+    sigma[:, 2, 2] = s[:, 2]  # Szz
+    sigma[:, 0, 1] = sigma[:, 1, 0] = s[:, 3]  # Sxy
+    sigma[:, 0, 2] = sigma[:, 2, 0] = s[:, 4]  # Sxz
+    sigma[:, 1, 2] = sigma[:, 2, 1] = s[:, 5]  # Syz
+    return sigma
+
+
+def calculate_principal_stress_std_batch(stress_tensors):
+    """Calculate principal stresses and max shear of all nodes at once.
+    Same as calculate_principal_stress_std(), but vectorized.
+
+    stress_tensors ... NumPy array, every row (Sxx, Syy, Szz, Sxy, Sxz, Syz)
+    returns four NumPy arrays (prin1, prin2, prin3, maxshear)
+    """
+    stress_tensors = np.asarray(stress_tensors, dtype=float).reshape(-1, 6)
+    eigvals = np.full((len(stress_tensors), 3), np.nan)
+    # NaN tensors, which can happen on Calculix frd result files, return NaN
+    valid = ~np.isnan(stress_tensors).any(axis=1)
+    eigvals[valid] = np.linalg.eigvalsh(get_stress_matrices(stress_tensors[valid]))
+    # eigvalsh returns ascending eigenvalues
+    eigvals = eigvals[:, ::-1]
+    maxshear = (eigvals[:, 0] - eigvals[:, 2]) / 2.0
+    return (eigvals[:, 0], eigvals[:, 1], eigvals[:, 2], maxshear)
+
+
 def calculate_principal_stress_std(stress_tensor):
     # if NaN is inside the array, which can happen on Calculix frd result files return NaN
     # https://forum.freecad.org/viewtopic.php?f=22&t=33911&start=10#p284229
@@ -760,6 +805,39 @@ def calculate_principal_stress_reinforced(stress_tensor):
     )
 
 
+def calculate_principal_stress_reinforced_batch(stress_tensors):
+    """Calculate principal stress vectors and values of all nodes at once.
+    Same as calculate_principal_stress_reinforced(), but vectorized.
+
+    stress_tensors ... NumPy array, every row (Sxx, Syy, Szz, Sxy, Sxz, Syz)
+    returns four NumPy arrays (prin1, prin2, prin3, maxshear) and the
+    principal stress vectors as NumPy array of shape (n, 3, 3)
+    """
+    stress_tensors = np.asarray(stress_tensors, dtype=float).reshape(-1, 6)
+    eigenvalues, eigenvectors = np.linalg.eig(get_stress_matrices(stress_tensors))
+
+    #
+    #   suppress complex eigenvalue and vectors that may occur for
+    #   near-zero (numerical noise) stress fields
+    #
+    eigenvalues = eigenvalues.real
+    eigenvectors = eigenvectors.real * eigenvalues[:, np.newaxis, :]
+
+    idx = np.argsort(eigenvalues, axis=1, kind="stable")[:, ::-1]
+    eigenvalues = np.take_along_axis(eigenvalues, idx, axis=1)
+    eigenvectors = np.take_along_axis(eigenvectors, idx[:, np.newaxis, :], axis=2)
+
+    maxshear = (eigenvalues[:, 0] - eigenvalues[:, 2]) / 2.0
+
+    return (
+        eigenvalues[:, 0],
+        eigenvalues[:, 1],
+        eigenvalues[:, 2],
+        maxshear,
+        np.transpose(eigenvectors, (0, 2, 1)),
+    )
+
+
 def calculate_rho(stress_tensor, fy):
     """Calculation of Reinforcement Ratios and Concrete Stresses
     (in accordance with http://heronjournal.nl/53-4/3.pdf)
@@ -918,6 +996,134 @@ def calculate_rho(stress_tensor, fy):
     return rhox[eqmin], rhoy[eqmin], rhoz[eqmin]
 
 
+def calculate_rho_batch(stress_tensors, fy):
+    """Calculation of Reinforcement Ratios of all nodes at once.
+    Same as calculate_rho(), but vectorized.
+
+    stress_tensors ... NumPy array, every row (Sxx, Syy, Szz, Sxy, Sxz, Syz)
+    returns NumPy array, every row (rhox, rhoy, rhoz)
+    """
+    s = np.asarray(stress_tensors, dtype=float).reshape(-1, 6)
+    sxx = s[:, 0]
+    syy = s[:, 1]
+    szz = s[:, 2]
+    sxy = s[:, 3]
+    syz = s[:, 5]
+    sxz = s[:, 4]
+
+    n = len(s)
+    rhox = np.zeros((n, 15))
+    rhoy = np.zeros((n, 15))
+    rhoz = np.zeros((n, 15))
+
+    def divide(a, b):
+        # a / b where b is not zero, 0.0 otherwise
+        nonzero = b != 0.0
+        return np.where(nonzero, a / np.where(nonzero, b, 1.0), 0.0)
+
+    i3 = sxx * syy * szz + 2 * sxy * sxz * syz - sxx * syz**2 - syy * sxz**2 - szz * sxy**2
+
+    # Solution (5), (6), (7)
+    rhoz[:, 0] = divide(i3, sxx * syy - sxy**2) / fy
+    rhoy[:, 1] = divide(i3, sxx * szz - sxz**2) / fy
+    rhox[:, 2] = divide(i3, syy * szz - syz**2) / fy
+
+    # Solution (9)
+    has = sxx != 0.0
+    fc = divide(sxz * sxy, sxx) - syz
+    fxy = divide(sxy**2, sxx)
+    fxz = divide(sxz**2, sxx)
+    rhoy[:, 3] = np.where(has, (syy - fxy + fc) / fy, 0.0)
+    rhoz[:, 3] = np.where(has, (szz - fxz + fc) / fy, 0.0)
+    rhoy[:, 4] = np.where(has, (syy - fxy - fc) / fy, 0.0)
+    rhoz[:, 4] = np.where(has, (szz - fxz - fc) / fy, 0.0)
+
+    # Solution (10)
+    has = syy != 0.0
+    fc = divide(syz * sxy, syy) - sxz
+    fxy = divide(sxy**2, syy)
+    fyz = divide(syz**2, syy)
+    rhox[:, 5] = np.where(has, (sxx - fxy + fc) / fy, 0.0)
+    rhoz[:, 5] = np.where(has, (szz - fyz + fc) / fy, 0.0)
+    rhox[:, 6] = np.where(has, (sxx - fxy - fc) / fy, 0.0)
+    rhoz[:, 6] = np.where(has, (szz - fyz - fc) / fy, 0.0)
+
+    # Solution (11)
+    has = szz != 0.0
+    fc = divide(sxz * syz, szz) - sxy
+    fxz = divide(sxz**2, szz)
+    fyz = divide(syz**2, szz)
+    rhox[:, 7] = np.where(has, (sxx - fxz + fc) / fy, 0.0)
+    rhoy[:, 7] = np.where(has, (syy - fyz + fc) / fy, 0.0)
+    rhox[:, 8] = np.where(has, (sxx - fxz - fc) / fy, 0.0)
+    rhoy[:, 8] = np.where(has, (syy - fyz - fc) / fy, 0.0)
+
+    # Solution (13)
+    rhox[:, 9] = (sxx + sxy + sxz) / fy
+    rhoy[:, 9] = (syy + sxy + syz) / fy
+    rhoz[:, 9] = (szz + sxz + syz) / fy
+
+    # Solution (14)
+    rhox[:, 10] = (sxx + sxy - sxz) / fy
+    rhoy[:, 10] = (syy + sxy - syz) / fy
+    rhoz[:, 10] = (szz - sxz - syz) / fy
+
+    # Solution (15)
+    rhox[:, 11] = (sxx - sxy - sxz) / fy
+    rhoy[:, 11] = (syy - sxy + syz) / fy
+    rhoz[:, 11] = (szz - sxz + syz) / fy
+
+    # Solution (16)
+    rhox[:, 12] = (sxx - sxy + sxz) / fy
+    rhoy[:, 12] = (syy - sxy - syz) / fy
+    rhoz[:, 12] = (szz + sxz - syz) / fy
+
+    # Solution (17)
+    rhox[:, 13] = np.where(syz != 0.0, (sxx - divide(sxy * sxz, syz)) / fy, 0.0)
+    rhoy[:, 13] = np.where(sxz != 0.0, (syy - divide(sxy * syz, sxz)) / fy, 0.0)
+    rhoz[:, 13] = np.where(sxy != 0.0, (szz - divide(sxz * syz, sxy)) / fy, 0.0)
+
+    # Concrete Stresses
+    sxy = sxy[:, np.newaxis]
+    sxz = sxz[:, np.newaxis]
+    syz = syz[:, np.newaxis]
+    scxx = sxx[:, np.newaxis] - rhox * fy
+    scyy = syy[:, np.newaxis] - rhoy * fy
+    sczz = szz[:, np.newaxis] - rhoz * fy
+    ic1 = scxx + scyy + sczz
+    ic2 = scxx * scyy + scyy * sczz + sczz * scxx - sxy**2 - sxz**2 - syz**2
+    ic3 = scxx * scyy * sczz + 2 * sxy * sxz * syz - scxx * syz**2 - scyy * sxz**2 - sczz * sxy**2
+
+    rsum = rhox + rhoy + rhoz
+    valid = (
+        (rhox >= -1.0e-10)
+        & (rhoy >= -1.0e-10)
+        & (rhoz > -1.0e-10)
+        & (ic1 <= 1.0e-6)
+        & (ic2 >= -1.0e-6)
+        & (ic3 <= 1.0e-6)
+        & (rsum < 1.0e9)
+        & (rsum > 0.0)
+    )
+    # the first solution with the smallest sum, solution 14 (all zero) if there is none
+    rsum = np.where(valid, rsum, np.inf)
+    eqmin = np.where(valid.any(axis=1), np.argmin(rsum, axis=1), 14)
+
+    rows = np.arange(n)
+    return np.column_stack((rhox[rows, eqmin], rhoy[rows, eqmin], rhoz[rows, eqmin]))
+
+
+def calculate_mohr_coulomb_batch(prin1, prin3, phi, fck):
+    """Calculation of Mohr Coulomb yield criterion of all nodes at once.
+    Same as calculate_mohr_coulomb(), but vectorized.
+    """
+    prin1 = np.asarray(prin1, dtype=float)
+    prin3 = np.asarray(prin3, dtype=float)
+    coh = fck * (1 - np.sin(phi)) / 2 / np.cos(phi)
+    mc_stress = (prin1 - prin3) + (prin1 + prin3) * np.sin(phi) - 2.0 * coh * np.cos(phi)
+    return np.where(mc_stress < 0.0, 0.0, mc_stress)
+
+
 def calculate_mohr_coulomb(prin1, prin3, phi, fck):
     """Calculation of Mohr Coulomb yield criterion to judge
     concrete crushing and shear failure.
@@ -940,7 +1146,10 @@ def calculate_mohr_coulomb(prin1, prin3, phi, fck):
 
 def calculate_disp_abs(displacements):
     # see https://forum.freecad.org/viewtopic.php?f=18&t=33106&start=100#p296657
-    return [np.linalg.norm(nd) for nd in displacements]
+    if len(displacements) == 0:
+        return []
+    displacements = np.asarray(displacements, dtype=float).reshape(-1, 3)
+    return np.linalg.norm(displacements, axis=1).tolist()
 
 
 ##  @}
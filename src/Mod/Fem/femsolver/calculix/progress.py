@@ -0,0 +1,207 @@
+# ***************************************************************************
+# *   Copyright (c) 2024 FreeCAD Project Association                        *
+# *                                                                         *
+# *   This file is part of the FreeCAD CAx development system.              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+__title__ = "FreeCAD FEM solver CalculiX progress"
+__author__ = "FreeCAD Project Association"
+__url__ = "https://www.freecad.org"
+
+## \addtogroup FEM
+#  @{
+
+import os
+import threading
+
+import FreeCAD
+
+
+# while running CalculiX writes one line per increment into the .sta file
+# and one line per equilibrium iteration into the .cvg file
+# both files are read incrementally while the solver is running
+# every line is converted into a progress event (a dictionary)
+
+STA_KEYS = ("step", "increment", "attempt", "iterations")
+STA_TIME_KEYS = ("total_time", "step_time", "increment_time")
+CVG_KEYS = ("step", "increment", "attempt", "iteration", "contact_elements")
+CVG_RESIDUAL_KEYS = ("force_residual", "disp_correction", "flux_residual", "temp_correction")
+
+
+def read_sta_line(line):
+    """
+    Returns the increment event of a .sta file line or None.
+
+    A not converged attempt is marked by ccx with an "U" after the attempt number.
+    """
+    values = line.split()
+    if len(values) != len(STA_KEYS) + len(STA_TIME_KEYS):
+        return None
+    converged = not values[2].endswith("U")
+    values[2] = values[2].rstrip("U")
+    try:
+        event = dict(zip(STA_KEYS, map(int, values[:4])))
+        event.update(zip(STA_TIME_KEYS, map(float, values[4:])))
+    except ValueError:
+        # header lines
+        return None
+    event["type"] = "increment"
+    event["converged"] = converged
+    return event
+
+
+def read_cvg_line(line):
+    """Returns the iteration event of a .cvg file line or None."""
+    values = line.split()
+    if len(values) != len(CVG_KEYS) + len(CVG_RESIDUAL_KEYS):
+        return None
+    try:
+        event = dict(zip(CVG_KEYS, map(int, values[:5])))
+        event.update(zip(CVG_RESIDUAL_KEYS, map(float, values[5:])))
+    except ValueError:
+        # header lines
+        return None
+    event["type"] = "iteration"
+    return event
+
+
+def format_event(event):
+    """Returns a status line for a progress event."""
+    if event["type"] == "increment":
+        return (
+            "Step {step}, increment {increment}, attempt {attempt}: "
+            "{iterations} iterations, total time {total_time:g}\n".format(**event)
+        )
+    return (
+        "Step {step}, increment {increment}, iteration {iteration}: "
+        "force residual {force_residual:g} %, flux residual {flux_residual:g} %\n".format(**event)
+    )
+
+
+class ProgressReader:
+    """
+    Reads the progress events out of the .sta and .cvg files of a ccx job.
+
+    read() returns the events of the lines added since the last call.
+    Incomplete lines at the file end are kept until they are completed.
+    """
+
+    def __init__(self, directory, job_name):
+        base = os.path.join(directory, job_name)
+        self.files = ((base + ".sta", read_sta_line), (base + ".cvg", read_cvg_line))
+        self.offsets = {}
+
+    def reset(self):
+        """Removes the files of a previous run, call it before ccx is started."""
+        for path, _ in self.files:
+            if os.path.isfile(path):
+                os.remove(path)
+        self.offsets = {}
+
+    def read(self):
+        events = []
+        for path, read_line in self.files:
+            try:
+                size = os.path.getsize(path)
+            except OSError:
+                continue
+            offset = self.offsets.get(path, 0)
+            if size < offset:
+                # the file has been rewritten
+                offset = 0
+            if size == offset:
+                continue
+            with open(path, "rb") as f:
+                f.seek(offset)
+                data = f.read(size - offset)
+            end = data.rfind(b"\n") + 1
+            self.offsets[path] = offset + end
+            for line in data[:end].decode(errors="replace").splitlines():
+                event = read_line(line)
+                if event is not None:
+                    events.append(event)
+        return events
+
+
+def observe_process(process, reader, on_output=None, on_progress=None, interval=0.5):
+    """
+    Observes a running ccx process until it has finished.
+
+    The stdout lines are passed to on_output as soon as ccx writes them,
+    the progress events of the reader to on_progress every interval seconds.
+    stdout and stderr are read in threads, thus the pipes never block ccx.
+    Exceptions of the callbacks are printed, they never stop the reading.
+    Returns the whole stdout and stderr as strings.
+    """
+    on_output = _guarded(on_output)
+    on_progress = _guarded(on_progress)
+    stdout = []
+    stderr = []
+    threads = [
+        threading.Thread(target=_read_pipe, args=(process.stdout, stdout, on_output)),
+        threading.Thread(target=_read_pipe, args=(process.stderr, stderr, None)),
+    ]
+    for thread in threads:
+        thread.daemon = True
+        thread.start()
+    while threads[0].is_alive():
+        threads[0].join(interval)
+        _notify(reader.read(), on_progress)
+    for thread in threads:
+        thread.join()
+    process.wait()
+    _notify(reader.read(), on_progress)
+    return "".join(stdout), "".join(stderr)
+
+
+def _read_pipe(pipe, lines, callback):
+    for line in iter(pipe.readline, b""):
+        line = line.decode(errors="replace")
+        lines.append(line)
+        if callback is not None:
+            callback(line)
+    pipe.close()
+
+
+def _notify(events, callback):
+    if callback is not None:
+        for event in events:
+            callback(event)
+
+
+def _guarded(callback):
+    # the pipe has to be drained even if a callback fails, otherwise ccx blocks
+    # only the first failure is printed, the callback may be called for every line
+    if callback is None:
+        return None
+    failed = []
+
+    def call(arg):
+        try:
+            callback(arg)
+        except Exception as e:
+            if not failed:
+                FreeCAD.Console.PrintError(f"CalculiX progress callback failed: {e}\n")
+                failed.append(e)
+
+    return call
+
+
+##  @}
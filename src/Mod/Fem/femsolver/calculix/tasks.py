@@ -35,11 +35,13 @@ import subprocess
 
 import FreeCAD
 
+from . import progress
 from . import writer
 from .. import run
 from .. import settings
 from feminout import importCcxDatResults
 from feminout import importCcxFrdResults
+from femresult import resultcache
 from femmesh import meshsetsgetter
 from femtools import femutils
 from femtools import membertools
@@ -80,11 +82,13 @@ class Prepare(run.Prepare):
         # TODO evaluate if it makes sense to add new task
         # between check and prepare to the solver frame work
         mesh_obj = membertools.get_mesh_to_solve(self.analysis)[0]  # pre check done already
+        ccx_prefs = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Fem/Ccx")
         meshdatagetter = meshsetsgetter.MeshSetsGetter(
             self.analysis,
             self.solver,
             mesh_obj,
             membertools.AnalysisMember(self.analysis),
+            processes=ccx_prefs.GetInt("NodeSearchProcesses", 1),
         )
         meshdatagetter.get_mesh_sets()
 
@@ -96,6 +100,7 @@ class Prepare(run.Prepare):
             meshdatagetter.member,
             self.directory,
             meshdatagetter.mat_geo_sets,
+            meshdatagetter=meshdatagetter,
         )
         path = w.write_solver_input()
         # report to user if task succeeded
@@ -121,19 +126,26 @@ class Solve(run.Solve):
             return
 
         # run solver
+        # the stdout and the .sta and .cvg files are read while ccx is running
+        reader = progress.ProgressReader(self.directory, _inputFileName)
+        reader.reset()
         self._process = subprocess.Popen(
             [binary, "-i", _inputFileName],
             cwd=self.directory,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
+            env=self.solverEnvironment(),
         )
         self.signalAbort.add(self._process.terminate)
-        # output = self._observeSolver(self._process)
-        self._process.communicate()
+        progress.observe_process(
+            self._process, reader, on_output=self.pushStatus, on_progress=self._pushProgress
+        )
         self.signalAbort.remove(self._process.terminate)
-        # if not self.aborted:
-        #     self._updateOutput(output)
-        # del output   # get flake8 quiet
+
+    def _pushProgress(self, event):
+        if event["type"] == "increment":
+            self.pushStatus(progress.format_event(event))
+        self.pushProgress(event)
 
 
 class Results(run.Results):
@@ -154,6 +166,7 @@ class Results(run.Results):
         for m in membertools.get_member(self.analysis, "Fem::FemResultObject"):
             if m.Mesh and femutils.is_of_type(m.Mesh, "Fem::MeshResult"):
                 self.analysis.Document.removeObject(m.Mesh.Name)
+            resultcache.remove_result(m)
             self.analysis.Document.removeObject(m.Name)
         self.analysis.Document.recompute()
 
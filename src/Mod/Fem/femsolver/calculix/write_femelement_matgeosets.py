@@ -25,6 +25,8 @@ __title__ = "FreeCAD FEM calculix write inpfile material and geometry sets"
 __author__ = "Bernd Hahnebach"
 __url__ = "https://www.freecad.org"
 
+import io
+
 
 def write_femelement_matgeosets(f, ccxwriter):
 
@@ -32,6 +34,18 @@ def write_femelement_matgeosets(f, ccxwriter):
     f.write("\n{}\n".format(59 * "*"))
     f.write("** Element sets for materials and FEM element type (solid, shell, beam, fluid)\n")
 
+    if ccxwriter.split_inpfile:
+        file_name_split = ccxwriter.mesh_name + "_matgeosets.inp"
+        f.write(f"*INCLUDE,INPUT={file_name_split}\n")
+        inpfile_split = io.StringIO()
+        write_matgeosets(inpfile_split, ccxwriter)
+        ccxwriter.write_split_inpfile(file_name_split, inpfile_split.getvalue())
+    else:
+        write_matgeosets(f, ccxwriter)
+
+
+def write_matgeosets(f, ccxwriter):
+
     for matgeoset in ccxwriter.mat_geo_sets:
 
         f.write("*ELSET,ELSET={}\n".format(matgeoset["ccx_elset_name"]))
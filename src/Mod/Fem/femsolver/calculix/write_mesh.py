@@ -27,8 +27,12 @@ __url__ = "https://www.freecad.org"
 
 
 import codecs
+import hashlib
+from itertools import chain
 from os.path import join
 
+import numpy as np
+
 from femmesh import meshtools
 
 
@@ -61,14 +65,28 @@ def write_mesh(ccxwriter):
         file_name_split = ccxwriter.mesh_name + "_" + write_name + ".inp"
         ccxwriter.femmesh_file = join(ccxwriter.dir_name, file_name_split)
 
-        ccxwriter.femmesh.writeABAQUS(
-            ccxwriter.femmesh_file,
-            element_param,
-            group_param,
-            volVariant=vol_variant,
-            faceVariant=face_variant,
-            edgeVariant=edge_variant,
-        )
+        # the mesh file of the last run is kept if the mesh and the element variants
+        # have not changed, fluid sections change the mesh file after writing
+        mesh_unchanged = False
+        if not ccxwriter.member.geos_fluidsection:
+            mesh_hash = get_femmesh_hash(
+                ccxwriter.meshdatagetter,
+                element_param,
+                group_param,
+                vol_variant,
+                face_variant,
+                edge_variant,
+            )
+            mesh_unchanged = ccxwriter.is_split_inpfile_unchanged(file_name_split, mesh_hash)
+        if not mesh_unchanged:
+            ccxwriter.femmesh.writeABAQUS(
+                ccxwriter.femmesh_file,
+                element_param,
+                group_param,
+                volVariant=vol_variant,
+                faceVariant=face_variant,
+                edgeVariant=edge_variant,
+            )
 
         inpfile = codecs.open(ccxwriter.file_name, "w", encoding="utf-8")
         inpfile.write("{}\n".format(59 * "*"))
@@ -91,3 +109,46 @@ def write_mesh(ccxwriter):
         inpfile.write("\n\n")
 
     return inpfile
+
+
+def get_femmesh_hash(meshdatagetter, *write_params):
+    # hash of everything the mesh file is made from: nodes, elements, groups and write parameter
+    # the node and element data of the mesh sets getter are used, missing data is added to it
+    # with element_param 1 only the elements of the highest dimension are written, these are
+    # the ones of the femelement_table
+    femmesh = meshdatagetter.femmesh
+    mesh_hash = hashlib.sha256(repr(write_params).encode("utf-8"))
+    counts = (femmesh.NodeCount, femmesh.VolumeCount, femmesh.FaceCount, femmesh.EdgeCount)
+    mesh_hash.update(repr(counts).encode("utf-8"))
+
+    if meshdatagetter.femnodes_index is not None:
+        node_ids = meshdatagetter.femnodes_index.node_ids
+        coords = meshdatagetter.femnodes_index.coords
+    else:
+        if not meshdatagetter.femnodes_mesh:
+            meshdatagetter.femnodes_mesh = femmesh.Nodes
+        nodes = meshdatagetter.femnodes_mesh
+        node_ids = np.fromiter(nodes, dtype=np.int64, count=len(nodes))
+        coords = np.array([(v.x, v.y, v.z) for v in nodes.values()], dtype=float)
+    mesh_hash.update(node_ids.tobytes())
+    mesh_hash.update(coords.tobytes())
+
+    if not meshdatagetter.femelement_table:
+        meshdatagetter.femelement_table = meshtools.get_femelement_table(femmesh)
+    element_table = meshdatagetter.femelement_table
+    mesh_hash.update(np.fromiter(element_table, dtype=np.int64, count=len(element_table)).tobytes())
+    mesh_hash.update(
+        np.fromiter(
+            map(len, element_table.values()), dtype=np.int64, count=len(element_table)
+        ).tobytes()
+    )
+    mesh_hash.update(
+        np.fromiter(chain.from_iterable(element_table.values()), dtype=np.int64).tobytes()
+    )
+
+    for group in femmesh.Groups:
+        mesh_hash.update(
+            repr((femmesh.getGroupName(group), femmesh.getGroupElementType(group))).encode("utf-8")
+        )
+        mesh_hash.update(np.array(femmesh.getGroupElements(group), dtype=np.int64).tobytes())
+    return mesh_hash.hexdigest()
@@ -108,14 +108,29 @@ units_information = """*********************************************************
 
 class FemInputWriterCcx(writerbase.FemInputWriter):
     def __init__(
-        self, analysis_obj, solver_obj, mesh_obj, member, dir_name=None, mat_geo_sets=None
+        self,
+        analysis_obj,
+        solver_obj,
+        mesh_obj,
+        member,
+        dir_name=None,
+        mat_geo_sets=None,
+        meshdatagetter=None,
     ):
         writerbase.FemInputWriter.__init__(
-            self, analysis_obj, solver_obj, mesh_obj, member, dir_name, mat_geo_sets
+            self,
+            analysis_obj,
+            solver_obj,
+            mesh_obj,
+            member,
+            dir_name,
+            mat_geo_sets,
+            meshdatagetter,
         )
         self.mesh_name = self.mesh_object.Name
         self.file_name = join(self.dir_name, self.mesh_name + ".inp")
         self.femmesh_file = ""  # the file the femmesh is in, no matter if one or split input file
+        self.split_hashes_file = join(self.dir_name, self.mesh_name + "_split_hashes.json")
         self.gravity = int(Units.Quantity(constants.gravity()).getValueAs("mm/s^2"))  # 9820 mm/s2
         self.units_information = units_information
 
@@ -131,6 +146,8 @@ class FemInputWriterCcx(writerbase.FemInputWriter):
         if self.solver_obj.SplitInputWriter is True:
             FreeCAD.Console.PrintMessage("Split input file.\n")
             self.split_inpfile = True
+            # unchanged split input files of the last run are kept
+            self.read_split_hashes()
         else:
             FreeCAD.Console.PrintMessage("One monster input file.\n")
             self.split_inpfile = False
@@ -205,6 +222,8 @@ class FemInputWriterCcx(writerbase.FemInputWriter):
 
         # close file
         inpfile.close()
+        if self.split_inpfile:
+            self.write_split_hashes()
 
         writetime = round((time.process_time() - time_start), 3)
         FreeCAD.Console.PrintMessage(f"Writing time CalculiX input file: {writetime} seconds.\n")
@@ -31,7 +31,9 @@ __url__ = "https://www.freecad.org"
 import cmath
 import os
 import os.path
+import shutil
 import subprocess
+import threading
 from platform import system
 
 import FreeCAD
@@ -43,6 +45,10 @@ from femtools import femutils
 from femtools import membertools
 
 
+# the solver output object is shared by concurrent runs of a parameter sweep
+_outputLock = threading.Lock()
+
+
 class Check(run.Check):
 
     def run(self):
@@ -123,14 +129,9 @@ class Solve(run.Solve):
             # different call depending if with multithreading or not
             num_cores = settings.get_cores("ElmerSolver")
             self.pushStatus(f"Number of CPU cores to be used for the solver run: {num_cores}\n")
-            args = []
+            args = [binary]
             if num_cores > 1:
-                if system() != "Windows":
-                    args.extend(["mpirun"])
-                else:
-                    args.extend(["mpiexec"])
-                args.extend(["-np", str(num_cores)])
-            args.extend([binary])
+                args = self._getMpiArgs(binary, num_cores)
             if system() == "Windows":
                 self._process = subprocess.Popen(
                     args,
@@ -138,10 +139,15 @@ class Solve(run.Solve):
                     stdout=subprocess.PIPE,
                     stderr=subprocess.PIPE,
                     startupinfo=femutils.startProgramInfo("hide"),
+                    env=self.solverEnvironment(),
                 )
             else:
                 self._process = subprocess.Popen(
-                    args, cwd=self.directory, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+                    args,
+                    cwd=self.directory,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    env=self.solverEnvironment(),
                 )
             self.signalAbort.add(self._process.terminate)
             output = self._observeSolver(self._process)
@@ -154,12 +160,28 @@ class Solve(run.Solve):
             self.pushStatus("Error: ElmerSolver binary has not been found!")
             self.fail()
 
+    def _getMpiArgs(self, binary, num_cores):
+        # the mesh has been partitioned by ElmerGrid into num_cores parts
+        # one ElmerSolver process is started for every partition
+        # Elmer versions before 9.0 have a separate MPI binary ElmerSolver_mpi
+        launcher = shutil.which("mpiexec" if system() == "Windows" else "mpirun")
+        if launcher is None:
+            self.report.warning("MPI launcher not found, ElmerSolver runs on one CPU core.")
+            self.pushStatus("Warning: MPI launcher not found, running on one CPU core.\n")
+            return [binary]
+        solvpath, name = os.path.split(binary)
+        mpi_binary = shutil.which(name.replace("ElmerSolver", "ElmerSolver_mpi"), path=solvpath)
+        if mpi_binary is not None:
+            binary = mpi_binary
+        return [launcher, "-np", str(num_cores), binary]
+
     def _updateOutput(self, output):
-        if self.solver.ElmerOutput is None:
-            self._createOutput()
         # check if eigenmodes were calculated and if so append them to output
         output = self._calculateEigenfrequencies(output)
-        self.solver.ElmerOutput.Text = output
+        with _outputLock:
+            if self.solver.ElmerOutput is None:
+                self._createOutput()
+            self.solver.ElmerOutput.Text = output
 
     def _createOutput(self):
         self.solver.ElmerOutput = self.analysis.Document.addObject(
@@ -351,22 +373,24 @@ class Results(run.Results):
         possible_post_file_old = os.path.join(self.directory, "case0001.vtu")
         possible_post_file_single = os.path.join(self.directory, "FreeCAD_t0001.vtu")
         possible_post_file_multi = os.path.join(self.directory, "FreeCAD_t0001.pvtu")
-        # depending on the currently set number of cores we try to load either
-        # the multi-thread result or the single result
-        if settings.get_cores("ElmerSolver") > 1:
-            if os.path.isfile(possible_post_file_multi):
-                postPath = possible_post_file_multi
-            else:
-                self.report.error("Result file not found.")
-                self.fail()
+        # a partitioned run writes the multi-thread result, a pvtu file which
+        # references one vtu file per partition, the pipeline reads them as one mesh
+        # the newest file is used, thus the result of the last run is loaded even if
+        # the number of cores has been changed in between
+        possible_post_files = [
+            path
+            for path in (
+                possible_post_file_multi,
+                possible_post_file_single,
+                possible_post_file_old,
+            )
+            if os.path.isfile(path)
+        ]
+        if possible_post_files:
+            postPath = max(possible_post_files, key=os.path.getmtime)
         else:
-            if os.path.isfile(possible_post_file_single):
-                postPath = possible_post_file_single
-            elif os.path.isfile(possible_post_file_old):
-                postPath = possible_post_file_old
-            else:
-                self.report.error("Result file not found.")
-                self.fail()
+            self.report.error("Result file not found.")
+            self.fail()
         return postPath
 
 
@@ -32,6 +32,7 @@ __url__ = "https://www.freecad.org"
 
 import os
 import os.path
+import shutil
 import subprocess
 import tempfile
 from platform import system
@@ -231,26 +232,45 @@ class Writer:
                 raise WriteError("Could not find ElmerGrid binary.")
             # for multithreading we first need a normal mesh creation run
             # then a second to split the mesh into the number of used cores
-            argsBasic = [binary, _ELMERGRID_IFORMAT, _ELMERGRID_OFORMAT, unvPath]
-            args = argsBasic
-            args.extend(["-out", self.directory])
-            if system() == "Windows":
-                subprocess.call(
-                    args, stdout=subprocess.DEVNULL, startupinfo=femutils.startProgramInfo("hide")
-                )
-            else:
-                subprocess.call(args, stdout=subprocess.DEVNULL)
+            # the second run partitions the Elmer mesh written by the first one
+            # thus the UNV file is only read once
+            self._runElmerGrid(
+                [binary, _ELMERGRID_IFORMAT, _ELMERGRID_OFORMAT, unvPath, "-out", self.directory]
+            )
+            self._removePartitioning()
             if num_cores > 1:
-                args = argsBasic
-                args.extend(["-partdual", "-metiskway", str(num_cores), "-out", self.directory])
-                if system() == "Windows":
-                    subprocess.call(
-                        args,
-                        stdout=subprocess.DEVNULL,
-                        startupinfo=femutils.startProgramInfo("hide"),
+                self._runElmerGrid(
+                    [
+                        binary,
+                        _ELMERGRID_OFORMAT,
+                        _ELMERGRID_OFORMAT,
+                        self.directory,
+                        "-partdual",
+                        "-metiskway",
+                        str(num_cores),
+                    ]
+                )
+                partitioning = os.path.join(self.directory, f"partitioning.{num_cores}")
+                if not os.path.isdir(partitioning):
+                    raise WriteError(
+                        f"ElmerGrid could not partition the mesh into {num_cores} parts."
                     )
-                else:
-                    subprocess.call(args, stdout=subprocess.DEVNULL)
+
+    def _runElmerGrid(self, args):
+        if system() == "Windows":
+            subprocess.call(
+                args, stdout=subprocess.DEVNULL, startupinfo=femutils.startProgramInfo("hide")
+            )
+        else:
+            subprocess.call(args, stdout=subprocess.DEVNULL)
+
+    def _removePartitioning(self):
+        # a partitioning of a former run with another number of cores
+        # would be used by ElmerSolver if the number of cores is changed back
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            if name.startswith("partitioning.") and os.path.isdir(path):
+                shutil.rmtree(path)
 
     def _writeStartinfo(self):
         path = os.path.join(self.directory, _STARTINFO_NAME)
@@ -122,6 +122,7 @@ class Solve(run.Solve):
             cwd=self.directory,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
+            env=self.solverEnvironment(),
         )
         self.signalAbort.add(self._process.terminate)
         self._process.communicate()
@@ -36,10 +36,12 @@ __title__ = "FreeCAD FEM solver run"
 __author__ = "Markus Hovorka, Bernd Hahnebach"
 __url__ = "https://www.freecad.org"
 
+import glob
 import os
 import os.path
 import shutil
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 
 # import threading  # not used ATM
 
@@ -168,6 +170,139 @@ def run_fem_solver(solver, working_dir=None):
                     display(machine.report, "Run Report", error_message)
 
 
+def run_fem_solver_sweep(solver, variants, working_dir, jobs=None, cpu_budget=None):
+    """Execute *solver* of the solver framework once for every variant of a sweep.
+
+    Every variant gets its own working directory ``variant_000``,
+    ``variant_001``, ... in *working_dir*. The solver input of the variants
+    is written one after the other, because the variants are made by
+    changing document object properties, which are restored afterwards.
+    The solvers are run concurrently by a bounded pool afterwards. No result
+    objects are loaded into the document. This method is blocking.
+
+    :param solver:
+        A document object which must be a framework compliant solver, see
+        :func:`run_fem_solver`.
+
+    :param variants:
+        A list of dictionaries with the property overrides of every variant.
+        The keys are ``"ObjectName.PropertyName"``, for dictionary properties
+        like the material a single entry can be set by
+        ``"ObjectName.PropertyName.Key"``. The values are set as given, thus
+        quantities can be given as strings, e.g. ``{"ConstraintForce.Force":
+        "2 kN"}``.
+
+    :param working_dir:
+        The existing directory the variant directories are created in.
+
+    :param jobs:
+        The number of solvers running at the same time. If ``None`` the
+        *cpu_budget* is used.
+
+    :param cpu_budget:
+        The total number of CPU cores used by all running solvers. Every
+        solver gets ``cpu_budget // jobs`` of them by ``OMP_NUM_THREADS``,
+        which is set in the environment of the solver processes only.
+        If ``None`` the number of CPU cores of the machine is used.
+
+    :returns:
+        A list with a dictionary for every variant with the keys
+        ``"variant"``, ``"directory"``, ``"failed"`` and ``"summary"``. The
+        summary is the min and max values of every result set of a CalculiX
+        frd result file (see
+        :func:`feminout.importCcxFrdResults.read_frd_result_summary`) or
+        ``None`` for other solvers.
+    """
+    if not hasattr(solver.Proxy, "createMachine"):
+        App.Console.PrintError("A parameter sweep needs a solver of the solver framework.\n")
+        return []
+    if not os.path.isdir(working_dir):
+        raise DirectoryDoesNotExistError("Invalid path")
+    if cpu_budget is None:
+        cpu_budget = os.cpu_count() or 1
+    if jobs is None:
+        jobs = cpu_budget
+    jobs = max(1, min(jobs, cpu_budget, len(variants)))
+    threads = max(1, cpu_budget // jobs)
+
+    # write the solver input of every variant
+    machines = []
+    for i, variant in enumerate(variants):
+        directory = os.path.join(working_dir, "variant_%03d" % i)
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        App.Console.PrintMessage(f"Sweep variant {i}: {variant}\n")
+        machine = solver.Proxy.createMachine(solver, directory, testmode=False)
+        machine.target = PREPARE
+        originals = _setSweepProperties(solver.Document, variant)
+        try:
+            machine.start()
+            machine.join()
+        finally:
+            _setSweepProperties(solver.Document, originals)
+        machines.append(machine)
+
+    # run the solvers, they are separate processes, thus threads are sufficient to wait for them
+    App.Console.PrintMessage(
+        f"Run {len(machines)} sweep variants, {jobs} at the same time "
+        f"with {threads} threads each.\n"
+    )
+    # the thread count is set in the environment of the solver processes only
+    for machine in machines:
+        machine.environment = {"OMP_NUM_THREADS": str(threads)}
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        list(executor.map(_solveSweepVariant, machines))
+
+    # summary of the results, read from the result files
+    results = []
+    for variant, machine in zip(variants, machines):
+        summary = None
+        if not machine.failed:
+            frd_files = sorted(glob.glob(os.path.join(machine.directory, "*.frd")))
+            if frd_files:
+                from feminout.importCcxFrdResults import read_frd_result_summary
+
+                summary = read_frd_result_summary(frd_files[0])
+        else:
+            App.Console.PrintError(f"Sweep variant in {machine.directory} failed.\n")
+        results.append(
+            {
+                "variant": variant,
+                "directory": machine.directory,
+                "failed": machine.failed,
+                "summary": summary,
+            }
+        )
+    return results
+
+
+def _setSweepProperties(doc, overrides):
+    # sets the overrides and returns the original values of the changed properties
+    originals = {}
+    for name, value in overrides.items():
+        obj_name, prop = name.split(".", 1)
+        obj = doc.getObject(obj_name)
+        if obj is None:
+            raise ValueError(f"Sweep object not found: {obj_name}")
+        prop, _, key = prop.partition(".")
+        originals.setdefault(obj_name + "." + prop, getattr(obj, prop))
+        if key:
+            data = dict(getattr(obj, prop))
+            data[key] = value
+            value = data
+        setattr(obj, prop, value)
+    doc.recompute()
+    return originals
+
+
+def _solveSweepVariant(machine):
+    if machine.failed or machine.state != SOLVE:
+        return
+    machine.target = SOLVE
+    machine.start()
+    machine.join()
+
+
 def getMachine(solver, path=None):
     """Get or create :class:`Machine` using caching mechanism.
 
@@ -308,11 +443,21 @@ class BaseTask(task.Thread):
         self.solver = None
         self.directory = None
         self.testmode = None
+        # environment variables set for the solver processes only, e.g. by a sweep
+        self.environment = {}
 
     @property
     def analysis(self):
         return self.solver.getParentGroup()
 
+    def solverEnvironment(self):
+        # the env argument of subprocess.Popen, None keeps the environment of FreeCAD
+        if not self.environment:
+            return None
+        env = dict(os.environ)
+        env.update(self.environment)
+        return env
+
 
 class Machine(BaseTask):
 
@@ -364,6 +509,7 @@ class Machine(BaseTask):
             t.solver = self.solver
             t.directory = self.directory
             t.testmode = self.testmode
+            t.environment = self.environment
 
     def _applyPending(self):
         if not self._isReset:
@@ -377,15 +523,20 @@ class Machine(BaseTask):
         def statusProxy(line):
             self.pushStatus(line)
 
+        def progressProxy(event):
+            self.pushProgress(event)
+
         def killer():
             task.abort()
 
         self.signalAbort.add(killer)
         task.signalStatus.add(statusProxy)
+        task.signalProgress.add(progressProxy)
         task.start()
         task.join()
         self.signalAbort.remove(killer)
         task.signalStatus.remove(statusProxy)
+        task.signalProgress.remove(progressProxy)
 
     def _getTask(self, state):
         if state == CHECK:
@@ -47,6 +47,7 @@ class Task:
         self.signalAbort = set()
         self.signalStatus = set()
         self.signalStatusCleared = set()
+        self.signalProgress = set()
         self.startTime = None
         self.stopTime = None
         self.running = False
@@ -107,6 +108,9 @@ class Task:
         self._status.append(line)
         signal.notify(self.signalStatus, line)
 
+    def pushProgress(self, event):
+        signal.notify(self.signalProgress, event)
+
     def clearStatus(self):
         self._status = []
         signal.notify(self.signalStatusCleared)
@@ -28,6 +28,9 @@ __url__ = "https://www.freecad.org"
 ## \addtogroup FEM
 #  @{
 
+import hashlib
+import io
+import json
 import os
 from os.path import join
 
@@ -38,7 +41,14 @@ from femmesh import meshsetsgetter
 
 class FemInputWriter:
     def __init__(
-        self, analysis_obj, solver_obj, mesh_obj, member, dir_name=None, mat_geo_sets=None
+        self,
+        analysis_obj,
+        solver_obj,
+        mesh_obj,
+        member,
+        dir_name=None,
+        mat_geo_sets=None,
+        meshdatagetter=None,
     ):
         # class attributes from parameter values
         self.analysis = analysis_obj
@@ -104,6 +114,11 @@ class FemInputWriter:
         self.femelement_edges_table = {}
         self.femelement_count_test = True
 
+        # content hashes of split input files, see write_split_inpfile
+        self.split_hashes_file = ""
+        self.last_split_hashes = {}
+        self.split_hashes = {}
+
         # deprecated, leave for compatibility reasons
         # do not add new objects
         # only the ones which exists on 0.19 release are kept
@@ -130,12 +145,15 @@ class FemInputWriter:
         self.transform_objects = member.cons_transform
 
         # meshdatagetter, for compatibility, same with all getter methods
-        self.meshdatagetter = meshsetsgetter.MeshSetsGetter(
-            self.analysis,
-            self.solver_obj,
-            self.mesh_object,
-            self.member,
-        )
+        # the getter which prepared the mesh sets is reused with its node and element data
+        if meshdatagetter is None:
+            meshdatagetter = meshsetsgetter.MeshSetsGetter(
+                self.analysis,
+                self.solver_obj,
+                self.mesh_object,
+                self.member,
+            )
+        self.meshdatagetter = meshdatagetter
 
     # ********************************************************************************************
     # ********************************************************************************************
@@ -171,9 +189,9 @@ class FemInputWriter:
         if self.split_inpfile is True:
             file_name_split = f"{self.mesh_name}_{write_name}.inp"
             f.write(f"*INCLUDE,INPUT={file_name_split}\n")
-            inpfile_split = open(join(self.dir_name, file_name_split), "w")
+            inpfile_split = io.StringIO()
             constraint_sets_loop_writing(inpfile_split, femobjs, write_before, write_after)
-            inpfile_split.close()
+            self.write_split_inpfile(file_name_split, inpfile_split.getvalue())
         else:
             constraint_sets_loop_writing(f, femobjs, write_before, write_after)
 
@@ -203,6 +221,45 @@ class FemInputWriter:
         if write_after != "":
             f.write(write_after)
 
+    # ********************************************************************************************
+    # split input files are only written if their content has changed since the last run
+    # the content hashes of the last run are kept in the split_hashes_file
+    def read_split_hashes(self):
+        self.last_split_hashes = {}
+        self.split_hashes = {}
+        if not os.path.isfile(self.split_hashes_file):
+            return
+        try:
+            with open(self.split_hashes_file) as hashes_file:
+                self.last_split_hashes = json.load(hashes_file)
+        except (OSError, ValueError):
+            FreeCAD.Console.PrintLog("Split input file hashes could not be read.\n")
+        # removed until all split input files are written
+        # thus an interrupted writing does not leave wrong hashes
+        os.remove(self.split_hashes_file)
+
+    def write_split_hashes(self):
+        with open(self.split_hashes_file, "w") as hashes_file:
+            json.dump(self.split_hashes, hashes_file, indent=1, sort_keys=True)
+
+    def is_split_inpfile_unchanged(self, file_name_split, content_hash):
+        # content_hash is the hash of the content or of everything the content is made from
+        self.split_hashes[file_name_split] = content_hash
+        if self.last_split_hashes.get(file_name_split) != content_hash:
+            return False
+        if not os.path.isfile(join(self.dir_name, file_name_split)):
+            return False
+        FreeCAD.Console.PrintLog(f"Unchanged split input file is kept: {file_name_split}\n")
+        return True
+
+    def write_split_inpfile(self, file_name_split, content):
+        content_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        if self.is_split_inpfile_unchanged(file_name_split, content_hash):
+            return
+        inpfile_split = open(join(self.dir_name, file_name_split), "w")
+        inpfile_split.write(content)
+        inpfile_split.close()
+
     # ********************************************************************************************
     # deprecated, do not add new constraints
     # only the ones which exists on 0.19 release are kept
@@ -133,6 +133,7 @@ class Solve(run.Solve):
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 startupinfo=femutils.startProgramInfo(state),
+                env=self.solverEnvironment(),
             )
         else:
             self._process = subprocess.Popen(
@@ -140,6 +141,7 @@ class Solve(run.Solve):
                 cwd=self.directory,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
+                env=self.solverEnvironment(),
             )
         self.signalAbort.add(self._process.terminate)
         self._process.communicate()
@@ -48,6 +48,7 @@ from PySide.QtGui import QApplication
 import FreeCAD
 import FreeCADGui
 
+import femresult.resultcache as resultcache
 import femresult.resulttools as resulttools
 
 translate = FreeCAD.Qt.translate
@@ -59,7 +60,7 @@ class _TaskPanel:
     """
 
     def __init__(self, obj):
-        self.result_obj = obj
+        self.result_obj = resultcache.load_result(obj)
         self.mesh_obj = self.result_obj.Mesh
         # task panel should be started by use of setEdit of view provider
         # in view provider checks: Mesh, active analysis and
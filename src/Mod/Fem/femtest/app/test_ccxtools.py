@@ -26,6 +26,7 @@ __title__ = "CcxTools FEM unit tests"
 __author__ = "Bernd Hahnebach"
 __url__ = "https://www.freecad.org"
 
+import os
 import unittest
 from os.path import join
 
@@ -120,6 +121,135 @@ class TestCcxTools(unittest.TestCase):
             res_obj_name=res_obj_name,
         )
 
+    def test_box_static_split_input(self):
+        # set up
+        from femexamples.boxanalysis_static import setup
+
+        setup(self.document, "ccxtools")
+        self.document.CalculiXCcxTools.SplitInputWriter = True
+        base_name = get_namefromdef("test_")
+        analysis_dir = testtools.get_fem_test_tmp_dir(self.pre_dir_name + base_name)
+        fea = ccxtools.FemToolsCcx(
+            self.document.Analysis, self.document.CalculiXCcxTools, test_mode=True
+        )
+        fea.update_objects()
+        fea.setup_working_dir(analysis_dir)
+        error = fea.write_inp_file()
+        self.assertFalse(error, "Writing failed")
+
+        # the unchanged mesh file is kept on a second writing
+        mesh_file = join(analysis_dir, self.mesh_name + "_femesh.inp")
+        with open(mesh_file, "a") as f:
+            f.write("** kept\n")
+        error = fea.write_inp_file()
+        self.assertFalse(error, "Second writing failed")
+        with open(mesh_file) as f:
+            mesh_data = f.read()
+        self.assertTrue(mesh_data.endswith("** kept\n"), "Unchanged mesh file was written again")
+
+        # a mesh with changed groups is written again
+        femmesh = fea.mesh.FemMesh.copy()
+        group = femmesh.addGroup("test_group", "Node")
+        femmesh.addGroupElements(group, [1])
+        fea.mesh.FemMesh = femmesh
+        error = fea.write_inp_file()
+        self.assertFalse(error, "Writing with mesh group failed")
+        with open(mesh_file) as f:
+            mesh_data = f.read()
+        self.assertFalse(mesh_data.endswith("** kept\n"), "Mesh file with new group was kept")
+        with open(mesh_file, "a") as f:
+            f.write("** kept\n")
+
+        # without the hashes of the last writing all files are written again
+        os.remove(join(analysis_dir, self.mesh_name + "_split_hashes.json"))
+        error = fea.write_inp_file()
+        self.assertFalse(error, "Third writing failed")
+        with open(mesh_file) as f:
+            mesh_data = f.read()
+        self.assertFalse(mesh_data.endswith("** kept\n"), "Mesh file was not written again")
+
+    def test_box_static_sweep(self):
+        # set up, the sweep needs a solver of the solver framework
+        import shutil
+        import ObjectsFem
+        from femexamples.boxanalysis_static import setup
+        from femsolver import run
+        from femsolver import settings
+
+        binary = settings.get_binary("Calculix", silent=True)
+        if not binary or not shutil.which(binary):
+            self.skipTest("CalculiX binary not found")
+
+        setup(self.document, "ccxtools")
+        self.document.removeObject("CalculiXCcxTools")
+        solver = ObjectsFem.makeSolverCalculix(self.document, "SolverCalculix")
+        self.document.Analysis.addObject(solver)
+        self.document.recompute()
+        base_name = get_namefromdef("test_")
+        analysis_dir = testtools.get_fem_test_tmp_dir(self.pre_dir_name + base_name)
+
+        # run two variants, the second one with the double force
+        variants = [{}, {"FemConstraintForce.Force": "80000.0 N"}]
+        results = run.run_fem_solver_sweep(solver, variants, analysis_dir, jobs=2)
+        self.assertEqual(len(results), 2)
+        for i, result in enumerate(results):
+            directory = join(analysis_dir, "variant_%03d" % i)
+            self.assertEqual(result["directory"], directory)
+            self.assertTrue(os.path.isdir(directory), "Variant directory missing")
+            self.assertFalse(result["failed"], "Variant {} failed".format(i))
+            self.assertTrue(result["summary"], "Variant {} has no summary".format(i))
+
+        # the changed property is restored
+        self.assertEqual(self.document.FemConstraintForce.Force.getValueAs("N"), 40000.0)
+
+        # the double force gives the larger displacement
+        disp_max = [result["summary"][-1]["disp_max"] for result in results]
+        self.assertGreater(disp_max[1], disp_max[0])
+
+    # ********************************************************************************************
+    def test_read_progress_files(self):
+        from femsolver.calculix import progress
+
+        base_name = get_namefromdef("test_")
+        analysis_dir = testtools.get_fem_test_tmp_dir(self.pre_dir_name + base_name)
+        reader = progress.ProgressReader(analysis_dir, self.mesh_name)
+        reader.reset()
+        self.assertEqual(reader.read(), [], "Progress found without progress files.")
+
+        sta_file = join(analysis_dir, self.mesh_name + ".sta")
+        cvg_file = join(analysis_dir, self.mesh_name + ".cvg")
+        with open(sta_file, "w") as f:
+            f.write(
+                "SUMMARY OF JOB INFORMATION\n"
+                "  STEP      INC     ATT    ITRS     TOT TIME     STEP TIME         INC TIME\n"
+                "     1       1       1       3  0.1000000E+00  0.1000000E+00  0.1000000E+00\n"
+                "     1       2       1U"
+            )
+        with open(cvg_file, "w") as f:
+            f.write(
+                "   SUMMARY OF C0NVERGENCE INFORMATION\n"
+                "  STEP   INC  ATT ITER     CONT.   RESID.        CORR.      RESID.      CORR.\n"
+                "                           EL.     FORCE(%)      DISP(%)    FLUX(%)    TEMP(%)\n"
+                "     1     1    1    1        0   0.1000E+03   0.1000E+03   0.0000E+00"
+                "   0.0000E+00\n"
+            )
+        events = reader.read()
+        self.assertEqual(len(events), 2, "Unexpected number of progress events.")
+        self.assertEqual(events[0]["type"], "increment", "Unexpected type of .sta event.")
+        self.assertEqual(events[0]["iterations"], 3, "Unexpected number of iterations.")
+        self.assertEqual(events[0]["total_time"], 0.1, "Unexpected total time.")
+        self.assertEqual(events[1]["type"], "iteration", "Unexpected type of .cvg event.")
+        self.assertEqual(events[1]["force_residual"], 100.0, "Unexpected force residual.")
+
+        # the incomplete line is read as soon as it is completed
+        with open(sta_file, "a") as f:
+            f.write("       2  0.1500000E+00  0.1500000E+00  0.5000000E-01\n")
+        events = reader.read()
+        self.assertEqual(len(events), 1, "Completed .sta line not read.")
+        self.assertEqual(events[0]["increment"], 2, "Unexpected increment.")
+        self.assertFalse(events[0]["converged"], "Not converged attempt not detected.")
+        self.assertEqual(reader.read(), [], "Progress events read twice.")
+
     # ********************************************************************************************
     def test_ccx_buckling_flexuralbuckling(self):
         from femexamples.ccx_buckling_flexuralbuckling import setup
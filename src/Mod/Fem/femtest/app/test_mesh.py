@@ -192,6 +192,62 @@ class TestMeshCommon(unittest.TestCase):
             f"Problem in test_writeAbaqus_precision, \n{read_node_line}\n{expected}",
         )
 
+    # ********************************************************************************************
+    def test_inp_nodes_2d(self):
+        # a *NODE block without z coordinates has to be read line by line
+        # 4 nodes with 3 values fit into 3 rows of 4 values in bulk
+        from feminout import importInpMesh
+
+        inp_file = join(testtools.get_fem_test_tmp_dir("mesh_common_inp_2d"), "tria3_mesh.inp")
+        with open(inp_file, "w") as f:
+            f.write("*NODE, NSET=Nall\n")
+            f.write("1, 5.0, 0.0\n2, 6.0, 0.0\n3, 7.0, 0.0\n4, 8.0, 0.0\n")
+            f.write("*ELEMENT, TYPE=CPS3, ELSET=Eall\n")
+            f.write("1, 1, 2, 3\n2, 1, 3, 4\n")
+
+        self.assertIsNone(
+            importInpMesh.read_inp_arrays(inp_file), "Nodes without z coordinate read in bulk"
+        )
+        femmesh = importInpMesh.read(inp_file)
+        self.assertEqual(
+            femmesh.Nodes,
+            {
+                1: FreeCAD.Vector(5.0, 0.0, 0.0),
+                2: FreeCAD.Vector(6.0, 0.0, 0.0),
+                3: FreeCAD.Vector(7.0, 0.0, 0.0),
+                4: FreeCAD.Vector(8.0, 0.0, 0.0),
+            },
+            "Nodes without z coordinate are unexpected",
+        )
+        self.assertEqual(femmesh.getElementNodes(2), (1, 3, 4), "Unexpected tria3 element")
+
+    # ********************************************************************************************
+    def test_inp_element_continued(self):
+        # the nodes of a C3D20 element are continued on the next line after a comma
+        # the element is read in bulk, duplicate nodes are overwritten like in read_inp()
+        from feminout import importInpMesh
+
+        inp_file = join(testtools.get_fem_test_tmp_dir("mesh_common_inp_cont"), "hexa20_mesh.inp")
+        with open(inp_file, "w") as f:
+            f.write("*NODE, NSET=Nall\n")
+            for node in range(1, 21):
+                f.write(f"{node}, {node}.0, 0.0, 1.0\n")
+            f.write("20, 20.0, 2.0, 2.0\n")
+            f.write("*ELEMENT, TYPE=C3D20, ELSET=Eall\n")
+            f.write("1, " + ", ".join(str(node) for node in range(1, 16)) + ",\n")
+            f.write(", ".join(str(node) for node in range(16, 21)) + "\n")
+
+        mesh_arrays = importInpMesh.read_inp_arrays(inp_file)
+        self.assertIsNotNone(mesh_arrays, "Continued element not read in bulk")
+        mesh_data = importInpMesh.read_inp(inp_file)
+        self.assertEqual(
+            mesh_arrays["volume20"].tolist(),
+            [mesh_data["Hexa20Elem"][1]],
+            "Continued element differs from the line reader",
+        )
+        self.assertEqual(mesh_arrays["node_ids"].tolist(), list(range(1, 21)))
+        self.assertEqual(mesh_arrays["nodes"][-1].tolist(), mesh_data["Nodes"][20])
+
 
 # ************************************************************************************************
 # ************************************************************************************************
@@ -373,6 +429,134 @@ class TestMeshEleTetra10(unittest.TestCase):
         obj.ViewObject.DisplayMode = "Faces, Wireframe & Nodes"
         """
 
+    # ********************************************************************************************
+    def test_tetra10_ele_faces(self):
+        # tetra10 element: node element table and element faces by nodes
+        from femmesh import meshtools
+
+        femelement_table = meshtools.get_femelement_table(self.femmesh)
+        femnodes_ele_table = meshtools.get_femnodes_ele_table(self.femmesh.Nodes, femelement_table)
+        self.assertEqual(
+            femnodes_ele_table[5],
+            [[1, 16]],
+            "Node element table of " + self.elem + " mesh element is unexpected",
+        )
+        # face 1 of ccx tetra10 are the nodes 1, 2, 3, 5, 6, 7
+        self.assertEqual(
+            meshtools.get_ccxelement_faces_by_femnodes(femnodes_ele_table, [1, 2, 3, 5, 6, 7]),
+            [[1, 1]],
+            "Element face of " + self.elem + " mesh element is unexpected",
+        )
+        all_nodes = list(range(1, 11))
+        self.assertEqual(
+            meshtools.get_ccxelement_faces_by_femnodes(femnodes_ele_table, all_nodes),
+            [[1, 1], [1, 2], [1, 3], [1, 4]],
+            "Element faces of " + self.elem + " mesh element are unexpected",
+        )
+        self.assertEqual(
+            meshtools.get_femelements_by_femnodes_bin(
+                femelement_table, femnodes_ele_table, all_nodes
+            ),
+            [1],
+            "Elements by nodes of " + self.elem + " mesh element are unexpected",
+        )
+
+    # ********************************************************************************************
+    def test_tetra10_femmesh2mesh(self):
+        # tetra10 element: surface triangles of the element corner nodes
+        from femmesh.femmesh2mesh import femmesh_2_mesh
+
+        out_mesh = femmesh_2_mesh(self.femmesh)
+        nodes = self.expected_nodes["nodes"]
+        expected_triangles = [[1, 2, 3], [1, 4, 2], [3, 4, 1], [2, 4, 3]]
+        self.assertEqual(
+            [FreeCAD.Vector(*p) for p in out_mesh],
+            [nodes[n] for triangle in expected_triangles for n in triangle],
+            "Surface triangles of " + self.elem + " mesh element are unexpected",
+        )
+
+    # ********************************************************************************************
+    def test_tetra10_nodes_index(self):
+        # tetra10 element: node search by reference shapes with the spatial node index
+        import Part
+        from femmesh import meshtools
+
+        corners = [FreeCAD.Vector(6, 12, 18), FreeCAD.Vector(0, 0, 18)]
+        corners += [FreeCAD.Vector(12, 0, 18), FreeCAD.Vector(6, 6, 0)]
+        face = Part.Face(Part.makePolygon(corners[:3], True))
+        solid = Part.Solid(
+            Part.Shell(
+                [
+                    Part.Face(Part.makePolygon([corners[i] for i in tri], True))
+                    for tri in ((0, 1, 2), (0, 1, 3), (1, 2, 3), (0, 2, 3))
+                ]
+            )
+        )
+        femnodes_index = meshtools.FemNodesIndex(self.femmesh.Nodes)
+        self.assertEqual(
+            femnodes_index.get_nodes_by_vertex(Part.Vertex(corners[3])),
+            [4],
+            "Nodes by vertex of " + self.elem + " mesh element are unexpected",
+        )
+        edge = Part.makeLine(corners[1], corners[2])
+        self.assertEqual(
+            femnodes_index.get_nodes_by_shape(edge),
+            sorted(self.femmesh.getNodesByEdge(edge)),
+            "Nodes by edge of " + self.elem + " mesh element are unexpected",
+        )
+        self.assertEqual(
+            femnodes_index.get_nodes_by_shape(face),
+            [1, 2, 3, 5, 6, 7],
+            "Nodes by face of " + self.elem + " mesh element are unexpected",
+        )
+        self.assertEqual(
+            femnodes_index.get_nodes_by_shape(solid),
+            list(range(1, 11)),
+            "Nodes by solid of " + self.elem + " mesh element are unexpected",
+        )
+        # solids are searched by the FemMesh, small faces are prefiltered by the index
+        femnodes_index = meshtools.FemNodesIndex(self.femmesh.Nodes, self.femmesh)
+        self.assertTrue(femnodes_index._searches_femmesh(solid))
+        self.assertEqual(
+            femnodes_index.get_nodes_by_shape(solid),
+            list(range(1, 11)),
+            "Nodes by solid of " + self.elem + " mesh element are unexpected",
+        )
+        self.assertEqual(
+            femnodes_index.get_nodes_by_shape(face),
+            sorted(self.femmesh.getNodesByFace(face)),
+            "Nodes by face of " + self.elem + " mesh element are unexpected",
+        )
+
+    # ********************************************************************************************
+    def test_tetra10_nodes_index_processes(self):
+        # tetra10 element: concurrent node search of many reference shapes
+        import Part
+        from femmesh import meshtools
+
+        corners = [FreeCAD.Vector(6, 12, 18), FreeCAD.Vector(0, 0, 18)]
+        corners += [FreeCAD.Vector(12, 0, 18), FreeCAD.Vector(6, 6, 0)]
+        shapes = {}
+        for i, tri in enumerate(((0, 1, 2), (0, 1, 3), (1, 2, 3), (0, 2, 3))):
+            shapes[("Tetra", "Face" + str(i + 1))] = Part.Face(
+                Part.makePolygon([corners[j] for j in tri], True)
+            )
+        shapes[("Tetra", "Vertex4")] = Part.Vertex(corners[3])
+        expected = meshtools.FemNodesIndex(self.femmesh.Nodes)
+        expected.add_shape_nodes(shapes, processes=1)
+        femnodes_index = meshtools.FemNodesIndex(self.femmesh.Nodes)
+        femnodes_index.add_shape_nodes(shapes, processes=2)
+        self.assertEqual(
+            femnodes_index.shape_nodes,
+            expected.shape_nodes,
+            "Nodes by shapes of " + self.elem + " mesh element are unexpected",
+        )
+        self.assertEqual(
+            femnodes_index.get_nodes_by_shape(None, ("Tetra", "Face1")),
+            [1, 2, 3, 5, 6, 7],
+            "Cached nodes by face of " + self.elem + " mesh element are unexpected",
+        )
+
     # ********************************************************************************************
     def test_tetra10_inp(self):
         # tetra10 element: reading from and writing to inp mesh file format
@@ -386,6 +570,59 @@ class TestMeshEleTetra10(unittest.TestCase):
 
         self.compare_mesh_files(femmesh_testfile, femmesh_outfile, file_extension)
 
+    # ********************************************************************************************
+    def test_tetra10_inp_bulk(self):
+        # tetra10 element: bulk inp reader compared with the line by line inp reader
+
+        file_extension = "inp"
+        outfile, testfile = self.get_file_paths(file_extension)
+
+        from feminout import importInpMesh
+        from feminout import importToolsFem
+
+        self.assertIsNotNone(importInpMesh.read_inp_arrays(testfile))
+        femmesh_outfile = importInpMesh.read(testfile)
+        femmesh_testfile = importToolsFem.make_femmesh(importInpMesh.read_inp(testfile))
+
+        self.compare_mesh_files(femmesh_testfile, femmesh_outfile, file_extension)
+
+    # ********************************************************************************************
+    def test_tetra10_meshnpz(self):
+        # tetra10 element: reading from and writing to binary NumPy mesh file format
+
+        file_extension = "meshnpz"
+        outfile, testfile = self.get_file_paths(file_extension)
+
+        # there is no binary test mesh file, the written mesh is compared with the inp test mesh
+        from feminout.importNpzMesh import read
+        from feminout.importNpzMesh import write
+
+        write(outfile, self.femmesh)
+        femmesh_testfile = Fem.read(self.base_testfile + "inp")
+        femmesh_outfile = read(outfile)
+        self.assertEqual(
+            femmesh_outfile.Nodes,
+            self.femmesh.Nodes,
+            "Nodes of the written {} mesh differ from the original mesh.".format(self.elem),
+        )
+        self.assertEqual(
+            [(v, femmesh_outfile.getElementNodes(v)) for v in femmesh_outfile.Volumes],
+            [(v, self.femmesh.getElementNodes(v)) for v in self.femmesh.Volumes],
+            "Volumes of the written {} mesh differ from the original mesh.".format(self.elem),
+        )
+
+        self.compare_mesh_files(femmesh_testfile, femmesh_outfile, file_extension)
+
+        # the element nodes are read by type at once
+        from femmesh.meshtools import get_mesh_arrays
+
+        mesh_arrays = get_mesh_arrays(self.femmesh)
+        self.assertEqual(
+            (mesh_arrays["volume10_ids"].tolist(), mesh_arrays["volume10"].tolist()),
+            ([1], [list(self.femmesh.getElementNodes(1))]),
+            "Mesh arrays of the {} mesh are unexpected.".format(self.elem),
+        )
+
     # ********************************************************************************************
     def test_tetra10_unv(self):
         # tetra10 element: reading from and writing to unv mesh file format
@@ -125,6 +125,43 @@ class TestResult(unittest.TestCase):
             "Calculated principal reinforced stresses are not the expected values.",
         )
 
+    # ********************************************************************************************
+    def test_stress_batch(self):
+        from femresult import resulttools
+
+        stress = self.get_stress_values()
+        # second node with NaN values, which can happen on CalculiX frd result files
+        stress_tensors = [stress, (float("NaN"),) * 6]
+
+        mises = resulttools.calculate_von_mises_batch(stress_tensors)
+        self.assertAlmostEqual(
+            mises[0],
+            resulttools.calculate_von_mises(stress),
+            places=10,
+            msg="Vectorized von Mises stress differs from the per node value.",
+        )
+
+        prin = resulttools.calculate_principal_stress_std_batch(stress_tensors)
+        expected = resulttools.calculate_principal_stress_std(stress)
+        for i in range(4):
+            self.assertAlmostEqual(
+                prin[i][0],
+                expected[i],
+                places=10,
+                msg="Vectorized principal stresses differ from the per node values.",
+            )
+            self.assertNotEqual(prin[i][1], prin[i][1], "NaN stress should give NaN.")
+
+        prin = resulttools.calculate_principal_stress_reinforced_batch([stress])
+        expected = resulttools.calculate_principal_stress_reinforced(stress)
+        for i in range(4):
+            self.assertAlmostEqual(
+                prin[i][0],
+                expected[i],
+                places=10,
+                msg="Vectorized reinforced principal stresses differ from the per node values.",
+            )
+
     # ********************************************************************************************
     def test_rho(self):
         data = (
@@ -193,6 +230,13 @@ class TestResult(unittest.TestCase):
             # fcc_print("Case{}: {}".format(i + 1 , rhores))
             self.assertEqual(rhores, case[1], f"Calculated rho are not the expected Case{i + 1}.")
 
+        from femresult.resulttools import calculate_rho_batch
+
+        res = calculate_rho_batch([case[0] for case in data], 500)
+        for i, case in enumerate(data):
+            rhores = tuple(round(r, 5) for r in res[i])
+            self.assertEqual(rhores, case[1], f"Vectorized rho are not the expected Case{i + 1}.")
+
     # ********************************************************************************************
     def test_disp_abs(self):
         expected_dispabs = 87.302986
@@ -205,3 +249,120 @@ class TestResult(unittest.TestCase):
         self.assertEqual(
             disp_abs, expected_dispabs, "Calculated displacement abs are not the expected values."
         )
+
+    # ********************************************************************************************
+    def test_read_frd_result_sets(self):
+        from feminout.importCcxFrdResults import iter_frd_result_sets
+        from feminout.importCcxFrdResults import read_frd_steps
+
+        frd_file = join(testtools.get_fem_test_home_dir(), "calculix", "box_static.frd")
+        steps = read_frd_steps(frd_file)
+        self.assertEqual(len(steps), 1, "Unexpected number of result sets in frd file.")
+        self.assertEqual(steps[0]["time"], 1.0, "Unexpected time of result set in frd file.")
+        self.assertEqual(steps[0]["step"], 0, "Unexpected step index of result set.")
+        self.assertTrue(steps[0]["last"], "Single result set not marked as last one.")
+
+        result_sets = list(iter_frd_result_sets(frd_file, fields=("disp", "stress")))
+        self.assertEqual(len(result_sets), 1, "Unexpected number of streamed result sets.")
+        result_set = result_sets[0]
+        self.assertEqual(
+            sorted(result_set),
+            ["disp", "last", "number", "step", "stress", "time"],
+            "Unexpected result fields.",
+        )
+        node_numbers, disp = result_set["disp"]
+        self.assertEqual(node_numbers.tolist(), list(range(1, 281)), "Unexpected node numbers.")
+        self.assertEqual(
+            disp[-1].tolist(), [-5.32384e-03, 1.88752e-03, -6.50264e-03], "Unexpected displacement."
+        )
+        node_numbers, stress = result_set["stress"]
+        self.assertEqual(node_numbers.tolist(), list(range(1, 281)), "Unexpected node numbers.")
+        # the frd columns (Sxx, Syy, Szz, Sxy, Syz, Szx) are stored as (..., Sxz, Syz)
+        self.assertEqual(
+            stress[0].tolist(),
+            [-2620.33, -871.861, -800.594, -429.349, -542.662, -121.884],
+            "Unexpected stress values.",
+        )
+        self.assertEqual(
+            list(iter_frd_result_sets(frd_file, steps=(1,))),
+            [],
+            "Not existing step should not be read.",
+        )
+
+        # a node listed twice keeps the position of its first and the values of its last record
+        import numpy as np
+        from feminout.importCcxFrdResults import _merge_frd_block
+
+        node_numbers, disp = _merge_frd_block(
+            "disp", 3, [(np.array([3, 1, 3, 2]), np.arange(12.0).reshape(4, 3))], []
+        )
+        self.assertEqual(node_numbers.tolist(), [3, 1, 2], "Unexpected duplicate node numbers.")
+        self.assertEqual(disp[0].tolist(), [6.0, 7.0, 8.0], "Unexpected duplicate node values.")
+
+    # ********************************************************************************************
+    def test_read_frd_result_summary(self):
+        from feminout.importCcxFrdResults import read_frd_result_summary
+
+        frd_file = join(testtools.get_fem_test_home_dir(), "calculix", "box_static.frd")
+        summary = read_frd_result_summary(frd_file)
+        self.assertEqual(len(summary), 1, "Unexpected number of result sets in summary.")
+        self.assertEqual(summary[0]["time"], 1.0, "Unexpected time of result set in summary.")
+        self.assertAlmostEqual(
+            summary[0]["disp_max"], 0.0937383460, 9, "Unexpected maximum displacement."
+        )
+        self.assertAlmostEqual(
+            summary[0]["vonmises_max"], 2203.5090958, 6, "Unexpected maximum von Mises stress."
+        )
+        self.assertNotIn("strain_max", summary[0], "Strain should not be summarized.")
+
+    # ********************************************************************************************
+    def test_result_cache(self):
+        import os
+        import ObjectsFem
+        from femresult import resultcache
+
+        res_obj = ObjectsFem.makeResultMechanical(self.document, "Result")
+        res_obj.NodeNumbers = [1, 2, 3]
+        res_obj.DisplacementVectors = [(1.0, 0.0, 0.0), (0.0, 2.0, 0.0), (0.0, 0.0, 3.0)]
+        res_obj.vonMises = [10.0, 20.0, 30.0]
+
+        resultcache.store_result(res_obj, "test_result_cache")
+        self.assertFalse(os.path.isabs(res_obj.ResultCache), "Result cache path not relative.")
+        self.assertTrue(
+            os.path.isdir(resultcache.get_result_dir(res_obj)), "Result cache not written."
+        )
+        self.assertEqual(len(res_obj.vonMises), 0, "Cached node data still in result object.")
+        self.assertEqual(len(res_obj.NodeNumbers), 0, "Cached node numbers still in result object.")
+
+        # only the requested fields are loaded
+        resultcache.load_result(res_obj, ("NodeNumbers", "vonMises"))
+        self.assertEqual(res_obj.NodeNumbers, [1, 2, 3], "Unexpected cached node numbers.")
+        self.assertEqual(res_obj.vonMises, [10.0, 20.0, 30.0], "Unexpected cached values.")
+        self.assertEqual(len(res_obj.DisplacementVectors), 0, "Not requested field loaded.")
+        resultcache.load_result(res_obj)
+        self.assertEqual(
+            res_obj.DisplacementVectors[2],
+            FreeCAD.Vector(0.0, 0.0, 3.0),
+            "Unexpected cached vectors.",
+        )
+
+        # unloading empties the cached fields but keeps the cache
+        resultcache.unload_result(res_obj)
+        self.assertEqual(len(res_obj.vonMises), 0, "Cached node data not unloaded.")
+        resultcache.load_result(res_obj, ("vonMises",))
+        self.assertEqual(res_obj.vonMises, [10.0, 20.0, 30.0], "Cached values lost by unloading.")
+
+        # an export loads the missing fields and empties only them again
+        loaded = resultcache.load_for_export(res_obj)
+        self.assertEqual(
+            sorted(loaded), ["DisplacementVectors", "NodeNumbers"], "Unexpected loaded fields."
+        )
+        self.assertEqual(res_obj.NodeNumbers, [1, 2, 3], "Node numbers not loaded for export.")
+        resultcache.unload_result(res_obj, loaded)
+        self.assertEqual(len(res_obj.NodeNumbers), 0, "Exported node numbers not unloaded.")
+        self.assertEqual(res_obj.vonMises, [10.0, 20.0, 30.0], "Loaded values unloaded by export.")
+
+        cache_dir = resultcache.get_result_dir(res_obj)
+        resultcache.remove_result(res_obj)
+        self.assertFalse(os.path.isdir(cache_dir), "Result cache not removed.")
+        self.assertEqual(res_obj.ResultCache, "", "Result cache still referenced.")
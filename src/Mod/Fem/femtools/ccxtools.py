@@ -35,6 +35,7 @@ import subprocess
 
 import FreeCAD
 
+from femsolver.calculix import progress
 from femtools import femutils
 from femtools import membertools
 
@@ -69,6 +70,8 @@ class FemToolsCcx(QtCore.QRunnable, QtCore.QObject):
     """
 
     finished = QtCore.Signal(int)
+    solver_output = QtCore.Signal(str)
+    solver_progress = QtCore.Signal(dict)
 
     def __init__(self, analysis=None, solver=None, test_mode=False):
         """The constructor
@@ -354,11 +357,13 @@ class FemToolsCcx(QtCore.QRunnable, QtCore.QObject):
         # TODO use separate method for getting the mesh set data
         from femmesh import meshsetsgetter
 
+        ccx_prefs = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Fem/Ccx")
         meshdatagetter = meshsetsgetter.MeshSetsGetter(
             self.analysis,
             self.solver,
             self.mesh,
             membertools.AnalysisMember(self.analysis),
+            processes=ccx_prefs.GetInt("NodeSearchProcesses", 1),
         )
         # save the sets into the member objects of the instanz meshdatagetter
         meshdatagetter.get_mesh_sets()
@@ -375,6 +380,7 @@ class FemToolsCcx(QtCore.QRunnable, QtCore.QObject):
                 meshdatagetter.member,
                 self.working_dir,
                 meshdatagetter.mat_geo_sets,
+                meshdatagetter=meshdatagetter,
             )
             self.inp_file_name = inp_writer.write_solver_input()
         except Exception:
@@ -515,6 +521,9 @@ class FemToolsCcx(QtCore.QRunnable, QtCore.QObject):
         cwd = QtCore.QDir.currentPath()
         f = QtCore.QFileInfo(self.inp_file_name)
         QtCore.QDir.setCurrent(f.path())
+        # stdout and the .sta and .cvg progress are emitted while ccx is running
+        reader = progress.ProgressReader(f.path(), f.baseName())
+        reader.reset()
         p = subprocess.Popen(
             [self.ccx_binary, "-i ", f.baseName()],
             stdout=subprocess.PIPE,
@@ -522,9 +531,9 @@ class FemToolsCcx(QtCore.QRunnable, QtCore.QObject):
             shell=False,
             env=_env,
         )
-        self.ccx_stdout, self.ccx_stderr = p.communicate()
-        self.ccx_stdout = self.ccx_stdout.decode()
-        self.ccx_stderr = self.ccx_stderr.decode()
+        self.ccx_stdout, self.ccx_stderr = progress.observe_process(
+            p, reader, on_output=self.solver_output.emit, on_progress=self.solver_progress.emit
+        )
         os.putenv("OMP_NUM_THREADS", ont_backup)
         QtCore.QDir.setCurrent(cwd)
         return p.returncode
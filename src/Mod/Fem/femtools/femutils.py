@@ -381,6 +381,22 @@ def pydecode(bytestring):
     return bytestring.decode("utf-8")
 
 
+def fork_available():
+    """Return True if work can be spread across forked worker processes.
+
+    Fork is not safe with the system frameworks on macOS. A forked copy of
+    the GUI process inherits the threads and locks of Qt, thus nothing is
+    forked while the GUI is up.
+    """
+    import multiprocessing
+
+    return (
+        "fork" in multiprocessing.get_all_start_methods()
+        and system() != "Darwin"
+        and not FreeCAD.GuiUp
+    )
+
+
 def startProgramInfo(code):
     """starts a program under Windows minimized, hidden or normal"""
     if system() == "Windows":
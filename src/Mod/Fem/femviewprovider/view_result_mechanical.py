@@ -33,6 +33,7 @@ __url__ = "https://www.freecad.org"
 import FreeCADGui
 
 from PySide import QtGui
+from femresult import resultcache
 from femtaskpanels import task_result_mechanical
 from . import view_base_femconstraint
 
@@ -55,6 +56,8 @@ class VPResultMechanical(view_base_femconstraint.VPBaseFemConstraint):
         FreeCADGui.Control.closeDialog()
         # hide the mesh after result viewing is finished, but do not reset the coloring
         self.Object.Mesh.ViewObject.hide()
+        # the task panel loaded the cached node data, it is not kept in the document
+        resultcache.unload_result(self.Object)
         return True
 
     def claimChildren(self):